@@ -1582,6 +1582,55 @@ def run_prd(argv: Sequence[str] | None = None) -> int:
     return 2
 
 
+def run_memory(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="gaia memory", description="Execution memory (KB) maintenance.")
+    parser.add_argument("--db", help="KB sqlite path (default: ~/.gaia/memory/kb.sqlite3)")
+    subparsers = parser.add_subparsers(dest="memory_command")
+
+    stats_parser = subparsers.add_parser("stats", help="Show KB row counts.")
+    stats_parser.add_argument("--domain")
+
+    gc_parser = subparsers.add_parser("gc", help="Incremental GC, row/size budgets and VACUUM.")
+    gc_parser.add_argument("--retention-days", type=int, default=30)
+    gc_parser.add_argument("--domain-budget", type=int, help="Max action rows per domain (0 = unlimited)")
+    gc_parser.add_argument("--max-db-mb", type=int, help="Target KB size in MB (0 = unlimited)")
+    gc_parser.add_argument("--batch-size", type=int, default=500)
+    gc_parser.add_argument("--full-vacuum", action="store_true", help="Rewrite the file and enable incremental VACUUM")
+    gc_parser.add_argument("--format", choices=("text", "json"), default="text")
+
+    args = parser.parse_args(list(argv or []))
+
+    from gaia.src.phase4.memory.store import MemoryStore
+
+    store = MemoryStore(db_path=Path(args.db).expanduser() if args.db else None, write_behind=False)
+    if args.memory_command == "stats":
+        print(json.dumps(store.get_stats(domain=args.domain), ensure_ascii=False, indent=2))
+        return 0
+    if args.memory_command == "gc":
+        result = store.compact(
+            retention_days=args.retention_days,
+            domain_row_budget=args.domain_budget,
+            max_db_bytes=None if args.max_db_mb is None else max(0, args.max_db_mb) * 1024 * 1024,
+            batch_size=args.batch_size,
+            full_vacuum=args.full_vacuum,
+        )
+        if args.format == "json":
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        else:
+            print(f"삭제된 행: {result['deleted']}")
+            print(
+                f"- 만료 action/summary: {result['expired_actions']}/{result['expired_summaries']}, "
+                f"도메인 예산: {result['budget_actions']}, 용량 예산: {result['size_actions']}, "
+                f"에피소드: {result['episodes']}"
+            )
+            print(f"회수된 페이지: {result['freed_pages']}")
+            print(f"DB 크기: {result['db_bytes'] / (1024 * 1024):.1f} MB")
+        return 0
+
+    parser.print_help()
+    return 2
+
+
 def _build_cli_harness_parser() -> argparse.ArgumentParser:
     from gaia.harness.cli_runtime import build_harness_parser
 
@@ -2406,6 +2455,7 @@ def _build_main_parser() -> argparse.ArgumentParser:
     subparsers.add_parser("cli", help="Harness CLI family")
     subparsers.add_parser("harness", help="Run GAIA evaluation harness")
     subparsers.add_parser("auth", help="Manage GAIA auth tokens")
+    subparsers.add_parser("memory", help="Execution memory (KB) stats and GC")
     subparsers.add_parser("help", help="Show help")
     return parser
 
@@ -2446,6 +2496,8 @@ def main(argv: Sequence[str] | None = None) -> int:
             return run_prd(args[1:])
         if args[0] == "auth":
             return gaia_auth.run_auth(args[1:])
+        if args[0] == "memory":
+            return run_memory(args[1:])
 
         _build_main_parser().print_help()
         print(f"Unknown command: {args[0]}", file=sys.stderr)
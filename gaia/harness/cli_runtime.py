@@ -13,12 +13,15 @@ from gaia.harness.runner import (
     benchmark_mode_label,
     _grade_task_result,
     _latest_report_path,
+    _open_row_stream,
+    _run_task_jobs,
     _summarize_grades,
     _summarize_results,
     _write_markdown,
     normalize_harness_qa_mode,
-    run_task,
+    normalize_harness_workers,
 )
+from gaia.harness.warm_worker import PERSISTENT_WORKER_RUNTIME
 
 _GATE_SUMMARY_HIGHER_KEYS = (
     "pass_at_1",
@@ -71,6 +74,18 @@ def build_harness_parser(prog: str = "gaia harness") -> argparse.ArgumentParser:
     run_parser.add_argument("--task-id")
     run_parser.add_argument("--limit", type=int)
     run_parser.add_argument("--repeats", type=int, default=1, help="Run the selected tasks multiple times.")
+    run_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Run up to N task attempts in parallel, each worker with its own OpenClaw profile.",
+    )
+    run_parser.add_argument(
+        "--runtime-isolation",
+        choices=("cold-process", PERSISTENT_WORKER_RUNTIME),
+        default=None,
+        help="Use a persistent worker interpreter per slot instead of a fresh process per attempt.",
+    )
     run_parser.add_argument("--timeout-sec", type=int, default=180)
     run_parser.add_argument("--session-prefix", default="harness")
     run_parser.add_argument(
@@ -418,6 +433,8 @@ def _run_registry(
     env: Mapping[str, str] | None = None,
     session_prefix: str = "harness",
     qa_mode: str | None = None,
+    workers: int = 1,
+    runtime_isolation: str | None = None,
 ) -> dict[str, Any]:
     tasks = _select_tasks(
         registry,
@@ -428,30 +445,47 @@ def _run_registry(
         contains=contains,
     )
     repeat_count = max(int(repeats), 1)
-    results: list[dict[str, Any]] = []
+    worker_count = normalize_harness_workers(workers)
     task_groups: dict[str, list[dict[str, Any]]] = {}
     normalized_qa_mode = normalize_harness_qa_mode(qa_mode)
 
     ARTIFACT_ROOT.mkdir(parents=True, exist_ok=True)
-    for repeat_index in range(1, repeat_count + 1):
-        for index, task in enumerate(tasks, start=1):
-            session_id = f"{session_prefix}:{task.id}:r{repeat_index}:i{index}"
-            row = run_task(
-                task,
-                python_executable=python_executable,
-                timeout_sec=timeout_sec,
-                env=env,
-                session_id=session_id,
-                qa_mode=normalized_qa_mode,
-            )
-            grades = _grade_task_result(task, row)
-            row["task_index"] = index
-            row["repeat_index"] = repeat_index
-            row["repeat_count"] = repeat_count
-            row["grades"] = [grade.to_dict() for grade in grades]
-            row["overall_pass"] = all(bool(grade.passed) for grade in grades)
-            results.append(row)
-            task_groups.setdefault(task.id, []).append(row)
+    run_id = f"harness_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    artifact_dir = ARTIFACT_ROOT / run_id
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    stream_row = _open_row_stream(artifact_dir)
+    job_meta = [
+        (task, index, repeat_index)
+        for repeat_index in range(1, repeat_count + 1)
+        for index, task in enumerate(tasks, start=1)
+    ]
+    jobs = [
+        (task, f"{session_prefix}:{task.id}:r{repeat_index}:i{index}")
+        for task, index, repeat_index in job_meta
+    ]
+
+    def _finalize_row(job_index: int, row: dict[str, Any]) -> None:
+        task, index, repeat_index = job_meta[job_index]
+        grades = _grade_task_result(task, row)
+        row["task_index"] = index
+        row["repeat_index"] = repeat_index
+        row["repeat_count"] = repeat_count
+        row["grades"] = [grade.to_dict() for grade in grades]
+        row["overall_pass"] = all(bool(grade.passed) for grade in grades)
+        stream_row(row)
+
+    results = _run_task_jobs(
+        jobs,
+        workers=worker_count,
+        python_executable=python_executable,
+        timeout_sec=timeout_sec,
+        env=env,
+        qa_mode=normalized_qa_mode,
+        runtime_isolation=runtime_isolation,
+        on_row=_finalize_row,
+    )
+    for (task, _index, _repeat_index), row in zip(job_meta, results):
+        task_groups.setdefault(task.id, []).append(row)
 
     task_reports: list[dict[str, Any]] = []
     for task in tasks:
@@ -488,9 +522,6 @@ def _run_registry(
             }
         )
 
-    run_id = f"harness_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    artifact_dir = ARTIFACT_ROOT / run_id
-    artifact_dir.mkdir(parents=True, exist_ok=True)
     durations = [float(row.get("duration_seconds") or 0.0) for row in results]
     summary = _summarize_results(task_reports)
     summary["pass_rate"] = round(sum(1 for row in results if bool(row.get("overall_pass"))) / len(results), 4) if results else 0.0
@@ -502,6 +533,7 @@ def _run_registry(
         "registry": str(registry.source) if registry.source else None,
         "task_count": len(tasks),
         "repeats": repeat_count,
+        "workers": worker_count,
         "selection": {
             "task_id": task_id,
             "limit": limit,
@@ -574,6 +606,8 @@ def run_harness_cli(argv: Sequence[str] | None = None) -> int:
             timeout_sec=max(10, int(parsed.timeout_sec)),
             session_prefix=str(parsed.session_prefix or "harness"),
             qa_mode=str(getattr(parsed, "qa_mode", "off") or "off"),
+            workers=getattr(parsed, "workers", 1),
+            runtime_isolation=getattr(parsed, "runtime_isolation", None),
         )
         if parsed.json:
             print(json.dumps(payload, ensure_ascii=False, indent=2))
@@ -582,6 +616,7 @@ def run_harness_cli(argv: Sequence[str] | None = None) -> int:
             print(f"artifact_dir: {payload.get('artifact_dir')}")
             print(f"task_count: {payload.get('task_count')}")
             print(f"repeats: {payload.get('repeats')}")
+            print(f"workers: {payload.get('workers')}")
             selection = payload.get("selection") if isinstance(payload.get("selection"), dict) else {}
             for key, value in selection.items():
                 if value not in (None, [], ""):
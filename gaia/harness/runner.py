@@ -3,14 +3,16 @@ from __future__ import annotations
 
 import json
 import os
+import queue
 import statistics
 import subprocess
 import sys
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Sequence
+from typing import Any, Callable, Dict, Iterable, Mapping, Sequence
 
 from .benchmark_policy import apply_benchmark_success_policy
 from .graders.blocked_vs_fail import BlockedVsFailGrader
@@ -20,6 +22,7 @@ from .graders.reason_codes import ReasonCodesGrader
 from .graders.status import StatusGrader
 from .registry import HarnessTask, TaskRegistry, load_builtin_registry, load_registry
 from .report_schema import GraderOutcome
+from .warm_worker import get_warm_worker, runtime_uses_persistent_worker
 
 WORKSPACE_ROOT = Path(__file__).resolve().parents[2]
 if str(WORKSPACE_ROOT) not in sys.path:
@@ -77,6 +80,17 @@ payload = json.loads({payload!r})
 task = payload["task"]
 session_id = payload["session_id"]
 benchmark_qa_mode = str(payload.get("qa_mode") or "").strip()
+worker_profile = str(os.getenv("GAIA_HARNESS_WORKER_PROFILE") or "").strip()
+if worker_profile:
+    try:
+        from gaia.src.phase4.mcp_local_dispatch_runtime import ensure_browser_profile
+        ensure_browser_profile(
+            os.getenv("GAIA_OPENCLAW_BASE_URL") or os.getenv("MCP_HOST_URL") or "",
+            profile=worker_profile,
+            timeout=(3, 30),
+        )
+    except Exception:
+        pass
 prepared_goal = _build_test_goal(url=task["url"], query=task["goal"])
 constraints = task.get("constraints") if isinstance(task.get("constraints"), dict) else {{}}
 expected_signals = task.get("expected_signals") if isinstance(task.get("expected_signals"), list) else []
@@ -129,6 +143,7 @@ def run_task(
     env: Mapping[str, str] | None = None,
     session_id: str | None = None,
     qa_mode: str | None = None,
+    runtime_isolation: str | None = None,
 ) -> Dict[str, Any]:
     task_payload = _task_payload(task)
     normalized_qa_mode = normalize_harness_qa_mode(qa_mode)
@@ -144,16 +159,38 @@ def run_task(
     elif normalized_qa_mode == ADAPTIVE_QA_MODE:
         run_env["GAIA_ADAPTIVE_QA"] = "1"
     run_env.setdefault("PYTHONUNBUFFERED", "1")
+    if runtime_isolation is None:
+        runtime_isolation = run_env.get("GAIA_BENCHMARK_RUNTIME_ISOLATION")
     try:
-        proc = subprocess.run(
-            [python_executable, "-u", "-c", code],
-            capture_output=True,
-            text=True,
-            timeout=timeout_sec,
-            env=run_env,
-            cwd=str(WORKSPACE_ROOT),
-            check=False,
-        )
+        if runtime_uses_persistent_worker(runtime_isolation):
+            worker = get_warm_worker(
+                python_executable=python_executable,
+                slot=run_env.get("GAIA_HARNESS_WORKER_INDEX") or "0",
+                env=run_env,
+            )
+            worker_result = worker.run(code, env=run_env, timeout_sec=timeout_sec)
+            if worker_result.timed_out:
+                raise subprocess.TimeoutExpired(
+                    cmd="gaia.harness.warm_worker",
+                    timeout=timeout_sec,
+                    output="\n".join([*worker_result.log_lines, worker_result.stdout]).strip(),
+                )
+            proc = subprocess.CompletedProcess(
+                args=["gaia.harness.warm_worker"],
+                returncode=int(worker_result.exit_code),
+                stdout=worker_result.stdout,
+                stderr="\n".join([*worker_result.log_lines, worker_result.error]).strip(),
+            )
+        else:
+            proc = subprocess.run(
+                [python_executable, "-u", "-c", code],
+                capture_output=True,
+                text=True,
+                timeout=timeout_sec,
+                env=run_env,
+                cwd=str(WORKSPACE_ROOT),
+                check=False,
+            )
         duration = round(time.monotonic() - started, 2)
     except subprocess.TimeoutExpired as exc:
         return {
@@ -213,6 +250,116 @@ def run_task(
     }
 
 
+def normalize_harness_workers(value: Any) -> int:
+    try:
+        workers = int(value or 1)
+    except Exception:
+        return 1
+    return max(1, min(workers, 32))
+
+
+def worker_profile_name(env: Mapping[str, str] | None, worker_index: int) -> str:
+    """OpenClaw profile owned by parallel worker ``worker_index``.
+
+    Shared by the harness worker pool and ``scripts/run_goal_benchmark.py`` slots
+    so both runners reuse the same browser profiles.
+    """
+    base_profile = str(
+        (env or {}).get("GAIA_OPENCLAW_PROFILE") or os.getenv("GAIA_OPENCLAW_PROFILE") or "openclaw"
+    ).strip() or "openclaw"
+    return f"{base_profile}-w{int(worker_index)}"
+
+
+def _worker_env(env: Mapping[str, str] | None, worker_index: int) -> dict[str, str]:
+    """Give each parallel worker its own OpenClaw profile so browser state never collides."""
+    merged = dict(env or {})
+    worker_profile = worker_profile_name(merged, worker_index)
+    merged["GAIA_OPENCLAW_PROFILE"] = worker_profile
+    merged["GAIA_HARNESS_WORKER_PROFILE"] = worker_profile
+    merged["GAIA_HARNESS_WORKER_INDEX"] = str(worker_index)
+    return merged
+
+
+def _run_task_jobs(
+    jobs: Sequence[tuple[HarnessTask, str]],
+    *,
+    workers: int = 1,
+    python_executable: str = sys.executable,
+    timeout_sec: int = 1800,
+    env: Mapping[str, str] | None = None,
+    qa_mode: str | None = None,
+    runtime_isolation: str | None = None,
+    on_row: Callable[[int, Dict[str, Any]], None] | None = None,
+) -> list[Dict[str, Any]]:
+    """Run ``(task, session_id)`` jobs and return their rows in job order.
+
+    With more than one worker the jobs are spread across a bounded pool of
+    child processes, each worker slot owning a distinct OpenClaw profile.
+    ``on_row`` is called on the calling thread as each job finishes, so
+    callers can stream rows before the whole batch completes.
+    """
+    worker_count = min(normalize_harness_workers(workers), max(1, len(jobs)))
+    rows: list[Dict[str, Any]] = [{} for _ in jobs]
+    if worker_count <= 1:
+        for job_index, (task, session_id) in enumerate(jobs):
+            row = run_task(
+                task,
+                python_executable=python_executable,
+                timeout_sec=timeout_sec,
+                env=env,
+                session_id=session_id,
+                qa_mode=qa_mode,
+                runtime_isolation=runtime_isolation,
+            )
+            rows[job_index] = row
+            if on_row is not None:
+                on_row(job_index, row)
+        return rows
+
+    free_slots: "queue.Queue[int]" = queue.Queue()
+    for worker_index in range(1, worker_count + 1):
+        free_slots.put(worker_index)
+
+    def _run_job(job_index: int) -> Dict[str, Any]:
+        task, session_id = jobs[job_index]
+        worker_index = free_slots.get()
+        try:
+            row = run_task(
+                task,
+                python_executable=python_executable,
+                timeout_sec=timeout_sec,
+                env=_worker_env(env, worker_index),
+                session_id=session_id,
+                qa_mode=qa_mode,
+                runtime_isolation=runtime_isolation,
+            )
+        finally:
+            free_slots.put(worker_index)
+        row["worker_index"] = worker_index
+        return row
+
+    with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="gaia-harness") as executor:
+        futures = {executor.submit(_run_job, job_index): job_index for job_index in range(len(jobs))}
+        for future in as_completed(futures):
+            job_index = futures[future]
+            row = future.result()
+            rows[job_index] = row
+            if on_row is not None:
+                on_row(job_index, row)
+    return rows
+
+
+def _open_row_stream(artifact_dir: Path) -> Callable[[Mapping[str, Any]], None]:
+    stream_path = artifact_dir / "results.jsonl"
+    stream_path.write_text("", encoding="utf-8")
+
+    def _append(row: Mapping[str, Any]) -> None:
+        with stream_path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    return _append
+
+
 def _grade_task_result(task: HarnessTask, row: Mapping[str, Any]) -> list[GraderOutcome]:
     grades: list[GraderOutcome] = []
     status_cfg = task.grader_configs.get("status", {}) if isinstance(task.grader_configs.get("status"), dict) else {}
@@ -405,6 +552,7 @@ def _write_markdown(path: Path, payload: Mapping[str, Any]) -> None:
         f"- generated_at: {payload.get('generated_at')}",
         f"- task_count: {payload.get('task_count')}",
         f"- repeats: {payload.get('repeats')}",
+        f"- workers: {payload.get('workers', 1)}",
         f"- qa_mode: {payload.get('qa_mode', 'off')}",
         f"- benchmark_mode: {payload.get('benchmark_mode', 'standard')}",
         "",
@@ -444,6 +592,8 @@ def run_registry(
     session_prefix: str = "harness",
     repeats: int = 1,
     qa_mode: str | None = None,
+    workers: int = 1,
+    runtime_isolation: str | None = None,
 ) -> dict[str, Any]:
     tasks = _select_tasks(registry, task_id=task_id, limit=limit)
     if suite_id is not None:
@@ -454,31 +604,46 @@ def run_registry(
     task_reports = []
     repeats = max(1, int(repeats))
     normalized_qa_mode = normalize_harness_qa_mode(qa_mode)
-    for index, task in enumerate(tasks, start=1):
-        task_rows = []
-        for attempt in range(1, repeats + 1):
-            session_id = f"{session_prefix}:{task.id}:{index}:{attempt}"
-            row = run_task(
-                task,
-                python_executable=python_executable,
-                timeout_sec=timeout_sec,
-                env=env,
-                session_id=session_id,
-                qa_mode=normalized_qa_mode,
-            )
-            row["attempt"] = attempt
-            row["attempt_index"] = attempt
-            row["attempt_count"] = repeats
-            grades = _grade_task_result(task, row)
-            row["grades"] = [grade.to_dict() for grade in grades]
-            row["overall_pass"] = all(bool(grade.passed) for grade in grades)
-            row["reason_code_counts"] = _summarize_reason_codes([row])
-            row["top_reason_codes"] = [
-                {"reason_code": code, "count": count}
-                for code, count in sorted(row["reason_code_counts"].items(), key=lambda item: (-int(item[1]), str(item[0])))[:10]
-            ]
-            task_rows.append(row)
-            results.append(row)
+    worker_count = normalize_harness_workers(workers)
+    run_id = f"harness_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    artifact_dir = ARTIFACT_ROOT / run_id
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    stream_row = _open_row_stream(artifact_dir)
+    jobs = [
+        (task, f"{session_prefix}:{task.id}:{index}:{attempt}")
+        for index, task in enumerate(tasks, start=1)
+        for attempt in range(1, repeats + 1)
+    ]
+
+    def _finalize_row(job_index: int, row: Dict[str, Any]) -> None:
+        task = jobs[job_index][0]
+        attempt = job_index % repeats + 1
+        row["attempt"] = attempt
+        row["attempt_index"] = attempt
+        row["attempt_count"] = repeats
+        grades = _grade_task_result(task, row)
+        row["grades"] = [grade.to_dict() for grade in grades]
+        row["overall_pass"] = all(bool(grade.passed) for grade in grades)
+        row["reason_code_counts"] = _summarize_reason_codes([row])
+        row["top_reason_codes"] = [
+            {"reason_code": code, "count": count}
+            for code, count in sorted(row["reason_code_counts"].items(), key=lambda item: (-int(item[1]), str(item[0])))[:10]
+        ]
+        stream_row(row)
+
+    job_rows = _run_task_jobs(
+        jobs,
+        workers=worker_count,
+        python_executable=python_executable,
+        timeout_sec=timeout_sec,
+        env=env,
+        qa_mode=normalized_qa_mode,
+        runtime_isolation=runtime_isolation,
+        on_row=_finalize_row,
+    )
+    for index, task in enumerate(tasks):
+        task_rows = job_rows[index * repeats : (index + 1) * repeats]
+        results.extend(task_rows)
         pass_count = sum(1 for row in task_rows if bool(row.get("overall_pass")))
         reason_code_counts = _summarize_reason_codes(task_rows)
         task_reports.append(
@@ -510,9 +675,6 @@ def run_registry(
                 ],
             }
         )
-    run_id = f"harness_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    artifact_dir = ARTIFACT_ROOT / run_id
-    artifact_dir.mkdir(parents=True, exist_ok=True)
     durations = [float(row.get("duration_seconds") or 0.0) for row in results]
     summary = _summarize_results(task_reports)
     summary["pass_rate"] = summary.get("pass_at_k", 0.0)
@@ -531,6 +693,7 @@ def run_registry(
         "registry": str(registry.source) if registry.source else None,
         "task_count": len(tasks),
         "repeats": repeats,
+        "workers": worker_count,
         "qa_mode": normalized_qa_mode or "off",
         "benchmark_mode": benchmark_mode_label(normalized_qa_mode),
         "results": results,
@@ -552,6 +715,7 @@ __all__ = [
     "load_builtin_registry",
     "load_registry",
     "normalize_harness_qa_mode",
+    "normalize_harness_workers",
     "run_registry",
     "run_task",
 ]
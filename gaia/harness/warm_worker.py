@@ -0,0 +1,369 @@
+"""Long-lived Python worker that runs generated harness/benchmark child code.
+
+The cold path spawns ``python -c <child code>`` per task, paying the
+``gaia.src.phase4`` import and client construction cost every time. A warm
+worker keeps one interpreter alive, receives the same child code plus the
+task environment as JSON lines on stdin, and answers on stdout with
+marker-prefixed JSON frames: one ``{"type": "line"}`` frame per line the task
+prints, sent as soon as the line is complete, then a ``{"type": "result"}``
+frame. Any other stdout line (e.g. written straight to ``sys.__stdout__``) is
+task log output. Both are passed through to the caller as they arrive.
+"""
+from __future__ import annotations
+
+import atexit
+import contextlib
+import io
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+PERSISTENT_WORKER_RUNTIME = "persistent-worker-cold-state"
+PERSISTENT_WORKER_ALIASES = frozenset(
+    {
+        PERSISTENT_WORKER_RUNTIME,
+        "persistent-worker",
+        "persistent",
+        "warm-worker",
+        "worker",
+    }
+)
+RESPONSE_MARKER = "@@GAIA_WARM_WORKER_RESULT@@"
+_FRAME_LINE = "line"
+_FRAME_RESULT = "result"
+_DEFAULT_MAX_TASKS = 25
+# Imported rather than run with ``-m`` so ``gaia.harness`` (which imports this
+# module) does not trigger runpy's double-import warning on every spawn.
+_WORKER_BOOTSTRAP = "from gaia.harness.warm_worker import main; raise SystemExit(main())"
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def runtime_uses_persistent_worker(runtime_isolation: str | None) -> bool:
+    raw = str(runtime_isolation or "").strip().lower().replace("_", "-")
+    return raw in PERSISTENT_WORKER_ALIASES
+
+
+def warm_worker_max_tasks() -> int:
+    raw = str(os.getenv("GAIA_WARM_WORKER_MAX_TASKS", "") or "").strip()
+    try:
+        value = int(raw) if raw else _DEFAULT_MAX_TASKS
+    except Exception:
+        return _DEFAULT_MAX_TASKS
+    return max(1, value)
+
+
+@dataclass
+class WarmWorkerResult:
+    exit_code: int
+    stdout: str = ""
+    log_lines: List[str] = field(default_factory=list)
+    error: str = ""
+    timed_out: bool = False
+    crashed: bool = False
+
+
+class WarmWorker:
+    """Client side of one persistent worker process."""
+
+    def __init__(
+        self,
+        *,
+        python_executable: str = sys.executable,
+        env: Mapping[str, str] | None = None,
+        cwd: Path | str = WORKSPACE_ROOT,
+        max_tasks: int | None = None,
+    ) -> None:
+        self.python_executable = python_executable
+        self.cwd = str(cwd)
+        self.max_tasks = max(1, int(max_tasks or warm_worker_max_tasks()))
+        self.tasks_run = 0
+        self.spawn_count = 0
+        self._spawn_env = dict(env or os.environ)
+        self._proc: Optional[subprocess.Popen[str]] = None
+        self._lines: "queue.Queue[Optional[Tuple[str, Any]]]" = queue.Queue()
+        self._lock = threading.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _spawn(self) -> None:
+        env = dict(self._spawn_env)
+        env.setdefault("PYTHONUNBUFFERED", "1")
+        env["PYTHONIOENCODING"] = "utf-8"
+        self._lines = queue.Queue()
+        self._proc = subprocess.Popen(
+            [self.python_executable, "-u", "-c", _WORKER_BOOTSTRAP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=env,
+            cwd=self.cwd,
+            encoding="utf-8",
+            errors="replace",
+        )
+        self.tasks_run = 0
+        self.spawn_count += 1
+        reader = threading.Thread(
+            target=self._pump_stdout,
+            args=(self._proc, self._lines),
+            name="gaia-warm-worker-reader",
+            daemon=True,
+        )
+        reader.start()
+
+    @staticmethod
+    def _pump_stdout(proc: subprocess.Popen[str], lines: "queue.Queue[Optional[Tuple[str, Any]]]") -> None:
+        """Split worker stdout into ``("raw", text)``, ``("line", text)``, ``("result", dict)`` or ``("bad", error)``."""
+        assert proc.stdout is not None
+        for raw_line in proc.stdout:
+            line = raw_line.rstrip("\n")
+            marker_at = line.find(RESPONSE_MARKER)
+            if marker_at < 0:
+                if line:
+                    lines.put(("raw", line))
+                continue
+            prefix = line[:marker_at]
+            if prefix.strip():
+                lines.put(("raw", prefix))
+            try:
+                frame = json.loads(line[marker_at + len(RESPONSE_MARKER):])
+            except Exception as exc:
+                lines.put(("bad", str(exc)))
+                continue
+            if not isinstance(frame, dict):
+                lines.put(("bad", "frame is not an object"))
+            elif frame.get("type") == _FRAME_LINE:
+                lines.put((_FRAME_LINE, str(frame.get("line") or "")))
+            else:
+                lines.put((_FRAME_RESULT, frame))
+        lines.put(None)
+
+    def close(self) -> None:
+        proc = self._proc
+        self._proc = None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except Exception:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+
+    def run(
+        self,
+        code: str,
+        *,
+        env: Mapping[str, str] | None = None,
+        timeout_sec: float = 1800,
+        on_line: Callable[[str], None] | None = None,
+    ) -> WarmWorkerResult:
+        """Execute child code in the worker; recycles the process on crash, timeout or task budget."""
+        with self._lock:
+            if not self.alive:
+                self._spawn()
+            proc = self._proc
+            assert proc is not None and proc.stdin is not None
+            request = {"code": code, "env": dict(env) if env is not None else None}
+            log_lines: List[str] = []
+            stdout_lines: List[str] = []
+            try:
+                proc.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+                proc.stdin.flush()
+            except Exception as exc:
+                self.close()
+                return WarmWorkerResult(exit_code=1, error=f"warm_worker_write_failed: {exc}", crashed=True)
+
+            deadline = time.monotonic() + max(1.0, float(timeout_sec))
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._kill()
+                    # 이미 스트리밍된 줄은 타임아웃이어도 그대로 돌려준다
+                    return WarmWorkerResult(
+                        exit_code=124,
+                        stdout=_join_lines(stdout_lines),
+                        log_lines=log_lines,
+                        timed_out=True,
+                    )
+                try:
+                    item = self._lines.get(timeout=remaining)
+                except queue.Empty:
+                    continue
+                if item is None:
+                    try:
+                        exit_code = proc.wait(timeout=5)
+                    except Exception:
+                        exit_code = proc.poll()
+                    self._proc = None
+                    return WarmWorkerResult(
+                        exit_code=int(exit_code if exit_code not in (None, 0) else 1),
+                        stdout=_join_lines(stdout_lines),
+                        log_lines=log_lines,
+                        error="warm_worker_exited",
+                        crashed=True,
+                    )
+                kind, payload = item
+                if kind == "bad":
+                    self._kill()
+                    return WarmWorkerResult(
+                        exit_code=1,
+                        stdout=_join_lines(stdout_lines),
+                        log_lines=log_lines,
+                        error=f"warm_worker_bad_response: {payload}",
+                        crashed=True,
+                    )
+                if kind == _FRAME_RESULT:
+                    response = payload
+                    break
+                (stdout_lines if kind == _FRAME_LINE else log_lines).append(payload)
+                if on_line is not None:
+                    on_line(payload)
+
+            self.tasks_run += 1
+            if self.tasks_run >= self.max_tasks:
+                self.close()
+            return WarmWorkerResult(
+                exit_code=int(response.get("exit_code") or 0),
+                stdout=_join_lines(stdout_lines),
+                log_lines=log_lines,
+                error=str(response.get("error") or ""),
+            )
+
+    def _kill(self) -> None:
+        proc = self._proc
+        self._proc = None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=5)
+        except Exception:
+            pass
+
+
+def _join_lines(lines: List[str]) -> str:
+    return "".join(f"{line}\n" for line in lines)
+
+
+_WORKERS_LOCK = threading.Lock()
+_WORKERS: Dict[Tuple[str, str], WarmWorker] = {}
+
+
+def get_warm_worker(
+    *,
+    python_executable: str = sys.executable,
+    slot: str = "0",
+    env: Mapping[str, str] | None = None,
+) -> WarmWorker:
+    """Return the shared worker for ``(python_executable, slot)``, creating it on first use."""
+    key = (str(python_executable), str(slot or "0"))
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(key)
+        if worker is None:
+            worker = WarmWorker(python_executable=python_executable, env=env)
+            _WORKERS[key] = worker
+        return worker
+
+
+def close_warm_workers() -> None:
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+    for worker in workers:
+        worker.close()
+
+
+atexit.register(close_warm_workers)
+
+
+class _LineFrameWriter(io.TextIOBase):
+    """Task stdout/stderr that forwards every completed line to the parent as a ``line`` frame."""
+
+    def __init__(self, channel: Any) -> None:
+        self._channel = channel
+        self._pending = ""
+        self._lock = threading.Lock()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            self._pending += str(text)
+            *complete, self._pending = self._pending.split("\n")
+            for line in complete:
+                self._send(line)
+        return len(text)
+
+    def close_partial(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._send(self._pending)
+                self._pending = ""
+
+    def _send(self, line: str) -> None:
+        _write_frame(self._channel, {"type": _FRAME_LINE, "line": line})
+
+
+def _write_frame(channel: Any, frame: Mapping[str, Any]) -> None:
+    channel.write(RESPONSE_MARKER + json.dumps(frame, ensure_ascii=False) + "\n")
+    channel.flush()
+
+
+def _execute_request(request: Mapping[str, Any], channel: Any) -> Dict[str, Any]:
+    env = request.get("env")
+    if isinstance(env, dict):
+        os.environ.clear()
+        os.environ.update({str(key): str(value) for key, value in env.items()})
+    writer = _LineFrameWriter(channel)
+    exit_code = 0
+    error = ""
+    namespace: Dict[str, Any] = {"__name__": "__gaia_warm_task__"}
+    with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+        try:
+            exec(compile(str(request.get("code") or ""), "<gaia-warm-task>", "exec"), namespace)
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+        except Exception:
+            exit_code = 1
+            error = traceback.format_exc()
+            writer.write(error)
+    writer.close_partial()
+    return {"exit_code": exit_code, "error": error}
+
+
+def main() -> int:
+    channel = sys.__stdout__
+    for raw_line in sys.stdin:
+        if not raw_line.strip():
+            continue
+        try:
+            request = json.loads(raw_line)
+        except Exception as exc:
+            response = {"exit_code": 1, "error": f"invalid_request: {exc}"}
+        else:
+            response = _execute_request(request if isinstance(request, dict) else {}, channel)
+        # 태스크가 sys.__stdout__에 개행 없이 남긴 출력과 프레임이 섞이지 않게 줄을 끊는다
+        channel.write("\n")
+        _write_frame(channel, {"type": _FRAME_RESULT, **response})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,7 @@ import html
 import json
 import re
 import shutil
+import sqlite3
 import statistics
 from dataclasses import dataclass
 from pathlib import Path
@@ -842,10 +843,7 @@ def override_suite_urls(suite_payload: Mapping[str, Any], target_url: str) -> di
     return payload
 
 
-def _summary_matches_site(summary: Mapping[str, Any], preset: BenchmarkPreset, selected_url: str) -> bool:
-    site = summary.get("site") if isinstance(summary.get("site"), Mapping) else {}
-    base_url = str(site.get("base_url") or "").strip()
-    host = extract_url_host(base_url)
+def _host_matches_site(host: str, preset: BenchmarkPreset, selected_url: str) -> bool:
     selected_host = extract_url_host(selected_url)
     if selected_host and host == selected_host:
         return True
@@ -854,6 +852,268 @@ def _summary_matches_site(summary: Mapping[str, Any], preset: BenchmarkPreset, s
     return False
 
 
+def _summary_matches_site(summary: Mapping[str, Any], preset: BenchmarkPreset, selected_url: str) -> bool:
+    site = summary.get("site") if isinstance(summary.get("site"), Mapping) else {}
+    base_url = str(site.get("base_url") or "").strip()
+    return _host_matches_site(extract_url_host(base_url), preset, selected_url)
+
+
+def benchmark_report_catalog_path(workspace_root: Path) -> Path:
+    return workspace_root / "artifacts" / "cache" / "benchmark_reports.sqlite3"
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return int(stat.st_mtime_ns), int(stat.st_size)
+
+
+def _load_report_results(result_path: Path) -> list[dict[str, Any]]:
+    if not result_path.exists():
+        return []
+    try:
+        parsed = json.loads(result_path.read_text(encoding="utf-8"))
+    except Exception:
+        return []
+    if not isinstance(parsed, list):
+        return []
+    return [row for row in parsed if isinstance(row, dict)]
+
+
+class BenchmarkReportCatalog:
+    """SQLite index over ``artifacts/benchmarks/*/summary.json``.
+
+    ``refresh()`` only stats each run directory and re-parses runs whose
+    summary/results mtime or size changed, so opening the benchmark board no
+    longer JSON-decodes every run. Queries filter on the indexed host and
+    failure columns and decode the stored payloads of matching rows only.
+    The cache directory and database file are only created on the first insert,
+    so workspaces without benchmark runs are left untouched.
+    """
+
+    def __init__(self, workspace_root: Path, db_path: Path | str | None = None) -> None:
+        self.root = workspace_root / "artifacts" / "benchmarks"
+        self.db_path = Path(db_path) if db_path else benchmark_report_catalog_path(workspace_root)
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self, *, create: bool) -> sqlite3.Connection | None:
+        """Open the catalog; without ``create`` a missing database yields ``None``."""
+        if self._conn is not None:
+            return self._conn
+        if not create and not self.db_path.exists():
+            return None
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            self._create_schema(conn)
+        except (OSError, sqlite3.Error):
+            # 쓰기 불가 워크스페이스에서는 호출 단위 인메모리 인덱스로 동작
+            conn = sqlite3.connect(":memory:")
+            self._create_schema(conn)
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS benchmark_reports (
+                artifact_dir TEXT PRIMARY KEY,
+                sort_key TEXT NOT NULL,
+                valid INTEGER NOT NULL,
+                host TEXT NOT NULL,
+                base_url TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                status_counts TEXT NOT NULL,
+                result_count INTEGER NOT NULL,
+                total_duration_seconds REAL NOT NULL,
+                has_failures INTEGER NOT NULL,
+                summary_mtime_ns INTEGER NOT NULL,
+                summary_size INTEGER NOT NULL,
+                results_mtime_ns INTEGER,
+                results_size INTEGER,
+                summary_json TEXT NOT NULL,
+                results_json TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_benchmark_reports_sort ON benchmark_reports(valid, sort_key)"
+        )
+        conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "BenchmarkReportCatalog":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def refresh(self) -> None:
+        """Revalidate every indexed run against the filesystem by mtime/size."""
+        known: dict[str, tuple[Any, ...]] = {}
+        existing = self._connection(create=False)
+        if existing is not None:
+            known = {
+                str(row[0]): (row[1], row[2], row[3], row[4])
+                for row in existing.execute(
+                    "SELECT artifact_dir, summary_mtime_ns, summary_size, results_mtime_ns, results_size"
+                    " FROM benchmark_reports"
+                )
+            }
+        seen: set[str] = set()
+        if self.root.exists():
+            for entry in self.root.iterdir():
+                summary_sig = _file_signature(entry / "summary.json")
+                if summary_sig is None:
+                    continue
+                artifact_dir = str(entry)
+                seen.add(artifact_dir)
+                results_sig = _file_signature(entry / "results.json")
+                signature = (*summary_sig, *(results_sig or (None, None)))
+                if known.get(artifact_dir) == signature:
+                    continue
+                self._index(entry, summary_sig, results_sig)
+        if self._conn is None:
+            return
+        stale = [(artifact_dir,) for artifact_dir in known if artifact_dir not in seen]
+        if stale:
+            self._conn.executemany("DELETE FROM benchmark_reports WHERE artifact_dir = ?", stale)
+        self._conn.commit()
+
+    def record(self, artifact_dir: Path) -> None:
+        """Index one finished run immediately, without waiting for the next refresh."""
+        try:
+            if artifact_dir.resolve().parent != self.root.resolve():
+                return
+        except OSError:
+            return
+        # refresh()와 같은 키를 쓰도록 벤치 루트 기준 경로로 정규화
+        entry = self.root / artifact_dir.name
+        summary_sig = _file_signature(entry / "summary.json")
+        if summary_sig is None:
+            return
+        self._index(entry, summary_sig, _file_signature(entry / "results.json"))
+        self._connection(create=True).commit()
+
+    def _index(
+        self,
+        artifact_dir: Path,
+        summary_sig: tuple[int, int],
+        results_sig: tuple[int, int] | None,
+    ) -> None:
+        try:
+            summary = json.loads((artifact_dir / "summary.json").read_text(encoding="utf-8"))
+        except Exception:
+            summary = None
+        valid = isinstance(summary, Mapping)
+        summary = dict(summary) if valid else {}
+        results = _load_report_results(artifact_dir / "results.json") if valid else []
+        site = summary.get("site") if isinstance(summary.get("site"), Mapping) else {}
+        base_url = str(site.get("base_url") or "").strip()
+        status_counts = summary.get("status_counts") if isinstance(summary.get("status_counts"), Mapping) else {}
+        total_duration = sum(
+            float(row["duration_seconds"])
+            for row in results
+            if isinstance(row.get("duration_seconds"), (int, float))
+        )
+        self._connection(create=True).execute(
+            """
+            INSERT OR REPLACE INTO benchmark_reports (
+                artifact_dir, sort_key, valid, host, base_url, started_at, status_counts,
+                result_count, total_duration_seconds, has_failures,
+                summary_mtime_ns, summary_size, results_mtime_ns, results_size,
+                summary_json, results_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                str(artifact_dir),
+                # glob("*/summary.json") 정렬 순서와 동일하게 맞추기 위해 구분자를 붙인다
+                f"{artifact_dir.name}/",
+                int(valid),
+                extract_url_host(base_url),
+                base_url,
+                str(summary.get("started_at") or ""),
+                json.dumps(dict(status_counts), ensure_ascii=False, default=str),
+                len(results),
+                total_duration,
+                int(valid and benchmark_report_has_failures({"summary": summary, "results": results})),
+                summary_sig[0],
+                summary_sig[1],
+                results_sig[0] if results_sig else None,
+                results_sig[1] if results_sig else None,
+                json.dumps(summary, ensure_ascii=False, default=str),
+                json.dumps(results, ensure_ascii=False, default=str),
+            ),
+        )
+
+    def query(
+        self,
+        *,
+        preset: BenchmarkPreset,
+        selected_url: str = "",
+        limit: int = 12,
+        include_payloads: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Return the newest runs for ``preset``, in the same order as the old glob scan."""
+        conn = self._connection(create=False)
+        if conn is None:
+            return []
+        max_reports = max(1, int(limit))
+        matched: list[tuple[Any, ...]] = []
+        rows = conn.execute(
+            "SELECT artifact_dir, host, has_failures FROM benchmark_reports WHERE valid = 1 ORDER BY sort_key DESC"
+        )
+        for row in rows:
+            if not _host_matches_site(str(row[1]), preset, selected_url):
+                continue
+            matched.append(row)
+            if len(matched) >= max_reports:
+                break
+        reports: list[dict[str, Any]] = []
+        for artifact_dir, _host, has_failures in matched:
+            report: dict[str, Any] = {
+                "artifact_dir": artifact_dir,
+                "summary_path": str(Path(artifact_dir) / "summary.json"),
+                "results_path": str(Path(artifact_dir) / "results.json"),
+                "has_failures": bool(has_failures),
+            }
+            if include_payloads:
+                summary_json, results_json = conn.execute(
+                    "SELECT summary_json, results_json FROM benchmark_reports WHERE artifact_dir = ?",
+                    (artifact_dir,),
+                ).fetchone()
+                report["summary"] = json.loads(summary_json)
+                report["results"] = json.loads(results_json)
+            reports.append(report)
+        return reports
+
+    def forget(self, artifact_dirs: Iterable[str]) -> None:
+        conn = self._connection(create=False)
+        if conn is None:
+            return
+        conn.executemany(
+            "DELETE FROM benchmark_reports WHERE artifact_dir = ?",
+            [(str(item),) for item in artifact_dirs],
+        )
+        conn.commit()
+
+
+def record_benchmark_report(workspace_root: Path, artifact_dir: Path) -> None:
+    """Add a just-finished run to the report catalog; failures are non-fatal."""
+    try:
+        with BenchmarkReportCatalog(workspace_root) as catalog:
+            catalog.record(Path(artifact_dir))
+    except Exception:
+        pass
+
+
 def scan_benchmark_reports(
     *,
     workspace_root: Path,
@@ -861,43 +1121,18 @@ def scan_benchmark_reports(
     selected_url: str = "",
     limit: int = 12,
     registry_payload: Mapping[str, Any] | None = None,
+    preset: BenchmarkPreset | None = None,
 ) -> list[dict[str, Any]]:
-    preset = resolve_benchmark_site(registry_payload or {}, site_key) or find_preset(site_key)
-    if preset is None:
-        return []
-    root = workspace_root / "artifacts" / "benchmarks"
-    if not root.exists():
+    target_preset = preset or resolve_benchmark_site(registry_payload or {}, site_key) or find_preset(site_key)
+    if target_preset is None:
         return []
-    reports: list[dict[str, Any]] = []
-    for summary_path in sorted(root.glob("*/summary.json"), reverse=True):
-        try:
-            summary = json.loads(summary_path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        if not isinstance(summary, Mapping):
-            continue
-        if not _summary_matches_site(summary, preset, selected_url):
-            continue
-        result_path = summary_path.with_name("results.json")
-        results: list[dict[str, Any]] = []
-        if result_path.exists():
-            try:
-                parsed = json.loads(result_path.read_text(encoding="utf-8"))
-                if isinstance(parsed, list):
-                    results = [row for row in parsed if isinstance(row, dict)]
-            except Exception:
-                results = []
-        reports.append(
-            {
-                "artifact_dir": str(summary_path.parent),
-                "summary_path": str(summary_path),
-                "results_path": str(result_path),
-                "summary": dict(summary),
-                "results": results,
-            }
-        )
-        if len(reports) >= max(1, int(limit)):
-            break
+    with BenchmarkReportCatalog(workspace_root) as catalog:
+        if not catalog.root.exists():
+            return []
+        catalog.refresh()
+        reports = catalog.query(preset=target_preset, selected_url=selected_url, limit=limit)
+    for report in reports:
+        report.pop("has_failures", None)
     return reports
 
 
@@ -944,55 +1179,37 @@ def prune_benchmark_reports(
             "deleted_dirs": [],
             "skipped_success": 0,
         }
-    root = (workspace_root / "artifacts" / "benchmarks").resolve()
-    reports: list[dict[str, Any]] = []
-    if root.exists():
-        for summary_path in sorted(root.glob("*/summary.json"), reverse=True):
-            try:
-                summary = json.loads(summary_path.read_text(encoding="utf-8"))
-            except Exception:
+    with BenchmarkReportCatalog(workspace_root) as catalog:
+        root = catalog.root.resolve()
+        reports: list[dict[str, Any]] = []
+        if root.exists():
+            catalog.refresh()
+            reports = catalog.query(
+                preset=target_preset,
+                selected_url=selected_url,
+                limit=limit,
+                include_payloads=False,
+            )
+        deleted_dirs: list[str] = []
+        deleted_keys: list[str] = []
+        skipped_success = 0
+        for report in reports:
+            if failed_only and not report["has_failures"]:
+                skipped_success += 1
                 continue
-            if not isinstance(summary, Mapping):
+            artifact_dir = Path(str(report.get("artifact_dir") or "")).resolve()
+            try:
+                artifact_dir.relative_to(root)
+            except ValueError:
                 continue
-            if not _summary_matches_site(summary, target_preset, selected_url):
+            if artifact_dir == root or not artifact_dir.exists():
                 continue
-            result_path = summary_path.with_name("results.json")
-            results: list[dict[str, Any]] = []
-            if result_path.exists():
-                try:
-                    parsed = json.loads(result_path.read_text(encoding="utf-8"))
-                    if isinstance(parsed, list):
-                        results = [row for row in parsed if isinstance(row, dict)]
-                except Exception:
-                    results = []
-            reports.append(
-                {
-                    "artifact_dir": str(summary_path.parent),
-                    "summary_path": str(summary_path),
-                    "results_path": str(result_path),
-                    "summary": dict(summary),
-                    "results": results,
-                }
-            )
-            if len(reports) >= max(1, int(limit)):
-                break
-    deleted_dirs: list[str] = []
-    skipped_success = 0
-    for report in reports:
-        has_failures = benchmark_report_has_failures(report)
-        if failed_only and not has_failures:
-            skipped_success += 1
-            continue
-        artifact_dir = Path(str(report.get("artifact_dir") or "")).resolve()
-        try:
-            artifact_dir.relative_to(root)
-        except ValueError:
-            continue
-        if artifact_dir == root or not artifact_dir.exists():
-            continue
-        deleted_dirs.append(str(artifact_dir))
-        if not dry_run:
-            shutil.rmtree(artifact_dir)
+            deleted_dirs.append(str(artifact_dir))
+            if not dry_run:
+                shutil.rmtree(artifact_dir)
+                deleted_keys.append(str(report["artifact_dir"]))
+        if deleted_keys:
+            catalog.forget(deleted_keys)
     return {
         "scanned": len(reports),
         "matched": len(reports),
@@ -1303,9 +1520,11 @@ def _infer_provider_from_model(model_name: str) -> str:
 __all__ = [
     "BENCHMARK_PRESETS",
     "BenchmarkPreset",
+    "BenchmarkReportCatalog",
     "append_scenario_to_suite",
     "benchmark_report_has_failures",
     "benchmark_registry_path",
+    "benchmark_report_catalog_path",
     "build_benchmark_catalog",
     "build_benchmark_site_catalog",
     "build_scenario_labels",
@@ -1325,6 +1544,7 @@ __all__ = [
     "load_suite_payload",
     "override_suite_urls",
     "prune_benchmark_reports",
+    "record_benchmark_report",
     "render_benchmark_reports_html",
     "replace_scenario_in_suite",
     "resolve_benchmark_site",
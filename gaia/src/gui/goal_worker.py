@@ -39,7 +39,7 @@ from gaia.src.phase4.goal_driven.adaptive_qa_runtime import (
 from gaia.src.phase4.goal_driven.multi_user_interaction_runtime import close_participant_browser_contexts
 from gaia.src.tracker.checklist import ChecklistTracker
 from gaia.src.utils.config import CONFIG
-from gaia.src.gui.benchmark_mode import override_suite_urls
+from gaia.src.gui.benchmark_mode import override_suite_urls, record_benchmark_report
 
 BATTLE_DEFAULT_SITE_URL = "https://gaia-battle-web.vercel.app"
 BATTLE_DEFAULT_SESSION_ID = "battle-live"
@@ -731,6 +731,7 @@ class BenchmarkWorker(QObject):
                     break
 
             return_code = self._process.wait()
+            record_benchmark_report(self._workspace_root, output_dir)
             summary_path = output_dir / "summary.json"
             results_path = output_dir / "results.json"
             summary_payload = json.loads(summary_path.read_text(encoding="utf-8")) if summary_path.exists() else {}
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import atexit
 import base64
+import contextlib
 import json
 import os
 import queue
@@ -10,20 +11,52 @@ import subprocess
 import tempfile
 import threading
 import time
+import weakref
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator
+
+_DEFAULT_POOL_SIZE = 2
+_DEFAULT_MAX_TURNS_PER_CLIENT = 4
+_DEFAULT_IDLE_RECYCLE_SEC = 300.0
 
 
 class CodexAppServerError(RuntimeError):
     """Raised when the persistent Codex app-server transport cannot complete a turn."""
 
 
+class CodexAppServerRequestError(CodexAppServerError):
+    """The app-server answered a request with a JSON-RPC error."""
+
+
+class CodexAppServerInputRejected(CodexAppServerRequestError):
+    """turn/start rejected the turn input (e.g. inline image data URLs)."""
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = str(os.getenv(name, "") or "").strip().lower()
+    if not raw:
+        return default
+    return raw not in {"0", "false", "no", "off", "disabled"}
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = str(os.getenv(name, "") or "").strip()
+    try:
+        return float(raw) if raw else default
+    except Exception:
+        return default
+
+
 class CodexAppServerClient:
     """Small JSON-RPC client for `codex app-server --listen stdio://`.
 
     The goal is narrower than OpenClaw's full native Codex harness: keep one
     app-server process alive and ask it for bounded text/vision decisions,
     while keeping GAIA's existing browser dispatch and verifier loop intact.
+
+    One reader thread routes responses by request id and notifications by
+    thread id, so several turns can run at once, each on its own app-server
+    thread. Use ``CodexAppServerPool`` to share clients across agents.
     """
 
     _BASE_INSTRUCTIONS = (
@@ -46,25 +79,44 @@ class CodexAppServerClient:
         self.timeout_sec = max(15, min(int(timeout_sec), 600))
         self.reasoning_effort = (reasoning_effort or os.getenv("GAIA_CODEX_REASONING_EFFORT") or "low").strip() or "low"
         self.reuse_thread = reuse_thread
+        self.inline_images = _env_flag("GAIA_CODEX_APP_SERVER_INLINE_IMAGES", True)
         self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._state_lock = threading.Lock()
         self._next_id = 1
         self._process: subprocess.Popen[str] | None = None
-        self._messages: queue.Queue[dict[str, Any]] = queue.Queue()
+        self._responses: dict[int, queue.Queue[dict[str, Any]]] = {}
+        self._thread_events: dict[str, queue.Queue[dict[str, Any]]] = {}
+        self._idle_threads: list[str] = []
         self._stderr_lines: queue.Queue[str] = queue.Queue()
-        self._thread_id: str | None = None
+        self._broken = False
+        self.in_flight = 0
+        self.last_used_at = time.monotonic()
         self._tmpdir = tempfile.TemporaryDirectory(prefix="gaia-codex-appserver-")
         self._cwd = Path(self._tmpdir.name) / "workspace"
         self._cwd.mkdir(parents=True, exist_ok=True)
-        atexit.register(self.close)
+        _LIVE_CLIENTS.add(self)
 
     @property
     def is_started(self) -> bool:
         return self._process is not None and self._process.poll() is None
 
+    @property
+    def healthy(self) -> bool:
+        """False once the process died or a turn left the protocol in an unknown state."""
+        if self._broken:
+            return False
+        return self._process is None or self._process.poll() is None
+
+    def mark_broken(self) -> None:
+        self._broken = True
+
     def close(self) -> None:
         with self._lock:
             proc = self._process
             self._process = None
+            with self._state_lock:
+                self._idle_threads.clear()
             if proc and proc.poll() is None:
                 proc.terminate()
                 try:
@@ -76,19 +128,40 @@ class CodexAppServerClient:
             except Exception:
                 pass
 
-    def analyze_text(self, prompt: str) -> str:
-        return self._run_turn([self._text_input(prompt)])
+    def analyze_text(self, prompt: str, *, on_delta: Callable[[str], None] | None = None) -> str:
+        return self._run_turn([self._text_input(prompt)], on_delta=on_delta)
 
-    def analyze_with_images(self, prompt: str, images: Iterable[str]) -> str:
+    def analyze_with_images(
+        self,
+        prompt: str,
+        images: Iterable[str],
+        *,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> str:
+        images = list(images)
+        if self.inline_images:
+            try:
+                return self._run_turn(
+                    [self._text_input(prompt), *(self._image_input(image) for image in images)],
+                    on_delta=on_delta,
+                )
+            except CodexAppServerInputRejected:
+                # data URL 이미지를 받지 않는 app-server 버전이면 임시 파일 경로로 되돌린다
+                self.inline_images = False
         inputs: list[dict[str, Any]] = [self._text_input(prompt)]
         image_paths = self._write_images(images)
         inputs.extend({"type": "localImage", "path": str(path)} for path in image_paths)
-        return self._run_turn(inputs)
+        return self._run_turn(inputs, on_delta=on_delta)
 
     @staticmethod
     def _text_input(text: str) -> dict[str, Any]:
         return {"type": "text", "text": text, "text_elements": []}
 
+    @staticmethod
+    def _image_input(image_b64: str) -> dict[str, Any]:
+        url = image_b64 if image_b64.startswith("data:") else f"data:image/png;base64,{image_b64}"
+        return {"type": "image", "url": url}
+
     def _write_images(self, images: Iterable[str]) -> list[Path]:
         paths: list[Path] = []
         image_dir = Path(self._tmpdir.name) / "images"
@@ -103,6 +176,8 @@ class CodexAppServerClient:
     def _start(self) -> None:
         if self.is_started:
             return
+        with self._state_lock:
+            self._idle_threads.clear()
         cmd = [
             self.codex_bin,
             "app-server",
@@ -151,9 +226,25 @@ class CodexAppServerClient:
             if not line:
                 continue
             try:
-                self._messages.put(json.loads(line))
+                message = json.loads(line)
             except Exception:
                 self._stderr_lines.put(f"invalid_json_stdout:{line[:500]}")
+                continue
+            if isinstance(message, dict):
+                self._route(message)
+
+    def _route(self, message: dict[str, Any]) -> None:
+        if "id" in message and "method" in message:
+            self._handle_server_request(message)
+            return
+        with self._state_lock:
+            if "id" in message:
+                target = self._responses.get(message.get("id"))  # type: ignore[arg-type]
+            else:
+                params = message.get("params") if isinstance(message.get("params"), dict) else {}
+                target = self._thread_events.get(str(params.get("threadId") or ""))
+        if target is not None:
+            target.put(message)
 
     def _read_stderr(self) -> None:
         proc = self._process
@@ -168,36 +259,50 @@ class CodexAppServerClient:
         proc = self._process
         if not proc or proc.poll() is not None or not proc.stdin:
             raise CodexAppServerError("codex app-server is not running")
-        proc.stdin.write(json.dumps(payload, ensure_ascii=False) + "\n")
-        proc.stdin.flush()
+        with self._write_lock:
+            proc.stdin.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            proc.stdin.flush()
 
     def _request(self, method: str, params: Any, *, timeout: int | None = None) -> dict[str, Any]:
-        with self._lock:
+        responses: queue.Queue[dict[str, Any]] = queue.Queue()
+        with self._state_lock:
             request_id = self._next_id
             self._next_id += 1
+            self._responses[request_id] = responses
+        try:
             self._send({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
-            return self._wait_for_response(request_id, timeout=timeout or self.timeout_sec)
+            return self._wait_for_response(request_id, responses, timeout=timeout or self.timeout_sec)
+        finally:
+            with self._state_lock:
+                self._responses.pop(request_id, None)
 
-    def _wait_for_response(self, request_id: int, *, timeout: int) -> dict[str, Any]:
+    def _wait_for_response(
+        self,
+        request_id: int,
+        responses: queue.Queue[dict[str, Any]],
+        *,
+        timeout: int,
+    ) -> dict[str, Any]:
         deadline = time.monotonic() + timeout
         while time.monotonic() < deadline:
-            if self._process and self._process.poll() is not None:
-                raise CodexAppServerError(f"codex app-server exited with code {self._process.returncode}: {self._stderr_tail()}")
+            self._raise_if_exited()
             try:
-                message = self._messages.get(timeout=0.25)
+                message = responses.get(timeout=0.25)
             except queue.Empty:
                 continue
-            if "id" in message and "method" in message:
-                self._handle_server_request(message)
-                continue
-            if message.get("id") != request_id:
-                continue
             if "error" in message:
-                raise CodexAppServerError(str(message.get("error")))
+                raise CodexAppServerRequestError(str(message.get("error")))
             result = message.get("result")
             return result if isinstance(result, dict) else {"result": result}
+        self.mark_broken()
         raise CodexAppServerError(f"codex app-server request timed out: {request_id}; stderr={self._stderr_tail()}")
 
+    def _raise_if_exited(self) -> None:
+        proc = self._process
+        if proc is not None and proc.poll() is not None:
+            self.mark_broken()
+            raise CodexAppServerError(f"codex app-server exited with code {proc.returncode}: {self._stderr_tail()}")
+
     def _handle_server_request(self, message: dict[str, Any]) -> None:
         request_id = message.get("id")
         method = str(message.get("method") or "")
@@ -231,9 +336,7 @@ class CodexAppServerClient:
         except Exception:
             pass
 
-    def _ensure_thread(self) -> str:
-        if self.reuse_thread and self._thread_id:
-            return self._thread_id
+    def _start_thread(self) -> str:
         response = self._request(
             "thread/start",
             {
@@ -252,46 +355,80 @@ class CodexAppServerClient:
         thread_id = thread.get("id") if isinstance(thread, dict) else None
         if not isinstance(thread_id, str) or not thread_id:
             raise CodexAppServerError(f"thread/start did not return a thread id: {response}")
-        if self.reuse_thread:
-            self._thread_id = thread_id
         return thread_id
 
-    def _run_turn(self, inputs: list[dict[str, Any]]) -> str:
+    def _lease_thread(self) -> str:
+        # app-server thread 하나는 한 번에 turn 하나만 돌리므로 동시 turn마다 thread를 따로 빌린다
+        with self._state_lock:
+            if self.reuse_thread and self._idle_threads:
+                return self._idle_threads.pop()
+        return self._start_thread()
+
+    def _return_thread(self, thread_id: str) -> None:
+        if not self.reuse_thread:
+            return
+        with self._state_lock:
+            self._idle_threads.append(thread_id)
+
+    def _run_turn(self, inputs: list[dict[str, Any]], *, on_delta: Callable[[str], None] | None = None) -> str:
         with self._lock:
             self._start()
-            thread_id = self._ensure_thread()
-            response = self._request(
-                "turn/start",
-                {
-                    "threadId": thread_id,
-                    "input": inputs,
-                    "approvalPolicy": "never",
-                    "sandboxPolicy": {"type": "readOnly", "networkAccess": False},
-                    "model": self.model,
-                    "effort": self.reasoning_effort or "low",
-                },
-                timeout=15,
-            )
+        self.last_used_at = time.monotonic()
+        thread_id = self._lease_thread()
+        events: queue.Queue[dict[str, Any]] = queue.Queue()
+        with self._state_lock:
+            self._thread_events[thread_id] = events
+        reusable = False
+        try:
+            try:
+                response = self._request(
+                    "turn/start",
+                    {
+                        "threadId": thread_id,
+                        "input": inputs,
+                        "approvalPolicy": "never",
+                        "sandboxPolicy": {"type": "readOnly", "networkAccess": False},
+                        "model": self.model,
+                        "effort": self.reasoning_effort or "low",
+                    },
+                    timeout=15,
+                )
+            except CodexAppServerRequestError as exc:
+                reusable = True
+                if any(item.get("type") == "image" for item in inputs):
+                    raise CodexAppServerInputRejected(str(exc)) from exc
+                raise
             turn = response.get("turn")
             turn_id = turn.get("id") if isinstance(turn, dict) else None
             if not isinstance(turn_id, str) or not turn_id:
                 raise CodexAppServerError(f"turn/start did not return a turn id: {response}")
-            return self._wait_for_turn(thread_id=thread_id, turn_id=turn_id)
+            text = self._wait_for_turn(thread_id=thread_id, turn_id=turn_id, events=events, on_delta=on_delta)
+            reusable = True
+            return text
+        finally:
+            with self._state_lock:
+                self._thread_events.pop(thread_id, None)
+            self.last_used_at = time.monotonic()
+            if reusable:
+                self._return_thread(thread_id)
 
-    def _wait_for_turn(self, *, thread_id: str, turn_id: str) -> str:
+    def _wait_for_turn(
+        self,
+        *,
+        thread_id: str,
+        turn_id: str,
+        events: queue.Queue[dict[str, Any]],
+        on_delta: Callable[[str], None] | None = None,
+    ) -> str:
         deadline = time.monotonic() + self.timeout_sec
         deltas: list[str] = []
         completed_text = ""
         while time.monotonic() < deadline:
-            if self._process and self._process.poll() is not None:
-                raise CodexAppServerError(f"codex app-server exited with code {self._process.returncode}: {self._stderr_tail()}")
+            self._raise_if_exited()
             try:
-                message = self._messages.get(timeout=0.25)
+                message = events.get(timeout=0.25)
             except queue.Empty:
                 continue
-            if "id" in message and "method" in message:
-                self._handle_server_request(message)
-                continue
             method = str(message.get("method") or "")
             params = message.get("params") if isinstance(message.get("params"), dict) else {}
             if params.get("threadId") != thread_id:
@@ -300,6 +437,8 @@ class CodexAppServerClient:
                 delta = params.get("delta")
                 if isinstance(delta, str):
                     deltas.append(delta)
+                    if on_delta is not None:
+                        on_delta(delta)
             elif method == "item/completed" and params.get("turnId") == turn_id:
                 item = params.get("item")
                 if isinstance(item, dict) and item.get("type") == "agentMessage":
@@ -315,6 +454,7 @@ class CodexAppServerClient:
                     if text:
                         return text
                     raise CodexAppServerError("turn completed without assistant text")
+        self.mark_broken()
         raise CodexAppServerError(f"codex app-server turn timed out: {turn_id}; stderr={self._stderr_tail()}")
 
     def _stderr_tail(self, limit: int = 3) -> str:
@@ -327,4 +467,224 @@ class CodexAppServerClient:
         return " | ".join(lines[-limit:])
 
 
-__all__ = ["CodexAppServerClient", "CodexAppServerError"]
+_LIVE_CLIENTS: "weakref.WeakSet[CodexAppServerClient]" = weakref.WeakSet()
+
+
+class CodexAppServerPool:
+    """Process-wide set of app-server clients leased by agents and threads.
+
+    A lease prefers an idle client, then starts a new one while the pool is
+    below ``size``, then shares the least busy client up to
+    ``max_turns_per_client`` concurrent turns, and otherwise waits. Dead or
+    broken clients are dropped on lease/release. Clients idle for longer than
+    ``idle_recycle_sec`` are closed by a timer armed on release, so a quiet pool
+    releases its processes; replacements are only started by the next lease.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], CodexAppServerClient],
+        *,
+        size: int | None = None,
+        max_turns_per_client: int | None = None,
+        idle_recycle_sec: float | None = None,
+    ) -> None:
+        self._factory = factory
+        self.size = max(1, int(size or codex_app_server_pool_size()))
+        self.max_turns_per_client = max(1, int(max_turns_per_client or codex_app_server_max_turns_per_client()))
+        self.idle_recycle_sec = max(
+            0.0,
+            float(codex_app_server_idle_recycle_sec() if idle_recycle_sec is None else idle_recycle_sec),
+        )
+        self._cond = threading.Condition()
+        self._clients: list[CodexAppServerClient] = []
+        self._closed = False
+        self._reaper: threading.Timer | None = None
+        self.metrics = {"leases": 0, "spawned": 0, "recycled": 0, "discarded": 0, "waits": 0}
+
+    @contextlib.contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[CodexAppServerClient]:
+        client = self.acquire(timeout)
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def acquire(self, timeout: float | None = None) -> CodexAppServerClient:
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        stale: list[CodexAppServerClient] = []
+        try:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise CodexAppServerError("codex app-server pool is closed")
+                    stale.extend(self._prune_locked(recycle_idle=False))
+                    client = self._pick_locked()
+                    if client is not None:
+                        client.in_flight += 1
+                        self.metrics["leases"] += 1
+                        return client
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise CodexAppServerError("codex app-server pool lease timed out")
+                    self.metrics["waits"] += 1
+                    self._cond.wait(remaining)
+        finally:
+            for client in stale:
+                client.close()
+
+    def release(self, client: CodexAppServerClient) -> None:
+        discard = False
+        with self._cond:
+            client.in_flight = max(0, client.in_flight - 1)
+            if client.in_flight == 0:
+                client.last_used_at = time.monotonic()
+            if not client.healthy and client in self._clients:
+                self._clients.remove(client)
+                self.metrics["discarded"] += 1
+            discard = client not in self._clients and client.in_flight == 0
+            stale = self._prune_locked(recycle_idle=True)
+            self._schedule_reap_locked()
+            self._cond.notify_all()
+        if discard:
+            client.close()
+        for other in stale:
+            other.close()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            clients, self._clients = self._clients, []
+            reaper, self._reaper = self._reaper, None
+            self._cond.notify_all()
+        if reaper is not None:
+            reaper.cancel()
+        for client in clients:
+            client.close()
+
+    def _schedule_reap_locked(self) -> None:
+        if self._closed or not self.idle_recycle_sec or self._reaper is not None:
+            return
+        idle_since = [
+            client.last_used_at for client in self._clients if client.in_flight == 0 and client.is_started
+        ]
+        if not idle_since:
+            return
+        delay = max(0.01, min(idle_since) + self.idle_recycle_sec - time.monotonic())
+        reaper = threading.Timer(delay, self._reap)
+        reaper.daemon = True
+        self._reaper = reaper
+        reaper.start()
+
+    def _reap(self) -> None:
+        with self._cond:
+            self._reaper = None
+            stale = self._prune_locked(recycle_idle=True)
+            self._schedule_reap_locked()
+        for client in stale:
+            client.close()
+
+    def _pick_locked(self) -> CodexAppServerClient | None:
+        idle = [client for client in self._clients if client.in_flight == 0]
+        if idle:
+            return max(idle, key=lambda client: (client.is_started, client.last_used_at))
+        if len(self._clients) < self.size:
+            client = self._factory()
+            self._clients.append(client)
+            self.metrics["spawned"] += 1
+            return client
+        shared = [client for client in self._clients if client.in_flight < self.max_turns_per_client]
+        if shared:
+            return min(shared, key=lambda client: client.in_flight)
+        return None
+
+    def _prune_locked(self, *, recycle_idle: bool) -> list[CodexAppServerClient]:
+        now = time.monotonic()
+        stale: list[CodexAppServerClient] = []
+        for client in list(self._clients):
+            if not client.healthy:
+                if client.in_flight == 0:
+                    stale.append(client)
+                self._clients.remove(client)
+                self.metrics["discarded"] += 1
+            elif (
+                recycle_idle
+                and client.in_flight == 0
+                and client.is_started
+                and self.idle_recycle_sec
+                and now - client.last_used_at > self.idle_recycle_sec
+            ):
+                stale.append(client)
+                self._clients.remove(client)
+                self.metrics["recycled"] += 1
+        return stale
+
+
+def codex_app_server_pool_size() -> int:
+    return max(1, int(_env_number("GAIA_CODEX_APP_SERVER_POOL_SIZE", _DEFAULT_POOL_SIZE)))
+
+
+def codex_app_server_max_turns_per_client() -> int:
+    return max(1, int(_env_number("GAIA_CODEX_APP_SERVER_MAX_TURNS", _DEFAULT_MAX_TURNS_PER_CLIENT)))
+
+
+def codex_app_server_idle_recycle_sec() -> float:
+    return max(0.0, _env_number("GAIA_CODEX_APP_SERVER_IDLE_SEC", _DEFAULT_IDLE_RECYCLE_SEC))
+
+
+_POOLS_LOCK = threading.Lock()
+_POOLS: dict[tuple[Any, ...], CodexAppServerPool] = {}
+
+
+def get_codex_app_server_pool(
+    *,
+    codex_bin: str | None = None,
+    model: str = "gpt-5.5",
+    timeout_sec: int = 120,
+    reasoning_effort: str | None = None,
+    reuse_thread: bool = True,
+) -> CodexAppServerPool:
+    """Return the shared pool for one client configuration, creating it on first use."""
+    key = (codex_bin or "", model, int(timeout_sec), reasoning_effort or "", bool(reuse_thread))
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = CodexAppServerPool(
+                lambda: CodexAppServerClient(
+                    codex_bin=codex_bin,
+                    model=model,
+                    timeout_sec=timeout_sec,
+                    reasoning_effort=reasoning_effort,
+                    reuse_thread=reuse_thread,
+                )
+            )
+            _POOLS[key] = pool
+        return pool
+
+
+@atexit.register
+def close_codex_app_server_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+    for client in list(_LIVE_CLIENTS):
+        try:
+            client.close()
+        except Exception:
+            continue
+
+
+__all__ = [
+    "CodexAppServerClient",
+    "CodexAppServerError",
+    "CodexAppServerInputRejected",
+    "CodexAppServerPool",
+    "CodexAppServerRequestError",
+    "close_codex_app_server_pools",
+    "codex_app_server_idle_recycle_sec",
+    "codex_app_server_max_turns_per_client",
+    "codex_app_server_pool_size",
+    "get_codex_app_server_pool",
+]
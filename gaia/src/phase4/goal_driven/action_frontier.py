@@ -0,0 +1,210 @@
+"""BFS action frontier for exploratory runs, partitioned by page.
+
+Pending actions are grouped by ``url_hash`` and kept in one heap per page,
+ordered by an upper bound of their selection score (highest known priority +
+the largest possible context bonus + the largest insertion-order bonus).
+Priorities are recomputed every step, so callers report increases through
+``raise_priority``, which re-pushes the entry with its new bound; lowered
+priorities leave the old bound valid. Selection pops from the current page's
+heap and re-scores lazily: an entry is only re-scored when its bound can still
+beat the best live score seen so far, so a pick touches a handful of entries
+instead of the whole frontier. Discards and superseded bounds are lazy
+tombstones, so pop and discard are both O(log n) amortized.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# frontier_context_bonus() 상한 (semantic-first + active scope + row-like container + role + group actions)
+MAX_CONTEXT_BONUS = 0.18 + 0.24 + 0.08 + 0.05 + 0.12
+_ORDER_BONUS_MAX = 0.25
+_ORDER_BONUS_STEP = 0.01
+_ORDER_BONUS_SLOTS = 25
+
+
+def frontier_key(url_hash: str, element_id: str, action_type: str) -> str:
+    return f"{url_hash}:{element_id}:{action_type}"
+
+
+def order_bonus(ordinal: int) -> float:
+    return max(0.0, _ORDER_BONUS_MAX - (ordinal * _ORDER_BONUS_STEP))
+
+
+@dataclass(slots=True)
+class FrontierEntry:
+    key: str
+    url_hash: str
+    element_id: str
+    action_type: str
+    priority: float
+    bound: float
+    seq: int
+    enqueued_at: float
+    alive: bool = True
+
+    def as_dict(self) -> Dict[str, str]:
+        return {"url_hash": self.url_hash, "element_id": self.element_id, "action_type": self.action_type}
+
+
+class ActionFrontier:
+    def __init__(self) -> None:
+        self._heaps: Dict[str, List[Tuple[float, int, FrontierEntry]]] = {}
+        self._live: Dict[str, FrontierEntry] = {}
+        self._partition_sizes: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self.metrics: Dict[str, int] = {"pushes": 0, "pops": 0, "discards": 0, "rescored": 0, "reprioritized": 0}
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __bool__(self) -> bool:
+        return bool(self._live)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._live
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        # dict insertion order == enqueue order
+        return (entry.as_dict() for entry in list(self._live.values()))
+
+    def push(self, url_hash: str, element_id: str, action_type: str, *, priority: float = 0.0) -> bool:
+        key = frontier_key(url_hash, element_id, action_type)
+        if key in self._live:
+            return False
+        entry = FrontierEntry(
+            key=key,
+            url_hash=url_hash,
+            element_id=element_id,
+            action_type=action_type,
+            priority=float(priority),
+            bound=_score_bound(float(priority)),
+            seq=next(self._seq),
+            enqueued_at=time.monotonic(),
+        )
+        heapq.heappush(self._heaps.setdefault(url_hash, []), (-entry.bound, entry.seq, entry))
+        self._live[key] = entry
+        self._partition_sizes[url_hash] = self._partition_sizes.get(url_hash, 0) + 1
+        self.metrics["pushes"] += 1
+        return True
+
+    def raise_priority(self, key: str, priority: float) -> bool:
+        """Re-push ``key`` when its priority grew past the one its heap bound was built from."""
+        entry = self._live.get(key)
+        if entry is None or float(priority) <= entry.priority:
+            return False
+        entry.priority = float(priority)
+        entry.bound = _score_bound(entry.priority)
+        # 같은 seq로 다시 넣어 동점 시 enqueue 순서를 유지하고, 예전 bound 항목은 tombstone이 된다
+        heapq.heappush(self._heaps[entry.url_hash], (-entry.bound, entry.seq, entry))
+        self.metrics["reprioritized"] += 1
+        self._maybe_compact(entry.url_hash)
+        return True
+
+    def discard(self, key: str) -> bool:
+        entry = self._live.pop(key, None)
+        if entry is None:
+            return False
+        entry.alive = False
+        self._shrink_partition(entry.url_hash)
+        self.metrics["discards"] += 1
+        self._maybe_compact(entry.url_hash)
+        return True
+
+    def _maybe_compact(self, url_hash: str) -> None:
+        heap = self._heaps.get(url_hash)
+        if heap and len(heap) > 2 * self._partition_sizes.get(url_hash, 0) + 16:
+            # tombstone이 과반이면 파티션 힙을 재구성
+            heap[:] = [item for item in heap if _is_current(item)]
+            heapq.heapify(heap)
+
+    def _shrink_partition(self, url_hash: str) -> None:
+        remaining = self._partition_sizes.get(url_hash, 0) - 1
+        if remaining > 0:
+            self._partition_sizes[url_hash] = remaining
+            return
+        # 빈 파티션은 tombstone까지 통째로 정리
+        self._partition_sizes.pop(url_hash, None)
+        self._heaps.pop(url_hash, None)
+
+    def partition_size(self, url_hash: str) -> int:
+        return self._partition_sizes.get(url_hash, 0)
+
+    def order_bonuses(self) -> Dict[str, float]:
+        """Insertion-order bonus by key, from each entry's position among all live entries.
+
+        Only the oldest ``_ORDER_BONUS_SLOTS`` entries get a non-zero bonus, so this
+        walks a fixed-size prefix rather than the whole frontier.
+        """
+        head = islice(self._live.values(), _ORDER_BONUS_SLOTS)
+        return {entry.key: order_bonus(index) for index, entry in enumerate(head)}
+
+    def pop_best(
+        self,
+        url_hash: str,
+        score_fn: Callable[[FrontierEntry], float],
+    ) -> Optional[FrontierEntry]:
+        """Remove and return the live entry of ``url_hash`` with the highest ``score_fn``.
+
+        Ties go to the earlier enqueued entry, like the previous stable sort.
+        ``score_fn`` must not exceed ``_score_bound(entry.priority)``; see
+        ``raise_priority``.
+        """
+        heap = self._heaps.get(url_hash)
+        if not heap:
+            return None
+        best: Optional[Tuple[float, int, FrontierEntry]] = None
+        examined: List[Tuple[float, int, FrontierEntry]] = []
+        while heap:
+            neg_bound, seq, entry = heap[0]
+            if not _is_current(heap[0]):
+                heapq.heappop(heap)
+                continue
+            if best is not None and best[0] > -neg_bound:
+                break
+            item = heapq.heappop(heap)
+            examined.append(item)
+            self.metrics["rescored"] += 1
+            score = float(score_fn(entry))
+            if best is None or score > best[0] or (score == best[0] and seq < best[1]):
+                best = (score, seq, entry)
+        for item in examined:
+            if best is None or item[2] is not best[2]:
+                heapq.heappush(heap, item)
+        if best is None:
+            return None
+        chosen = best[2]
+        chosen.alive = False
+        self._live.pop(chosen.key, None)
+        self._shrink_partition(chosen.url_hash)
+        self.metrics["pops"] += 1
+        return chosen
+
+    def stats(self) -> Dict[str, float]:
+        now = time.monotonic()
+        # dict insertion order == enqueue order, so the first live entry is the oldest
+        oldest = next(iter(self._live.values())).enqueued_at if self._live else now
+        stats: Dict[str, float] = dict(self.metrics)
+        stats.update(
+            {
+                "size": len(self._live),
+                "partitions": len(self._partition_sizes),
+                "largest_partition": max(self._partition_sizes.values(), default=0),
+                "heap_slots": sum(len(heap) for heap in self._heaps.values()),
+                "oldest_age_s": round(now - oldest, 3),
+            }
+        )
+        return stats
+
+
+def _score_bound(priority: float) -> float:
+    return priority + MAX_CONTEXT_BONUS + _ORDER_BONUS_MAX
+
+
+def _is_current(item: Tuple[float, int, FrontierEntry]) -> bool:
+    entry = item[2]
+    return entry.alive and -item[0] == entry.bound
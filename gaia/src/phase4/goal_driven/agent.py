@@ -185,7 +185,19 @@ from gaia.src.phase4.memory.retriever import MemoryRetriever
 from gaia.src.phase4.memory.store import MemoryStore
 from gaia.src.phase4.orchestrator import MasterOrchestrator
 from .text_llm_runtime import call_llm_text_only as call_llm_text_only_impl
-from .captcha_observer_runtime import run_captcha_observer as run_captcha_observer_impl
+from .captcha_observer_runtime import (
+    captcha_observer_needs_screenshot as captcha_observer_needs_screenshot_impl,
+    run_captcha_observer as run_captcha_observer_impl,
+)
+from .observation_prefetch import (
+    observation_pipelining_enabled,
+    resolve_screenshot,
+    start_screenshot_capture,
+    start_snapshot_prefetch,
+)
+from .step_profiler import StepProfiler, finalize_step_profile, profile_phase, step_profiler_enabled
+from .decision_stream_runtime import finish_decision_stream
+from .page_settle_runtime import settle_page
 from .wrapper_trace_runtime import thin_wrapper_enabled
 from .human_answer_runtime import (
     is_goal_achievement_confirmation_request,
@@ -522,7 +534,12 @@ class GoalDrivenAgent:
         ):
             self._log("🛠️ DOM 강제 복구 보류: 인증/전환 직후라 세션 재생성 대신 재대기 후 DOM을 다시 읽습니다.")
             for delay in (0.9, 1.3, 1.8):
-                time.sleep(delay)
+                settle_page(
+                    self,
+                    reason="auth_dom_retry",
+                    max_wait_ms=int(delay * 2000),
+                    fallback_ms=int(delay * 1000),
+                )
                 try:
                     recovered = self._analyze_dom(scope_container_ref_id="")
                 except Exception as exc:
@@ -551,7 +568,7 @@ class GoalDrivenAgent:
                 self._last_exec_result = self._execute_action("goto", url=start_url)
             except Exception as exc:
                 self._log(f"⚠️ 세션 재생성 후 시작 URL 복구 실패: {exc}")
-        time.sleep(0.8)
+        settle_page(self, reason="session_reset", fallback_ms=800)
         try:
             recovered = self._analyze_dom()
         except Exception as exc:
@@ -1308,7 +1325,7 @@ class GoalDrivenAgent:
                 self._log(f"⚠️ dead navigation 시작 URL 복구 실패: {exc}")
                 return False
         self._last_action_selected_element = None
-        time.sleep(1.0)
+        settle_page(self, reason="dead_navigation_recovery", fallback_ms=1000)
         return True
 
     def _pick_context_shift_element(
@@ -1399,7 +1416,8 @@ class GoalDrivenAgent:
         return extract_domain_impl(url)
 
     def _build_memory_context(self, goal: TestGoal) -> str:
-        return build_memory_context_impl(self, goal)
+        with profile_phase(self, "prompt_format"):
+            return build_memory_context_impl(self, goal)
 
     def _record_recovery_hints(self, goal: TestGoal, reason_code: str) -> None:
         return record_recovery_hints_impl(self, goal, reason_code)
@@ -1414,15 +1432,16 @@ class GoalDrivenAgent:
         changed: bool,
         error: Optional[str],
     ) -> None:
-        return record_action_memory_impl(
-            self,
-            goal=goal,
-            step_number=step_number,
-            decision=decision,
-            success=success,
-            changed=changed,
-            error=error,
-        )
+        with profile_phase(self, "history_write"):
+            return record_action_memory_impl(
+                self,
+                goal=goal,
+                step_number=step_number,
+                decision=decision,
+                success=success,
+                changed=changed,
+                error=error,
+            )
 
     def _record_goal_summary(
         self,
@@ -1452,7 +1471,8 @@ class GoalDrivenAgent:
         decision: ActionDecision,
         dom_elements: List[DOMElement],
     ) -> tuple[bool, Optional[str]]:
-        return validate_goal_achievement_claim_impl(self, goal, decision, dom_elements)
+        with profile_phase(self, "verification"):
+            return validate_goal_achievement_claim_impl(self, goal, decision, dom_elements)
 
     def _build_failure_result(
         self,
@@ -1481,7 +1501,20 @@ class GoalDrivenAgent:
         3. 액션 실행
         4. 목표 달성 여부 확인
         5. 반복
+
+        스텝별 phase 소요 시간은 run history 디렉터리의 step_profile.json에 기록된다.
         """
+        self._step_profiler = StepProfiler(enabled=step_profiler_enabled())
+        try:
+            return self._execute_goal_steps(goal)
+        finally:
+            try:
+                # 마지막 스텝의 스트림 tail은 다음 결정 턴이 없으므로 여기서 기록한다
+                finish_decision_stream(self)
+            finally:
+                finalize_step_profile(self)
+
+    def _execute_goal_steps(self, goal: TestGoal) -> GoalResult:
         start_time = time.time()
         steps: List[StepResult] = []
         runtime_state = initialize_goal_execution_state_impl(self, goal)
@@ -1506,7 +1539,7 @@ class GoalDrivenAgent:
         if goal.start_url:
             self._log(f"📍 시작 URL로 이동: {goal.start_url}")
             self._execute_action("goto", url=goal.start_url)
-            time.sleep(2)  # 페이지 로드 대기
+            settle_page(self, reason="start_url", fallback_ms=2000)
 
         requires_login_interaction = self._goal_requires_login_interaction(goal)
         has_login_test_data = self._has_login_test_data(goal)
@@ -1528,6 +1561,7 @@ class GoalDrivenAgent:
         while orchestrator.can_continue():
             step_count = orchestrator.begin_step()
             step_start = time.time()
+            self._step_profiler.begin_step(step_count)
             if (not thin_wrapper_mode) and context_shift_cooldown > 0:
                 context_shift_cooldown -= 1
 
@@ -1793,13 +1827,20 @@ class GoalDrivenAgent:
                 )
 
             # 2. 필요할 때만 스크린샷 캡처. DOM이 충분하면 text-only 판단으로 먼저 간다.
-            screenshot = self._capture_screenshot() if vision_policy.use_screenshot else None
+            screenshot = None
+            if vision_policy.use_screenshot and observation_pipelining_enabled():
+                # 파이프라이닝 모드에서는 프롬프트를 만드는 동안 백그라운드로 캡처하고 LLM 호출 직전에 합류한다
+                screenshot = start_screenshot_capture(self)
+                if captcha_observer_needs_screenshot_impl(self, dom_elements):
+                    screenshot = resolve_screenshot(screenshot)
+            elif vision_policy.use_screenshot:
+                screenshot = self._capture_screenshot()
 
             captcha_observer_result = run_captcha_observer_impl(
                 self,
                 goal=goal,
                 dom_elements=dom_elements,
-                screenshot=screenshot,
+                screenshot=screenshot if isinstance(screenshot, str) else None,
                 step_count=step_count,
                 steps=steps,
                 start_time=start_time,
@@ -1940,6 +1981,7 @@ class GoalDrivenAgent:
                     screenshot=screenshot,
                     memory_context=memory_context,
                 )
+                screenshot = resolve_screenshot(screenshot)
                 self._log(f"LLM 결정: {decision.action.value} - {decision.reasoning}")
                 decision, dom_elements, screenshot, retried_visual_dom_mismatch = (
                     self._retry_decision_after_visual_dom_ref_mismatch(
@@ -2338,14 +2380,15 @@ class GoalDrivenAgent:
             if not intent_fields and decision.reasoning:
                 intent_fields.append(str(decision.reasoning))
             action_intent_key = self._candidate_intent_key(decision.action.value, intent_fields)
-            record_run_history_decision_impl(
-                self,
-                step_number=step_count,
-                decision=decision,
-                selected_element=selected_element,
-            )
+            with profile_phase(self, "history_write"):
+                record_run_history_decision_impl(
+                    self,
+                    step_number=step_count,
+                    decision=decision,
+                    selected_element=selected_element,
+                )
 
-            with participant_decision_session(self, decision, restore=False):
+            with participant_decision_session(self, decision, restore=False), profile_phase(self, "action_dispatch"):
                 step_result, success, error = sub_agent.run_step(
                     step_number=step_count,
                     step_start=step_start,
@@ -2379,29 +2422,32 @@ class GoalDrivenAgent:
                 if len(self._recent_click_element_ids) > 24:
                     self._recent_click_element_ids = self._recent_click_element_ids[-24:]
 
-            post_action_result = handle_post_action_runtime(
-                self,
-                goal=goal,
-                decision=decision,
-                success=success,
-                error=error,
-                before_signature=before_signature,
-                dom_elements=dom_elements,
-                steps=steps,
-                step_count=step_count,
-                start_time=start_time,
-                login_gate_visible=login_gate_visible,
-                has_login_test_data=has_login_test_data,
-                modal_open_hint=modal_open_hint,
-                scroll_streak=scroll_streak,
-                ineffective_action_streak=ineffective_action_streak,
-                force_context_shift=force_context_shift,
-                context_shift_fail_streak=context_shift_fail_streak,
-                context_shift_cooldown=context_shift_cooldown,
-                click_intent_key=click_intent_key,
-                action_intent_key=action_intent_key,
-                master_orchestrator=master_orchestrator,
-            )
+            with profile_phase(self, "post_action_probe"):
+                post_action_result = handle_post_action_runtime(
+                    self,
+                    goal=goal,
+                    decision=decision,
+                    success=success,
+                    error=error,
+                    before_signature=before_signature,
+                    dom_elements=dom_elements,
+                    steps=steps,
+                    step_count=step_count,
+                    start_time=start_time,
+                    login_gate_visible=login_gate_visible,
+                    has_login_test_data=has_login_test_data,
+                    modal_open_hint=modal_open_hint,
+                    scroll_streak=scroll_streak,
+                    ineffective_action_streak=ineffective_action_streak,
+                    force_context_shift=force_context_shift,
+                    context_shift_fail_streak=context_shift_fail_streak,
+                    context_shift_cooldown=context_shift_cooldown,
+                    click_intent_key=click_intent_key,
+                    action_intent_key=action_intent_key,
+                    master_orchestrator=master_orchestrator,
+                )
+            # post-action 판정은 자체 settle/스냅샷을 써야 하므로 선행 수집은 그 뒤에 시작한다
+            start_snapshot_prefetch(self, reason=decision.action.value)
             post_dom = post_action_result.get("post_dom") or []
             changed = bool(post_action_result.get("changed"))
             state_change = post_action_result.get("state_change")
@@ -2461,12 +2507,13 @@ class GoalDrivenAgent:
                 f"scope={str(scope_container_ref_id or '') or '<default>'} "
                 f"force_refresh={bool(force_refresh)}"
             )
-        result = analyze_dom_impl(
-            self,
-            url=url,
-            scope_container_ref_id=scope_container_ref_id,
-            force_refresh=force_refresh,
-        )
+        with profile_phase(self, "snapshot"):
+            result = analyze_dom_impl(
+                self,
+                url=url,
+                scope_container_ref_id=scope_container_ref_id,
+                force_refresh=force_refresh,
+            )
         if trace_enabled:
             self._log(
                 "🧪 collect trace(end): "
@@ -2498,7 +2545,8 @@ class GoalDrivenAgent:
                 f"phase={str(getattr(self, '_goal_policy_phase', '') or '')} "
                 f"intent={str(getattr(self, '_goal_phase_intent', '') or '')}"
             )
-        result = capture_screenshot_impl(self)
+        with profile_phase(self, "screenshot"):
+            result = capture_screenshot_impl(self)
         if trace_enabled:
             self._log(
                 "🧪 screenshot trace(end): "
@@ -2639,7 +2687,14 @@ class GoalDrivenAgent:
             self._log(
                 f"🕒 스크린샷/DOM 불일치 감지: {delay_ms}ms 대기 후 DOM을 강제로 다시 수집합니다."
             )
-        time.sleep(delay_ms / 1000.0)
+        settle_page(
+            self,
+            reason=refresh_reason,
+            max_wait_ms=delay_ms * 3,
+            quiet_ms=min(delay_ms, 300),
+            network_idle=False,
+            fallback_ms=delay_ms,
+        )
 
         GoalDrivenAgent._force_next_dom_resnapshot(self, reason=refresh_reason)
         refreshed_dom = self._analyze_dom(force_refresh=True)
@@ -2682,13 +2737,14 @@ class GoalDrivenAgent:
                 f"dom_count={len(dom_elements or [])} "
                 f"has_screenshot={bool(screenshot)}"
             )
-        decision = decide_next_action_impl(
-            self,
-            dom_elements,
-            goal,
-            screenshot=screenshot,
-            memory_context=memory_context,
-        )
+        with profile_phase(self, "prompt_format"):
+            decision = decide_next_action_impl(
+                self,
+                dom_elements,
+                goal,
+                screenshot=screenshot,
+                memory_context=memory_context,
+            )
         if trace_enabled:
             self._log(
                 "🧪 decide trace(end): "
@@ -49,7 +49,7 @@ def append_run_state_ledger(
     value = str(getattr(decision, "value", "") or "").strip()
     state_keys: list[str] = []
     if isinstance(state_change, dict):
-        state_keys = sorted(str(key) for key, val in state_change.items() if bool(val))[:16]
+        state_keys = sorted(str(key) for key, val in state_change.items() if bool(val) and key != "dom_delta")[:16]
 
     entry: Dict[str, Any] = {
         "step": int(step_number),
@@ -320,5 +320,7 @@ def record_goal_summary(
                 },
             )
         )
+        # 목표 종료 시점: write-behind 큐를 비워 에피소드 기록을 확정한다.
+        agent._memory_store.flush()
     except Exception:
         return
@@ -125,14 +125,11 @@ def build_browser_action_rules_block() -> str:
     return f"## 작업 규칙\n{text}"
 
 
-def build_browser_action_rules_for_agent(agent: Any) -> str:
-    """agent 상태에 따라 동적으로 규칙을 조합한다.
+def build_browser_action_reinforcement_block(agent: Any) -> str:
+    """최근 action/feedback에서 반복 패턴이 보일 때만 긴급 경고 블록을 반환한다.
 
-    현재는 정적 규칙만 반환하지만,
-    향후 agent._action_history 기반으로 특정 규칙을 강조할 수 있다.
+    정적 규칙 블록과 분리돼 있어 프롬프트의 캐시 가능한 prefix를 깨지 않는다.
     """
-    base = build_browser_action_rules_block()
-
     recent_actions = slice_recent_prompt_items(list(getattr(agent, "_action_history", []) or []), default=5)
     recent_feedback = slice_recent_prompt_items(list(getattr(agent, "_action_feedback", []) or []), default=5)
 
@@ -148,10 +145,9 @@ def build_browser_action_rules_for_agent(agent: Any) -> str:
             "⚠ 최근 같은 action이 반복 실패했습니다. 다른 ref나 다른 접근 경로를 탐색하세요."
         )
 
-    if reinforcements:
-        base += "\n\n## 긴급 행동 경고\n" + "\n".join(reinforcements)
-
-    return base
+    if not reinforcements:
+        return ""
+    return "## 긴급 행동 경고\n" + "\n".join(reinforcements)
 
 
 def _detect_repeated_wait(recent_actions: list[str]) -> bool:
@@ -138,6 +138,23 @@ def _should_start_captcha_observer(agent: Any, dom_elements: Iterable[Any], scre
     return bool(auth_window_active or captcha_surface_present)
 
 
+def captcha_observer_needs_screenshot(agent: Any, dom_elements: Iterable[Any]) -> bool:
+    """Whether ``run_captcha_observer`` could use this step's screenshot."""
+    future = getattr(agent, "_captcha_observer_future", None)
+    if future is not None:
+        return bool(future.done())
+    state = getattr(agent, "_captcha_observer_state", {}) or {}
+    if str(state.get("status") or "").strip().lower() == "confirmed" and not bool(state.get("consumed")):
+        return True
+    if getattr(agent, "_captcha_solver_skip", False):
+        return False
+    if _has_captcha_surface_signal(dom_elements):
+        return True
+    watch_sec = float(getattr(agent, "_captcha_observer_watch_window_sec", 30.0) or 30.0)
+    recent_auth_submit_at = float(getattr(agent, "_last_auth_submit_at", 0.0) or 0.0)
+    return recent_auth_submit_at > 0.0 and (time.time() - recent_auth_submit_at) < watch_sec
+
+
 def run_captcha_observer(
     agent: Any,
     *,
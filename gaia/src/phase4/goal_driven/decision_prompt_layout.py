@@ -0,0 +1,241 @@
+"""decide_next_action 프롬프트 조립층 (정적 prefix + 동적 section + token budget).
+
+Providers reuse a cached prompt prefix only when the leading bytes are
+identical between calls. The rule blocks that never change within a run
+(role intro, continuity priority, hygiene rules, participant skill, OpenClaw
+and semantic hint rules, browser action rules, response format) therefore
+form one static prefix. It is built once per backend and reused byte for
+byte. Everything that changes per step follows as ordered dynamic sections.
+
+The token budget is opt-in (``GAIA_DECISION_PROMPT_TOKEN_BUDGET``, default 0 =
+off). When set and the estimated prompt size exceeds it, the budgeter trims
+dynamic sections line by line, lowest priority first, down to each section's
+``min_lines``, and leaves a ``(... N줄 생략: token budget)`` marker where lines
+were dropped. The estimate is character based (~4 characters per token) and
+needs no tokenizer dependency. A UTF-8 byte count would read every Hangul
+syllable as three characters and trim Korean pages far too early.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+_DEFAULT_TOKEN_BUDGET = 0
+_CHARS_PER_TOKEN = 4
+_TRIM_MARKER_TEMPLATE = "(... {dropped}줄 생략: token budget)"
+
+PROMPT_INTRO = """당신은 OpenClaw 스타일의 웹 작업 에이전트입니다.
+현재 화면과 직전 결과를 다시 읽고, 다음 한 단계만 결정하세요."""
+
+SESSION_CONTINUITY_RULE = """## 세션 연속성 우선순위
+- 1순위: replay packet 첫머리의 replay boundary, resume checklist, recent attempt digest를 먼저 읽는다.
+- 2순위: session summary의 Startup Continuity Audit와 Session Start Rules를 먼저 읽는다.
+- 3순위: MEMORY에서 이전 run의 recent attempts, outcome, resume hint를 읽는다.
+- 4순위: retrieval hit는 현재 goal/reason_code와 직접 맞는 항목만 반영한다.
+- 5순위: compact state는 보조 기록으로만 쓴다."""
+
+PROGRESS_HYGIENE_RULE = """## 진행 위생 규칙
+- mutation/수집/적용 goal에서는 새 CTA를 반복하기 전에 현재 열린 modal/overlay/panel이 목표와 무관하게 진행을 실제로 막는지 먼저 확인하세요. 막고 있을 때만 원래 작업 surface로 복귀하는 한 단계를 우선하고, 임시 성공 토스트/배너처럼 약한 신호는 닫기보다 원래 목표 진행을 우선하세요.
+- 로그인/인증/OTP/보안문자/정답 입력처럼 현재 화면에서 사용자의 실제 값이 필요하지만 `사용 가능한 테스트 데이터`에 그 값이 없으면 추측하지 마세요. 이때는 아래 human_answer skill을 호출하세요.
+- human_answer skill 사용법: `action`은 `wait`, `value`는 JSON 문자열/객체 `{"skill":"human_answer","question":"사용자에게 물어볼 질문","fields":["필요한_key"],"reason_code":"human_answer_required"}`로 응답합니다. 필요한 필드명은 현재 화면과 목표를 보고 직접 정하세요.
+- human_answer는 사용자에게 묻기 위한 skill입니다. 버튼 클릭/입력으로 해결 가능한 단계에는 쓰지 말고, 모델이 알 수 없는 실제 비밀값/정답/인증값이 필요할 때만 사용하세요.
+- 목표 달성 여부를 사용자에게 확인하려고 human_answer를 호출하지 마세요. 순위표/목록/기사/검색결과처럼 화면 증거로 검증 가능한 목표는 `is_goal_achieved=true`와 `goal_achievement_reason`으로 선언하면 검증 에이전트가 DOM 증거로 판정합니다.
+- 목표가 여러 카드/행/댓글/기사/검색결과의 텍스트를 읽고 세거나 필드를 비교하는 목록 수집형이라고 판단되면 `collect_text_evidence=true`로 두세요. 현재 화면에서 수집할 필드(예: 제목, 출처, 시간, 요약, 댓글 본문)는 `text_evidence_focus`에 적으세요.
+- `collect_text_evidence`는 action을 대체하지 않습니다. evidence를 수집하면서도 다음 단계가 필요하면 click/scroll/inspect를 그대로 선택하고, 충분히 수집했다고 판단될 때만 `is_goal_achieved=true`를 선언하세요."""
+
+SEMANTIC_HINT_RULE = """## 후보 의미 힌트
+- 각 DOM 줄의 `semantics=[...]`는 wrapper가 붙인 약한 힌트입니다. 정답으로 확정하지 말고 현재 DOM 문맥으로 다시 검증하세요.
+- `destination_reveal_candidate`와 `close_like`가 함께 보이면 닫기/취소 계열일 가능성을 먼저 의심하세요.
+- `source_mutation_candidate`가 보여도 최근 피드백이 no-op이거나 duplicate 경고가 있으면 같은 CTA를 반복하지 마세요.
+- `auth_identifier_field`, `auth_password_field`, `auth_submit_candidate`는 로그인 surface 안에서만 참고할 약한 힌트입니다.
+- 인증 surface 요약에 `fill_with="..."`가 보이면 그것은 현재 DOM 값이 아니라, 그 입력칸에 넣어야 할 자격증명입니다.
+- 인증 surface 안에 identifier/password 입력 ref와 `fill_with`가 함께 보이면, 방금 그 ref를 채운 직후가 아닌 한 submit보다 fill을 우선하세요.
+- `surface_close_candidate`는 현재 foreground surface를 닫고 배경으로 돌아가는 약한 힌트입니다.
+- `occluded_background_candidate`는 DOM에 보여도 현재 surface 뒤에 가려져 클릭 실패할 수 있습니다.
+- 상태 요약이 `불확실`이면 wrapper belief를 버리고 현재 DOM과 스크린샷만으로 판단하세요."""
+
+OPENCLAW_PRIMARY_RULE = """## OpenClaw 원본 우선 규칙
+- `## OpenClaw 원본 역할 트리 (주 입력)`은 wrapper가 재가공하기 전 OpenClaw snapshot 발췌입니다. action을 고를 때 가장 먼저 신뢰하세요.
+- `## 구조화 보조 힌트`와 `semantics=[...]`는 2차 힌트입니다. 원본 role tree의 ref/role/name/트리 위치와 충돌하면 원본 역할 트리를 우선하세요.
+- 같은 이름 CTA가 여러 개면 `ref`, 트리 위치, 같은 row/section 주변 raw line으로 구분하세요."""
+
+DYNAMIC_CONTEXT_NOTICE = """## 현재 턴 입력
+- 아래부터는 이번 턴의 목표/관찰/기록입니다. 위 규칙과 응답 형식을 그대로 적용하세요.
+- `(... N줄 생략: token budget)` 표시는 길이 제한으로 잘린 부분입니다. 생략된 내용을 추측하지 마세요."""
+
+RESPONSE_FORMAT_BLOCK = """## 응답 형식 (JSON만, 마크다운 없이)
+{
+    "action": "click" | "fill" | "type" | "inspect" | "focus" | "press" | "scroll" | "wait" | "select",
+    "ref_id": 요소 ref ID (문자열, DOM에 [ref=...]로 표시된 값을 우선 사용; inspect/focus/wait면 null 허용),
+    "element_id": 요소ID (숫자, 없으면 null 허용; inspect/focus/wait면 null 허용),
+    "value": "입력값 (fill/type), inspect 질문/관찰 목적, target_id/tab_id (focus), 키 이름 (press), select 값(문자열/콤마구분/JSON 배열), wait 조건(JSON 또는 ms), 또는 human_answer skill JSON",
+    "reasoning": "현재 화면 기준으로 이 행동이 왜 다음 단계인지",
+    "confidence": 0.0~1.0,
+    "is_goal_achieved": true | false,
+    "goal_achievement_reason": "목표 달성 판단 이유 (is_goal_achieved가 true인 경우)",
+    "collect_text_evidence": true | false,
+    "text_evidence_reason": "목록/카드/댓글/기사 텍스트 evidence를 이번 턴에 누적해야 하는 이유 또는 null",
+    "text_evidence_focus": ["수집할 필드/관찰 포인트", "예: 제목", "예: 출처/시간/요약"],
+    "participant_id": "다중 참여자 모드에서 현재 액션을 수행할 participant id 또는 null",
+    "next_participant": "현재 액션 이후 우선 실행할 participant id 또는 null",
+    "turn_control": {
+        "status": "continue" | "wait_for" | "done",
+        "wait_for": [
+            {"kind":"blackboard_key", "blackboard_key":"message_sent", "note":"receiver는 sender가 메시지를 보낸 뒤 확인한다"},
+            {"kind":"timeout", "timeout_seconds":10, "note":"이벤트가 늦게 도착할 수 있어 짧게 재확인한다"}
+        ],
+        "reason": "이 action 이후 같은 참여자를 계속 실행할지, 이벤트를 기다릴지, 종료할지"
+    } 또는 null,
+    "participant_plan": {
+        "skill": "multi_user_interaction",
+        "required": true | false,
+        "reason": "단일 세션으로 검증할 수 없는 이유",
+        "participants": [
+            {"id":"sender", "role":"sender", "display_name":"Sender", "persona":"메시지를 보내는 사용자"},
+            {"id":"receiver", "role":"receiver", "display_name":"Receiver", "persona":"메시지를 받는 사용자"}
+        ],
+        "credential_requests": [
+            {"participant_id":"sender", "fields":["username","password"], "required":true},
+            {"participant_id":"receiver", "fields":["username","password"], "required":true}
+        ],
+        "coordination_plan": ["sender가 메시지를 보낸다", "receiver가 수신 여부를 확인한다"],
+        "expected_events": ["message_sent", "message_received", "notification_visible"]
+    } 또는 null,
+    "blackboard_event": "message_sent/message_received/notification_visible 같은 공유 관찰 key 또는 null",
+    "blackboard_payload": {}
+}"""
+
+PROMPT_TAIL = "JSON 응답:"
+
+
+def decision_prompt_token_budget() -> int:
+    raw = str(os.getenv("GAIA_DECISION_PROMPT_TOKEN_BUDGET", "") or "").strip()
+    try:
+        value = int(raw) if raw else _DEFAULT_TOKEN_BUDGET
+    except Exception:
+        return _DEFAULT_TOKEN_BUDGET
+    return max(0, value)
+
+
+def estimate_prompt_tokens(text: str) -> int:
+    return (len(str(text or "")) + _CHARS_PER_TOKEN - 1) // _CHARS_PER_TOKEN
+
+
+@functools.lru_cache(maxsize=16)
+def build_static_prompt_prefix(
+    *,
+    openclaw_backend: bool,
+    participant_skill_prompt: str,
+    browser_rules_block: str,
+) -> str:
+    """이번 run 동안 바뀌지 않는 규칙 블록만으로 byte-stable prefix를 만든다."""
+    blocks = [
+        PROMPT_INTRO,
+        SESSION_CONTINUITY_RULE,
+        PROGRESS_HYGIENE_RULE,
+        participant_skill_prompt.strip(),
+        OPENCLAW_PRIMARY_RULE if openclaw_backend else "",
+        SEMANTIC_HINT_RULE,
+        browser_rules_block.strip(),
+        RESPONSE_FORMAT_BLOCK,
+        DYNAMIC_CONTEXT_NOTICE,
+    ]
+    return "\n\n".join(block for block in blocks if block) + "\n\n"
+
+
+@dataclass
+class PromptSection:
+    name: str
+    title: str
+    body: str
+    # priority가 낮을수록 먼저 잘린다. trimmable=False면 budget을 넘어도 유지한다.
+    priority: int = 50
+    trimmable: bool = True
+    keep: str = "head"
+    min_lines: int = 0
+
+    def render(self) -> str:
+        body = str(self.body or "").rstrip()
+        if not self.title:
+            return body
+        return f"{self.title}\n{body}" if body else self.title
+
+
+def _trim_section(section: PromptSection, excess_tokens: int) -> Tuple[int, int]:
+    """Drop lines from ``section`` until ``excess_tokens`` are freed; return (freed, dropped)."""
+    lines = str(section.body or "").rstrip().splitlines()
+    removable = len(lines) - max(0, int(section.min_lines))
+    if removable <= 0 or excess_tokens <= 0:
+        return 0, 0
+    before = estimate_prompt_tokens(section.render())
+    # 생략 표시가 차지할 글자 수를 먼저 빼고, 줄+개행 글자 수를 누적해 필요한 만큼만 자른다
+    target_chars = excess_tokens * _CHARS_PER_TOKEN + len(_TRIM_MARKER_TEMPLATE.format(dropped=len(lines)))
+    dropped = 0
+    freed_chars = 0
+    while dropped < removable and freed_chars < target_chars:
+        dropped += 1
+        line = lines[-dropped] if section.keep == "head" else lines[dropped - 1]
+        freed_chars += len(line) + 1
+    kept = lines[: len(lines) - dropped] if section.keep == "head" else lines[dropped:]
+    marker = _TRIM_MARKER_TEMPLATE.format(dropped=dropped)
+    trimmed_body = "\n".join(kept + [marker] if section.keep == "head" else [marker] + kept)
+    original_body = section.body
+    section.body = trimmed_body
+    freed_tokens = before - estimate_prompt_tokens(section.render())
+    if freed_tokens <= 0:
+        # 짧은 section은 생략 표시가 원문보다 길 수 있으므로 그대로 둔다
+        section.body = original_body
+        return 0, 0
+    return freed_tokens, dropped
+
+
+def assemble_decision_prompt(
+    static_prefix: str,
+    sections: List[PromptSection],
+    *,
+    token_budget: Optional[int] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """정적 prefix 뒤에 동적 section을 붙이고 budget에 맞게 잘라 (prompt, trace)를 돌려준다."""
+    budget = decision_prompt_token_budget() if token_budget is None else max(0, int(token_budget))
+    live = [section for section in sections if section.render().strip()]
+    prefix_tokens = estimate_prompt_tokens(static_prefix)
+    tail_tokens = estimate_prompt_tokens(PROMPT_TAIL)
+
+    def _total() -> int:
+        # section 사이 구분자("\n\n")까지 포함해 추정한다
+        return prefix_tokens + tail_tokens + sum(estimate_prompt_tokens(s.render() + "\n\n") for s in live)
+
+    estimated_before = _total()
+    trimmed: Dict[str, int] = {}
+    if budget > 0 and estimated_before > budget:
+        excess = estimated_before - budget
+        for section in sorted((s for s in live if s.trimmable), key=lambda s: s.priority):
+            if excess <= 0:
+                break
+            freed, dropped = _trim_section(section, excess)
+            if dropped:
+                trimmed[section.name] = dropped
+                excess -= freed
+    dynamic_text = "\n\n".join(section.render() for section in live)
+    prompt = f"{static_prefix}{dynamic_text}\n\n{PROMPT_TAIL}"
+    trace = {
+        "static_prefix_sha1": hashlib.sha1(static_prefix.encode("utf-8")).hexdigest()[:12],
+        "static_prefix_tokens": prefix_tokens,
+        "token_budget": budget,
+        "estimated_tokens_before": estimated_before,
+        "estimated_tokens": estimate_prompt_tokens(prompt),
+        "trimmed_sections": trimmed,
+    }
+    return prompt, trace
+
+
+__all__ = [
+    "PromptSection",
+    "assemble_decision_prompt",
+    "build_static_prompt_prefix",
+    "decision_prompt_token_budget",
+    "estimate_prompt_tokens",
+]
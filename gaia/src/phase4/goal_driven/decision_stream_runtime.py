@@ -0,0 +1,312 @@
+"""Streaming actor decisions with early JSON commit (opt-in).
+
+With ``GAIA_LLM_STREAM_DECISION=1`` the decision call streams the model
+response through ``llm.stream_text`` instead of waiting for the whole
+completion. ``DecisionStreamScanner`` tracks the top-level JSON object as it
+arrives and records each field once its value is complete. The decision is
+handed to ``parse_decision`` as soon as either
+
+* the object closed (trailing fences/whitespace and end-of-stream are not
+  awaited), or
+* every field the step loop reads right after the decision is complete —
+  ``action`` through ``collect_text_evidence`` (plus ``goal_achievement_reason``
+  / ``text_evidence_*`` when their flags are true). The remaining tail
+  (``participant_id`` … ``blackboard_payload``) is multi-participant metadata,
+  so this early commit is skipped while a participant registry is active.
+
+The rest of the stream is drained on a background thread. The next decision
+turn records the full text as the ``actor_decision_response_tail`` transcript
+on the step thread; when the goal ends, tails still pending are given a short
+grace period and flushed so the last step's tail is not lost. If a drained tail turns out to carry coordination fields
+that the early decision dropped, early commit is held for the rest of the goal.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_EARLY_FIELDS = (
+    "action",
+    "ref_id",
+    "element_id",
+    "value",
+    "reasoning",
+    "confidence",
+    "is_goal_achieved",
+    "collect_text_evidence",
+)
+_COORDINATION_FIELDS = ("participant_id", "next_participant", "turn_control", "participant_plan", "blackboard_event")
+_FINISH_TAIL_WAIT_S = 2.0
+
+
+def decision_streaming_enabled(agent: Any) -> bool:
+    raw_value = str(os.getenv("GAIA_LLM_STREAM_DECISION", "") or "").strip().lower()
+    if raw_value not in {"1", "true", "yes", "on"}:
+        return False
+    return callable(getattr(getattr(agent, "llm", None), "stream_text", None))
+
+
+class DecisionStreamScanner:
+    """Incremental scanner over a streamed top-level JSON object.
+
+    Text before the first ``{`` (e.g. a code fence) is ignored. ``fields`` holds
+    every top-level key whose value has been fully received and decoded.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[str] = []
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_start = -1
+        self._key: Optional[str] = None
+        self._value_start = -1
+        self.fields: Dict[str, Any] = {}
+        self.closed = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def feed(self, delta: str) -> None:
+        self._chunks.append(delta)
+        if self.closed:
+            return
+        if not self._buffer:
+            start = delta.find("{")
+            if start < 0:
+                return
+            delta = delta[start:]
+        self._buffer += delta
+        buf = self._buffer
+        for pos in range(self._pos, len(buf)):
+            ch = buf[pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key_start >= 0:
+                        self._key = self._decode(buf[self._key_start:pos + 1])
+                        self._key_start = -1
+                continue
+            if ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._value_start < 0:
+                    self._key_start = pos
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._complete_field(buf, pos)
+                    self.closed = True
+                    self._pos = pos + 1
+                    return
+            elif ch == ":" and self._depth == 1 and self._value_start < 0:
+                self._value_start = pos + 1
+            elif ch == "," and self._depth == 1:
+                self._complete_field(buf, pos)
+        self._pos = len(buf)
+
+    def _complete_field(self, buf: str, end: int) -> None:
+        if self._key is not None and self._value_start >= 0:
+            raw = buf[self._value_start:end].strip()
+            try:
+                self.fields[self._key] = json.loads(raw)
+            except ValueError:
+                pass
+        self._key = None
+        self._value_start = -1
+
+    @staticmethod
+    def _decode(raw: str) -> Optional[str]:
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return None
+        return value if isinstance(value, str) else None
+
+
+def early_decision_ready(fields: Dict[str, Any]) -> bool:
+    """True once every field the step loop consumes right after the decision is complete."""
+    if any(name not in fields for name in _EARLY_FIELDS):
+        return False
+    if fields.get("is_goal_achieved") is True and "goal_achievement_reason" not in fields:
+        return False
+    if fields.get("collect_text_evidence") is True:
+        return "text_evidence_reason" in fields and "text_evidence_focus" in fields
+    return True
+
+
+@dataclass
+class DecisionStreamTail:
+    future: "Future[str]"
+    committed_text: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def _ensure_executor(agent: Any) -> ThreadPoolExecutor:
+    executor = getattr(agent, "_decision_stream_executor", None)
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gaia-decision-tail")
+        agent._decision_stream_executor = executor
+    return executor
+
+
+def _record(agent: Any, payload: Dict[str, Any]) -> None:
+    profiler = getattr(agent, "_step_profiler", None)
+    recorder = getattr(profiler, "record_event", None)
+    if callable(recorder):
+        recorder("decision_stream", payload)
+
+
+def _drain_tail(stream: Iterator[str], scanner: DecisionStreamScanner) -> str:
+    for delta in stream:
+        scanner.feed(delta)
+    return scanner.text
+
+
+def stream_decision_response(
+    agent: Any,
+    prompt: str,
+    screenshot: Optional[str],
+    *,
+    participant_mode: bool,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Stream the decision and return ``(response_text, stream_trace)`` at the earliest safe point."""
+    started = time.perf_counter()
+    images = [screenshot] if screenshot else []
+    stream = iter(
+        agent.llm.stream_text(
+            prompt,
+            images,
+            max_completion_tokens=None if images else 4096,
+            temperature=0.1,
+        )
+    )
+    scanner = DecisionStreamScanner()
+    allow_fields = not participant_mode and not bool(getattr(agent, "_decision_stream_hold", False))
+    trace: Dict[str, Any] = {"commit": "end", "first_token_ms": None}
+    response_text: Optional[str] = None
+    for delta in stream:
+        if trace["first_token_ms"] is None:
+            trace["first_token_ms"] = int((time.perf_counter() - started) * 1000)
+        scanner.feed(delta)
+        if scanner.closed:
+            trace["commit"] = "object"
+            response_text = scanner.text
+            break
+        if allow_fields and early_decision_ready(scanner.fields):
+            trace["commit"] = "fields"
+            response_text = json.dumps(scanner.fields, ensure_ascii=False)
+            break
+    trace["commit_ms"] = int((time.perf_counter() - started) * 1000)
+    trace["chars_at_commit"] = len(scanner.text)
+    if response_text is None:
+        _record(agent, dict(trace))
+        return scanner.text, trace
+    tails = getattr(agent, "_decision_stream_tails", None)
+    if not isinstance(tails, list):
+        tails = []
+        agent._decision_stream_tails = tails
+    tails.append(
+        DecisionStreamTail(
+            future=_ensure_executor(agent).submit(_drain_tail, stream, scanner),
+            committed_text=response_text,
+            metadata={**dict(metadata or {}), "commit": trace["commit"]},
+        )
+    )
+    _record(agent, dict(trace))
+    return response_text, trace
+
+
+def _dropped_coordination_fields(committed_text: str, full_text: str) -> List[str]:
+    scanner = DecisionStreamScanner()
+    scanner.feed(full_text)
+    committed = DecisionStreamScanner()
+    committed.feed(committed_text)
+    dropped = []
+    for name in _COORDINATION_FIELDS:
+        value = scanner.fields.get(name)
+        if value in (None, "", {}, []) or name in committed.fields:
+            continue
+        if name == "participant_plan" and isinstance(value, dict) and not value.get("required"):
+            continue
+        dropped.append(name)
+    return dropped
+
+
+def flush_decision_stream_tails(agent: Any, *, wait_s: float = 0.0) -> int:
+    """Record finished stream tails on the step thread; return how many were flushed.
+
+    With ``wait_s`` the pending tails are first given up to that long to finish.
+    """
+    tails = getattr(agent, "_decision_stream_tails", None)
+    if not isinstance(tails, list) or not tails:
+        return 0
+    if wait_s > 0:
+        wait_futures([tail.future for tail in tails], timeout=wait_s)
+    from .run_history_runtime import record_run_history_transcript
+
+    flushed = 0
+    for tail in list(tails):
+        if not tail.future.done():
+            continue
+        tails.remove(tail)
+        flushed += 1
+        try:
+            full_text = tail.future.result()
+        except Exception as exc:
+            _record(agent, {"commit": tail.metadata.get("commit"), "tail_error": str(exc)[:200]})
+            continue
+        dropped = _dropped_coordination_fields(tail.committed_text, full_text)
+        if dropped:
+            # 조기 확정이 협업 필드를 놓쳤으면 이 goal 동안은 객체가 닫힐 때까지 기다린다
+            agent._decision_stream_hold = True
+            recorder = getattr(agent, "_record_reason_code", None)
+            if callable(recorder):
+                recorder("llm_stream_tail_dropped_fields")
+        record_run_history_transcript(
+            agent,
+            stage="actor_decision_response_tail",
+            role="assistant",
+            content=full_text,
+            metadata={**tail.metadata, "dropped_fields": dropped},
+        )
+    return flushed
+
+
+def finish_decision_stream(agent: Any) -> int:
+    """Flush the tails left when a goal ends, waiting briefly for ones still draining."""
+    return flush_decision_stream_tails(agent, wait_s=_FINISH_TAIL_WAIT_S)
+
+
+def shutdown_decision_stream(agent: Any) -> None:
+    agent._decision_stream_tails = []
+    agent._decision_stream_hold = False
+    executor = getattr(agent, "_decision_stream_executor", None)
+    agent._decision_stream_executor = None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "DecisionStreamScanner",
+    "DecisionStreamTail",
+    "decision_streaming_enabled",
+    "early_decision_ready",
+    "finish_decision_stream",
+    "flush_decision_stream_tails",
+    "shutdown_decision_stream",
+    "stream_decision_response",
+]
@@ -4,6 +4,9 @@ import os
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+from gaia.src.phase4.mcp_ref.snapshot_diff import build_role_snapshot_index, render_role_snapshot_delta
+
+from .element_feature_index import ElementFeatures, active_element_feature_index
 from .models import DOMElement
 
 
@@ -14,7 +17,42 @@ def truncate_for_prompt(text: str, limit: int = 120) -> str:
     return normalized
 
 
+def _element_features(agent: Any, el: DOMElement) -> Optional[ElementFeatures]:
+    if not callable(getattr(agent, "_normalize_text", None)) or not callable(getattr(agent, "_tokenize_text", None)):
+        return None
+    index = active_element_feature_index(agent)
+    if index is None:
+        return None
+    return index.features(agent, el, _element_fields)
+
+
+def _goal_memo(agent: Any, el: DOMElement, name: str, compute: Any) -> Any:
+    features = _element_features(agent, el)
+    if features is None:
+        return compute(None)
+    if name not in features.goal_memo:
+        features.goal_memo[name] = compute(features)
+    return features.goal_memo[name]
+
+
+def _fields_have_hint(agent: Any, features: Optional[ElementFeatures], fields: List[str], hint_name: str) -> bool:
+    if features is not None and hint_name in features.field_hints:
+        return features.field_hints[hint_name]
+    check = getattr(agent, hint_name)
+    value = any(check(f) for f in fields)
+    if features is not None:
+        features.field_hints[hint_name] = value
+    return value
+
+
 def fields_for_element(agent: Any, el: DOMElement) -> List[str]:
+    features = _element_features(agent, el)
+    if features is not None:
+        return list(features.fields)
+    return _element_fields(agent, el)
+
+
+def _element_fields(agent: Any, el: DOMElement) -> List[str]:
     selector = agent._element_full_selectors.get(el.id) or agent._element_selectors.get(el.id) or ""
     backend_name = str(getattr(agent, "_browser_backend_name", "") or "").strip().lower()
     group_action_blob = ""
@@ -44,6 +82,11 @@ def context_match_tokens(agent: Any, el: DOMElement) -> List[str]:
     goal_tokens = set(getattr(agent, "_goal_tokens", set()) or set())
     if not goal_tokens:
         return []
+    features = _element_features(agent, el)
+    if features is not None:
+        return sorted(
+            goal_tokens.intersection(features.text_tokens | features.container_tokens | features.context_tokens)
+        )
     matched: set[str] = set()
     for source in (
         getattr(el, "text", None),
@@ -60,11 +103,24 @@ def role_ref_alignment_score(agent: Any, el: DOMElement) -> float:
     goal_tokens = set(getattr(agent, "_goal_tokens", set()) or set())
     if not goal_tokens:
         return 0.0
+    return _goal_memo(
+        agent, el, "role_ref_alignment_score", lambda features: _role_ref_alignment_score(agent, el, goal_tokens, features)
+    )
+
+
+def _role_ref_alignment_score(
+    agent: Any,
+    el: DOMElement,
+    goal_tokens: set[str],
+    features: Optional[ElementFeatures],
+) -> float:
     backend_name = str(getattr(agent, "_browser_backend_name", "") or "").strip().lower()
     role_name = str(getattr(el, "role_ref_name", None) or "")
     role_role = str(getattr(el, "role_ref_role", None) or "")
+    role_name_tokens = features.role_name_tokens if features is not None else set(agent._tokenize_text(role_name))
+    normalized_role_name = features.role_ref_name_norm if features is not None else agent._normalize_text(role_name)
     score = 0.0
-    score += 1.5 * len(goal_tokens.intersection(set(agent._tokenize_text(role_name))))
+    score += 1.5 * len(goal_tokens.intersection(role_name_tokens))
     if role_role.lower() in {"row", "listitem", "gridcell", "cell", "article"}:
         score += 1.25
     elif backend_name != "openclaw" and role_role.lower() in {"button", "link", "tab", "menuitem", "option"}:
@@ -72,7 +128,7 @@ def role_ref_alignment_score(agent: Any, el: DOMElement) -> float:
     quoted_matches = re.findall(r'"([^"]+)"', str(getattr(agent, "_active_goal_text", "") or ""))
     for phrase in quoted_matches:
         normalized_phrase = agent._normalize_text(phrase)
-        if normalized_phrase and normalized_phrase in agent._normalize_text(role_name):
+        if normalized_phrase and normalized_phrase in normalized_role_name:
             score += 3.0
     return float(score)
 
@@ -81,10 +137,28 @@ def context_score(agent: Any, el: DOMElement) -> float:
     goal_tokens = set(getattr(agent, "_goal_tokens", set()) or set())
     if not goal_tokens:
         return 0.0
+    return _goal_memo(agent, el, "context_score", lambda features: _context_score(agent, el, goal_tokens, features))
+
+
+def _context_score(
+    agent: Any,
+    el: DOMElement,
+    goal_tokens: set[str],
+    features: Optional[ElementFeatures],
+) -> float:
     backend_name = str(getattr(agent, "_browser_backend_name", "") or "").strip().lower()
-    text_tokens = set(agent._tokenize_text(getattr(el, "text", "") or ""))
-    container_tokens = set(agent._tokenize_text(getattr(el, "container_name", "") or ""))
-    context_tokens = set(agent._tokenize_text(getattr(el, "context_text", "") or ""))
+    if features is not None:
+        text_tokens = features.text_tokens
+        container_tokens = features.container_tokens
+        context_tokens = features.context_tokens
+        normalized_container_name = features.container_name_norm
+        normalized_context_text = features.context_text_norm
+    else:
+        text_tokens = set(agent._tokenize_text(getattr(el, "text", "") or ""))
+        container_tokens = set(agent._tokenize_text(getattr(el, "container_name", "") or ""))
+        context_tokens = set(agent._tokenize_text(getattr(el, "context_text", "") or ""))
+        normalized_container_name = agent._normalize_text(getattr(el, "container_name", "") or "")
+        normalized_context_text = agent._normalize_text(getattr(el, "context_text", "") or "")
     score = 0.0
     if backend_name == "openclaw":
         score += 1.5 * len(goal_tokens.intersection(text_tokens))
@@ -98,13 +172,13 @@ def context_score(agent: Any, el: DOMElement) -> float:
     quoted_matches = re.findall(r'"([^"]+)"', str(getattr(agent, "_active_goal_text", "") or ""))
     for phrase in quoted_matches:
         normalized_phrase = agent._normalize_text(phrase)
-        if normalized_phrase and normalized_phrase in agent._normalize_text(getattr(el, "container_name", "") or ""):
+        if normalized_phrase and normalized_phrase in normalized_container_name:
             score += 4.0
-        elif normalized_phrase and normalized_phrase in agent._normalize_text(getattr(el, "context_text", "") or ""):
+        elif normalized_phrase and normalized_phrase in normalized_context_text:
             score += 3.5 if backend_name == "openclaw" else 2.5
     if backend_name != "openclaw":
         action_labels = [agent._normalize_text(v) for v in (getattr(el, "group_action_labels", None) or []) if v]
-        duplicate_label = agent._normalize_text(getattr(el, "text", "") or "")
+        duplicate_label = features.text_norm if features is not None else agent._normalize_text(getattr(el, "text", "") or "")
         if duplicate_label and action_labels.count(duplicate_label) > 1 and goal_tokens.intersection(container_tokens):
             score += 1.5
     return float(score)
@@ -117,6 +191,10 @@ def semantic_tags_for_element(agent: Any, el: DOMElement) -> List[str]:
     normalize = getattr(agent, "_normalize_text", None)
     if not callable(normalize):
         return []
+    return list(_goal_memo(agent, el, "semantic_tags", lambda _features: _semantic_tags(el, semantics, normalize)))
+
+
+def _semantic_tags(el: DOMElement, semantics: Any, normalize: Any) -> List[str]:
     target_terms = [
         normalize(term)
         for term in list(getattr(semantics, "target_terms", []) or [])
@@ -523,11 +601,17 @@ def pick_scoped_container(
         group_name = str(bucket["name"] or "")
         group_source = str(bucket["source"] or "")
         group_elements = list(bucket["elements"] or [])
-        container_tokens = set(agent._tokenize_text(group_name))
         context_blob = " ".join(
             str(getattr(el, "context_text", None) or "") for el in group_elements if getattr(el, "context_text", None)
         )
-        context_tokens = set(agent._tokenize_text(context_blob))
+        group_features = [_element_features(agent, el) for el in group_elements]
+        if group_features and all(features is not None for features in group_features):
+            # Tokens never span the joining spaces, so the union equals tokenizing the joined blob.
+            container_tokens = set(group_features[0].container_tokens)
+            context_tokens = set().union(*(features.context_tokens for features in group_features))
+        else:
+            container_tokens = set(agent._tokenize_text(group_name))
+            context_tokens = set(agent._tokenize_text(context_blob))
         score = 0.0
         score += 2.5 * len(goal_tokens.intersection(container_tokens))
         score += 1.0 * len(goal_tokens.intersection(context_tokens))
@@ -580,41 +664,18 @@ def _compute_delta_snapshot(
 ) -> Tuple[List[str], float]:
     """이전 턴과 현재 턴의 raw snapshot을 비교해 변경된 영역만 추출한다.
 
+    ref/role/name 기준 subtree 해시 diff를 사용하므로 긴 페이지에서도 거의 선형 시간이다.
+
     Returns:
         (delta_lines, change_ratio) — change_ratio는 0.0~1.0
     """
-    import difflib
-
     if not prev_lines:
         return cur_lines, 1.0
-
-    matcher = difflib.SequenceMatcher(None, prev_lines, cur_lines, autojunk=False)
-    changed_indices: set = set()
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-        if tag == "equal":
-            continue
-        for j in range(max(0, j1 - context_radius), min(len(cur_lines), j2 + context_radius)):
-            changed_indices.add(j)
-
-    if not changed_indices:
-        return [], 0.0
-
-    change_ratio = len(changed_indices) / max(1, len(cur_lines))
-
-    sorted_indices = sorted(changed_indices)
-    delta_lines: List[str] = []
-    prev_idx = -2
-    for idx in sorted_indices:
-        if idx > prev_idx + 1:
-            if delta_lines:
-                delta_lines.append(f"... (unchanged {idx - prev_idx - 1} lines)")
-        delta_lines.append(cur_lines[idx])
-        prev_idx = idx
-
-    remaining = len(cur_lines) - 1 - prev_idx
-    if remaining > 0:
-        delta_lines.append(f"... (unchanged {remaining} lines)")
-
+    delta_lines, change_ratio, _diff = render_role_snapshot_delta(
+        "\n".join(prev_lines),
+        "\n".join(cur_lines),
+        context_radius=context_radius,
+    )
     return delta_lines, change_ratio
 
 
@@ -766,8 +827,10 @@ def _render_openclaw_raw_role_tree(
         fallback_ratio = 0.7
 
     if prev_text and not delta_disabled:
-        prev_lines = prev_text.splitlines()
-        delta_lines, change_ratio = _compute_delta_snapshot(prev_lines, raw_lines)
+        delta_lines, change_ratio, diff = render_role_snapshot_delta(
+            "\n".join(prev_text.splitlines()),
+            "\n".join(raw_lines),
+        )
 
         if change_ratio == 0.0:
             agent._prev_raw_snapshot_text = snapshot_text
@@ -775,9 +838,18 @@ def _render_openclaw_raw_role_tree(
 
         if change_ratio < fallback_ratio:
             agent._prev_raw_snapshot_text = snapshot_text
-            return [
-                f"(변경 영역만 표시 — 전체 {len(raw_lines)}줄 중 {len(delta_lines)}줄, 변경률 {change_ratio:.0%})",
-            ] + delta_lines
+            header = [
+                f"(변경 영역만 표시 — 전체 {len(raw_lines)}줄 중 {len(delta_lines)}줄, 변경률 {change_ratio:.0%}, "
+                f"추가 {len(diff.inserted)} · 제거 {len(diff.removed)} · 변경 {len(diff.changed)})",
+            ]
+            if diff.removed:
+                removed_index = build_role_snapshot_index("\n".join(prev_text.splitlines()))
+                removed_labels = [
+                    truncate_for_prompt(removed_index.nodes[line].text.strip(), 80)
+                    for line in diff.removed[:3]
+                ]
+                header.append(f"(제거된 영역: {' | '.join(removed_labels)})")
+            return header + delta_lines
 
     agent._prev_raw_snapshot_text = snapshot_text
     return raw_lines
@@ -960,7 +1032,8 @@ def format_dom_for_llm(agent: Any, elements: List[DOMElement]) -> str:
         return "\n".join(lines)
 
     def _score(el: DOMElement) -> float:
-        text = agent._normalize_text(el.text)
+        features = _element_features(agent, el)
+        text = features.text_norm if features is not None else agent._normalize_text(el.text)
         aria = agent._normalize_text(el.aria_label)
         role = agent._normalize_text(el.role)
         tag = agent._normalize_text(el.tag)
@@ -968,16 +1041,16 @@ def format_dom_for_llm(agent: Any, elements: List[DOMElement]) -> str:
         selector = agent._element_full_selectors.get(el.id) or agent._element_selectors.get(el.id) or ""
         fields = agent._fields_for_element(el)
 
-        has_progress = any(agent._contains_progress_cta_hint(f) for f in fields)
-        has_next = any(agent._contains_next_pagination_hint(f) for f in fields)
-        has_context = any(agent._contains_context_shift_hint(f) for f in fields)
-        has_expand = any(agent._contains_expand_hint(f) for f in fields)
-        has_wishlist_like = any(agent._contains_wishlist_like_hint(f) for f in fields)
-        has_add_like = any(agent._contains_add_like_hint(f) for f in fields)
-        has_login_hint = any(agent._contains_login_hint(f) for f in fields)
-        has_configure = any(agent._contains_configure_hint(f) for f in fields)
-        has_execute = any(agent._contains_execute_hint(f) for f in fields)
-        has_apply = any(agent._contains_apply_hint(f) for f in fields)
+        has_progress = _fields_have_hint(agent, features, fields, "_contains_progress_cta_hint")
+        has_next = _fields_have_hint(agent, features, fields, "_contains_next_pagination_hint")
+        has_context = _fields_have_hint(agent, features, fields, "_contains_context_shift_hint")
+        has_expand = _fields_have_hint(agent, features, fields, "_contains_expand_hint")
+        has_wishlist_like = _fields_have_hint(agent, features, fields, "_contains_wishlist_like_hint")
+        has_add_like = _fields_have_hint(agent, features, fields, "_contains_add_like_hint")
+        has_login_hint = _fields_have_hint(agent, features, fields, "_contains_login_hint")
+        has_configure = _fields_have_hint(agent, features, fields, "_contains_configure_hint")
+        has_execute = _fields_have_hint(agent, features, fields, "_contains_execute_hint")
+        has_apply = _fields_have_hint(agent, features, fields, "_contains_apply_hint")
 
         score = 0.0
         semantic_tags = set(semantic_tag_cache.get(int(getattr(el, "id", -1)), []) or [])
@@ -1043,9 +1116,14 @@ def format_dom_for_llm(agent: Any, elements: List[DOMElement]) -> str:
                 score -= 7.0
 
         normalized_selector = agent._normalize_text(selector)
-        normalized_container_name = agent._normalize_text(getattr(el, "container_name", None) or "")
-        normalized_context_text = agent._normalize_text(getattr(el, "context_text", None) or "")
-        container_tokens = set(agent._tokenize_text(getattr(el, "container_name", "") or ""))
+        if features is not None:
+            normalized_container_name = features.container_name_norm
+            normalized_context_text = features.context_text_norm
+            container_tokens = set(features.container_tokens)
+        else:
+            normalized_container_name = agent._normalize_text(getattr(el, "container_name", None) or "")
+            normalized_context_text = agent._normalize_text(getattr(el, "context_text", None) or "")
+            container_tokens = set(agent._tokenize_text(getattr(el, "container_name", "") or ""))
         self_blob = agent._normalize_text(
             " ".join(
                 [
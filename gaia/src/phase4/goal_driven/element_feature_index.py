@@ -0,0 +1,123 @@
+"""Per-snapshot element feature index shared by prompt formatting and scoring.
+
+``format_dom_for_llm``, its element ranking and ``pick_scoped_container`` all
+look at the same elements several times per step, and each look used to
+re-normalize and re-tokenize the same strings. The index keeps the
+snapshot-scoped features of every element (normalized text, token sets,
+prompt fields) keyed by the active snapshot id / DOM hash, plus goal-scoped derived values (semantic tags, context scores) that
+are dropped whenever the goal changes. Without a snapshot identity nothing is
+cached, so callers outside a live snapshot see exactly the uncached behaviour.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .models import DOMElement
+
+
+def element_feature_index_enabled() -> bool:
+    raw_value = str(os.getenv("GAIA_ELEMENT_FEATURE_INDEX", "1") or "1").strip().lower()
+    return raw_value not in {"0", "false", "no", "off"}
+
+
+@dataclass(slots=True)
+class ElementFeatures:
+    element: DOMElement
+    fields: List[str]
+    text_norm: str
+    container_name_norm: str
+    context_text_norm: str
+    role_ref_name_norm: str
+    text_tokens: frozenset[str]
+    container_tokens: frozenset[str]
+    context_tokens: frozenset[str]
+    role_name_tokens: frozenset[str]
+    # ``any(agent.<hint>(field) for field in fields)`` results; hints are pure text checks.
+    field_hints: Dict[str, bool] = field(default_factory=dict)
+    # Goal-dependent values (semantic tags, context scores); cleared on goal change.
+    goal_memo: Dict[str, Any] = field(default_factory=dict)
+
+
+class ElementFeatureIndex:
+    def __init__(self, snapshot_key: Tuple[Any, ...]) -> None:
+        self.snapshot_key = snapshot_key
+        self._goal_refs: Tuple[Any, ...] = ()
+        self._entries: Dict[int, ElementFeatures] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync_goal(self, goal_refs: Tuple[Any, ...]) -> None:
+        previous = self._goal_refs
+        if len(previous) == len(goal_refs) and all(a is b or a == b for a, b in zip(previous, goal_refs)):
+            return
+        self._goal_refs = goal_refs
+        for entry in self._entries.values():
+            entry.goal_memo.clear()
+
+    def features(self, agent: Any, el: DOMElement, build_fields: Callable[[Any, DOMElement], List[str]]) -> ElementFeatures:
+        entry = self._entries.get(id(el))
+        if entry is not None and entry.element is el:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        normalize = agent._normalize_text
+        tokenize = agent._tokenize_text
+        text = str(getattr(el, "text", "") or "")
+        container_name = str(getattr(el, "container_name", None) or "")
+        context_text = str(getattr(el, "context_text", None) or "")
+        role_ref_name = str(getattr(el, "role_ref_name", None) or "")
+        entry = ElementFeatures(
+            element=el,
+            fields=build_fields(agent, el),
+            text_norm=normalize(text),
+            container_name_norm=normalize(container_name),
+            context_text_norm=normalize(context_text),
+            role_ref_name_norm=normalize(role_ref_name),
+            text_tokens=frozenset(tokenize(text)),
+            container_tokens=frozenset(tokenize(container_name)),
+            context_tokens=frozenset(tokenize(context_text)),
+            role_name_tokens=frozenset(tokenize(role_ref_name)),
+        )
+        self._entries[id(el)] = entry
+        return entry
+
+
+def _snapshot_key(agent: Any) -> Tuple[Any, ...]:
+    snapshot_id = str(getattr(agent, "_active_snapshot_id", "") or "")
+    dom_hash = str(getattr(agent, "_active_dom_hash", "") or "")
+    if not snapshot_id and not dom_hash:
+        return ()
+    # The selector maps are rebuilt per snapshot and feed the prompt fields.
+    return (snapshot_id, dom_hash, id(getattr(agent, "_element_full_selectors", None)))
+
+
+def _goal_refs(agent: Any) -> Tuple[Any, ...]:
+    return (
+        getattr(agent, "_goal_semantics", None),
+        getattr(agent, "_goal_tokens", None),
+        str(getattr(agent, "_active_goal_text", "") or ""),
+        str(getattr(agent, "_browser_backend_name", "") or "").strip().lower(),
+    )
+
+
+def active_element_feature_index(agent: Any) -> Optional[ElementFeatureIndex]:
+    """Return the index for the agent's current snapshot, replacing a stale one; ``None`` if uncacheable."""
+    if not element_feature_index_enabled():
+        return None
+    key = _snapshot_key(agent)
+    if not key:
+        return None
+    index = getattr(agent, "_element_feature_index", None)
+    if not isinstance(index, ElementFeatureIndex) or index.snapshot_key != key:
+        index = ElementFeatureIndex(key)
+        try:
+            agent._element_feature_index = index
+        except Exception:
+            return None
+    index.sync_goal(_goal_refs(agent))
+    return index
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import os
-import time
 from typing import Any, Dict, List, Optional, Set
 
 from .models import ActionDecision, ActionType, DOMElement, StepResult, TestGoal
+from .page_settle_runtime import settle_page
 
 
 def _policy_int(agent: Any, key: str, default: int) -> int:
@@ -304,7 +304,7 @@ def handle_forced_context_shift(
                 context_shift_used_elements.clear()
                 agent._last_context_shift_intent = ""
                 context_shift_cooldown = context_shift_cooldown_steps
-                time.sleep(0.2)
+                settle_page(agent, reason="context_shift", max_wait_ms=1000, fallback_ms=200)
                 return {
                     "continue_loop": False,
                     "force_context_shift": force_context_shift,
@@ -314,7 +314,7 @@ def handle_forced_context_shift(
                 }
             else:
                 force_context_shift = True
-        time.sleep(0.4)
+        settle_page(agent, reason="context_shift", max_wait_ms=2000, fallback_ms=400)
         return {
             "continue_loop": True,
             "force_context_shift": force_context_shift,
@@ -391,7 +391,7 @@ def handle_forced_context_shift(
                     "context_shift_cooldown": context_shift_cooldown,
                     "ineffective_action_streak": ineffective_action_streak,
                 }
-        time.sleep(0.3)
+        settle_page(agent, reason="context_shift", max_wait_ms=1500, fallback_ms=300)
         return {
             "continue_loop": True,
             "force_context_shift": force_context_shift,
@@ -5,6 +5,7 @@ import re
 from typing import Any, Dict, List, Optional, Set
 from urllib.parse import urljoin, urlparse
 
+from .action_frontier import FrontierEntry, frontier_key
 from .exploratory_models import ElementState, PageState, TestableAction
 from .models import DOMElement
 
@@ -398,17 +399,12 @@ def generate_testable_actions(agent: Any, page_state: PageState) -> List[Testabl
 
 
 def enqueue_frontier_action(agent: Any, page_state: PageState, action: TestableAction) -> None:
-    key = f"{page_state.url_hash}:{action.element_id}:{action.action_type}"
-    if key in agent._action_frontier_set:
-        return
-    agent._action_frontier.append(
-        {
-            "url_hash": page_state.url_hash,
-            "element_id": action.element_id,
-            "action_type": action.action_type,
-        }
+    agent._action_frontier.push(
+        page_state.url_hash,
+        action.element_id,
+        action.action_type,
+        priority=float(action.priority),
     )
-    agent._action_frontier_set.add(key)
 
 
 def has_pending_inputs(agent: Any, page_state: PageState) -> bool:
@@ -695,37 +691,42 @@ def select_frontier_action(
     page_state: PageState,
     testable_actions: List[TestableAction],
 ) -> Optional[TestableAction]:
-    if not agent._action_frontier:
+    frontier = agent._action_frontier
+    if not frontier.partition_size(page_state.url_hash):
         return None
 
     action_map = {
-        f"{page_state.url_hash}:{action.element_id}:{action.action_type}": action
+        frontier_key(page_state.url_hash, action.element_id, action.action_type): action
         for action in testable_actions
     }
-    element_map = {el.element_id: el for el in page_state.interactive_elements}
-    candidates: List[tuple[float, Dict[str, str], str, Optional[TestableAction], Optional[ElementState]]] = []
-    for index, entry in enumerate(list(agent._action_frontier)):
-        if entry["url_hash"] != page_state.url_hash:
-            continue
-        key = f"{entry['url_hash']}:{entry['element_id']}:{entry['action_type']}"
-        action = action_map.get(key)
-        element = element_map.get(entry["element_id"])
+    # 우선순위는 매 스텝 다시 계산되므로(auth 부스트 등) 오른 항목은 힙 bound를 갱신한다
+    for key, action in action_map.items():
+        frontier.raise_priority(key, float(action.priority))
+    order_bonuses = frontier.order_bonuses()
+    element_map: Optional[Dict[str, ElementState]] = None
+
+    def _element(element_id: str) -> Optional[ElementState]:
+        nonlocal element_map
+        if element_map is None:
+            element_map = {el.element_id: el for el in page_state.interactive_elements}
+        return element_map.get(element_id)
+
+    def _score(entry: FrontierEntry) -> float:
+        action = action_map.get(entry.key)
+        element = _element(entry.element_id)
         score = float(action.priority) if action else 0.0
         if element is not None:
             score += frontier_context_bonus(agent, element)
-        score += max(0.0, 0.25 - (index * 0.01))
-        candidates.append((score, entry, key, action, element))
+        return score + order_bonuses.get(entry.key, 0.0)
 
-    if not candidates:
+    entry = frontier.pop_best(page_state.url_hash, _score)
+    if entry is None:
         return None
-
-    candidates.sort(key=lambda item: item[0], reverse=True)
-    _score, entry, key, action, element = candidates[0]
-    agent._action_frontier.remove(entry)
-    agent._action_frontier_set.discard(key)
+    action = action_map.get(entry.key)
     if action:
         return action
+    element = _element(entry.element_id)
     if element:
-        return build_action_for_element(agent, element, entry["action_type"])
+        return build_action_for_element(agent, element, entry.action_type)
 
     return None
@@ -1,67 +1,45 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import math
-import os
 import re
 from pathlib import Path
 from typing import Any, List, Optional
 
 from gaia.src.phase4.memory.models import MemorySummaryRecord
 from .exploratory_models import ExplorationResult, PageState, TestableAction
+from .llm_response_cache import LLMResponseCache, screenshot_digest
+from .semantic_cache_index import open_semantic_cache
 
 
 def resolve_llm_cache_path() -> str:
     repo_root = Path(__file__).resolve().parents[4]
-    return str(repo_root / "artifacts" / "llm_cache.json")
+    return str(repo_root / "artifacts" / "cache" / "llm_cache.sqlite3")
 
 
 def resolve_semantic_cache_path() -> str:
     repo_root = Path(__file__).resolve().parents[4]
-    return str(repo_root / "artifacts" / "cache" / "semantic_llm_cache.json")
+    return str(repo_root / "artifacts" / "cache" / "semantic_llm_cache.sqlite3")
 
 
 def load_llm_cache(agent: Any) -> None:
     try:
-        if os.path.exists(agent._llm_cache_path):
-            with open(agent._llm_cache_path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            if isinstance(data, dict):
-                agent._llm_cache = {k: str(v) for k, v in data.items()}
+        agent._llm_cache = LLMResponseCache(agent._llm_cache_path)
     except Exception as exc:
         agent._log(f"⚠️ LLM 캐시 로드 실패: {exc}")
 
 
-def save_llm_cache(agent: Any) -> None:
-    try:
-        os.makedirs(os.path.dirname(agent._llm_cache_path), exist_ok=True)
-        with open(agent._llm_cache_path, "w", encoding="utf-8") as handle:
-            json.dump(agent._llm_cache, handle, ensure_ascii=False, indent=2)
-    except Exception as exc:
-        agent._log(f"⚠️ LLM 캐시 저장 실패: {exc}")
-
-
 def load_semantic_cache(agent: Any) -> None:
+    legacy_json_path = str(Path(agent._semantic_cache_path).with_suffix(".json"))
     try:
-        if os.path.exists(agent._semantic_cache_path):
-            with open(agent._semantic_cache_path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            if isinstance(data, list):
-                agent._semantic_cache = data
+        agent._semantic_cache = open_semantic_cache(
+            agent._semantic_cache_path,
+            legacy_json_path=legacy_json_path,
+        )
     except Exception as exc:
         agent._log(f"⚠️ 시맨틱 캐시 로드 실패: {exc}")
 
 
-def save_semantic_cache(agent: Any) -> None:
-    try:
-        os.makedirs(os.path.dirname(agent._semantic_cache_path), exist_ok=True)
-        with open(agent._semantic_cache_path, "w", encoding="utf-8") as handle:
-            json.dump(agent._semantic_cache, handle, ensure_ascii=False)
-    except Exception as exc:
-        agent._log(f"⚠️ 시맨틱 캐시 저장 실패: {exc}")
-
-
 def record_exploration_summary(agent: Any, *, result: ExplorationResult) -> None:
     if not agent._memory_store.enabled:
         return
@@ -85,6 +63,7 @@ def record_exploration_summary(agent: Any, *, result: ExplorationResult) -> None
                 },
             )
         )
+        agent._memory_store.flush()
     except Exception:
         return
 
@@ -94,7 +73,7 @@ def get_llm_cache_key(prompt: str, screenshot: Optional[str], action_signature:
     digest.update(prompt.encode("utf-8"))
     digest.update(action_signature.encode("utf-8"))
     if screenshot:
-        digest.update(screenshot.encode("utf-8"))
+        digest.update(screenshot_digest(screenshot).encode("utf-8"))
     return digest.hexdigest()
 
 
@@ -148,37 +127,17 @@ def cosine_similarity(left: List[float], right: List[float]) -> float:
 def semantic_cache_lookup(agent: Any, text: str, action_signature: str, threshold: float = 0.95) -> Optional[str]:
     if not agent._semantic_cache:
         return None
-    query_embedding = embed_text(text)
-    best_score = 0.0
-    best_response: Optional[str] = None
-    for entry in agent._semantic_cache:
-        embedding = entry.get("embedding")
-        response = entry.get("response")
-        signature = entry.get("signature")
-        if signature != action_signature:
-            continue
-        if not isinstance(embedding, list) or not isinstance(response, str):
-            continue
-        score = cosine_similarity(query_embedding, embedding)
-        if score > best_score:
-            best_score = score
-            best_response = response
-    if best_response and best_score >= threshold:
-        agent._log(f"🧠 시맨틱 캐시 hit (score={best_score:.2f})")
-        return best_response
+    response, score = agent._semantic_cache.lookup(embed_text(text), action_signature, threshold)
+    if response:
+        agent._log(f"🧠 시맨틱 캐시 hit (score={score:.2f})")
+        return response
     return None
 
 
 def semantic_cache_store(agent: Any, text: str, response: str, action_signature: str) -> None:
-    embedding = embed_text(text)
-    agent._semantic_cache.append(
-        {
-            "embedding": embedding,
-            "response": response,
-            "text": text[:500],
-            "signature": action_signature,
-        }
-    )
-    if len(agent._semantic_cache) > 200:
-        agent._semantic_cache = agent._semantic_cache[-200:]
-    save_semantic_cache(agent)
+    if agent._semantic_cache is None:
+        return
+    try:
+        agent._semantic_cache.store(embed_text(text), response, action_signature, text)
+    except Exception as exc:
+        agent._log(f"⚠️ 시맨틱 캐시 저장 실패: {exc}")
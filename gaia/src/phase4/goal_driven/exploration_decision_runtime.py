@@ -157,6 +157,8 @@ def decide_next_exploration_action(
         action_signature = agent._action_signature(testable_actions)
         cache_key = agent._get_llm_cache_key(prompt, screenshot, action_signature)
         response_text = agent._llm_cache.get(cache_key)
+        if response_text and isinstance(agent._llm_cache, dict):
+            agent._llm_cache[cache_key] = agent._llm_cache.pop(cache_key)
 
         if response_text:
             agent._log("🧠 LLM 캐시 hit")
@@ -171,9 +173,9 @@ def decide_next_exploration_action(
                 response_text = agent._call_llm_text_only(prompt)
 
             agent._llm_cache[cache_key] = response_text
-            if len(agent._llm_cache) > 200:
+            if isinstance(agent._llm_cache, dict) and len(agent._llm_cache) > 200:
+                # SQLite 캐시를 못 연 경우의 메모리 fallback은 가장 오래 안 쓴 항목부터 버린다
                 agent._llm_cache.pop(next(iter(agent._llm_cache)))
-            agent._save_llm_cache()
 
             semantic_text = agent._semantic_cache_text(page_state, testable_actions)
             agent._semantic_cache_store(semantic_text, response_text, action_signature)
@@ -10,7 +10,7 @@ import json
 import math
 import os
 import re
-from typing import Any, Dict, List, Optional, Set, Callable, Tuple
+from typing import Any, Dict, List, Optional, Set, Callable, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin
@@ -20,6 +20,7 @@ from gaia.src.phase4.memory.store import MemoryStore
 from gaia.src.phase4.orchestrator import MasterOrchestrator
 from gaia.src.phase4.tool_loop_detector import ToolLoopDetector
 from gaia.src.phase4.browser_error_utils import add_no_retry_hint, extract_reason_fields
+from .action_frontier import ActionFrontier
 from .exploration_artifacts_runtime import (
     generate_gif as generate_gif_impl,
     save_screenshot_to_file as save_screenshot_to_file_impl,
@@ -43,12 +44,12 @@ from .exploration_cache_runtime import (
     record_exploration_summary as record_exploration_summary_impl,
     resolve_llm_cache_path as resolve_llm_cache_path_impl,
     resolve_semantic_cache_path as resolve_semantic_cache_path_impl,
-    save_llm_cache as save_llm_cache_impl,
-    save_semantic_cache as save_semantic_cache_impl,
     semantic_cache_lookup as semantic_cache_lookup_impl,
     semantic_cache_store as semantic_cache_store_impl,
     semantic_cache_text as semantic_cache_text_impl,
 )
+from .llm_response_cache import LLMResponseCache
+from .semantic_cache_index import SemanticCacheIndex
 from .exploratory_browser_runtime import (
     capture_screenshot as capture_screenshot_impl,
     check_console_errors as check_console_errors_impl,
@@ -134,6 +135,7 @@ from .exploratory_models import (
     ElementState,
 )
 from .models import DOMElement
+from .page_settle_runtime import settle_page
 
 
 class ExploratoryAgent:
@@ -209,20 +211,19 @@ class ExploratoryAgent:
         self._action_attempts: Dict[
             str, int
         ] = {}  # url_hash:element_id:action_type -> count
-        self._action_frontier: List[Dict[str, str]] = []
-        self._action_frontier_set: Set[str] = set()
+        self._action_frontier = ActionFrontier()
         self._state_action_history: Dict[str, Set[str]] = {}
         self._current_state_key: Optional[str] = None
         self._toggle_action_history: Dict[str, int] = {}
         self._seed_urls: List[str] = []
 
         # LLM 응답 캐시
-        self._llm_cache: Dict[str, str] = {}
+        self._llm_cache: Union[LLMResponseCache, Dict[str, str]] = {}
         self._llm_cache_path = self._resolve_llm_cache_path()
         self._load_llm_cache()
 
         # LLM 시맨틱 캐시
-        self._semantic_cache: List[Dict[str, object]] = []
+        self._semantic_cache: Optional[SemanticCacheIndex] = None
         self._semantic_cache_path = self._resolve_semantic_cache_path()
         self._load_semantic_cache()
 
@@ -483,15 +484,9 @@ class ExploratoryAgent:
     def _load_llm_cache(self) -> None:
         load_llm_cache_impl(self)
 
-    def _save_llm_cache(self) -> None:
-        save_llm_cache_impl(self)
-
     def _load_semantic_cache(self) -> None:
         load_semantic_cache_impl(self)
 
-    def _save_semantic_cache(self) -> None:
-        save_semantic_cache_impl(self)
-
     @staticmethod
     def _extract_domain(url: str) -> str:
         return extract_domain_impl(url)
@@ -631,7 +626,7 @@ class ExploratoryAgent:
         # 시작 URL로 이동
         self._log(f"📍 시작 URL로 이동")
         self._execute_action("goto", url=start_url)
-        time.sleep(2)  # 페이지 로드 대기
+        settle_page(self, reason="start_url", fallback_ms=2000)
         self._current_url = start_url
         self._seed_urls = self._normalize_seed_urls(start_url)
 
@@ -664,7 +659,7 @@ class ExploratoryAgent:
             page_state = self._analyze_current_page()
             if not page_state:
                 self._log("⚠️  페이지 분석 실패, 잠시 대기 후 재시도")
-                time.sleep(2)
+                settle_page(self, reason="page_analysis_retry", fallback_ms=2000)
                 page_state = self._analyze_current_page()
                 if not page_state:
                     self._log("❌ 페이지 분석 실패, 탐색 중단")
@@ -714,7 +709,7 @@ class ExploratoryAgent:
 
                 # 사용자가 로그인 완료 후 페이지 재분석
                 self._log("🔄 로그인 후 페이지 재분석...")
-                time.sleep(3)
+                settle_page(self, reason="post_login", max_wait_ms=6000, fallback_ms=3000)
                 page_state = self._analyze_current_page()
                 if page_state:
                     self._log(
@@ -981,7 +976,7 @@ class ExploratoryAgent:
                 self._tested_elements.add(decision.selected_action.element_id)
 
             # 11. 스크린샷 (액션 실행 후) - 결과 확인용 (GIF에는 포함 안함)
-            time.sleep(1)  # UI 변화 대기
+            settle_page(self, reason="post_action", fallback_ms=1000)  # UI 변화 대기
             screenshot_started_at = time.perf_counter()
             screenshot_after = self._capture_screenshot()
             screenshot_elapsed_ms = int((time.perf_counter() - screenshot_started_at) * 1000)
@@ -1187,6 +1182,7 @@ class ExploratoryAgent:
         self._verification_report["reason_code_summary"] = dict(self._validation_reason_counts or {})
         self._verification_report["container_source_summary"] = dict(self._last_container_source_summary or {})
         self._verification_report["active_scoped_container_ref"] = str(self._active_scoped_container_ref or "")
+        self._verification_report["frontier_stats"] = self._action_frontier.stats()
 
         # 최종 결과 생성
         result = ExplorationResult(
@@ -1725,7 +1721,14 @@ class ExploratoryAgent:
                     if menu_selector:
                         self._log("ℹ️ 메뉴 항목 클릭 전 메뉴 열기 시도")
                         self._execute_action("click", selector=menu_selector)
-                        time.sleep(0.5)
+                        settle_page(
+                            self,
+                            reason="menu_open",
+                            max_wait_ms=1500,
+                            quiet_ms=200,
+                            network_idle=False,
+                            fallback_ms=500,
+                        )
                         did_open_menu = True
                 self._execute_action(
                     "scrollIntoView",
@@ -1803,7 +1806,7 @@ class ExploratoryAgent:
                 success, error = False, f"지원하지 않는 액션: {action.action_type}"
 
             # 액션 실행 후 에러 수 확인
-            time.sleep(0.5)
+            settle_page(self, reason="post_action_console", max_wait_ms=2000, fallback_ms=500)
             errors_after = len(self._check_console_errors())
 
             # 새로운 에러 발생했으면 이슈로 기록
@@ -2161,7 +2164,7 @@ class ExploratoryAgent:
             if not ok:
                 self._log(f"⚠️ context shift navigate 실패: {err}")
                 continue
-            time.sleep(1.0)
+            settle_page(self, reason="context_shift_navigate", fallback_ms=1000)
             shifted_state = self._analyze_current_page()
             if shifted_state:
                 previous_phase = self._runtime_phase
@@ -2187,7 +2190,7 @@ class ExploratoryAgent:
             if not ok:
                 self._log(f"⚠️ context shift re-sync 실패: {err}")
                 continue
-            time.sleep(1.0)
+            settle_page(self, reason="context_shift_resync", fallback_ms=1000)
             shifted_state = self._analyze_current_page()
             if shifted_state:
                 previous_phase = self._runtime_phase
@@ -5,8 +5,10 @@ import time
 from typing import Any, Dict, List
 
 from .models import GoalResult, StepResult, TestGoal
+from .decision_stream_runtime import shutdown_decision_stream
 from .goal_policy_runtime import initialize_goal_policy_runtime
 from .goal_replanning_runtime import initialize_goal_replanning_state
+from .observation_prefetch import shutdown_observation_prefetch
 from .run_history_runtime import initialize_run_history as initialize_run_history_impl
 from .wrapper_trace_runtime import thin_wrapper_enabled
 
@@ -93,6 +95,9 @@ def initialize_goal_execution_state(agent: Any, goal: TestGoal) -> Dict[str, Any
     agent._captcha_observer_last_result = {}
     agent._captcha_observer_confirmed = False
     agent._captcha_observer_state = {}
+    shutdown_observation_prefetch(agent)
+    agent._observation_prefetch_metrics = {}
+    shutdown_decision_stream(agent)
     agent._blocked_intent = {}
     agent._blocked_intent_resumed = False
     agent._blocked_intent_resume_attempts = 0
@@ -5,9 +5,16 @@ import time
 from typing import Any, List, Optional
 
 from .browser_action_rules import (
-    build_browser_action_rules_for_agent,
+    build_browser_action_reinforcement_block,
+    build_browser_action_rules_block,
     slice_recent_prompt_items,
 )
+from .decision_prompt_layout import PromptSection, assemble_decision_prompt, build_static_prompt_prefix
+from .decision_stream_runtime import (
+    decision_streaming_enabled,
+    flush_decision_stream_tails,
+    stream_decision_response,
+)
 from .dom_prompt_formatting import detect_active_surface_context, semantic_tags_for_element
 from .goal_policy_phase_runtime import goal_phase_intent
 from .goal_completion_helpers import build_text_evidence_memory_block
@@ -24,10 +31,12 @@ from .multi_user_interaction_runtime import (
     build_participant_prompt_block,
     participant_test_data_for_prompt,
 )
+from .observation_prefetch import resolve_screenshot
 from .run_history_runtime import (
     build_run_history_replay_packet_context as build_run_history_replay_packet_context_impl,
     record_run_history_transcript as record_run_history_transcript_impl,
 )
+from .step_profiler import profile_phase
 from .wrapper_trace_runtime import dump_wrapper_trace, serialize_dom_elements, thin_wrapper_enabled, wrapper_mode_name
 
 
@@ -581,6 +590,7 @@ def decide_next_action(
         "vision_policy": dict(getattr(agent, "_last_vision_policy_trace", {}) or {}),
         "owner": "gaia_pre_llm",
     }
+    flush_decision_stream_tails(agent)
     current_phase = str(getattr(agent, "_goal_policy_phase", "") or "").strip().lower()
     current_phase_intent = str(getattr(agent, "_goal_phase_intent", "") or goal_phase_intent(current_phase))
     thin_wrapper_mode = _thin_wrapper_mode(agent)
@@ -651,143 +661,80 @@ def decide_next_action(
         if post_dom_wrapper_observation_block
         else ""
     )
-    semantic_hint_rule = """
-## 후보 의미 힌트
-- 각 DOM 줄의 `semantics=[...]`는 wrapper가 붙인 약한 힌트입니다. 정답으로 확정하지 말고 현재 DOM 문맥으로 다시 검증하세요.
-- `destination_reveal_candidate`와 `close_like`가 함께 보이면 닫기/취소 계열일 가능성을 먼저 의심하세요.
-- `source_mutation_candidate`가 보여도 최근 피드백이 no-op이거나 duplicate 경고가 있으면 같은 CTA를 반복하지 마세요.
-- `auth_identifier_field`, `auth_password_field`, `auth_submit_candidate`는 로그인 surface 안에서만 참고할 약한 힌트입니다.
-- 인증 surface 요약에 `fill_with="..."`가 보이면 그것은 현재 DOM 값이 아니라, 그 입력칸에 넣어야 할 자격증명입니다.
-- 인증 surface 안에 identifier/password 입력 ref와 `fill_with`가 함께 보이면, 방금 그 ref를 채운 직후가 아닌 한 submit보다 fill을 우선하세요.
-- `surface_close_candidate`는 현재 foreground surface를 닫고 배경으로 돌아가는 약한 힌트입니다.
-- `occluded_background_candidate`는 DOM에 보여도 현재 surface 뒤에 가려져 클릭 실패할 수 있습니다.
-- 상태 요약이 `불확실`이면 wrapper belief를 버리고 현재 DOM과 스크린샷만으로 판단하세요.
-"""
-    openclaw_primary_rule = """
-## OpenClaw 원본 우선 규칙
-- `## OpenClaw 원본 역할 트리 (주 입력)`은 wrapper가 재가공하기 전 OpenClaw snapshot 발췌입니다. action을 고를 때 가장 먼저 신뢰하세요.
-- `## 구조화 보조 힌트`와 `semantics=[...]`는 2차 힌트입니다. 원본 role tree의 ref/role/name/트리 위치와 충돌하면 원본 역할 트리를 우선하세요.
-- 같은 이름 CTA가 여러 개면 `ref`, 트리 위치, 같은 row/section 주변 raw line으로 구분하세요.
-""" if backend_name == "openclaw" else ""
-    browser_action_rules_block = build_browser_action_rules_for_agent(agent)
+    static_prefix = build_static_prompt_prefix(
+        openclaw_backend=backend_name == "openclaw",
+        participant_skill_prompt=participant_skill_prompt,
+        browser_rules_block=build_browser_action_rules_block(),
+    )
+    # 파이프라이닝 모드의 백그라운드 캡처는 위의 프롬프트 조립과 겹쳐 진행되고 여기서 합류한다
+    screenshot = resolve_screenshot(screenshot)
     visual_input_block = (
-        "## 시각 입력 상태\n- screenshot: 제공됨. DOM/ref와 함께 현재 화면 증거로 사용하세요."
+        "- screenshot: 제공됨. DOM/ref와 함께 현재 화면 증거로 사용하세요."
         if screenshot
         else (
-            "## 시각 입력 상태\n"
             "- screenshot: 제공되지 않음. 현재 판단은 DOM/role tree와 실행 피드백만으로 수행하세요.\n"
             "- DOM만으로 다음 ref/action을 확정할 수 없고 실제 화면 확인이 필요하면 추측하지 말고 wait로 "
             "화면 컨텍스트 필요성을 reasoning에 명시하세요."
         )
     )
-    prompt = f"""당신은 OpenClaw 스타일의 웹 작업 에이전트입니다.
-현재 화면과 직전 결과를 다시 읽고, 다음 한 단계만 결정하세요.
-
-## 목표
-- 이름: {goal.name}
-- 설명: {goal.description}
-- 성공 조건: {', '.join(goal.success_criteria)}
-- 실패 조건: {', '.join(goal.failure_criteria) if goal.failure_criteria else '없음'}
-
-{visual_input_block}
-
-## 사용 가능한 테스트 데이터
-{json.dumps(prompt_test_data, ensure_ascii=False, indent=2)}
-
-{pre_dom_wrapper_observation_block}
-
-## 최근 액션 기록
-{chr(10).join(recent_action_history) if recent_action_history else '없음'}
-
-## 최근 실행 피드백
-{chr(10).join(recent_action_feedback) if recent_action_feedback else '없음'}
-
-{text_evidence_prompt_block}
-
-{participant_prompt_block}
-
-## 최근 반복 클릭 element_id
-{recent_block_text}
-
-## 세션 연속성 우선순위
-- 1순위: replay packet 첫머리의 replay boundary, resume checklist, recent attempt digest를 먼저 읽는다.
-- 2순위: session summary의 Startup Continuity Audit와 Session Start Rules를 먼저 읽는다.
-- 3순위: MEMORY에서 이전 run의 recent attempts, outcome, resume hint를 읽는다.
-- 4순위: retrieval hit는 현재 goal/reason_code와 직접 맞는 항목만 반영한다.
-- 5순위: compact state는 보조 기록으로만 쓴다.
-
-## 진행 위생 규칙
-- mutation/수집/적용 goal에서는 새 CTA를 반복하기 전에 현재 열린 modal/overlay/panel이 목표와 무관하게 진행을 실제로 막는지 먼저 확인하세요. 막고 있을 때만 원래 작업 surface로 복귀하는 한 단계를 우선하고, 임시 성공 토스트/배너처럼 약한 신호는 닫기보다 원래 목표 진행을 우선하세요.
-- 로그인/인증/OTP/보안문자/정답 입력처럼 현재 화면에서 사용자의 실제 값이 필요하지만 `사용 가능한 테스트 데이터`에 그 값이 없으면 추측하지 마세요. 이때는 아래 human_answer skill을 호출하세요.
-- human_answer skill 사용법: `action`은 `wait`, `value`는 JSON 문자열/객체 `{{"skill":"human_answer","question":"사용자에게 물어볼 질문","fields":["필요한_key"],"reason_code":"human_answer_required"}}`로 응답합니다. 필요한 필드명은 현재 화면과 목표를 보고 직접 정하세요.
-- human_answer는 사용자에게 묻기 위한 skill입니다. 버튼 클릭/입력으로 해결 가능한 단계에는 쓰지 말고, 모델이 알 수 없는 실제 비밀값/정답/인증값이 필요할 때만 사용하세요.
-- 목표 달성 여부를 사용자에게 확인하려고 human_answer를 호출하지 마세요. 순위표/목록/기사/검색결과처럼 화면 증거로 검증 가능한 목표는 `is_goal_achieved=true`와 `goal_achievement_reason`으로 선언하면 검증 에이전트가 DOM 증거로 판정합니다.
-- 목표가 여러 카드/행/댓글/기사/검색결과의 텍스트를 읽고 세거나 필드를 비교하는 목록 수집형이라고 판단되면 `collect_text_evidence=true`로 두세요. 현재 화면에서 수집할 필드(예: 제목, 출처, 시간, 요약, 댓글 본문)는 `text_evidence_focus`에 적으세요.
-- `collect_text_evidence`는 action을 대체하지 않습니다. evidence를 수집하면서도 다음 단계가 필요하면 click/scroll/inspect를 그대로 선택하고, 충분히 수집했다고 판단될 때만 `is_goal_achieved=true`를 선언하세요.
-
-{participant_skill_prompt}
-
-{run_history_replay_block}
-
-## 도메인 실행 기억(KB)
-{memory_context or '없음'}
-
-## {state_cache_title}
-{goal_state_summary}
-
-## 현재 화면의 DOM 요소와 목표 관련 증거
-{elements_text}
-
-{post_dom_wrapper_observation_section}
-
-{openclaw_primary_rule}
-{semantic_hint_rule}
-
-{browser_action_rules_block}
-
-## 응답 형식 (JSON만, 마크다운 없이)
-{{
-    \"action\": \"click\" | \"fill\" | \"type\" | \"inspect\" | \"focus\" | \"press\" | \"scroll\" | \"wait\" | \"select\",
-    \"ref_id\": 요소 ref ID (문자열, DOM에 [ref=...]로 표시된 값을 우선 사용; inspect/focus/wait면 null 허용),
-    \"element_id\": 요소ID (숫자, 없으면 null 허용; inspect/focus/wait면 null 허용),
-    \"value\": \"입력값 (fill/type), inspect 질문/관찰 목적, target_id/tab_id (focus), 키 이름 (press), select 값(문자열/콤마구분/JSON 배열), wait 조건(JSON 또는 ms), 또는 human_answer skill JSON\",
-    \"reasoning\": \"현재 화면 기준으로 이 행동이 왜 다음 단계인지\",
-    \"confidence\": 0.0~1.0,
-    \"is_goal_achieved\": true | false,
-    \"goal_achievement_reason\": \"목표 달성 판단 이유 (is_goal_achieved가 true인 경우)\",
-    \"collect_text_evidence\": true | false,
-    \"text_evidence_reason\": \"목록/카드/댓글/기사 텍스트 evidence를 이번 턴에 누적해야 하는 이유 또는 null\",
-    \"text_evidence_focus\": [\"수집할 필드/관찰 포인트\", \"예: 제목\", \"예: 출처/시간/요약\"],
-    \"participant_id\": \"다중 참여자 모드에서 현재 액션을 수행할 participant id 또는 null\",
-    \"next_participant\": \"현재 액션 이후 우선 실행할 participant id 또는 null\",
-    \"turn_control\": {{
-        \"status\": \"continue\" | \"wait_for\" | \"done\",
-        \"wait_for\": [
-            {{\"kind\":\"blackboard_key\", \"blackboard_key\":\"message_sent\", \"note\":\"receiver는 sender가 메시지를 보낸 뒤 확인한다\"}},
-            {{\"kind\":\"timeout\", \"timeout_seconds\":10, \"note\":\"이벤트가 늦게 도착할 수 있어 짧게 재확인한다\"}}
-        ],
-        \"reason\": \"이 action 이후 같은 참여자를 계속 실행할지, 이벤트를 기다릴지, 종료할지\"
-    }} 또는 null,
-    \"participant_plan\": {{
-        \"skill\": \"multi_user_interaction\",
-        \"required\": true | false,
-        \"reason\": \"단일 세션으로 검증할 수 없는 이유\",
-        \"participants\": [
-            {{\"id\":\"sender\", \"role\":\"sender\", \"display_name\":\"Sender\", \"persona\":\"메시지를 보내는 사용자\"}},
-            {{\"id\":\"receiver\", \"role\":\"receiver\", \"display_name\":\"Receiver\", \"persona\":\"메시지를 받는 사용자\"}}
-        ],
-        \"credential_requests\": [
-            {{\"participant_id\":\"sender\", \"fields\":[\"username\",\"password\"], \"required\":true}},
-            {{\"participant_id\":\"receiver\", \"fields\":[\"username\",\"password\"], \"required\":true}}
-        ],
-        \"coordination_plan\": [\"sender가 메시지를 보낸다\", \"receiver가 수신 여부를 확인한다\"],
-        \"expected_events\": [\"message_sent\", \"message_received\", \"notification_visible\"]
-    }} 또는 null,
-    \"blackboard_event\": \"message_sent/message_received/notification_visible 같은 공유 관찰 key 또는 null\",
-    \"blackboard_payload\": {{}}
-}}
-
-JSON 응답:"""
+    goal_block = "\n".join(
+        [
+            f"- 이름: {goal.name}",
+            f"- 설명: {goal.description}",
+            f"- 성공 조건: {', '.join(goal.success_criteria)}",
+            f"- 실패 조건: {', '.join(goal.failure_criteria) if goal.failure_criteria else '없음'}",
+        ]
+    )
+    prompt_sections = [
+        PromptSection("goal", "## 목표", goal_block, trimmable=False),
+        PromptSection("visual_input", "## 시각 입력 상태", visual_input_block, trimmable=False),
+        PromptSection(
+            "test_data",
+            "## 사용 가능한 테스트 데이터",
+            json.dumps(prompt_test_data, ensure_ascii=False, indent=2),
+            trimmable=False,
+        ),
+        PromptSection("pre_dom_observation", "", pre_dom_wrapper_observation_block, priority=60),
+        PromptSection(
+            "action_history",
+            "## 최근 액션 기록",
+            chr(10).join(recent_action_history) if recent_action_history else "없음",
+            priority=70,
+            keep="tail",
+            min_lines=2,
+        ),
+        PromptSection(
+            "action_feedback",
+            "## 최근 실행 피드백",
+            chr(10).join(recent_action_feedback) if recent_action_feedback else "없음",
+            priority=70,
+            keep="tail",
+            min_lines=2,
+        ),
+        PromptSection("text_evidence", "", text_evidence_prompt_block, priority=30, min_lines=1),
+        PromptSection("participants", "", participant_prompt_block, priority=50, min_lines=1),
+        PromptSection("recent_clicks", "## 최근 반복 클릭 element_id", recent_block_text, trimmable=False),
+        PromptSection("replay_packet", "", run_history_replay_block, priority=20, min_lines=1),
+        PromptSection("domain_memory", "## 도메인 실행 기억(KB)", memory_context or "없음", priority=25),
+        PromptSection("state_summary", f"## {state_cache_title}", goal_state_summary, priority=55),
+        PromptSection(
+            "dom",
+            "## 현재 화면의 DOM 요소와 목표 관련 증거",
+            elements_text,
+            priority=90,
+            min_lines=40,
+        ),
+        PromptSection("post_dom_observation", "", post_dom_wrapper_observation_section, priority=40),
+        PromptSection(
+            "action_reinforcement",
+            "",
+            build_browser_action_reinforcement_block(agent),
+            trimmable=False,
+        ),
+    ]
+    prompt, prompt_layout_trace = assemble_decision_prompt(static_prefix, prompt_sections)
+    if prompt_layout_trace["trimmed_sections"]:
+        agent._log(f"🧪 prompt budget trim: {prompt_layout_trace}")
 
     try:
         dump_wrapper_trace(
@@ -807,6 +754,7 @@ JSON 응답:"""
                 "elements_text": elements_text,
                 "prompt": prompt,
                 "prompt_mode": "agentic",
+                "prompt_layout": prompt_layout_trace,
                 "elements": serialize_dom_elements(elements_for_prompt, agent=agent),
                 "prompt_elements": serialize_dom_elements(elements_for_prompt, agent=agent),
                 "recent_action_history": recent_action_history,
@@ -830,30 +778,45 @@ JSON 응답:"""
                 "path": "vision" if screenshot else "text_only",
             },
         )
+        response_metadata = {
+            "goal_id": getattr(goal, "id", ""),
+            "goal_name": getattr(goal, "name", ""),
+            "phase": current_phase,
+            "path": "vision" if screenshot else "text_only",
+        }
+        stream_trace: dict[str, Any] = {}
         llm_started = time.perf_counter()
-        if screenshot:
-            response_text = agent.llm.analyze_with_vision(prompt, screenshot)
-        else:
-            response_text = agent._call_llm_text_only(prompt)
+        with profile_phase(agent, "llm_call"):
+            if decision_streaming_enabled(agent):
+                response_text, stream_trace = stream_decision_response(
+                    agent,
+                    prompt,
+                    screenshot,
+                    participant_mode=bool(participant_prompt_block),
+                    metadata=response_metadata,
+                )
+            elif screenshot:
+                response_text = agent.llm.analyze_with_vision(prompt, screenshot)
+            else:
+                response_text = agent._call_llm_text_only(prompt)
         agent._last_llm_trace = {
             "used_llm": True,
             "llm_ms": int((time.perf_counter() - llm_started) * 1000),
             "path": "vision" if screenshot else "text_only",
             "vision_policy": dict(getattr(agent, "_last_vision_policy_trace", {}) or {}),
             "owner": "llm",
+            "prompt_tokens_est": prompt_layout_trace["estimated_tokens"],
+            "static_prefix_tokens": prompt_layout_trace["static_prefix_tokens"],
         }
+        if stream_trace:
+            agent._last_llm_trace["stream"] = stream_trace
         agent._log(f"🧪 llm trace: {agent._last_llm_trace}")
         record_run_history_transcript_impl(
             agent,
             stage="actor_decision_response",
             role="assistant",
             content=response_text,
-            metadata={
-                "goal_id": getattr(goal, "id", ""),
-                "goal_name": getattr(goal, "name", ""),
-                "phase": current_phase,
-                "path": "vision" if screenshot else "text_only",
-            },
+            metadata={**response_metadata, **({"stream_commit": stream_trace["commit"]} if stream_trace else {})},
         )
         decision = agent._parse_decision(response_text)
         dump_wrapper_trace(
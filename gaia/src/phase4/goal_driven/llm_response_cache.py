@@ -0,0 +1,189 @@
+"""Size-bounded exact-match LLM response cache backed by SQLite."""
+from __future__ import annotations
+
+import base64
+import hashlib
+import os
+import sqlite3
+import threading
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover
+    Image = None
+
+_DEFAULT_MAX_ENTRIES = 2000
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def llm_cache_max_entries() -> int:
+    raw = str(os.getenv("GAIA_LLM_CACHE_MAX_ENTRIES", "") or "").strip()
+    try:
+        value = int(raw) if raw else _DEFAULT_MAX_ENTRIES
+    except Exception:
+        return _DEFAULT_MAX_ENTRIES
+    return max(1, value)
+
+
+def llm_cache_max_bytes() -> int:
+    raw = str(os.getenv("GAIA_LLM_CACHE_MAX_BYTES", "") or "").strip()
+    try:
+        value = int(raw) if raw else _DEFAULT_MAX_BYTES
+    except Exception:
+        return _DEFAULT_MAX_BYTES
+    return max(1024, value)
+
+
+def screenshot_digest(screenshot: Optional[str]) -> str:
+    """Return a 64-bit difference hash of the downscaled frame.
+
+    Frames that differ only by a blinking caret or anti-aliasing noise map to
+    the same digest. Falls back to a content hash when Pillow is missing or the
+    payload is not a decodable image.
+    """
+    text = str(screenshot or "").strip()
+    if not text:
+        return ""
+    if "," in text and text.lower().startswith("data:image"):
+        text = text.split(",", 1)[1].strip()
+    if Image is not None:
+        try:
+            with Image.open(BytesIO(base64.b64decode(text))) as image:
+                pixels = image.convert("L").resize((9, 8)).tobytes()
+            bits = 0
+            for row in range(8):
+                for col in range(8):
+                    left = pixels[row * 9 + col]
+                    right = pixels[row * 9 + col + 1]
+                    bits = (bits << 1) | (1 if left > right else 0)
+            return f"dhash:{bits:016x}"
+        except Exception:
+            pass
+    return "sha1:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Upsert-per-entry response store with LRU eviction and hit/miss/bytes metrics.
+
+    Supports the ``get`` / ``[]=`` / ``len`` subset of ``dict`` the exploratory
+    agent already uses, so call sites do not need to know about SQLite.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        *,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.db_path = str(db_path) if db_path else ":memory:"
+        self.max_entries = max(1, int(max_entries or llm_cache_max_entries()))
+        self.max_bytes = max(1, int(max_bytes or llm_cache_max_bytes()))
+        self.metrics: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "bytes_read": 0,
+            "bytes_written": 0,
+        }
+        self._lock = threading.Lock()
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache(last_used)")
+        self._conn.commit()
+        row = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        self._entries = int(row[0])
+        self._bytes = int(row[1])
+        # Monotonic use counter instead of wall time so LRU order is exact.
+        self._clock = int(self._conn.execute("SELECT COALESCE(MAX(last_used), 0) FROM llm_cache").fetchone()[0])
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM llm_cache WHERE key = ?", (str(key),)).fetchone()
+        return row is not None
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.metrics["misses"] += 1
+                return default
+            response = str(row[0])
+            self.metrics["hits"] += 1
+            self.metrics["bytes_read"] += len(response.encode("utf-8"))
+            self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (self._tick(), key))
+            self._conn.commit()
+            return response
+
+    def __setitem__(self, key: str, response: str) -> None:
+        self.put(key, response)
+
+    def put(self, key: str, response: str) -> None:
+        response = str(response)
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT INTO llm_cache (key, response, size, last_used) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET response = excluded.response, size = excluded.size, "
+                "last_used = excluded.last_used",
+                (key, response, size, self._tick()),
+            )
+            if previous is None:
+                self._entries += 1
+            else:
+                self._bytes -= int(previous[0])
+            self._bytes += size
+            self.metrics["writes"] += 1
+            self.metrics["bytes_written"] += size
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        while self._entries > self.max_entries or (self._bytes > self.max_bytes and self._entries > 1):
+            overflow = max(1, self._entries - self.max_entries)
+            rows = self._conn.execute(
+                "SELECT key, size FROM llm_cache ORDER BY last_used ASC LIMIT ?", (overflow,)
+            ).fetchall()
+            if not rows:
+                return
+            self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", [(row[0],) for row in rows])
+            self._entries -= len(rows)
+            self._bytes -= sum(int(row[1]) for row in rows)
+            self.metrics["evictions"] += len(rows)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self.metrics)
+            stats["entries"] = self._entries
+            stats["bytes"] = self._bytes
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
@@ -0,0 +1,211 @@
+"""Speculative observation prefetch for the goal step loop (opt-in).
+
+With ``GAIA_OBSERVATION_PIPELINING=1`` the step loop stops waiting on the
+browser serially. Once the post-action probe is done, the next
+``browser_snapshot`` request is sent on a background thread, so it runs
+during the remaining step bookkeeping. It starts only after the probe so the
+probe's change detection always compares against its own settled snapshot,
+and only when the probe left no valid default snapshot in the analyze cache
+(e.g. the observation was deferred). The next step's default
+``_analyze_dom()`` call takes that payload instead of requesting a new one,
+but only while it is still valid:
+
+* no action or forced resnapshot has bumped ``_dom_cache_generation`` since
+  the prefetch started (the key must match the ``analyze_dom`` cache key);
+* its ``epoch`` is not older than the snapshot the agent already holds;
+* it finished at most ``GAIA_OBSERVATION_PREFETCH_MAX_AGE_SEC`` ago.
+
+Otherwise it is dropped and a fresh snapshot is taken. The worker only fetches
+the raw payload; agent state is updated on the step thread. The decision
+screenshot is captured on the same pool while the prompt is being formatted.
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+_DEFAULT_MAX_AGE_SEC = 5.0
+_RESULT_TIMEOUT_SEC = 45.0
+
+
+def observation_pipelining_enabled() -> bool:
+    raw_value = str(os.getenv("GAIA_OBSERVATION_PIPELINING", "") or "").strip().lower()
+    return raw_value in {"1", "true", "yes", "on"}
+
+
+def observation_prefetch_max_age_sec() -> float:
+    raw = str(os.getenv("GAIA_OBSERVATION_PREFETCH_MAX_AGE_SEC", "") or "").strip()
+    try:
+        value = float(raw) if raw else _DEFAULT_MAX_AGE_SEC
+    except Exception:
+        return _DEFAULT_MAX_AGE_SEC
+    return max(0.0, value)
+
+
+@dataclass
+class PendingSnapshot:
+    key: Tuple[Any, ...]
+    future: "Future[Tuple[Optional[Dict[str, Any]], float]]"
+    started_at: float
+    reason: str = ""
+
+
+def _metrics(agent: Any) -> Dict[str, int]:
+    metrics = getattr(agent, "_observation_prefetch_metrics", None)
+    if not isinstance(metrics, dict):
+        metrics = {}
+        agent._observation_prefetch_metrics = metrics
+    for name in ("started", "hits", "stale", "errors", "screenshots"):
+        metrics.setdefault(name, 0)
+    return metrics
+
+
+def _ensure_executor(agent: Any) -> ThreadPoolExecutor:
+    executor = getattr(agent, "_observation_prefetch_executor", None)
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gaia-observe")
+        agent._observation_prefetch_executor = executor
+    return executor
+
+
+def _record(agent: Any, outcome: str, **payload: Any) -> None:
+    profiler = getattr(agent, "_step_profiler", None)
+    recorder = getattr(profiler, "record_event", None)
+    if callable(recorder):
+        recorder("observation_prefetch", {"outcome": outcome, **payload})
+
+
+def _fetch_snapshot(mcp_host_url: str, session_id: str) -> Tuple[Optional[Dict[str, Any]], float]:
+    from .goal_dom_runtime import request_browser_snapshot
+
+    dispatch = request_browser_snapshot(mcp_host_url, session_id)
+    data = dispatch.payload if isinstance(dispatch.payload, dict) else None
+    if int(dispatch.status_code or 0) >= 400 or not data or "error" in data:
+        return None, time.monotonic()
+    if not (data.get("elements") or data.get("dom_elements")):
+        return None, time.monotonic()
+    return data, time.monotonic()
+
+
+def start_snapshot_prefetch(agent: Any, *, reason: str = "") -> bool:
+    """Request the next default snapshot in the background; return True when started."""
+    if not observation_pipelining_enabled():
+        return False
+    backend_snapshot = getattr(agent, "_last_backend_post_action_snapshot", None)
+    if isinstance(backend_snapshot, dict) and backend_snapshot.get("dom_elements"):
+        # 백엔드가 이미 액션 후 snapshot을 돌려줬으면 그걸로 캐시가 채워진다
+        return False
+    discard_snapshot_prefetch(agent)
+    session_id = str(getattr(agent, "session_id", "") or "default")
+    key = (int(getattr(agent, "_dom_cache_generation", 0) or 0), session_id, "", "")
+    cache = getattr(agent, "_dom_analyze_cache", None)
+    if isinstance(cache, dict) and tuple(cache.get("key") or ()) == key:
+        # post-action probe가 이미 이번 세대의 기본 snapshot을 캐시에 남겼다
+        return False
+    future = _ensure_executor(agent).submit(
+        _fetch_snapshot,
+        str(getattr(agent, "mcp_host_url", "") or ""),
+        str(getattr(agent, "session_id", "") or ""),
+    )
+    agent._observation_prefetch_pending = PendingSnapshot(
+        key=key,
+        future=future,
+        started_at=time.monotonic(),
+        reason=str(reason or ""),
+    )
+    _metrics(agent)["started"] += 1
+    return True
+
+
+def discard_snapshot_prefetch(agent: Any) -> None:
+    pending = getattr(agent, "_observation_prefetch_pending", None)
+    agent._observation_prefetch_pending = None
+    if isinstance(pending, PendingSnapshot):
+        pending.future.cancel()
+
+
+def take_prefetched_snapshot(agent: Any, cache_key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+    """Return the prefetched snapshot payload for ``cache_key`` if it is still valid."""
+    pending = getattr(agent, "_observation_prefetch_pending", None)
+    if not isinstance(pending, PendingSnapshot):
+        return None
+    if tuple(cache_key) != tuple(pending.key):
+        if tuple(cache_key[:2]) == tuple(pending.key[:2]):
+            # url/scope 지정 수집은 기본 snapshot을 대신하지 못하므로 선행 수집은 그대로 둔다
+            return None
+        discard_snapshot_prefetch(agent)
+        _metrics(agent)["stale"] += 1
+        _record(agent, "stale", reason="generation")
+        return None
+    agent._observation_prefetch_pending = None
+    metrics = _metrics(agent)
+    waited = time.monotonic()
+    try:
+        data, finished_at = pending.future.result(timeout=_RESULT_TIMEOUT_SEC)
+    except Exception:
+        metrics["errors"] += 1
+        _record(agent, "error")
+        return None
+    wait_ms = int((time.monotonic() - waited) * 1000)
+    if data is None:
+        metrics["errors"] += 1
+        _record(agent, "error", wait_ms=wait_ms)
+        return None
+    current_epoch = int(getattr(agent, "_active_snapshot_epoch", 0) or 0)
+    payload_epoch = int(data.get("epoch") or 0)
+    if current_epoch and payload_epoch and payload_epoch < current_epoch:
+        metrics["stale"] += 1
+        _record(agent, "stale", reason="epoch")
+        return None
+    if time.monotonic() - finished_at > observation_prefetch_max_age_sec():
+        metrics["stale"] += 1
+        _record(agent, "stale", reason="age")
+        return None
+    metrics["hits"] += 1
+    _record(
+        agent,
+        "hit",
+        wait_ms=wait_ms,
+        saved_ms=int(max(0.0, waited - pending.started_at) * 1000),
+        dom_hash=str(data.get("dom_hash") or ""),
+    )
+    return data
+
+
+def start_screenshot_capture(agent: Any) -> "Future[Optional[str]]":
+    _metrics(agent)["screenshots"] += 1
+    return _ensure_executor(agent).submit(agent._capture_screenshot)
+
+
+def resolve_screenshot(screenshot: Any) -> Optional[str]:
+    """Return the screenshot, waiting for a background capture when one was passed."""
+    if isinstance(screenshot, Future):
+        try:
+            return screenshot.result(timeout=_RESULT_TIMEOUT_SEC)
+        except Exception:
+            return None
+    return screenshot
+
+
+def shutdown_observation_prefetch(agent: Any) -> None:
+    discard_snapshot_prefetch(agent)
+    executor = getattr(agent, "_observation_prefetch_executor", None)
+    agent._observation_prefetch_executor = None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "PendingSnapshot",
+    "discard_snapshot_prefetch",
+    "observation_pipelining_enabled",
+    "observation_prefetch_max_age_sec",
+    "resolve_screenshot",
+    "shutdown_observation_prefetch",
+    "start_screenshot_capture",
+    "start_snapshot_prefetch",
+    "take_prefetched_snapshot",
+]
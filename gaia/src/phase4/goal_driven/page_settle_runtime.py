@@ -0,0 +1,108 @@
+"""Event-driven page settle used instead of fixed post-navigation sleeps.
+
+The browser backend waits for network idle, then for the DOM to stop mutating
+(with a stable in-page DOM hash) for ``quiet_ms``, all within a single
+``max_wait_ms`` budget. The hash is computed in the page rather than compared
+across snapshots because OpenClaw snapshots carry no ``dom_hash``. The time actually waited is charged to the
+``settle`` step phase and attached to the current step of the step profile.
+When the backend cannot settle the page, the caller's previous fixed sleep is
+used as the fallback so behaviour never gets less patient than before.
+
+Settle talks to the backend directly instead of going through the agent's
+``_execute_action``. A settle is not a step action, so it must not overwrite
+``_last_exec_meta``, reset the backend post-action snapshot/trace, or
+invalidate the DOM analysis cache of the action it follows.
+"""
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Dict, Optional
+
+from gaia.src.phase4.mcp_local_dispatch_runtime import execute_mcp_action
+
+from .step_profiler import StepProfiler, profile_phase
+
+_DEFAULT_MAX_WAIT_MS = 4000
+_SETTLE_LOG_LIMIT = 200
+
+
+def page_settle_enabled() -> bool:
+    raw_value = str(os.getenv("GAIA_PAGE_SETTLE", "1") or "1").strip().lower()
+    return raw_value not in {"0", "false", "no", "off"}
+
+
+def page_settle_max_wait_ms() -> int:
+    raw = str(os.getenv("GAIA_PAGE_SETTLE_MAX_MS", "") or "").strip()
+    try:
+        value = int(raw) if raw else _DEFAULT_MAX_WAIT_MS
+    except Exception:
+        return _DEFAULT_MAX_WAIT_MS
+    return max(0, min(value, 30000))
+
+
+def _request_settle(agent: Any, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    base_url = str(getattr(agent, "mcp_host_url", "") or "").strip()
+    if not base_url:
+        return None
+    response = execute_mcp_action(
+        base_url,
+        action="browser_settle",
+        params={"session_id": str(getattr(agent, "session_id", "") or "default"), **payload},
+        timeout=(5, float(payload["max_wait_ms"]) / 1000.0 + 10.0),
+    )
+    data = response.payload if isinstance(response.payload, dict) else {}
+    if int(response.status_code) >= 400 or not data.get("success"):
+        return None
+    settle = data.get("settle")
+    return dict(settle) if isinstance(settle, dict) else None
+
+
+def settle_page(
+    agent: Any,
+    *,
+    reason: str,
+    max_wait_ms: Optional[int] = None,
+    quiet_ms: int = 300,
+    network_idle: bool = True,
+    fallback_ms: int = 0,
+) -> Dict[str, Any]:
+    """Block until the page settles or ``max_wait_ms`` elapses; returns the settle record."""
+    ceiling_ms = page_settle_max_wait_ms()
+    budget_ms = ceiling_ms if max_wait_ms is None else max(0, min(int(max_wait_ms), ceiling_ms))
+    record: Dict[str, Any] = {"reason": str(reason or ""), "mode": "disabled"}
+    started = time.perf_counter()
+    with profile_phase(agent, "settle"):
+        details: Optional[Dict[str, Any]] = None
+        if page_settle_enabled() and budget_ms > 0:
+            payload = {"max_wait_ms": budget_ms, "quiet_ms": int(quiet_ms), "network_idle": bool(network_idle)}
+            try:
+                details = _request_settle(agent, payload)
+            except Exception as exc:
+                log_fn = getattr(agent, "_log", None)
+                if callable(log_fn):
+                    log_fn(f"⚠️ page settle 요청 실패({reason}): {exc}")
+        if details is not None:
+            record["mode"] = "event"
+            for key in ("network_idle", "dom_quiet", "timed_out"):
+                record[key] = bool(details.get(key))
+        elif fallback_ms > 0:
+            record["mode"] = "fallback_sleep"
+            time.sleep(float(fallback_ms) / 1000.0)
+    record["waited_ms"] = int((time.perf_counter() - started) * 1000)
+    _remember_settle(agent, record)
+    return record
+
+
+def _remember_settle(agent: Any, record: Dict[str, Any]) -> None:
+    agent._last_page_settle = record
+    history = getattr(agent, "_page_settle_history", None)
+    if not isinstance(history, list):
+        history = []
+        agent._page_settle_history = history
+    history.append(record)
+    if len(history) > _SETTLE_LOG_LIMIT:
+        del history[: len(history) - _SETTLE_LOG_LIMIT]
+    profiler = getattr(agent, "_step_profiler", None)
+    if isinstance(profiler, StepProfiler):
+        profiler.record_event("settle", record)
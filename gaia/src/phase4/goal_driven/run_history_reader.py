@@ -0,0 +1,212 @@
+"""Incremental JSONL readers for run-history ``events.jsonl`` / ``transcript.jsonl``.
+
+Run-history files are append-only, but summaries are rendered several times per
+step. A reader remembers the byte offset of the last complete line it parsed
+and only decodes bytes appended since then. It keeps a bounded window of the
+newest rows in memory, and for event logs it folds every row into running
+aggregates (failure buckets, last terminal/progress/failed event) so those
+stay exact for the whole file even after old rows leave the window.
+
+A rewrite or truncation of the file is detected by its identity, its size and
+a fingerprint of the head and of the bytes just before the saved offset. The
+reader then starts over from the beginning.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_DEFAULT_WINDOW_ROWS = 20000
+_MAX_CACHED_READERS = 32
+_FINGERPRINT_BYTES = 256
+
+
+def run_history_window_rows() -> int:
+    raw = str(os.getenv("GAIA_RUN_HISTORY_WINDOW_ROWS", "") or "").strip()
+    try:
+        value = int(raw) if raw else _DEFAULT_WINDOW_ROWS
+    except Exception:
+        return _DEFAULT_WINDOW_ROWS
+    return max(1, value)
+
+
+class EventAggregates:
+    """Running aggregates over every event row ever read from one file."""
+
+    def __init__(self) -> None:
+        self._failure_buckets: Dict[str, Dict[str, Any]] = {}
+        self.kind_counts: Dict[str, int] = {}
+        self.last_terminal: Optional[Dict[str, Any]] = None
+        self.last_progress: Optional[Dict[str, Any]] = None
+        self.last_failed_outcome: Optional[Dict[str, Any]] = None
+
+    def add(self, event: Dict[str, Any]) -> None:
+        kind = str(event.get("kind") or "").strip()
+        self.kind_counts[kind] = self.kind_counts.get(kind, 0) + 1
+        if kind == "goal_end":
+            self.last_terminal = event
+            return
+        if kind != "step_outcome":
+            return
+        if bool(event.get("success")) or bool(event.get("changed")):
+            self.last_progress = event
+        if bool(event.get("success")):
+            return
+        self.last_failed_outcome = event
+        action = str(event.get("action") or "").strip() or "unknown"
+        ref_id = str(event.get("ref_id") or "").strip() or "-"
+        reason_code = str(event.get("reason_code") or "").strip() or "unknown"
+        run_id = str(event.get("run_id") or "").strip()
+        bucket = self._failure_buckets.setdefault(
+            f"{action}|{ref_id}|{reason_code}",
+            {
+                "action": action,
+                "ref_id": ref_id,
+                "reason_code": reason_code,
+                "count": 0,
+                "last_run_id": run_id,
+            },
+        )
+        bucket["count"] = int(bucket.get("count", 0)) + 1
+        bucket["last_run_id"] = run_id
+
+    def failure_buckets(self) -> List[Dict[str, Any]]:
+        items = [dict(bucket) for bucket in self._failure_buckets.values()]
+        return sorted(items, key=lambda item: int(item.get("count", 0)), reverse=True)
+
+
+class EventWindow(list):
+    """Rows of a run-history file; full windows carry the file's aggregates.
+
+    Slicing or filtering yields a plain ``list``, so only an unmodified window
+    returned by the reader exposes ``aggregates``.
+    """
+
+    aggregates: Optional[EventAggregates] = None
+    dropped_rows: int = 0
+
+
+class JsonlTailReader:
+    def __init__(self, path: Path, *, window_rows: Optional[int] = None, aggregate: bool = False) -> None:
+        self.path = Path(path)
+        self.window_rows = max(1, int(window_rows or run_history_window_rows()))
+        self.aggregate = aggregate
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, identity: Optional[Tuple[int, int]]) -> None:
+        self._identity = identity
+        self._offset = 0
+        self._head_digest = ""
+        self._tail_digest = ""
+        self._rows: List[Dict[str, Any]] = []
+        self._dropped = 0
+        self._aggregates = EventAggregates() if self.aggregate else None
+        self.metrics = {"full_reads": 0, "incremental_reads": 0, "parsed_rows": 0}
+
+    @staticmethod
+    def _digest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    def _fingerprints(self, fh: Any, offset: int) -> Tuple[str, str]:
+        fh.seek(0)
+        head = fh.read(min(offset, _FINGERPRINT_BYTES))
+        tail_start = max(0, offset - _FINGERPRINT_BYTES)
+        fh.seek(tail_start)
+        tail = fh.read(offset - tail_start)
+        return self._digest(head), self._digest(tail)
+
+    def read(self) -> EventWindow:
+        with self._lock:
+            try:
+                stat = self.path.stat()
+            except OSError:
+                self._reset(None)
+                return self._window()
+            identity = (int(stat.st_dev), int(stat.st_ino))
+            try:
+                with self.path.open("rb") as fh:
+                    if identity != self._identity or stat.st_size < self._offset:
+                        self._reset(identity)
+                    elif self._offset and self._fingerprints(fh, self._offset) != (self._head_digest, self._tail_digest):
+                        self._reset(identity)
+                    if stat.st_size > self._offset:
+                        self.metrics["incremental_reads" if self._offset else "full_reads"] += 1
+                        fh.seek(self._offset)
+                        self._consume(fh.read(stat.st_size - self._offset))
+                        self._head_digest, self._tail_digest = self._fingerprints(fh, self._offset)
+            except OSError:
+                self._reset(None)
+            return self._window()
+
+    def _consume(self, data: bytes) -> None:
+        # 마지막 줄이 아직 쓰이는 중일 수 있으므로 개행으로 끝난 줄까지만 소비한다
+        end = data.rfind(b"\n")
+        if end < 0:
+            return
+        self._offset += end + 1
+        for raw_line in data[: end + 1].splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line.decode("utf-8", errors="replace"))
+            except Exception:
+                continue
+            if not isinstance(item, dict):
+                continue
+            self.metrics["parsed_rows"] += 1
+            self._rows.append(item)
+            if self._aggregates is not None:
+                self._aggregates.add(item)
+        overflow = len(self._rows) - self.window_rows
+        if overflow > 0:
+            del self._rows[:overflow]
+            self._dropped += overflow
+
+    def _window(self) -> EventWindow:
+        window = EventWindow(self._rows)
+        window.aggregates = self._aggregates
+        window.dropped_rows = self._dropped
+        return window
+
+
+_READERS_LOCK = threading.Lock()
+_READERS: "OrderedDict[Tuple[str, bool], JsonlTailReader]" = OrderedDict()
+
+
+def read_jsonl_rows(raw_path: object, *, aggregate: bool = False) -> EventWindow:
+    """Return the parsed rows of ``raw_path`` through a cached incremental reader."""
+    text = str(raw_path or "").strip()
+    if not text:
+        return EventWindow()
+    key = (os.path.abspath(text), bool(aggregate))
+    with _READERS_LOCK:
+        reader = _READERS.get(key)
+        if reader is None:
+            reader = JsonlTailReader(Path(key[0]), aggregate=aggregate)
+            _READERS[key] = reader
+        _READERS.move_to_end(key)
+        while len(_READERS) > _MAX_CACHED_READERS:
+            _READERS.popitem(last=False)
+    return reader.read()
+
+
+def clear_jsonl_readers() -> None:
+    with _READERS_LOCK:
+        _READERS.clear()
+
+
+__all__ = [
+    "EventAggregates",
+    "EventWindow",
+    "JsonlTailReader",
+    "clear_jsonl_readers",
+    "read_jsonl_rows",
+    "run_history_window_rows",
+]
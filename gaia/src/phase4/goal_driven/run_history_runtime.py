@@ -6,6 +6,7 @@ import os
 import re
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 from types import SimpleNamespace
@@ -13,6 +14,9 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 from .models import ActionDecision, DOMElement, TestGoal
+from .run_history_reader import EventAggregates, EventWindow, read_jsonl_rows
+from .run_history_updater_worker import CoalescingUpdaterWorker, register_worker
+from .run_history_writer import RunHistoryWriter
 
 
 _DEFAULT_HISTORY_ENABLED = "1"
@@ -55,48 +59,55 @@ def _json_default(value: object) -> object:
     return str(value)
 
 
-def _append_event(agent: Any, payload: Dict[str, Any]) -> None:
+def _run_history_writer(agent: Any) -> RunHistoryWriter:
+    writer = getattr(agent, "_run_history_writer", None)
+    if not isinstance(writer, RunHistoryWriter):
+        writer = RunHistoryWriter()
+        agent._run_history_writer = writer
+    return writer
+
+
+def flush_run_history_writer(agent: Any) -> None:
+    # 버퍼에 남은 줄을 OS로 넘겨 같은/다른 프로세스의 reader가 최신 이벤트를 보게 한다
+    writer = getattr(agent, "_run_history_writer", None)
+    if isinstance(writer, RunHistoryWriter):
+        writer.flush(fsync=False)
+
+
+def close_run_history_writer(agent: Any) -> None:
+    writer = getattr(agent, "_run_history_writer", None)
+    if isinstance(writer, RunHistoryWriter):
+        writer.close()
+
+
+def _append_jsonl(agent: Any, attrs: tuple[str, str], payload: Dict[str, Any], *, durable: bool = False) -> None:
     if not _history_enabled(agent):
         return
-    raw_paths = [
-        str(getattr(agent, "_run_history_events_path", "") or "").strip(),
-        str(getattr(agent, "_run_history_session_events_path", "") or "").strip(),
-    ]
-    seen: set[str] = set()
-    for raw_path in raw_paths:
-        if not raw_path or raw_path in seen:
-            continue
-        seen.add(raw_path)
-        events_path = Path(raw_path)
-        try:
-            events_path.parent.mkdir(parents=True, exist_ok=True)
-            with events_path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(payload, ensure_ascii=False, default=_json_default))
-                fh.write("\n")
-        except Exception:
-            continue
+    raw_paths = [str(getattr(agent, attr, "") or "").strip() for attr in attrs]
+    if not any(raw_paths):
+        return
+    try:
+        line = json.dumps(payload, ensure_ascii=False, default=_json_default)
+    except Exception:
+        return
+    _run_history_writer(agent).append(raw_paths, line, durable=durable)
+
+
+def _append_event(agent: Any, payload: Dict[str, Any], *, durable: bool = False) -> None:
+    _append_jsonl(
+        agent,
+        ("_run_history_events_path", "_run_history_session_events_path"),
+        payload,
+        durable=durable,
+    )
 
 
 def _append_transcript(agent: Any, payload: Dict[str, Any]) -> None:
-    if not _history_enabled(agent):
-        return
-    raw_paths = [
-        str(getattr(agent, "_run_history_transcript_path", "") or "").strip(),
-        str(getattr(agent, "_run_history_session_transcript_path", "") or "").strip(),
-    ]
-    seen: set[str] = set()
-    for raw_path in raw_paths:
-        if not raw_path or raw_path in seen:
-            continue
-        seen.add(raw_path)
-        transcript_path = Path(raw_path)
-        try:
-            transcript_path.parent.mkdir(parents=True, exist_ok=True)
-            with transcript_path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(payload, ensure_ascii=False, default=_json_default))
-                fh.write("\n")
-        except Exception:
-            continue
+    _append_jsonl(
+        agent,
+        ("_run_history_transcript_path", "_run_history_session_transcript_path"),
+        payload,
+    )
 
 
 def _decision_action_value(decision: ActionDecision) -> str:
@@ -105,53 +116,24 @@ def _decision_action_value(decision: ActionDecision) -> str:
 
 
 def _load_events(agent: Any) -> List[Dict[str, Any]]:
+    flush_run_history_writer(agent)
     raw_path = str(getattr(agent, "_run_history_session_events_path", "") or "").strip()
     if not raw_path:
         raw_path = str(getattr(agent, "_run_history_events_path", "") or "").strip()
-    events_path = Path(raw_path)
-    if not events_path or not events_path.exists():
-        return []
-    events: List[Dict[str, Any]] = []
-    try:
-        with events_path.open("r", encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    item = json.loads(line)
-                except Exception:
-                    continue
-                if isinstance(item, dict):
-                    events.append(item)
-    except Exception:
-        return []
-    return events
+    return read_jsonl_rows(raw_path, aggregate=True)
 
 
 def _load_transcript_rows(agent: Any) -> List[Dict[str, Any]]:
+    flush_run_history_writer(agent)
     raw_path = str(getattr(agent, "_run_history_session_transcript_path", "") or "").strip()
     if not raw_path:
         raw_path = str(getattr(agent, "_run_history_transcript_path", "") or "").strip()
-    transcript_path = Path(raw_path)
-    if not transcript_path or not transcript_path.exists():
-        return []
-    rows: List[Dict[str, Any]] = []
-    try:
-        with transcript_path.open("r", encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    item = json.loads(line)
-                except Exception:
-                    continue
-                if isinstance(item, dict):
-                    rows.append(item)
-    except Exception:
-        return []
-    return rows
+    return read_jsonl_rows(raw_path)
+
+
+def _window_aggregates(events: List[Dict[str, Any]]) -> Optional[EventAggregates]:
+    # _load_events()가 돌려준 전체 window일 때만 파일 전체 집계를 재사용한다
+    return events.aggregates if isinstance(events, EventWindow) else None
 
 
 def _goal_domain_slug(goal: Optional[TestGoal], agent: Any) -> str:
@@ -223,6 +205,11 @@ def _render_decision_line(event: Dict[str, Any]) -> str:
     return " | ".join(parts)
 
 
+def _state_change_signal_keys(state_change: Dict[str, Any]) -> List[str]:
+    # dom_delta는 진단용 중첩 dict라 signals 목록에서 실제 신호를 밀어내지 않게 뺀다
+    return [str(key) for key, value in state_change.items() if value and key != "dom_delta"]
+
+
 def _render_outcome_line(event: Dict[str, Any]) -> str:
     action = str(event.get("action") or "").strip() or "unknown"
     status = str(event.get("status") or "").strip() or "unknown"
@@ -238,7 +225,7 @@ def _render_outcome_line(event: Dict[str, Any]) -> str:
         parts.append(f"reason_code={reason_code}")
     state_change = event.get("state_change")
     if isinstance(state_change, dict) and state_change:
-        positives = [str(key) for key, value in state_change.items() if value]
+        positives = _state_change_signal_keys(state_change)
         if positives:
             parts.append("signals=" + ",".join(positives[:6]))
     error = _truncate_text(event.get("error") or "", 120)
@@ -266,7 +253,7 @@ def _render_signal_lines(agent: Any) -> List[str]:
             pieces.append("pagination_candidate=true")
         state_change = item.get("state_change")
         if isinstance(state_change, dict):
-            positives = [str(key) for key, value in state_change.items() if value]
+            positives = _state_change_signal_keys(state_change)
             if positives:
                 pieces.append("signals=" + ",".join(positives[:6]))
         if pieces:
@@ -341,6 +328,9 @@ def _dedupe_lines(lines: List[str]) -> List[str]:
 
 
 def _latest_terminal_event(events: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    aggregates = _window_aggregates(events)
+    if aggregates is not None:
+        return aggregates.last_terminal
     for event in reversed(events):
         if str(event.get("kind") or "").strip() == "goal_end":
             return event
@@ -472,6 +462,9 @@ def _current_run_events(agent: Any, events: List[Dict[str, Any]]) -> List[Dict[s
 
 
 def _last_failed_outcome(events: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    aggregates = _window_aggregates(events)
+    if aggregates is not None:
+        return aggregates.last_failed_outcome
     for event in reversed(events):
         if str(event.get("kind") or "").strip() != "step_outcome":
             continue
@@ -757,6 +750,9 @@ def _render_compact_summary(agent: Any, events: List[Dict[str, Any]], goal: Opti
 
 
 def _session_failure_buckets(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    aggregates = _window_aggregates(events)
+    if aggregates is not None:
+        return aggregates.failure_buckets()
     grouped: Dict[str, Dict[str, Any]] = {}
     for event in events:
         if str(event.get("kind") or "") != "step_outcome":
@@ -784,6 +780,9 @@ def _session_failure_buckets(events: List[Dict[str, Any]]) -> List[Dict[str, Any
 
 
 def _last_progress_event(events: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    aggregates = _window_aggregates(events)
+    if aggregates is not None:
+        return aggregates.last_progress
     for event in reversed(events):
         if str(event.get("kind") or "") != "step_outcome":
             continue
@@ -1453,7 +1452,39 @@ def _write_updater_lock_artifact(
     _write_history_document(getattr(agent, "_run_history_session_updater_lock_path", ""), artifact)
 
 
-def _launch_run_history_background_subprocess(agent: Any, *, trigger: str) -> None:
+def _background_updater_mode() -> str:
+    raw = str(os.getenv("GAIA_RUN_HISTORY_BACKGROUND_UPDATER", "thread") or "thread").strip().lower()
+    return "subprocess" if raw in {"subprocess", "process"} else "thread"
+
+
+_UPDATER_WORKER_LOCK = threading.Lock()
+_UPDATER_WORKER: Optional[CoalescingUpdaterWorker] = None
+
+
+def _run_history_updater_worker_pass(run_dir: str, trigger: str) -> None:
+    run_history_artifact_only_updater_pass(
+        run_dir,
+        drain_reason=f"background_worker:{trigger}",
+        worker_pid=os.getpid(),
+        fallback_trigger=trigger,
+    )
+
+
+def _run_history_updater_worker() -> CoalescingUpdaterWorker:
+    global _UPDATER_WORKER
+    with _UPDATER_WORKER_LOCK:
+        if _UPDATER_WORKER is None:
+            _UPDATER_WORKER = register_worker(CoalescingUpdaterWorker(_run_history_updater_worker_pass))
+        return _UPDATER_WORKER
+
+
+def wait_for_run_history_updater_idle(timeout: Optional[float] = None) -> bool:
+    with _UPDATER_WORKER_LOCK:
+        worker = _UPDATER_WORKER
+    return worker.wait_idle(timeout) if worker is not None else True
+
+
+def _launch_run_history_background_update(agent: Any, *, trigger: str) -> None:
     if not _history_enabled(agent) or not _background_subprocess_enabled():
         return
     run_dir = str(getattr(agent, "_run_history_dir", "") or "").strip()
@@ -1463,6 +1494,47 @@ def _launch_run_history_background_subprocess(agent: Any, *, trigger: str) -> No
         return
     if not list(getattr(agent, "_run_history_background_queue_triggers", []) or []):
         return
+    flush_run_history_writer(agent)
+    if _background_updater_mode() == "subprocess":
+        _launch_run_history_background_subprocess(agent, trigger=trigger, run_dir=run_dir)
+        return
+    _submit_run_history_background_worker(agent, trigger=trigger, run_dir=run_dir)
+
+
+def _submit_run_history_background_worker(agent: Any, *, trigger: str, run_dir: str) -> None:
+    now = float(time.time())
+    current_pid = os.getpid()
+    normalized_trigger = str(trigger or "").strip() or "unspecified"
+    # 같은 프로세스의 worker가 잡은 lock은 막지 않는다. 진행 중이면 큐가 후속 1회로 합쳐 준다
+    existing_lock = _load_updater_lock_payload(agent)
+    if _is_active_background_lock(existing_lock, current_pid=current_pid):
+        agent._run_history_background_last_launch_status = "skipped_active_lock"
+        agent._run_history_background_last_launch_trigger = normalized_trigger
+        agent._run_history_background_last_launch_at = now
+        agent._run_history_background_last_launch_pid = int(existing_lock.get("pid") or 0)
+        return
+    # worker가 먼저 끝나고 쓴 idle lock을 덮어쓰지 않도록 lock을 먼저 기록한 뒤 큐에 넣는다
+    _write_updater_lock_artifact(
+        agent,
+        status="launching",
+        owner="background_worker",
+        trigger=trigger,
+        pid=current_pid,
+        reason="queued",
+        lease_seconds=_background_lock_lease_seconds(),
+    )
+    queued = _run_history_updater_worker().submit(run_dir, normalized_trigger)
+    agent._run_history_background_last_launch_status = "queued" if queued else "coalesced"
+    agent._run_history_background_last_launch_trigger = normalized_trigger
+    agent._run_history_background_last_launch_at = now
+    agent._run_history_background_last_launch_pid = current_pid
+    if queued:
+        agent._run_history_background_launch_count = int(
+            getattr(agent, "_run_history_background_launch_count", 0) or 0
+        ) + 1
+
+
+def _launch_run_history_background_subprocess(agent: Any, *, trigger: str, run_dir: str) -> None:
     now = float(time.time())
     last_launch_at = float(getattr(agent, "_run_history_background_last_launch_at", 0.0) or 0.0)
     if last_launch_at > 0 and now - last_launch_at < 0.5:
@@ -2076,10 +2148,15 @@ def run_history_artifact_only_updater_pass(
     *,
     drain_reason: str = "artifact_only_queue_drain",
     worker_pid: int = 0,
+    fallback_trigger: str = "",
 ) -> Dict[str, str]:
     agent = _build_run_history_artifact_only_agent(run_dir)
     _restore_context_snapshot_state_from_artifact(agent)
     _restore_background_queue_state_from_artifact(agent)
+    if fallback_trigger and not agent._run_history_background_queue_triggers:
+        # 앞선 pass가 queue artifact를 idle로 덮어쓴 뒤 들어온 요청도 한 번은 갱신한다
+        agent._run_history_background_queue_triggers = [str(fallback_trigger).strip()]
+        agent._run_history_background_pending_include_retrieval = True
     current_pid = int(worker_pid or 0)
     existing_lock = _load_updater_lock_payload(agent)
     if _is_active_background_lock(existing_lock, current_pid=current_pid):
@@ -2292,7 +2369,7 @@ def run_history_background_updater_pass(
         include_retrieval=include_retrieval,
     )
     if not _should_drain_background_update(trigger):
-        _launch_run_history_background_subprocess(agent, trigger=trigger)
+        _launch_run_history_background_update(agent, trigger=trigger)
         return refresh_run_history_updater_artifacts(
             agent,
             trigger=trigger,
@@ -3369,6 +3446,7 @@ def initialize_run_history(agent: Any, goal: TestGoal) -> None:
     session_prompt_path = session_dir / "compact.md"
     session_memory_path = session_dir / "MEMORY.md"
     session_transcript_path = session_dir / "transcript.jsonl"
+    close_run_history_writer(agent)
     agent._run_history_run_id = run_id
     agent._run_history_dir = str(run_dir)
     agent._run_history_events_path = str(events_path)
@@ -3522,5 +3600,7 @@ def record_run_history_goal_outcome(
             "step_count": int(step_count),
             "duration_seconds": float(duration_seconds),
         },
+        durable=True,
     )
     run_history_summary_side_pass(agent, goal=goal, include_retrieval=True, trigger="goal_end")
+    close_run_history_writer(agent)
@@ -0,0 +1,122 @@
+"""In-process worker that drains queued run-history updater work.
+
+Deferred triggers (``decision`` / ``step_outcome``) used to spawn a fresh
+``scripts/run_history_background_updater.py`` interpreter for every refresh.
+This worker runs the same artifact-only pass on one daemon thread instead.
+The queue is keyed by run directory. A trigger for a run that is already
+waiting is merged into the waiting entry (the latest drain reason wins). A
+trigger that arrives while that run is being refreshed queues one follow-up
+pass, so the last trigger is never lost.
+"""
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+_DEFAULT_SHUTDOWN_TIMEOUT_SEC = 5.0
+
+
+class CoalescingUpdaterWorker:
+    def __init__(self, handler: Callable[[str, str], object], *, name: str = "gaia-run-history-updater") -> None:
+        self._handler = handler
+        self._name = name
+        self._cond = threading.Condition()
+        self._pending: "OrderedDict[str, str]" = OrderedDict()
+        self._in_flight = ""
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self.metrics: Dict[str, int] = {"submitted": 0, "coalesced": 0, "passes": 0, "errors": 0}
+        self.last_error = ""
+
+    def submit(self, key: str, reason: str) -> bool:
+        """Queue a pass for ``key``; return False when merged into a waiting entry."""
+        normalized = str(key or "").strip()
+        if not normalized:
+            return False
+        with self._cond:
+            if self._stopped:
+                return False
+            self.metrics["submitted"] += 1
+            merged = normalized in self._pending
+            if merged:
+                self.metrics["coalesced"] += 1
+            self._pending[normalized] = str(reason or "").strip()
+            self._ensure_thread()
+            self._cond.notify_all()
+            return not merged
+
+    def pending_keys(self) -> list[str]:
+        with self._cond:
+            return list(self._pending)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + max(0.0, float(timeout))
+        with self._cond:
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def stop(self, timeout: float = _DEFAULT_SHUTDOWN_TIMEOUT_SEC) -> None:
+        # 대기 중인 항목은 updater_queue.json에 남아 있으므로 sweeper/다음 실행이 이어서 비운다
+        with self._cond:
+            self._stopped = True
+            self._pending.clear()
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    self._cond.notify_all()
+                    return
+                key, reason = self._pending.popitem(last=False)
+                self._in_flight = key
+            try:
+                self._handler(key, reason)
+            except Exception as exc:
+                with self._cond:
+                    self.metrics["errors"] += 1
+                    self.last_error = f"{exc.__class__.__name__}: {exc}"
+            finally:
+                with self._cond:
+                    self.metrics["passes"] += 1
+                    self._in_flight = ""
+                    self._cond.notify_all()
+
+
+_WORKERS_LOCK = threading.Lock()
+_WORKERS: list[CoalescingUpdaterWorker] = []
+
+
+def register_worker(worker: CoalescingUpdaterWorker) -> CoalescingUpdaterWorker:
+    with _WORKERS_LOCK:
+        _WORKERS.append(worker)
+    return worker
+
+
+@atexit.register
+def _stop_workers() -> None:
+    with _WORKERS_LOCK:
+        workers = list(_WORKERS)
+    for worker in workers:
+        worker.stop()
+
+
+__all__ = ["CoalescingUpdaterWorker", "register_worker"]
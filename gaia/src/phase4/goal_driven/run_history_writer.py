@@ -0,0 +1,195 @@
+"""Buffered append-only writer for run-history JSONL files.
+
+Every event is mirrored into the run and session copies of ``events.jsonl`` /
+``transcript.jsonl``. Opening and closing each file per event is slow on
+network-mounted artifact directories, so a writer keeps one append handle per
+path and batches encoded lines in memory.
+
+Pending lines are written out when the buffer reaches
+``GAIA_RUN_HISTORY_FLUSH_BYTES``, when ``GAIA_RUN_HISTORY_FLUSH_INTERVAL_SEC``
+has passed since the first pending line (a daemon timer covers idle periods),
+and immediately for durable (terminal) events. Those flushes also ``fsync``,
+so a crash loses at most one flush interval. In-process readers call
+``flush(fsync=False)`` first, which only hands buffered bytes to the OS.
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+_DEFAULT_FLUSH_INTERVAL_SEC = 1.0
+_DEFAULT_FLUSH_BYTES = 64 * 1024
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = str(os.getenv(name, "") or "").strip()
+    try:
+        return float(raw) if raw else default
+    except Exception:
+        return default
+
+
+def run_history_flush_interval_sec() -> float:
+    return max(0.0, _env_float("GAIA_RUN_HISTORY_FLUSH_INTERVAL_SEC", _DEFAULT_FLUSH_INTERVAL_SEC))
+
+
+def run_history_flush_bytes() -> int:
+    return max(0, int(_env_float("GAIA_RUN_HISTORY_FLUSH_BYTES", float(_DEFAULT_FLUSH_BYTES))))
+
+
+class RunHistoryWriter:
+    def __init__(
+        self,
+        *,
+        flush_interval_sec: Optional[float] = None,
+        flush_bytes: Optional[int] = None,
+    ) -> None:
+        self.flush_interval_sec = (
+            run_history_flush_interval_sec() if flush_interval_sec is None else max(0.0, float(flush_interval_sec))
+        )
+        self.flush_bytes = run_history_flush_bytes() if flush_bytes is None else max(0, int(flush_bytes))
+        self._lock = threading.RLock()
+        self._handles: Dict[str, Any] = {}
+        self._pending: Dict[str, List[bytes]] = {}
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._unsynced: set[str] = set()
+        self._timer: Optional[threading.Timer] = None
+        self.metrics = {"appends": 0, "flushes": 0, "fsyncs": 0, "opens": 0, "write_errors": 0}
+        _LIVE_WRITERS.add(self)
+
+    def append(self, paths: Iterable[str], line: str, *, durable: bool = False) -> None:
+        """Queue ``line`` (without trailing newline) for every distinct path."""
+        data = (line + "\n").encode("utf-8")
+        with self._lock:
+            for path in dict.fromkeys(str(item or "").strip() for item in paths):
+                if not path:
+                    continue
+                self._pending.setdefault(path, []).append(data)
+                self._pending_bytes += len(data)
+                self.metrics["appends"] += 1
+            if not self._pending_bytes:
+                return
+            if not self._pending_since:
+                self._pending_since = time.monotonic()
+            if (
+                durable
+                or self._pending_bytes >= self.flush_bytes
+                or time.monotonic() - self._pending_since >= self.flush_interval_sec
+            ):
+                self.flush(fsync=True)
+            else:
+                self._schedule_timer()
+
+    def flush(self, *, fsync: bool = True) -> None:
+        with self._lock:
+            self._cancel_timer()
+            pending, self._pending = self._pending, {}
+            self._pending_bytes = 0
+            self._pending_since = 0.0
+            for path, chunks in pending.items():
+                fh = self._handle(path)
+                if fh is None:
+                    continue
+                try:
+                    fh.write(b"".join(chunks))
+                    fh.flush()
+                except OSError:
+                    self.metrics["write_errors"] += 1
+                    self._drop_handle(path)
+                    continue
+                self._unsynced.add(path)
+            if pending:
+                self.metrics["flushes"] += 1
+            if fsync:
+                self._fsync_unsynced()
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush(fsync=True)
+            for path in list(self._handles):
+                self._drop_handle(path)
+
+    def _handle(self, path: str) -> Any:
+        fh = self._handles.get(path)
+        if fh is not None:
+            return fh
+        try:
+            target = Path(path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fh = target.open("ab")
+        except OSError:
+            self.metrics["write_errors"] += 1
+            return None
+        self.metrics["opens"] += 1
+        self._handles[path] = fh
+        return fh
+
+    def _drop_handle(self, path: str) -> None:
+        fh = self._handles.pop(path, None)
+        self._unsynced.discard(path)
+        if fh is None:
+            return
+        try:
+            fh.close()
+        except OSError:
+            pass
+
+    def _fsync_unsynced(self) -> None:
+        for path in list(self._unsynced):
+            fh = self._handles.get(path)
+            if fh is None:
+                continue
+            try:
+                os.fsync(fh.fileno())
+            except OSError:
+                self.metrics["write_errors"] += 1
+                self._drop_handle(path)
+                continue
+            self.metrics["fsyncs"] += 1
+        self._unsynced.clear()
+
+    def _schedule_timer(self) -> None:
+        if self._timer is not None:
+            return
+        delay = max(0.0, self._pending_since + self.flush_interval_sec - time.monotonic())
+        timer = threading.Timer(delay, self._on_timer)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _cancel_timer(self) -> None:
+        timer, self._timer = self._timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if self._timer is not threading.current_thread():
+                return
+            self._timer = None
+            self.flush(fsync=True)
+
+
+_LIVE_WRITERS: "weakref.WeakSet[RunHistoryWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_writers() -> None:
+    for writer in list(_LIVE_WRITERS):
+        try:
+            writer.close()
+        except Exception:
+            continue
+
+
+__all__ = [
+    "RunHistoryWriter",
+    "run_history_flush_bytes",
+    "run_history_flush_interval_sec",
+]
@@ -0,0 +1,272 @@
+"""Vectorized semantic LLM cache partitioned by action signature.
+
+Embeddings for each action signature live in one contiguous float32 matrix so
+a lookup is a single matrix-vector product. Entries are evicted LRU-first once
+the global capacity is exceeded and lazily dropped after the TTL. Every insert,
+hit and eviction is written through to SQLite row-by-row instead of rewriting
+the whole cache file.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EMBEDDING_DIM = 128
+_DEFAULT_CAPACITY = 20000
+_INITIAL_ROWS = 16
+
+
+def semantic_cache_capacity() -> int:
+    raw = str(os.getenv("GAIA_SEMANTIC_CACHE_CAPACITY", "") or "").strip()
+    try:
+        value = int(raw) if raw else _DEFAULT_CAPACITY
+    except Exception:
+        return _DEFAULT_CAPACITY
+    return max(1, value)
+
+
+def semantic_cache_ttl_seconds() -> float:
+    """TTL in seconds; ``0`` (the default) keeps entries until LRU eviction."""
+    raw = str(os.getenv("GAIA_SEMANTIC_CACHE_TTL_SEC", "") or "").strip()
+    try:
+        value = float(raw) if raw else 0.0
+    except Exception:
+        return 0.0
+    return max(0.0, value)
+
+
+class _Partition:
+    """Rows of one action signature: embeddings matrix plus parallel metadata."""
+
+    def __init__(self, dim: int) -> None:
+        self.matrix = np.zeros((_INITIAL_ROWS, dim), dtype=np.float32)
+        self.created_at = np.zeros(_INITIAL_ROWS, dtype=np.float64)
+        self.entry_ids: List[int] = []
+        self.responses: List[str] = []
+        self.row_of: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.entry_ids)
+
+    def append(self, entry_id: int, vector: np.ndarray, response: str, created_at: float) -> None:
+        row = len(self.entry_ids)
+        if row >= self.matrix.shape[0]:
+            grow = self.matrix.shape[0] * 2
+            matrix = np.zeros((grow, self.matrix.shape[1]), dtype=np.float32)
+            matrix[:row] = self.matrix[:row]
+            created = np.zeros(grow, dtype=np.float64)
+            created[:row] = self.created_at[:row]
+            self.matrix, self.created_at = matrix, created
+        self.matrix[row] = vector
+        self.created_at[row] = created_at
+        self.entry_ids.append(entry_id)
+        self.responses.append(response)
+        self.row_of[entry_id] = row
+
+    def remove(self, entry_id: int) -> None:
+        row = self.row_of.pop(entry_id, None)
+        if row is None:
+            return
+        last = len(self.entry_ids) - 1
+        if row != last:
+            moved_id = self.entry_ids[last]
+            self.matrix[row] = self.matrix[last]
+            self.created_at[row] = self.created_at[last]
+            self.entry_ids[row] = moved_id
+            self.responses[row] = self.responses[last]
+            self.row_of[moved_id] = row
+        self.entry_ids.pop()
+        self.responses.pop()
+
+
+def _normalize(vector: Sequence[float] | np.ndarray, dim: int) -> Optional[np.ndarray]:
+    array = np.zeros(dim, dtype=np.float32)
+    values = np.asarray(vector, dtype=np.float32).reshape(-1)[:dim]
+    array[: values.shape[0]] = values
+    norm = float(np.linalg.norm(array))
+    if norm <= 0.0:
+        return None
+    return array / norm
+
+
+class SemanticCacheIndex:
+    def __init__(
+        self,
+        db_path: Path | str | None = None,
+        *,
+        capacity: int | None = None,
+        ttl_seconds: float | None = None,
+        dim: int = EMBEDDING_DIM,
+    ) -> None:
+        self.db_path = Path(db_path) if db_path else None
+        self.capacity = max(1, int(capacity or semantic_cache_capacity()))
+        self.ttl_seconds = semantic_cache_ttl_seconds() if ttl_seconds is None else max(0.0, float(ttl_seconds))
+        self.dim = int(dim)
+        self._partitions: Dict[str, _Partition] = {}
+        self._lru: "OrderedDict[int, str]" = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS semantic_cache (
+                    id INTEGER PRIMARY KEY,
+                    signature TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    response TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def _load(self) -> None:
+        assert self._conn is not None
+        rows = self._conn.execute(
+            "SELECT id, signature, embedding, response, created_at FROM semantic_cache ORDER BY last_used ASC, id ASC"
+        ).fetchall()
+        for entry_id, signature, blob, response, created_at in rows:
+            vector = np.frombuffer(blob, dtype=np.float32)
+            if vector.shape[0] != self.dim:
+                continue
+            self._insert_memory(int(entry_id), str(signature), vector, str(response), float(created_at))
+            self._next_id = max(self._next_id, int(entry_id) + 1)
+        self._evict_overflow()
+        self._conn.commit()
+
+    def _insert_memory(self, entry_id: int, signature: str, vector: np.ndarray, response: str, created_at: float) -> None:
+        partition = self._partitions.get(signature)
+        if partition is None:
+            partition = _Partition(self.dim)
+            self._partitions[signature] = partition
+        partition.append(entry_id, vector, response, created_at)
+        self._lru[entry_id] = signature
+
+    def _remove(self, entry_ids: List[int]) -> None:
+        for entry_id in entry_ids:
+            signature = self._lru.pop(entry_id, None)
+            partition = self._partitions.get(signature or "")
+            if partition is None:
+                continue
+            partition.remove(entry_id)
+            if not partition:
+                self._partitions.pop(signature, None)
+        if self._conn is not None and entry_ids:
+            self._conn.executemany("DELETE FROM semantic_cache WHERE id = ?", [(i,) for i in entry_ids])
+
+    def _evict_overflow(self) -> None:
+        overflow = len(self._lru) - self.capacity
+        if overflow > 0:
+            self._remove([entry_id for entry_id, _ in zip(self._lru.keys(), range(overflow))])
+
+    def lookup(self, embedding: Sequence[float] | np.ndarray, signature: str, threshold: float = 0.95) -> Tuple[Optional[str], float]:
+        """Return ``(response, score)`` for the best match in ``signature``'s partition."""
+        query = _normalize(embedding, self.dim)
+        if query is None:
+            return None, 0.0
+        with self._lock:
+            partition = self._partitions.get(signature)
+            if partition is None:
+                return None, 0.0
+            now = time.time()
+            if self.ttl_seconds > 0:
+                count = len(partition)
+                expired = np.nonzero(partition.created_at[:count] < now - self.ttl_seconds)[0]
+                if expired.size:
+                    self._remove([partition.entry_ids[int(row)] for row in expired])
+                    if self._conn is not None:
+                        self._conn.commit()
+                    partition = self._partitions.get(signature)
+                    if partition is None:
+                        return None, 0.0
+            scores = partition.matrix[: len(partition)] @ query
+            best_row = int(np.argmax(scores))
+            best_score = float(scores[best_row])
+            if best_score < threshold:
+                return None, best_score
+            entry_id = partition.entry_ids[best_row]
+            self._lru.move_to_end(entry_id)
+            if self._conn is not None:
+                self._conn.execute("UPDATE semantic_cache SET last_used = ? WHERE id = ?", (now, entry_id))
+                self._conn.commit()
+            return partition.responses[best_row], best_score
+
+    def store(self, embedding: Sequence[float] | np.ndarray, response: str, signature: str, text: str = "") -> None:
+        vector = _normalize(embedding, self.dim)
+        if vector is None:
+            return
+        with self._lock:
+            now = time.time()
+            entry_id = self._next_id
+            self._next_id += 1
+            self._insert_memory(entry_id, signature, vector, response, now)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT INTO semantic_cache (id, signature, embedding, response, text, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (entry_id, signature, vector.tobytes(), response, text[:500], now, now),
+                )
+            self._evict_overflow()
+            if self._conn is not None:
+                self._conn.commit()
+
+    def import_entries(self, entries: List[Dict[str, Any]]) -> int:
+        """Bulk-load legacy ``{"embedding", "response", "signature", "text"}`` rows."""
+        imported = 0
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            embedding = entry.get("embedding")
+            response = entry.get("response")
+            if not isinstance(embedding, list) or not isinstance(response, str):
+                continue
+            self.store(embedding, response, str(entry.get("signature") or ""), str(entry.get("text") or ""))
+            imported += 1
+        return imported
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._lru),
+                "partitions": len(self._partitions),
+                "capacity": self.capacity,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def open_semantic_cache(db_path: Path | str, *, legacy_json_path: Path | str | None = None) -> SemanticCacheIndex:
+    """Open the SQLite-backed index, importing a legacy JSON cache file once."""
+    index = SemanticCacheIndex(db_path)
+    legacy = Path(legacy_json_path) if legacy_json_path else None
+    if legacy is not None and legacy.exists() and not len(index):
+        try:
+            data = json.loads(legacy.read_text(encoding="utf-8"))
+        except Exception:
+            data = None
+        if isinstance(data, list):
+            index.import_entries(data)
+    return index
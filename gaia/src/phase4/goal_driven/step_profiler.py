@@ -0,0 +1,190 @@
+"""Per-step phase timing for GoalDrivenAgent.execute_goal.
+
+Each step is split into named phases (snapshot, prompt_format, llm_call,
+action_dispatch, post_action_probe, verification, history_write, ...). Phases
+may nest; a parent only keeps its self time so the phase breakdown of a step
+adds up to the step's wall time, with the remainder reported as ``other``.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+STEP_PROFILE_FILENAME = "step_profile.json"
+
+
+def step_profiler_enabled() -> bool:
+    raw_value = str(os.getenv("GAIA_STEP_PROFILE", "1") or "1").strip().lower()
+    return raw_value not in {"0", "false", "no", "off"}
+
+
+def _openclaw_transport_stats() -> Dict[str, int]:
+    try:
+        from gaia.src.phase4.openclaw_http_pool import openclaw_http_pool_stats
+
+        return openclaw_http_pool_stats()
+    except Exception:
+        return {}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class StepProfiler:
+    def __init__(self, *, enabled: bool = True) -> None:
+        self.enabled = bool(enabled)
+        self.steps: List[Dict[str, Any]] = []
+        self._current: Optional[Dict[str, Any]] = None
+        self._step_started = 0.0
+        self._stack: List[List[float]] = []
+        self._owner_thread: Optional[int] = None
+        self.setup_events: List[Dict[str, Any]] = []
+        self._transport_baseline = _openclaw_transport_stats() if self.enabled else {}
+
+    def begin_step(self, step_number: int) -> None:
+        if not self.enabled:
+            return
+        self.end_step()
+        self._owner_thread = threading.get_ident()
+        self._current = {"step": int(step_number), "phases": {}}
+        self._step_started = time.perf_counter()
+        self._stack = []
+
+    def end_step(self) -> None:
+        current = self._current
+        if current is None:
+            return
+        total_ms = (time.perf_counter() - self._step_started) * 1000.0
+        phases: Dict[str, float] = current["phases"]
+        current["total_ms"] = round(total_ms, 3)
+        current["phases"] = {name: round(value, 3) for name, value in phases.items()}
+        current["phases"]["other"] = round(max(0.0, total_ms - sum(phases.values())), 3)
+        self.steps.append(current)
+        self._current = None
+        self._stack = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        # Phases started off the step thread (e.g. observe fan-out workers) are ignored.
+        if self._current is None or threading.get_ident() != self._owner_thread:
+            yield
+            return
+        frame = [time.perf_counter(), 0.0]  # [started, child_ms]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed_ms = (time.perf_counter() - frame[0]) * 1000.0
+            if self._current is not None:
+                phases: Dict[str, float] = self._current["phases"]
+                phases[name] = phases.get(name, 0.0) + max(0.0, elapsed_ms - frame[1])
+            if self._stack:
+                self._stack[-1][1] += elapsed_ms
+
+    def record_event(self, kind: str, payload: Dict[str, Any]) -> None:
+        """Attach a small record (e.g. a page settle) to the running step, or to setup before step 1."""
+        if not self.enabled:
+            return
+        event = {"kind": str(kind), **dict(payload or {})}
+        if self._current is None:
+            if not self.steps:
+                self.setup_events.append(event)
+            return
+        if threading.get_ident() != self._owner_thread:
+            return
+        self._current.setdefault("events", []).append(event)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        samples: Dict[str, List[float]] = {}
+        for step in self.steps:
+            for name, value in step.get("phases", {}).items():
+                samples.setdefault(name, []).append(float(value))
+            samples.setdefault("step_total", []).append(float(step.get("total_ms", 0.0)))
+        return {
+            name: {
+                "count": len(values),
+                "total_ms": round(sum(values), 3),
+                "p50_ms": round(_percentile(values, 50), 3),
+                "p95_ms": round(_percentile(values, 95), 3),
+                "max_ms": round(max(values), 3),
+            }
+            for name, values in sorted(samples.items())
+        }
+
+    def transport_stats(self) -> Dict[str, int]:
+        """OpenClaw HTTP pool counters accumulated since this profiler was created."""
+        current = _openclaw_transport_stats()
+        stats = {
+            name: max(0, int(value) - int(self._transport_baseline.get(name, 0) or 0))
+            for name, value in current.items()
+            if name != "active_sessions"
+        }
+        if not stats.get("requests"):
+            return {}
+        stats["active_sessions"] = int(current.get("active_sessions", 0) or 0)
+        return stats
+
+    def to_payload(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"step_count": len(self.steps), "summary": self.summary(), "steps": list(self.steps)}
+        if self.setup_events:
+            payload["setup_events"] = list(self.setup_events)
+        transport = self.transport_stats()
+        if transport:
+            payload["openclaw_transport"] = transport
+        return payload
+
+
+def profile_phase(agent: Any, name: str) -> contextlib.AbstractContextManager:
+    """Time ``name`` on the agent's active profiler; a no-op when profiling is off."""
+    profiler = getattr(agent, "_step_profiler", None)
+    if not isinstance(profiler, StepProfiler) or not profiler.enabled:
+        return contextlib.nullcontext()
+    return profiler.phase(name)
+
+
+def finalize_step_profile(agent: Any) -> Optional[Dict[str, Any]]:
+    """Close the last step, log the phase breakdown and write it next to the run history."""
+    profiler = getattr(agent, "_step_profiler", None)
+    if not isinstance(profiler, StepProfiler) or not profiler.enabled:
+        return None
+    profiler.end_step()
+    payload = profiler.to_payload()
+    agent._last_step_profile = payload
+    if not payload["steps"]:
+        return payload
+    summary = payload["summary"]
+    ranked = sorted(
+        ((name, stats) for name, stats in summary.items() if name != "step_total"),
+        key=lambda item: item[1]["total_ms"],
+        reverse=True,
+    )
+    breakdown = ", ".join(f"{name}={stats['p50_ms']:.0f}/{stats['p95_ms']:.0f}ms" for name, stats in ranked[:6])
+    agent._log(f"⏱️ step profile (p50/p95): {breakdown}")
+    transport = payload.get("openclaw_transport")
+    if transport:
+        agent._log(
+            "🔌 openclaw transport: "
+            f"requests={transport.get('requests', 0)} new={transport.get('new_connections', 0)} "
+            f"reused={transport.get('reused_connections', 0)}"
+        )
+    run_dir = str(getattr(agent, "_run_history_dir", "") or "").strip()
+    if run_dir:
+        try:
+            path = Path(run_dir) / STEP_PROFILE_FILENAME
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        except Exception as exc:
+            agent._log(f"⚠️ step profile 저장 실패: {exc}")
+    return payload
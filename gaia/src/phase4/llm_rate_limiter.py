@@ -0,0 +1,81 @@
+"""Global LLM call pacing shared by concurrent benchmark scenarios.
+
+Concurrent benchmark slots run in separate child processes, so the limiter
+keeps its schedule in a small SQLite file named by
+``GAIA_LLM_RATE_LIMIT_STATE``. Each call reserves the next free slot
+``60 / GAIA_LLM_RATE_LIMIT_PER_MIN`` seconds after the previous reservation
+inside one ``BEGIN IMMEDIATE`` transaction, then sleeps until that slot. The
+limiter is a no-op when no rate is configured, and it falls back to
+process-local pacing when the shared state file cannot be used.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_LOCAL_LOCK = threading.Lock()
+_local_next_at = 0.0
+
+
+def llm_rate_limit_per_min() -> float:
+    raw = str(os.getenv("GAIA_LLM_RATE_LIMIT_PER_MIN", "") or "").strip()
+    try:
+        value = float(raw) if raw else 0.0
+    except Exception:
+        return 0.0
+    return max(0.0, value)
+
+
+def _reserve_shared(state_path: str, interval: float, now: float) -> float:
+    Path(state_path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(state_path, timeout=60, isolation_level=None)
+    try:
+        conn.execute("CREATE TABLE IF NOT EXISTS llm_rate_limit (id INTEGER PRIMARY KEY, next_at REAL NOT NULL)")
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute("SELECT next_at FROM llm_rate_limit WHERE id = 1").fetchone()
+        slot_at = max(now, float(row[0]) if row else 0.0)
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_rate_limit (id, next_at) VALUES (1, ?)",
+            (slot_at + interval,),
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return slot_at
+
+
+def _reserve_local(interval: float, now: float) -> float:
+    global _local_next_at
+    with _LOCAL_LOCK:
+        slot_at = max(now, _local_next_at)
+        _local_next_at = slot_at + interval
+    return slot_at
+
+
+def acquire_llm_call_slot() -> float:
+    """Block until the next LLM call may start; return the seconds waited."""
+    rate = llm_rate_limit_per_min()
+    if rate <= 0:
+        return 0.0
+    interval = 60.0 / rate
+    # wall clock: 여러 프로세스가 같은 스케줄을 공유해야 하므로 monotonic을 쓸 수 없다
+    now = time.time()
+    state_path = str(os.getenv("GAIA_LLM_RATE_LIMIT_STATE", "") or "").strip()
+    slot_at = 0.0
+    if state_path:
+        try:
+            slot_at = _reserve_shared(state_path, interval, now)
+        except (OSError, sqlite3.Error):
+            slot_at = 0.0
+    if not slot_at:
+        slot_at = _reserve_local(interval, now)
+    wait = slot_at - now
+    if wait > 0:
+        time.sleep(wait)
+    return max(0.0, wait)
+
+
+__all__ = ["acquire_llm_call_slot", "llm_rate_limit_per_min"]
@@ -7,17 +7,24 @@ from __future__ import annotations
 import base64
 import json
 import os
+import queue
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List
 
 import openai
 
-from gaia.src.phase4.codex_app_server_client import CodexAppServerClient, CodexAppServerError
+from gaia.src.phase4.codex_app_server_client import (
+    CodexAppServerError,
+    CodexAppServerPool,
+    get_codex_app_server_pool,
+)
+from gaia.src.phase4.llm_rate_limiter import acquire_llm_call_slot
 from gaia.src.utils.models import DomElement
 
 
@@ -193,7 +200,7 @@ class LLMVisionClient:
             and shutil.which("codex") is not None
         )
         self._prefer_codex_app_server = self._prefer_codex_cli and self._codex_app_server_enabled()
-        self._codex_app_server_client: CodexAppServerClient | None = None
+        self._codex_app_server_pool: CodexAppServerPool | None = None
         client_kwargs: dict[str, Any] = {"api_key": api_key, "timeout": 60.0}
         if base_url:
             client_kwargs["base_url"] = base_url
@@ -418,7 +425,13 @@ class LLMVisionClient:
 
         raise RuntimeError(f"codex exec failed: {last_error or 'unknown error'}")
 
-    def _run_codex_app_server(self, prompt: str, images: List[str] | None = None) -> str:
+    def _run_codex_app_server(
+        self,
+        prompt: str,
+        images: List[str] | None = None,
+        *,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> str:
         codex_bin = shutil.which("codex")
         if not codex_bin:
             raise RuntimeError("codex CLI를 찾을 수 없습니다.")
@@ -426,8 +439,9 @@ class LLMVisionClient:
             codex_timeout_sec = int(os.getenv("GAIA_CODEX_EXEC_TIMEOUT_SEC", "120") or 120)
         except Exception:
             codex_timeout_sec = 120
-        if self._codex_app_server_client is None:
-            self._codex_app_server_client = CodexAppServerClient(
+        if self._codex_app_server_pool is None:
+            # 프로세스 전역 풀: 여러 agent/스레드가 같은 app-server 프로세스를 빌려 쓴다
+            self._codex_app_server_pool = get_codex_app_server_pool(
                 codex_bin=codex_bin,
                 model=self.model,
                 timeout_sec=codex_timeout_sec,
@@ -435,21 +449,28 @@ class LLMVisionClient:
                 reuse_thread=self._codex_app_server_reuse_thread(),
             )
         try:
-            if images:
-                return self._codex_app_server_client.analyze_with_images(prompt, images)
-            return self._codex_app_server_client.analyze_text(prompt)
+            with self._codex_app_server_pool.lease(timeout=codex_timeout_sec) as app_server:
+                if images:
+                    return app_server.analyze_with_images(prompt, images, on_delta=on_delta)
+                return app_server.analyze_text(prompt, on_delta=on_delta)
         except CodexAppServerError as exc:
             raise RuntimeError(f"codex app-server failed: {exc}") from exc
 
-    def _run_codex_transport(self, prompt: str, images: List[str] | None = None) -> str:
+    def _run_codex_transport(
+        self,
+        prompt: str,
+        images: List[str] | None = None,
+        *,
+        on_delta: Callable[[str], None] | None = None,
+    ) -> str:
+        acquire_llm_call_slot()
         if self._prefer_codex_app_server:
             try:
-                return self._run_codex_app_server(prompt, images)
+                return self._run_codex_app_server(prompt, images, on_delta=on_delta)
             except RuntimeError as exc:
+                # 공유 풀은 다른 agent도 쓰므로 닫지 않는다. 고장 난 클라이언트는 풀이 반납 시 폐기한다.
                 self._prefer_codex_app_server = False
-                if self._codex_app_server_client is not None:
-                    self._codex_app_server_client.close()
-                    self._codex_app_server_client = None
+                self._codex_app_server_pool = None
                 print(
                     self._console_text(
                         f"⚠️ Codex app-server 실패({str(exc)[:120]}…) → 기존 codex exec 경로로 전환합니다.",
@@ -458,6 +479,10 @@ class LLMVisionClient:
                 )
         return self._run_codex_exec(prompt, images or [])
 
+    def _create_chat_completion(self, **kwargs: Any) -> Any:
+        acquire_llm_call_slot()
+        return self.client.chat.completions.create(**kwargs)
+
     @staticmethod
     def _response_text(response: Any) -> str:
         try:
@@ -506,7 +531,7 @@ class LLMVisionClient:
                     raise
 
         try:
-            response = self.client.chat.completions.create(
+            response = self._create_chat_completion(
                 model=self.model,
                 max_completion_tokens=max_completion_tokens,
                 temperature=temperature,
@@ -520,6 +545,126 @@ class LLMVisionClient:
             self._raise_actionable(exc)
             raise
 
+    def stream_text(
+        self,
+        prompt: str,
+        images: List[str] | None = None,
+        *,
+        max_completion_tokens: int | None = None,
+        temperature: float = 0.1,
+    ) -> Iterator[str]:
+        """Yield the response text as it is generated.
+
+        Deltas are yielded raw (code fences included). The Codex app-server and
+        the OpenAI-compatible API stream token deltas; ``codex exec`` yields the
+        whole answer once. If the streaming request could not be sent, the
+        blocking ``analyze_text``/``analyze_with_vision`` path (with its
+        Codex/API fallbacks) is used instead. Once it was sent, failures are
+        raised rather than asking the model a second time for the same answer.
+        """
+        images = [image for image in (images or []) if image]
+        request: Dict[str, bool] = {"sent": False}
+        try:
+            if self._prefer_codex_cli:
+                stream = self._stream_codex_transport(prompt, images, request=request)
+            else:
+                stream = self._stream_chat_completion(
+                    prompt,
+                    images,
+                    max_completion_tokens=max_completion_tokens,
+                    temperature=temperature,
+                    request=request,
+                )
+            yield from stream
+            return
+        except Exception:
+            if request["sent"]:
+                raise
+        if images:
+            yield self.analyze_with_vision(prompt, images[0])
+        else:
+            yield self.analyze_text(
+                prompt,
+                max_completion_tokens=max_completion_tokens or 4096,
+                temperature=temperature,
+            )
+
+    def _stream_codex_transport(
+        self,
+        prompt: str,
+        images: List[str],
+        *,
+        request: Dict[str, bool],
+    ) -> Iterator[str]:
+        deltas: "queue.Queue[Any]" = queue.Queue()
+        done = object()
+        outcome: Dict[str, Any] = {}
+
+        def run() -> None:
+            try:
+                outcome["text"] = self._run_codex_transport(prompt, images, on_delta=deltas.put)
+            except BaseException as exc:
+                outcome["error"] = exc
+            finally:
+                deltas.put(done)
+
+        # codex transport는 app-server 실패 시 exec로 자체 폴백하므로 시작 시점부터 전송된 것으로 본다
+        request["sent"] = True
+        threading.Thread(target=run, daemon=True, name="gaia-codex-stream").start()
+        streamed: List[str] = []
+        while True:
+            item = deltas.get()
+            if item is done:
+                break
+            streamed.append(item)
+            yield item
+        if "error" in outcome:
+            raise outcome["error"]
+        text = str(outcome.get("text") or "")
+        so_far = "".join(streamed)
+        if text.startswith(so_far):
+            if text[len(so_far):]:
+                yield text[len(so_far):]
+        elif not streamed:
+            yield text
+        else:
+            # app-server 도중 실패로 codex exec 결과가 따로 오면 이어 붙일 수 없다
+            raise RuntimeError("codex stream diverged from the final message")
+
+    def _stream_chat_completion(
+        self,
+        prompt: str,
+        images: List[str],
+        *,
+        max_completion_tokens: int | None,
+        temperature: float,
+        request: Dict[str, bool],
+    ) -> Iterator[str]:
+        if self.client is None:
+            raise RuntimeError("OpenAI client is not configured")
+        kwargs: Dict[str, Any] = {"model": self.model, "stream": True}
+        if images:
+            kwargs["max_completion_tokens"] = max_completion_tokens or 2048
+            content: List[Dict[str, Any]] = [{"type": "text", "text": prompt}]
+            content.extend(
+                {"type": "image_url", "image_url": {"url": f"data:image/png;base64,{image}"}}
+                for image in images
+            )
+            kwargs["messages"] = [{"role": "user", "content": content}]
+        else:
+            kwargs["max_completion_tokens"] = max_completion_tokens or 4096
+            kwargs["temperature"] = temperature
+            kwargs["messages"] = [{"role": "user", "content": prompt}]
+        response = self._create_chat_completion(**kwargs)
+        request["sent"] = True
+        for chunk in response:
+            choices = getattr(chunk, "choices", None) or []
+            if not choices:
+                continue
+            text = getattr(getattr(choices[0], "delta", None), "content", None)
+            if isinstance(text, str) and text:
+                yield text
+
     def select_element_for_step(
         self,
         step_description: str,
@@ -792,22 +937,23 @@ JSON response:"""
                     raise
 
         try:
-            response = self.client.chat.completions.create(
+            response = self._create_chat_completion(
                 model=self.model,
                 max_completion_tokens=2048,
                 messages=[
                     {
                         "role": "user",
+                        # text를 먼저 두어 프롬프트의 정적 prefix가 provider prompt cache에 걸리게 한다
                         "content": [
+                            {
+                                "type": "text",
+                                "text": prompt
+                            },
                             {
                                 "type": "image_url",
                                 "image_url": {
                                     "url": f"data:image/png;base64,{screenshot_base64}"
                                 }
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
                             }
                         ]
                     }
@@ -901,7 +1047,7 @@ Required JSON format (no markdown):
 JSON response:"""
 
         try:
-            response = self.client.chat.completions.create(
+            response = self._create_chat_completion(
                 model=self.model,
                 max_completion_tokens=1024,
                 messages=[
@@ -1030,7 +1176,7 @@ Required JSON format (no markdown):
 JSON response:"""
 
         try:
-            response = self.client.chat.completions.create(
+            response = self._create_chat_completion(
                 model=self.model,
                 max_completion_tokens=512,
                 messages=[
@@ -1360,7 +1506,7 @@ Required JSON format (no markdown):
 JSON response:"""
 
         try:
-            response = self.client.chat.completions.create(
+            response = self._create_chat_completion(
                 model=self.model,
                 max_completion_tokens=1024,
                 messages=[
@@ -1479,7 +1625,7 @@ Required JSON format (no markdown):
 JSON response:"""
 
         try:
-            response = self.client.chat.completions.create(
+            response = self._create_chat_completion(
                 model=self.model,
                 max_completion_tokens=1024,
                 messages=[
@@ -1696,7 +1842,7 @@ Required JSON format (no markdown):
 JSON response:"""
 
         try:
-            response = self.client.chat.completions.create(
+            response = self._create_chat_completion(
                 model=self.model,
                 max_completion_tokens=1024,
                 messages=[
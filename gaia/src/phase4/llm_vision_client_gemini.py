@@ -11,11 +11,12 @@ import json
 import os
 import base64
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from google import genai
 from google.genai import types
 
+from gaia.src.phase4.llm_rate_limiter import acquire_llm_call_slot
 from gaia.src.utils.models import DomElement
 
 
@@ -189,6 +190,7 @@ class GeminiVisionClient:
         temperature: float = 0.1,
     ) -> str:
         """텍스트 전용 분석."""
+        acquire_llm_call_slot()
         response = self.client.models.generate_content(
             model=self.model,
             contents=[types.Content(role="user", parts=[types.Part(text=prompt)])],
@@ -200,6 +202,44 @@ class GeminiVisionClient:
         text = getattr(response, "text", "")
         return text.strip() if isinstance(text, str) else ""
 
+    def stream_text(
+        self,
+        prompt: str,
+        images: List[str] | None = None,
+        *,
+        max_completion_tokens: int | None = None,
+        temperature: float = 0.1,
+    ) -> Iterator[str]:
+        """응답 텍스트를 생성되는 대로 delta 단위로 돌려준다 (code fence 포함 원문)."""
+        parts = [types.Part(text=prompt)]
+        for img_base64 in images or []:
+            parts.append(
+                types.Part(
+                    inline_data=types.Blob(
+                        mime_type="image/png",
+                        data=base64.b64decode(img_base64),
+                    )
+                )
+            )
+        max_tokens = max_completion_tokens or (16384 if images else 4096)
+        acquire_llm_call_slot()
+        stream = self.client.models.generate_content_stream(
+            model=self.model,
+            contents=[types.Content(role="user", parts=parts)],
+            config=types.GenerateContentConfig(
+                max_output_tokens=max_tokens,
+                temperature=temperature,
+            ),
+        )
+        for chunk in stream:
+            try:
+                text = chunk.text
+            except Exception:
+                # 후보가 없는 chunk(안전 필터 메타데이터 등)는 text 접근이 실패한다
+                continue
+            if isinstance(text, str) and text:
+                yield text
+
     def _call_vision_api(
         self, prompt: str, images: List[str], max_tokens: int = 16384
     ) -> str:
@@ -218,6 +258,7 @@ class GeminiVisionClient:
                 )
             )
 
+        acquire_llm_call_slot()
         try:
             response = self.client.models.generate_content(
                 model=self.model,
@@ -21,6 +21,7 @@ _OPENCLAW_BROWSER_ACTIONS = {
     "browser_find",
     "browser_act",
     "browser_wait",
+    "browser_settle",
     "browser_screenshot",
     "capture_screenshot",
 }
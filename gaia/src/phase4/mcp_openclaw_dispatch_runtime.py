@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+import json
 import os
 from pathlib import Path
 import re
@@ -13,6 +15,7 @@ from urllib.parse import quote, urlparse, urlunparse
 import requests
 
 from gaia.src.phase4.embedded_openclaw_runtime import ensure_embedded_openclaw_base_url
+from gaia.src.phase4.openclaw_http_pool import openclaw_http_request
 from gaia.src.phase4.browser_context_manager import build_auto_follow_state_update
 from gaia.src.phase4.mcp_ref.snapshot_helpers import (
     _build_context_snapshot_from_elements,
@@ -21,12 +24,15 @@ from gaia.src.phase4.mcp_ref.snapshot_helpers import (
     _role_snapshot_stats,
 )
 from gaia.src.phase4.mcp_ref.actionability_errors import extract_pointer_interceptor
+from gaia.src.phase4.mcp_ref.snapshot_diff import summarize_role_snapshot_change
 
 _SESSION_LOCK = threading.Lock()
 _SESSIONS: Dict[str, Dict[str, Any]] = {}
 _BASE_URL_CACHE: Dict[str, str] = {}
 _DEFAULT_OPENCLAW_REQUEST_TIMEOUT_S = 12.0
 _TABS_CACHE_MAX_AGE_S = 2.0
+_OBSERVE_EXECUTOR_LOCK = threading.Lock()
+_OBSERVE_EXECUTOR: Optional[ThreadPoolExecutor] = None
 
 _INTERACTIVE_ROLES = {
     "button",
@@ -226,6 +232,11 @@ def _openclaw_dom_text_block_limit() -> int:
     return max(0, min(value, 200))
 
 
+def _openclaw_parallel_observe_enabled() -> bool:
+    raw_value = str(os.getenv("GAIA_OPENCLAW_PARALLEL_OBSERVE", "0") or "0").strip().lower()
+    return raw_value in {"1", "true", "yes", "on"}
+
+
 def _resolve_base_url(raw_base_url: str | None) -> str:
     explicit_base_url = str(os.getenv("GAIA_OPENCLAW_BASE_URL", "") or "").strip()
     base_url = explicit_base_url or str(raw_base_url or "").strip()
@@ -240,7 +251,7 @@ def _resolve_base_url(raw_base_url: str | None) -> str:
 
     def _looks_like_browser_server(candidate: str) -> bool:
         try:
-            response = requests.get(candidate, headers=_headers(), timeout=1.5)
+            response = openclaw_http_request("GET", candidate, headers=_headers(), timeout=1.5)
         except Exception:
             return False
         if response.status_code >= 400:
@@ -341,9 +352,10 @@ def _request(
         payload_profile = str(payload.get("profile") or "").strip()
     query.setdefault("profile", _profile_name(query.get("profile") or payload_profile or None))
     url = f"{base_url}{path}"
-    response = requests.request(
-        method=method.upper(),
-        url=url,
+    response = openclaw_http_request(
+        method,
+        url,
+        profile=str(query.get("profile") or ""),
         params=query,
         json=payload,
         headers=_headers(),
@@ -2784,6 +2796,106 @@ def _commit_verify_interval_ms() -> int:
         return 700
 
 
+# Resolves once the DOM has had no mutations (and the in-page DOM hash has not
+# moved) for ``quietMs``. The hash folds the URL, the element tag sequence and the
+# body text length with FNV-1a: OpenClaw snapshots carry no ``dom_hash`` and a
+# role snapshot per poll would cost a full round-trip, so stability is checked on
+# this page-side hash instead. The observer lives on ``window`` so consecutive
+# polls share it; a navigation simply starts a fresh one.
+_PAGE_SETTLE_FN_TEMPLATE = """() => {
+  const quietMs = __QUIET_MS__;
+  const now = Date.now();
+  let h = 0x811c9dc5;
+  const fold = (text) => {
+    for (let i = 0; i < text.length; i++) { h ^= text.charCodeAt(i); h = Math.imul(h, 0x01000193); }
+  };
+  fold(location.href);
+  const nodes = document.getElementsByTagName("*");
+  for (let i = 0; i < nodes.length; i++) fold(nodes[i].tagName);
+  fold(String((document.body && document.body.innerText || "").length));
+  const fp = (h >>> 0).toString(16) + ":" + nodes.length;
+  let s = window.__gaiaSettle;
+  if (!s) {
+    s = window.__gaiaSettle = { last: now, fp: fp, observer: null };
+    try {
+      s.observer = new MutationObserver(() => { s.last = Date.now(); });
+      s.observer.observe(document.documentElement || document, {
+        childList: true, subtree: true, attributes: true, characterData: true
+      });
+    } catch (e) {}
+  }
+  if (s.fp !== fp) { s.fp = fp; s.last = now; }
+  if (document.readyState === "loading" || now - s.last < quietMs) return false;
+  try { if (s.observer) s.observer.disconnect(); } catch (e) {}
+  window.__gaiaSettle = null;
+  return true;
+}"""
+
+
+def _page_settle_fn(quiet_ms: int) -> str:
+    return _PAGE_SETTLE_FN_TEMPLATE.replace("__QUIET_MS__", str(max(50, int(quiet_ms))))
+
+
+def _settle_target(
+    *,
+    base_url: str,
+    target_id: str,
+    profile: str,
+    max_wait_ms: int,
+    quiet_ms: int,
+    network_idle: bool,
+    timeout: Any = None,
+) -> Dict[str, Any]:
+    """Wait for network idle, then DOM quiescence, never longer than ``max_wait_ms`` in total."""
+    started = time.perf_counter()
+    max_wait_ms = max(0, int(max_wait_ms))
+    result: Dict[str, Any] = {
+        "network_idle": False,
+        "dom_quiet": False,
+        "timed_out": False,
+        "max_wait_ms": max_wait_ms,
+    }
+
+    def _elapsed_ms() -> int:
+        return int((time.perf_counter() - started) * 1000)
+
+    if network_idle and max_wait_ms > 0:
+        status_code, _data, _text = _request(
+            "POST",
+            base_url=base_url,
+            path="/act",
+            timeout=timeout,
+            payload={
+                "targetId": target_id,
+                "profile": profile,
+                "kind": "wait",
+                "loadState": "networkidle",
+                "timeoutMs": max(500, max_wait_ms // 2),
+            },
+        )
+        result["network_idle"] = status_code < 400
+        result["network_idle_ms"] = _elapsed_ms()
+    remaining_ms = max_wait_ms - _elapsed_ms()
+    if remaining_ms >= min(500, max(50, int(quiet_ms))):
+        status_code, _data, _text = _request(
+            "POST",
+            base_url=base_url,
+            path="/act",
+            timeout=timeout,
+            payload={
+                "targetId": target_id,
+                "profile": profile,
+                "kind": "wait",
+                "fn": _page_settle_fn(quiet_ms),
+                "timeoutMs": max(500, remaining_ms),
+            },
+        )
+        result["dom_quiet"] = status_code < 400
+    result["timed_out"] = not result["dom_quiet"]
+    result["waited_ms"] = _elapsed_ms()
+    return result
+
+
 def _element_actionability_label(item: Dict[str, Any]) -> str:
     attrs = item.get("attributes") if isinstance(item.get("attributes"), dict) else {}
     for value in (
@@ -3192,17 +3304,22 @@ def _build_snapshot_payload(
     return payload
 
 
-def _snapshot_payload_for_target(
+def _observe_executor() -> ThreadPoolExecutor:
+    global _OBSERVE_EXECUTOR
+    with _OBSERVE_EXECUTOR_LOCK:
+        if _OBSERVE_EXECUTOR is None:
+            _OBSERVE_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gaia-openclaw-observe")
+        return _OBSERVE_EXECUTOR
+
+
+def _fetch_raw_snapshot_for_target(
     *,
     base_url: str,
-    session_id: str,
-    state: Dict[str, Any],
     target_id: str,
+    profile: str,
     timeout: Any,
-    requested_scope_ref_id: str = "",
-) -> Optional[Dict[str, Any]]:
-    profile = str(state.get("profile") or "").strip()
-    params = {
+) -> Tuple[int, Dict[str, Any], str]:
+    params: Dict[str, Any] = {
         "targetId": target_id,
         "format": "role",
         "refs": "aria",
@@ -3210,31 +3327,105 @@ def _snapshot_payload_for_target(
     }
     if profile:
         params["profile"] = profile
-    status_code, data, text = _request(
+    return _request(
         "GET",
         base_url=base_url,
         path="/snapshot",
         timeout=timeout,
         params=params,
     )
-    if status_code >= 400:
-        return None
-    frame_descriptors = (
-        _fetch_frame_descriptors_for_target(
-            base_url=base_url,
-            target_id=target_id,
-            profile=profile,
-            timeout=timeout,
+
+
+def _timed_call(timings_ms: Dict[str, int], name: str, fn: Any, **kwargs: Any) -> Any:
+    started = time.perf_counter()
+    try:
+        return fn(**kwargs)
+    finally:
+        timings_ms[name] = int((time.perf_counter() - started) * 1000)
+
+
+def _observe_target(
+    *,
+    base_url: str,
+    target_id: str,
+    profile: str,
+    timeout: Any,
+) -> Dict[str, Any]:
+    """Fetch the raw snapshot plus frame and DOM-text reads for one target.
+
+    With ``GAIA_OPENCLAW_PARALLEL_OBSERVE`` enabled the independent reads are
+    issued concurrently, so the observation costs roughly the slowest call
+    instead of the sum. Frame descriptors are fetched speculatively in that
+    mode and dropped when the snapshot has no iframe, which keeps the merged
+    payload identical to the sequential path.
+    """
+    timings_ms: Dict[str, int] = {}
+    read_kwargs = {"base_url": base_url, "target_id": target_id, "profile": profile, "timeout": timeout}
+    started = time.perf_counter()
+    frame_descriptors: List[Dict[str, Any]] = []
+    dom_text_blocks: List[Dict[str, Any]] = []
+    if _openclaw_parallel_observe_enabled():
+        executor = _observe_executor()
+        snapshot_future = executor.submit(
+            _timed_call, timings_ms, "snapshot", _fetch_raw_snapshot_for_target, **read_kwargs
         )
-        if _snapshot_may_contain_iframe(data)
-        else []
-    )
-    dom_text_blocks = _fetch_dom_text_blocks_for_target(
+        frames_future = executor.submit(
+            _timed_call, timings_ms, "frames", _fetch_frame_descriptors_for_target, **read_kwargs
+        )
+        dom_text_future = executor.submit(
+            _timed_call, timings_ms, "dom_text", _fetch_dom_text_blocks_for_target, **read_kwargs
+        )
+        status_code, data, text = snapshot_future.result()
+        try:
+            frame_descriptors = list(frames_future.result() or [])
+        except Exception:
+            frame_descriptors = []
+        try:
+            dom_text_blocks = list(dom_text_future.result() or [])
+        except Exception:
+            dom_text_blocks = []
+        if status_code >= 400 or not _snapshot_may_contain_iframe(data):
+            frame_descriptors = []
+        if status_code >= 400:
+            dom_text_blocks = []
+    else:
+        status_code, data, text = _timed_call(timings_ms, "snapshot", _fetch_raw_snapshot_for_target, **read_kwargs)
+        if status_code < 400:
+            if _snapshot_may_contain_iframe(data):
+                frame_descriptors = _timed_call(
+                    timings_ms, "frames", _fetch_frame_descriptors_for_target, **read_kwargs
+                )
+            dom_text_blocks = _timed_call(timings_ms, "dom_text", _fetch_dom_text_blocks_for_target, **read_kwargs)
+    timings_ms["total"] = int((time.perf_counter() - started) * 1000)
+    return {
+        "status_code": int(status_code),
+        "data": data if isinstance(data, dict) else {},
+        "text": str(text or ""),
+        "frame_descriptors": frame_descriptors,
+        "dom_text_blocks": dom_text_blocks,
+        "timings_ms": timings_ms,
+    }
+
+
+def _snapshot_payload_for_target(
+    *,
+    base_url: str,
+    session_id: str,
+    state: Dict[str, Any],
+    target_id: str,
+    timeout: Any,
+    requested_scope_ref_id: str = "",
+) -> Optional[Dict[str, Any]]:
+    profile = str(state.get("profile") or "").strip()
+    observation = _observe_target(
         base_url=base_url,
         target_id=target_id,
         profile=profile,
         timeout=timeout,
     )
+    if int(observation["status_code"]) >= 400:
+        return None
+    data = observation["data"]
     payload = _build_snapshot_payload(
         session_id=session_id,
         target_id=target_id,
@@ -3242,9 +3433,10 @@ def _snapshot_payload_for_target(
         requested_scope_ref_id=requested_scope_ref_id,
         raw_snapshot=data,
         state=state,
-        frame_descriptors=frame_descriptors,
-        dom_text_blocks=dom_text_blocks,
+        frame_descriptors=observation["frame_descriptors"],
+        dom_text_blocks=observation["dom_text_blocks"],
     )
+    payload["observation_timings_ms"] = dict(observation["timings_ms"])
     _augment_snapshot_with_ref_actionability(
         payload=payload,
         base_url=base_url,
@@ -3905,6 +4097,13 @@ def _derive_state_change_from_snapshot_payloads(
         "snapshot_id_before": str(before.get("snapshot_id") or ""),
         "snapshot_id_after": str(after.get("snapshot_id") or ""),
     }
+    try:
+        dom_delta = summarize_role_snapshot_change(before, after)
+    except Exception:
+        dom_delta = {}
+    if dom_delta:
+        # 진단용 구조 diff는 progress 신호와 섞이지 않도록 한 키 아래에 둔다
+        state_change["dom_delta"] = dom_delta
     return _merge_state_change_evidence(
         state_change=state_change,
         evidence=new_page_evidence,
@@ -4496,6 +4695,8 @@ def dispatch_openclaw_action(
     effective_params = dict(params or {})
     if action == "browser_wait" and not str(effective_params.get("action") or "").strip():
         effective_params["action"] = "wait"
+    if action == "browser_settle" and not str(effective_params.get("action") or "").strip():
+        effective_params["action"] = "settle"
     base_url = _resolve_base_url(raw_base_url)
     session_id = str((effective_params or {}).get("session_id") or "default")
     profile_name = _session_profile(
@@ -4565,19 +4766,13 @@ def dispatch_openclaw_action(
         if bool((effective_params or {}).get("force_refresh")):
             _clear_snapshot_cache(state)
         target_id = str(state.get("target_id") or "").strip()
-        status_code, data, text = _request(
-            "GET",
+        observation = _observe_target(
             base_url=base_url,
-            path="/snapshot",
+            target_id=target_id,
+            profile=profile_name,
             timeout=timeout,
-            params={
-                "targetId": target_id,
-                "format": "role",
-                "refs": "aria",
-                "profile": profile_name,
-                "maxChars": _openclaw_snapshot_max_chars_param(),
-            },
         )
+        status_code, data, text = observation["status_code"], observation["data"], observation["text"]
         if status_code >= 400 and _target_missing(status_code, data, text):
             fallback_url = str(state.get("current_url") or fallback_url or "")
             _clear_session_target(session_id)
@@ -4588,37 +4783,15 @@ def dispatch_openclaw_action(
                 timeout=timeout,
             )
             target_id = str(state.get("target_id") or "").strip()
-            status_code, data, text = _request(
-                "GET",
-                base_url=base_url,
-                path="/snapshot",
-                timeout=timeout,
-                params={
-                    "targetId": target_id,
-                    "format": "role",
-                    "refs": "aria",
-                    "profile": profile_name,
-                    "maxChars": _openclaw_snapshot_max_chars_param(),
-                },
-            )
-        if status_code >= 400:
-            return _normalize_failure(status_code, data, text)
-        frame_descriptors = (
-            _fetch_frame_descriptors_for_target(
+            observation = _observe_target(
                 base_url=base_url,
                 target_id=target_id,
                 profile=profile_name,
                 timeout=timeout,
             )
-            if _snapshot_may_contain_iframe(data)
-            else []
-        )
-        dom_text_blocks = _fetch_dom_text_blocks_for_target(
-            base_url=base_url,
-            target_id=target_id,
-            profile=profile_name,
-            timeout=timeout,
-        )
+            status_code, data, text = observation["status_code"], observation["data"], observation["text"]
+        if status_code >= 400:
+            return _normalize_failure(status_code, data, text)
         payload = _build_snapshot_payload(
             session_id=session_id,
             target_id=target_id,
@@ -4626,9 +4799,10 @@ def dispatch_openclaw_action(
             requested_scope_ref_id=str((effective_params or {}).get("scope_container_ref_id") or "").strip(),
             raw_snapshot=data,
             state=state,
-            frame_descriptors=frame_descriptors,
-            dom_text_blocks=dom_text_blocks,
+            frame_descriptors=observation["frame_descriptors"],
+            dom_text_blocks=observation["dom_text_blocks"],
         )
+        payload["observation_timings_ms"] = dict(observation["timings_ms"])
         return 200, payload, ""
 
     if action == "browser_find":
@@ -4820,6 +4994,57 @@ def dispatch_openclaw_action(
             },
             "",
         )
+    if browser_action == "settle":
+        settle_options = dict(effective_params)
+        raw_value = settle_options.get("value")
+        if isinstance(raw_value, str) and raw_value.strip().startswith("{"):
+            try:
+                parsed_value = json.loads(raw_value)
+            except Exception:
+                parsed_value = None
+            if isinstance(parsed_value, dict):
+                settle_options.update(parsed_value)
+        elif isinstance(raw_value, dict):
+            settle_options.update(raw_value)
+        try:
+            max_wait_ms = int(settle_options.get("max_wait_ms") or settle_options.get("maxWaitMs") or 3000)
+        except Exception:
+            max_wait_ms = 3000
+        try:
+            quiet_ms = int(settle_options.get("quiet_ms") or settle_options.get("quietMs") or 300)
+        except Exception:
+            quiet_ms = 300
+        network_idle = settle_options.get("network_idle", settle_options.get("networkIdle", True))
+        settle = _settle_target(
+            base_url=base_url,
+            target_id=target_id,
+            profile=profile_name,
+            max_wait_ms=max(0, min(max_wait_ms, 30000)),
+            quiet_ms=max(50, min(quiet_ms, 5000)),
+            network_idle=bool(network_idle) and str(network_idle).strip().lower() not in {"0", "false", "no", "off"},
+            timeout=timeout,
+        )
+        return (
+            200,
+            {
+                "success": True,
+                "effective": True,
+                "reason_code": "ok" if not settle["timed_out"] else "settle_timeout",
+                "reason": "ok",
+                "state_change": {
+                    "backend": "openclaw",
+                    "backend_progress": False,
+                    "backend_effective_only": True,
+                    "settle": settle,
+                },
+                "settle": settle,
+                "current_url": str(state.get("current_url") or requested_url or ""),
+                "session_id": session_id,
+                "profile": profile_name,
+                "targetId": target_id,
+            },
+            "",
+        )
     try:
         payload = _build_openclaw_action_payload(
             target_id=target_id,
@@ -5137,6 +5362,15 @@ def dispatch_openclaw_action(
         settle_ms = 350 if probe_kind in {"click", "press", "select", "drag"} else 180
         if settle_ms > 0:
             time.sleep(float(settle_ms) / 1000.0)
+        after_tabs_future = None
+        if before_tabs_payload and _openclaw_parallel_observe_enabled():
+            after_tabs_future = _observe_executor().submit(
+                _tabs_payload_for_target,
+                base_url=base_url,
+                target_id=target_id,
+                profile=profile_name,
+                timeout=timeout,
+            )
         try:
             probe_started = time.perf_counter()
             after_payload = _snapshot_payload_for_target(
@@ -5153,11 +5387,15 @@ def dispatch_openclaw_action(
         after_tabs_payload: Optional[Dict[str, Any]] = None
         if before_tabs_payload:
             try:
-                after_tabs_payload = _tabs_payload_for_target(
-                    base_url=base_url,
-                    target_id=target_id,
-                    profile=profile_name,
-                    timeout=timeout,
+                after_tabs_payload = (
+                    after_tabs_future.result()
+                    if after_tabs_future is not None
+                    else _tabs_payload_for_target(
+                        base_url=base_url,
+                        target_id=target_id,
+                        profile=profile_name,
+                        timeout=timeout,
+                    )
                 )
                 _remember_tabs_payload(
                     state=state,
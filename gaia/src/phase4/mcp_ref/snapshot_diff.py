@@ -0,0 +1,253 @@
+"""Structural diff of role snapshots keyed by ref identity.
+
+Each snapshot is indexed once (and memoized by text, so the previous turn's
+index is reused): every line gets an identity key (its ref, else role/name,
+else the raw text, disambiguated by sibling occurrence) and a subtree hash.
+The diff walks both trees top-down, skipping any matched subtree whose hash is
+unchanged, so the cost is proportional to the snapshot size plus the size of
+what changed instead of difflib's quadratic worst case.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .snapshot_helpers import _RoleLine, _parse_role_snapshot
+
+_ROOT = -1
+
+
+@dataclass(slots=True)
+class RoleSnapshotIndex:
+    nodes: List[_RoleLine]
+    children: Dict[int, List[int]]
+    keys: List[Tuple[Any, ...]]
+    hashes: List[int]
+
+
+@dataclass(slots=True)
+class RoleSnapshotDiff:
+    inserted: List[int] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+    changed: List[int] = field(default_factory=list)
+    # Current-snapshot parents whose matched children changed order (``-1`` is the root).
+    reordered: List[int] = field(default_factory=list)
+    # Current-snapshot line indices touched by the diff (inserted subtrees,
+    # changed lines and the anchor where a removed subtree used to be).
+    touched: Set[int] = field(default_factory=set)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.inserted or self.removed or self.changed or self.reordered)
+
+
+def _identity_key(node: _RoleLine) -> Tuple[Any, ...]:
+    if node.ref:
+        return ("ref", node.ref)
+    if node.matched:
+        return ("role", node.role, node.name.strip())
+    return ("text", node.text.strip())
+
+
+@lru_cache(maxsize=8)
+def build_role_snapshot_index(snapshot: str) -> RoleSnapshotIndex:
+    nodes = _parse_role_snapshot(snapshot)
+    children: Dict[int, List[int]] = {_ROOT: []}
+    keys: List[Tuple[Any, ...]] = [()] * len(nodes)
+    occurrences: Dict[Tuple[int, Tuple[Any, ...]], int] = {}
+    for index, node in enumerate(nodes):
+        if not node.text.strip():
+            continue
+        children.setdefault(node.parent, []).append(index)
+        base = _identity_key(node)
+        seen = occurrences.get((node.parent, base), 0)
+        occurrences[(node.parent, base)] = seen + 1
+        keys[index] = base + (seen,)
+    hashes = [0] * len(nodes)
+    # Children always follow their parent, so a reverse sweep sees them first.
+    for index in range(len(nodes) - 1, -1, -1):
+        if not keys[index]:
+            continue
+        child_hashes = tuple(hashes[child] for child in children.get(index, ()))
+        hashes[index] = hash((nodes[index].text.strip(), child_hashes))
+    return RoleSnapshotIndex(nodes=nodes, children=children, keys=keys, hashes=hashes)
+
+
+def _subtree_indices(index: RoleSnapshotIndex, root: int) -> List[int]:
+    out: List[int] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        out.append(current)
+        stack.extend(reversed(index.children.get(current, ())))
+    return out
+
+
+def _moved_positions(sequence: List[int]) -> List[int]:
+    """Positions outside one longest increasing subsequence of ``sequence``, i.e. the moved items."""
+    tails: List[int] = []
+    tail_positions: List[int] = []
+    previous: List[int] = [-1] * len(sequence)
+    for position, value in enumerate(sequence):
+        slot = bisect_left(tails, value)
+        if slot == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[slot] = value
+            tail_positions[slot] = position
+        previous[position] = tail_positions[slot - 1] if slot else -1
+    kept: Set[int] = set()
+    position = tail_positions[-1] if tail_positions else -1
+    while position >= 0:
+        kept.add(position)
+        position = previous[position]
+    return [position for position in range(len(sequence)) if position not in kept]
+
+
+def diff_role_snapshots(prev: RoleSnapshotIndex, cur: RoleSnapshotIndex) -> RoleSnapshotDiff:
+    diff = RoleSnapshotDiff()
+    pending: List[Tuple[int, int]] = [(_ROOT, _ROOT)]
+    while pending:
+        prev_parent, cur_parent = pending.pop()
+        prev_children = prev.children.get(prev_parent, [])
+        cur_children = cur.children.get(cur_parent, [])
+        prev_by_key = {prev.keys[child]: child for child in prev_children}
+        matched: Dict[int, int] = {}
+        for cur_child in cur_children:
+            prev_child = prev_by_key.get(cur.keys[cur_child])
+            if prev_child is None:
+                diff.inserted.append(cur_child)
+                diff.touched.update(_subtree_indices(cur, cur_child))
+                continue
+            matched[prev_child] = cur_child
+            if prev.hashes[prev_child] == cur.hashes[cur_child]:
+                continue
+            if prev.nodes[prev_child].text.strip() != cur.nodes[cur_child].text.strip():
+                diff.changed.append(cur_child)
+                diff.touched.add(cur_child)
+            pending.append((prev_child, cur_child))
+        # ref로 모두 매칭돼도 형제 순서가 바뀌면(정렬/재배치) 부모 해시만 달라지므로 따로 잡는다
+        order = [prev_child for prev_child in prev_children if prev_child in matched]
+        if [matched[prev_child] for prev_child in order] != sorted(matched.values()):
+            cur_order = sorted(matched.values())
+            rank = {prev_child: position for position, prev_child in enumerate(order)}
+            by_cur = {cur_child: prev_child for prev_child, cur_child in matched.items()}
+            moved = _moved_positions([rank[by_cur[cur_child]] for cur_child in cur_order])
+            diff.reordered.append(cur_parent)
+            diff.touched.update(cur_order[position] for position in moved)
+        if len(matched) == len(prev_children):
+            continue
+        # Anchor each removed subtree on the surviving sibling before it (or the
+        # parent / first sibling) so the delta shows where something vanished.
+        anchor = cur_parent if cur_parent != _ROOT else (cur_children[0] if cur_children else _ROOT)
+        for prev_child in prev_children:
+            if prev_child in matched:
+                anchor = matched[prev_child]
+                continue
+            diff.removed.append(prev_child)
+            if anchor != _ROOT:
+                diff.touched.add(anchor)
+    diff.inserted.sort()
+    diff.removed.sort()
+    diff.changed.sort()
+    diff.reordered.sort()
+    return diff
+
+
+def _ancestor_lines(index: RoleSnapshotIndex, touched: Set[int]) -> Set[int]:
+    ancestors: Set[int] = set()
+    for line in touched:
+        parent = index.nodes[line].parent
+        while parent != _ROOT and parent not in ancestors and parent not in touched:
+            ancestors.add(parent)
+            parent = index.nodes[parent].parent
+    return ancestors
+
+
+def render_role_snapshot_delta(
+    prev_snapshot: str,
+    cur_snapshot: str,
+    *,
+    context_radius: int = 2,
+) -> Tuple[List[str], float, RoleSnapshotDiff]:
+    """Return ``(delta_lines, change_ratio, diff)`` for the current snapshot.
+
+    ``change_ratio`` counts touched lines plus ``context_radius`` neighbours;
+    ancestor lines of touched nodes are shown for orientation but not counted.
+    """
+    cur_index = build_role_snapshot_index(cur_snapshot)
+    cur_lines = [node.text for node in cur_index.nodes]
+    if not prev_snapshot:
+        return cur_lines, 1.0, RoleSnapshotDiff(touched=set(range(len(cur_lines))))
+    diff = diff_role_snapshots(build_role_snapshot_index(prev_snapshot), cur_index)
+    if diff.empty:
+        return [], 0.0, diff
+    if not diff.touched:
+        return cur_lines, 1.0, diff
+
+    shown: Set[int] = set()
+    for line in diff.touched:
+        shown.update(range(max(0, line - context_radius), min(len(cur_lines), line + context_radius + 1)))
+    change_ratio = len(shown) / max(1, len(cur_lines))
+    shown.update(_ancestor_lines(cur_index, diff.touched))
+
+    delta_lines: List[str] = []
+    prev_idx = -1
+    for idx in sorted(shown):
+        if idx > prev_idx + 1 and delta_lines:
+            delta_lines.append(f"... (unchanged {idx - prev_idx - 1} lines)")
+        delta_lines.append(cur_lines[idx])
+        prev_idx = idx
+    remaining = len(cur_lines) - 1 - prev_idx
+    if remaining > 0:
+        delta_lines.append(f"... (unchanged {remaining} lines)")
+    return delta_lines, min(1.0, change_ratio), diff
+
+
+def _role_snapshot_text(payload: Optional[Dict[str, Any]]) -> str:
+    if not isinstance(payload, dict):
+        return ""
+    role_snapshot = payload.get("role_snapshot")
+    if not isinstance(role_snapshot, dict):
+        return ""
+    return str(role_snapshot.get("snapshot") or "")
+
+
+def summarize_role_snapshot_change(
+    before_payload: Optional[Dict[str, Any]],
+    after_payload: Optional[Dict[str, Any]],
+    *,
+    sample_limit: int = 5,
+) -> Dict[str, Any]:
+    """State-change evidence from two snapshot payloads; ``{}`` when either lacks a role snapshot."""
+    before_text = _role_snapshot_text(before_payload)
+    after_text = _role_snapshot_text(after_payload)
+    if not before_text or not after_text:
+        return {}
+    before_index = build_role_snapshot_index(before_text)
+    after_index = build_role_snapshot_index(after_text)
+    diff = diff_role_snapshots(before_index, after_index)
+
+    def _labels(index: RoleSnapshotIndex, roots: List[int]) -> List[str]:
+        return [index.nodes[root].text.strip()[:160] for root in roots[: max(0, sample_limit)]]
+
+    inserted_refs = [
+        str(after_index.nodes[line].ref)
+        for root in diff.inserted
+        for line in _subtree_indices(after_index, root)
+        if after_index.nodes[line].ref
+    ]
+    return {
+        "structure_changed": not diff.empty,
+        "subtrees_inserted": len(diff.inserted),
+        "subtrees_removed": len(diff.removed),
+        "nodes_changed": len(diff.changed),
+        "subtrees_reordered": len(diff.reordered),
+        "inserted_refs": inserted_refs[:20],
+        "inserted_samples": _labels(after_index, diff.inserted),
+        "removed_samples": _labels(before_index, diff.removed),
+        "changed_samples": _labels(after_index, diff.changed),
+    }
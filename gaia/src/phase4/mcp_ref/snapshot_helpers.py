@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 from playwright.async_api import Page
@@ -380,96 +381,239 @@ _ROLE_STRUCTURAL = {
 }
 
 
+_ROLE_LINE_RE = re.compile(r'^(\s*-\s*)(\w+)(?:\s+"([^"]*)")?(.*)$')
+_REF_RE = re.compile(r"\[ref=(e\d+)\]", flags=re.IGNORECASE)
+_NTH_RE = re.compile(r"\[nth=(\d+)\]")
+_TRUNCATION_MARKER = "[...TRUNCATED - page too large]"
+
+
+@dataclass(slots=True)
+class _RoleLine:
+    """One snapshot line, parsed once and shared by compaction, tree building and stats."""
+
+    text: str
+    depth: int
+    head: str = ""
+    role: str = ""
+    name: str = ""
+    suffix: str = ""
+    matched: bool = False
+    ref: Optional[str] = None
+    nth: Optional[int] = None
+    has_ref_marker: bool = False
+    parent: int = -1
+    has_ref_descendant: bool = False
+
+
 def _snapshot_line_depth(line: str) -> int:
     indent = len(line) - len(line.lstrip(" "))
     return max(0, indent // 2)
 
 
+def _parse_role_line(line: str) -> _RoleLine:
+    node = _RoleLine(text=line, depth=_snapshot_line_depth(line))
+    m = _ROLE_LINE_RE.match(line)
+    if m:
+        node.matched = True
+        node.head = m.group(1) + m.group(2)
+        node.role = m.group(2).lower()
+        node.name = m.group(3) or ""
+        node.suffix = m.group(4) or ""
+    if "[" in line:
+        node.has_ref_marker = "[ref=" in line
+        ref_match = _REF_RE.search(line)
+        if ref_match:
+            node.ref = ref_match.group(1)
+        nth_match = _NTH_RE.search(line)
+        if nth_match:
+            node.nth = int(nth_match.group(1))
+    return node
+
+
+def _link_role_lines(nodes: List[_RoleLine]) -> List[_RoleLine]:
+    """Fill ``parent`` and ``has_ref_descendant`` in one stack pass (in place).
+
+    Blank lines never become parents but, as in the original line scan, still
+    close the compaction blocks of shallower-or-equal lines.
+    """
+    tree_stack: List[int] = []
+    block_stack: List[int] = []
+    for index, node in enumerate(nodes):
+        node.has_ref_descendant = False
+        depth = node.depth
+        while block_stack and nodes[block_stack[-1]].depth >= depth:
+            closed = nodes[block_stack.pop()]
+            if closed.has_ref_descendant and block_stack:
+                nodes[block_stack[-1]].has_ref_descendant = True
+        if node.has_ref_marker and block_stack:
+            nodes[block_stack[-1]].has_ref_descendant = True
+        block_stack.append(index)
+        if not node.text.strip():
+            node.parent = -1
+            continue
+        while tree_stack and nodes[tree_stack[-1]].depth >= depth:
+            tree_stack.pop()
+        node.parent = tree_stack[-1] if tree_stack else -1
+        tree_stack.append(index)
+    while block_stack:
+        closed = nodes[block_stack.pop()]
+        if closed.has_ref_descendant and block_stack:
+            nodes[block_stack[-1]].has_ref_descendant = True
+    return nodes
+
+
+def _parse_role_snapshot(snapshot: str) -> List[_RoleLine]:
+    return _link_role_lines([_parse_role_line(line) for line in str(snapshot or "").split("\n")])
+
+
+def _compact_role_nodes(nodes: List[_RoleLine]) -> List[_RoleLine]:
+    """Keep ref lines, ``key: value`` lines and ancestors of ref lines; relinks the survivors."""
+    kept = [
+        node
+        for node in nodes
+        if node.has_ref_marker
+        or (":" in node.text and not node.text.rstrip().endswith(":"))
+        or node.has_ref_descendant
+    ]
+    return _link_role_lines(kept)
+
+
 def _compact_role_tree(snapshot: str) -> str:
-    lines = snapshot.split("\n")
-    out: List[str] = []
-    for i, line in enumerate(lines):
-        if "[ref=" in line:
-            out.append(line)
-            continue
-        if ":" in line and not line.rstrip().endswith(":"):
-            out.append(line)
-            continue
-        current_depth = _snapshot_line_depth(line)
-        has_ref_child = False
-        for j in range(i + 1, len(lines)):
-            child_depth = _snapshot_line_depth(lines[j])
-            if child_depth <= current_depth:
-                break
-            if "[ref=" in lines[j]:
-                has_ref_child = True
-                break
-        if has_ref_child:
-            out.append(line)
-    return "\n".join(out)
+    return "\n".join(node.text for node in _compact_role_nodes(_parse_role_snapshot(snapshot)))
 
 
 def _limit_snapshot_text(snapshot: str, max_chars: int) -> tuple[str, bool]:
     limit = max(200, min(int(max_chars or 24000), 120000))
     if len(snapshot) <= limit:
         return snapshot, False
-    return f"{snapshot[:limit]}\n\n[...TRUNCATED - page too large]", True
+    return f"{snapshot[:limit]}\n\n{_TRUNCATION_MARKER}", True
+
+
+def _limit_role_nodes(
+    nodes: List[_RoleLine],
+    *,
+    line_limit: int,
+    max_chars: int,
+) -> Tuple[str, List[_RoleLine], bool]:
+    """Apply the line and char budgets to parsed lines without re-parsing untouched lines."""
+    nodes = nodes[: max(1, min(int(line_limit or 500), 5000))]
+    snapshot = "\n".join(node.text for node in nodes)
+    limited, truncated = _limit_snapshot_text(snapshot, max_chars=max_chars)
+    if not truncated:
+        return snapshot, nodes, False
+    limit = max(200, min(int(max_chars or 24000), 120000))
+    kept: List[_RoleLine] = []
+    used = 0
+    for node in nodes:
+        end = used + len(node.text)
+        if end > limit:
+            break
+        kept.append(node)
+        used = end + 1
+        if used > limit:
+            break
+    cut = limited[:limit][used:] if used <= limit else ""
+    tail = ([cut] if used <= limit else []) + ["", _TRUNCATION_MARKER]
+    kept.extend(_parse_role_line(line) for line in tail)
+    return limited, _link_role_lines(kept), True
 
 
 def _parse_ai_ref(suffix: str) -> Optional[str]:
-    m = re.search(r"\[ref=(e\d+)\]", suffix or "", flags=re.IGNORECASE)
+    m = _REF_RE.search(suffix or "")
     if not m:
         return None
     return m.group(1)
 
 
-def _role_snapshot_stats(snapshot: str, refs: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+def _role_snapshot_stats(
+    snapshot: str,
+    refs: Dict[str, Dict[str, Any]],
+    *,
+    nodes: Optional[List[_RoleLine]] = None,
+) -> Dict[str, int]:
     interactive = 0
     for item in refs.values():
         role = str((item or {}).get("role") or "").strip().lower()
         if role in _ROLE_INTERACTIVE:
             interactive += 1
+    if not snapshot:
+        line_count = 0
+    elif nodes is not None:
+        line_count = len(nodes)
+    else:
+        line_count = snapshot.count("\n") + 1
     return {
-        "lines": len(snapshot.split("\n")) if snapshot else 0,
+        "lines": line_count,
         "chars": len(snapshot),
         "refs": len(refs),
         "interactive": interactive,
     }
 
 
-def _build_role_tree(snapshot: str, refs: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
-    lines = str(snapshot or "").split("\n")
+def _role_tree_from_nodes(nodes: List[_RoleLine], refs: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
     tree: List[Dict[str, Any]] = []
-    stack: List[Dict[str, Any]] = []
-    for line in lines:
-        stripped = str(line or "").strip()
+    entry_by_index: Dict[int, Dict[str, Any]] = {}
+    names_by_index: Dict[int, List[str]] = {}
+    for index, node in enumerate(nodes):
+        stripped = node.text.strip()
         if not stripped:
             continue
-        depth = _snapshot_line_depth(line)
-        match = re.match(r'^-\s*(\w+)(?:\s+"([^"]*)")?', stripped)
-        role = str(match.group(1) or "").strip().lower() if match else ""
-        name = str(match.group(2) or "").strip() if match else ""
-        ref = _parse_ai_ref(stripped)
-        nth_match = re.search(r"\[nth=(\d+)\]", stripped)
-        nth = int(nth_match.group(1)) if nth_match else None
-        while stack and int(stack[-1].get("depth", 0) or 0) >= depth:
-            stack.pop()
-        ancestor_names = [str(item.get("name") or "").strip() for item in stack if str(item.get("name") or "").strip()]
-        node = {
-            "depth": depth,
-            "role": role or str((refs.get(ref or "") or {}).get("role") or "").strip().lower(),
-            "name": name or str((refs.get(ref or "") or {}).get("name") or "").strip(),
+        ref = node.ref
+        ref_meta = refs.get(ref or "") or {}
+        parent = entry_by_index.get(node.parent)
+        if parent is None:
+            ancestor_names: List[str] = []
+        else:
+            ancestor_names = list(names_by_index[node.parent])
+            if parent["name"]:
+                ancestor_names.append(parent["name"])
+        entry = {
+            "depth": node.depth,
+            "role": node.role or str(ref_meta.get("role") or "").strip().lower(),
+            "name": node.name.strip() or str(ref_meta.get("name") or "").strip(),
             "ref": ref or None,
-            "nth": nth,
-            "parent_ref": str(stack[-1].get("ref") or "").strip() or None if stack else None,
+            "nth": node.nth,
+            "parent_ref": str(parent.get("ref") or "").strip() or None if parent is not None else None,
             "line": stripped,
             "ancestor_names": ancestor_names,
         }
-        tree.append(node)
-        stack.append({"depth": depth, "ref": node.get("ref"), "name": node.get("name"), "role": node.get("role")})
+        tree.append(entry)
+        entry_by_index[index] = entry
+        names_by_index[index] = ancestor_names
     return tree
 
 
+def _build_role_tree(snapshot: str, refs: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return _role_tree_from_nodes(_parse_role_snapshot(snapshot), refs)
+
+
+def _finalize_role_snapshot(
+    nodes: List[_RoleLine],
+    refs: Dict[str, Dict[str, Any]],
+    *,
+    compact: bool,
+    line_limit: int,
+    max_chars: int,
+    refs_mode: Optional[str] = None,
+) -> Dict[str, Any]:
+    if not nodes or (len(nodes) == 1 and not nodes[0].text):
+        nodes = [_parse_role_line("(empty)")]
+    _link_role_lines(nodes)
+    if compact:
+        nodes = _compact_role_nodes(nodes)
+    snapshot, nodes, truncated = _limit_role_nodes(nodes, line_limit=line_limit, max_chars=max_chars)
+    payload: Dict[str, Any] = {"snapshot": snapshot}
+    if refs_mode:
+        payload["refs_mode"] = refs_mode
+    return {
+        **payload,
+        "refs": refs,
+        "tree": _role_tree_from_nodes(nodes, refs),
+        "truncated": truncated,
+        "stats": _role_snapshot_stats(snapshot, refs, nodes=nodes),
+    }
+
+
 def _build_role_snapshot_from_aria_text(
     aria_snapshot: str,
     *,
@@ -483,7 +627,7 @@ def _build_role_snapshot_from_aria_text(
     refs: Dict[str, Dict[str, Any]] = {}
     refs_by_key: Dict[str, List[str]] = defaultdict(list)
     counts_by_key: Dict[str, int] = defaultdict(int)
-    out: List[str] = []
+    out: List[_RoleLine] = []
     ref_counter = 0
 
     def _next_ref() -> str:
@@ -492,23 +636,15 @@ def _build_role_snapshot_from_aria_text(
         return f"e{ref_counter}"
 
     for line in lines:
-        depth = _snapshot_line_depth(line)
-        if max_depth is not None and depth > max_depth:
-            continue
-
-        m = re.match(r'^(\s*-\s*)(\w+)(?:\s+"([^"]*)")?(.*)$', line)
-        if not m:
-            if not interactive:
-                out.append(line)
+        node = _parse_role_line(line)
+        if max_depth is not None and node.depth > max_depth:
             continue
-
-        prefix, role_raw, name, suffix = m.group(1), m.group(2), m.group(3), m.group(4)
-        if role_raw.startswith("/"):
+        if not node.matched:
             if not interactive:
-                out.append(line)
+                out.append(node)
             continue
 
-        role = (role_raw or "").lower()
+        role, name = node.role, node.name
         if interactive and role not in _ROLE_INTERACTIVE:
             continue
         if compact and role in _ROLE_STRUCTURAL and not name:
@@ -516,7 +652,7 @@ def _build_role_snapshot_from_aria_text(
 
         should_have_ref = role in _ROLE_INTERACTIVE or (role in _ROLE_CONTENT and bool(name))
         if not should_have_ref:
-            out.append(line)
+            out.append(node)
             continue
 
         ref = _next_ref()
@@ -532,15 +668,15 @@ def _build_role_snapshot_from_aria_text(
             ref_payload["nth"] = nth
         refs[ref] = ref_payload
 
-        enhanced = f"{prefix}{role_raw}"
+        enhanced = node.head
         if name:
             enhanced += f' "{name}"'
         enhanced += f" [ref={ref}]"
         if nth > 0:
             enhanced += f" [nth={nth}]"
-        if suffix:
-            enhanced += suffix
-        out.append(enhanced)
+        if node.suffix:
+            enhanced += node.suffix
+        out.append(_parse_role_line(enhanced))
 
     duplicate_keys = {k for k, v in refs_by_key.items() if len(v) > 1}
     for ref, data in refs.items():
@@ -548,19 +684,7 @@ def _build_role_snapshot_from_aria_text(
         if key not in duplicate_keys:
             data.pop("nth", None)
 
-    snapshot = "\n".join(out) or "(empty)"
-    if compact:
-        snapshot = _compact_role_tree(snapshot)
-    trimmed_lines = snapshot.split("\n")[: max(1, min(int(line_limit or 500), 5000))]
-    snapshot = "\n".join(trimmed_lines)
-    snapshot, truncated = _limit_snapshot_text(snapshot, max_chars=max_chars)
-    return {
-        "snapshot": snapshot,
-        "refs": refs,
-        "tree": _build_role_tree(snapshot, refs),
-        "truncated": truncated,
-        "stats": _role_snapshot_stats(snapshot, refs),
-    }
+    return _finalize_role_snapshot(out, refs, compact=compact, line_limit=line_limit, max_chars=max_chars)
 
 
 def _build_role_snapshot_from_ai_text(
@@ -574,47 +698,28 @@ def _build_role_snapshot_from_ai_text(
 ) -> Dict[str, Any]:
     lines = str(ai_snapshot or "").split("\n")
     refs: Dict[str, Dict[str, Any]] = {}
-    out: List[str] = []
+    out: List[_RoleLine] = []
 
     for line in lines:
-        depth = _snapshot_line_depth(line)
-        if max_depth is not None and depth > max_depth:
+        node = _parse_role_line(line)
+        if max_depth is not None and node.depth > max_depth:
             continue
-
-        m = re.match(r'^(\s*-\s*)(\w+)(?:\s+"([^"]*)")?(.*)$', line)
-        if not m:
-            out.append(line)
-            continue
-
-        _, role_raw, name, suffix = m.group(1), m.group(2), m.group(3), m.group(4)
-        if role_raw.startswith("/"):
-            out.append(line)
+        if not node.matched:
+            out.append(node)
             continue
 
-        role = (role_raw or "").lower()
+        role, name = node.role, node.name
         if interactive and role not in _ROLE_INTERACTIVE:
             continue
         if compact and role in _ROLE_STRUCTURAL and not name:
             continue
 
-        ref = _parse_ai_ref(suffix or "")
+        ref = node.ref if "[" in node.suffix else None
         if ref:
             refs[ref] = {"role": role, **({"name": name} if name else {})}
-        out.append(line)
+        out.append(node)
 
-    snapshot = "\n".join(out) or "(empty)"
-    if compact:
-        snapshot = _compact_role_tree(snapshot)
-    trimmed_lines = snapshot.split("\n")[: max(1, min(int(line_limit or 500), 5000))]
-    snapshot = "\n".join(trimmed_lines)
-    snapshot, truncated = _limit_snapshot_text(snapshot, max_chars=max_chars)
-    return {
-        "snapshot": snapshot,
-        "refs": refs,
-        "tree": _build_role_tree(snapshot, refs),
-        "truncated": truncated,
-        "stats": _role_snapshot_stats(snapshot, refs),
-    }
+    return _finalize_role_snapshot(out, refs, compact=compact, line_limit=line_limit, max_chars=max_chars)
 
 
 def _build_role_refs_from_elements(elements: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
@@ -671,7 +776,7 @@ def _build_role_snapshot_from_elements(
     max_chars: int = 24000,
 ) -> Dict[str, Any]:
     refs = _build_role_refs_from_elements(elements)
-    lines: List[str] = []
+    lines: List[_RoleLine] = []
     for item in elements:
         if not isinstance(item, dict):
             continue
@@ -688,20 +793,16 @@ def _build_role_snapshot_from_elements(
         parts.append(f"[ref={ref}]")
         if nth is not None:
             parts.append(f"[nth={nth}]")
-        lines.append(" ".join(parts))
-
-    snapshot = "\n".join(lines) or "(empty)"
-    trimmed_lines = snapshot.split("\n")[: max(1, min(int(line_limit or 500), 5000))]
-    snapshot = "\n".join(trimmed_lines)
-    snapshot, truncated = _limit_snapshot_text(snapshot, max_chars=max_chars)
-    return {
-        "snapshot": snapshot,
-        "refs_mode": "role",
-        "refs": refs,
-        "tree": _build_role_tree(snapshot, refs),
-        "truncated": truncated,
-        "stats": _role_snapshot_stats(snapshot, refs),
-    }
+        lines.append(_parse_role_line(" ".join(parts)))
+
+    return _finalize_role_snapshot(
+        lines,
+        refs,
+        compact=False,
+        line_limit=line_limit,
+        max_chars=max_chars,
+        refs_mode="role",
+    )
 
 
 def _build_role_groups_for_container(
@@ -22,10 +22,77 @@ def _overlap_score(left: Sequence[str], right: Sequence[str]) -> float:
     return float(inter) / float(union or 1)
 
 
+_FTS_CANDIDATE_LIMIT = 240
+
+
+def _relevance_by_id(rows: Sequence[dict]) -> dict[int, float]:
+    """Map FTS5 ``bm25`` (negative, lower is better) to 0..1 within one result set."""
+    raw = {int(row["id"]): max(0.0, -float(row.get("bm25") or 0.0)) for row in rows}
+    top = max(raw.values(), default=0.0)
+    if top <= 0.0:
+        return {row_id: 1.0 for row_id in raw}
+    return {row_id: value / top for row_id, value in raw.items()}
+
+
 class MemoryRetriever:
     def __init__(self, store: MemoryStore):
         self.store = store
 
+    @staticmethod
+    def _outcome_bonus(row: dict) -> float:
+        score = 0.0
+        if int(row.get("success") or 0) == 1:
+            score += 0.4
+        if int(row.get("effective") or 0) == 1:
+            score += 0.4
+        if row.get("reason_code") in {"ok", "no_state_change", "not_found", "not_actionable"}:
+            score += 0.1
+        return score
+
+    def _rank_indexed(
+        self,
+        *,
+        domain: str,
+        goal_tokens: set[str],
+        history_tokens: set[str],
+        reason_codes: list[str] | None = None,
+    ) -> list[tuple[dict, float]]:
+        """BM25-rank the domain's full history; empty when FTS5 has no match."""
+        if not getattr(self.store, "fts_enabled", False):
+            return []
+        goal_rows = self.store.search_actions(
+            domain=domain,
+            tokens=sorted(goal_tokens),
+            limit=_FTS_CANDIDATE_LIMIT,
+            reason_codes=reason_codes,
+        )
+        history_rows = (
+            self.store.search_actions(
+                domain=domain,
+                tokens=sorted(history_tokens),
+                limit=_FTS_CANDIDATE_LIMIT,
+                reason_codes=reason_codes,
+            )
+            if history_tokens
+            else []
+        )
+        if not goal_rows and not history_rows:
+            return []
+        goal_rel = _relevance_by_id(goal_rows)
+        history_rel = _relevance_by_id(history_rows)
+        candidates = {int(row["id"]): row for row in [*history_rows, *goal_rows]}
+        scored = [
+            (
+                row,
+                1.3 * goal_rel.get(row_id, 0.0)
+                + 0.6 * history_rel.get(row_id, 0.0)
+                + self._outcome_bonus(row),
+            )
+            for row_id, row in candidates.items()
+        ]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored
+
     def _score_row(self, row: dict, goal_tokens: set[str], history_tokens: set[str]) -> float:
         text_blob = " ".join(
             [
@@ -40,12 +107,7 @@ class MemoryRetriever:
         score = 0.0
         score += 1.3 * _overlap_score(goal_tokens, row_tokens)
         score += 0.6 * _overlap_score(history_tokens, row_tokens)
-        if int(row.get("success") or 0) == 1:
-            score += 0.4
-        if int(row.get("effective") or 0) == 1:
-            score += 0.4
-        if row.get("reason_code") in {"ok", "no_state_change", "not_found", "not_actionable"}:
-            score += 0.1
+        score += self._outcome_bonus(row)
         return score
 
     @staticmethod
@@ -79,21 +141,22 @@ class MemoryRetriever:
     ) -> list[MemorySuggestion]:
         if not self.store.enabled or not domain:
             return []
-        rows = self.store.query_actions(domain=domain, limit=240)
-        if not rows:
-            return []
         goal_tokens = _tokenize(goal_text)
         history_tokens = _tokenize(" ".join(action_history[-6:]))
-        ranked = sorted(
-            rows,
-            key=lambda row: self._score_row(row, goal_tokens, history_tokens),
-            reverse=True,
-        )
+        ranked = self._rank_indexed(domain=domain, goal_tokens=goal_tokens, history_tokens=history_tokens)
+        if not ranked:
+            rows = self.store.query_actions(domain=domain, limit=240)
+            if not rows:
+                return []
+            ranked = sorted(
+                ((row, self._score_row(row, goal_tokens, history_tokens)) for row in rows),
+                key=lambda item: item[1],
+                reverse=True,
+            )
         successes: list[MemorySuggestion] = []
         failures: list[MemorySuggestion] = []
-        for row in ranked:
+        for row, confidence in ranked:
             is_success = int(row.get("success") or 0) == 1 and int(row.get("effective") or 0) == 1
-            confidence = self._score_row(row, goal_tokens, history_tokens)
             if is_success and len(successes) < max(1, success_limit):
                 successes.append(self._to_suggestion("success_pattern", row, confidence))
             if (not is_success) and len(failures) < max(1, failure_limit):
@@ -113,19 +176,23 @@ class MemoryRetriever:
         if not self.store.enabled or not domain:
             return []
         target_codes = [reason_code] if reason_code else ["no_state_change", "not_found", "not_actionable"]
-        rows = self.store.query_actions(domain=domain, reason_codes=target_codes, limit=max(20, limit * 5))
-        if not rows:
-            return []
         goal_tokens = _tokenize(goal_text)
-        ranked = sorted(
-            rows,
-            key=lambda row: self._score_row(row, goal_tokens, set()),
-            reverse=True,
+        ranked = self._rank_indexed(
+            domain=domain,
+            goal_tokens=goal_tokens,
+            history_tokens=set(),
+            reason_codes=target_codes,
         )
-        out: list[MemorySuggestion] = []
-        for row in ranked[: max(1, limit)]:
-            out.append(self._to_suggestion("recovery", row, self._score_row(row, goal_tokens, set())))
-        return out
+        if not ranked:
+            rows = self.store.query_actions(domain=domain, reason_codes=target_codes, limit=max(20, limit * 5))
+            if not rows:
+                return []
+            ranked = sorted(
+                ((row, self._score_row(row, goal_tokens, set())) for row in rows),
+                key=lambda item: item[1],
+                reverse=True,
+            )
+        return [self._to_suggestion("recovery", row, confidence) for row, confidence in ranked[: max(1, limit)]]
 
     @staticmethod
     def format_for_prompt(
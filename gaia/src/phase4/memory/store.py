@@ -1,8 +1,14 @@
 """SQLite-backed memory store for GAIA execution traces."""
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import queue
+import re
 import sqlite3
+import threading
+import weakref
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -14,23 +20,133 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+_DEFAULT_FLUSH_INTERVAL_MS = 250
+_DEFAULT_WRITE_QUEUE_SIZE = 1000
+_DEFAULT_GC_BATCH_SIZE = 500
+_DEFAULT_DOMAIN_ROW_BUDGET = 50_000
+_DEFAULT_MAX_DB_MB = 512
+_INCREMENTAL_VACUUM_PAGES = 2048
+_AGGREGATE_SELECTOR_MAX_CHARS = 120
+_SELECTOR_QUOTED_RE = re.compile(r"""(["'])(?:(?!\1).)*\1""")
+_SELECTOR_NUMBER_RE = re.compile(r"\d+")
+_LIVE_STORES: "weakref.WeakSet[MemoryStore]" = weakref.WeakSet()
+
+
+def memory_write_behind_enabled() -> bool:
+    raw_value = str(os.getenv("GAIA_MEMORY_WRITE_BEHIND", "1") or "1").strip().lower()
+    return raw_value not in {"0", "false", "no", "off"}
+
+
+def memory_flush_interval_seconds() -> float:
+    raw_value = str(os.getenv("GAIA_MEMORY_FLUSH_INTERVAL_MS", "") or "").strip()
+    try:
+        value = int(raw_value) if raw_value else _DEFAULT_FLUSH_INTERVAL_MS
+    except Exception:
+        value = _DEFAULT_FLUSH_INTERVAL_MS
+    return max(10, min(value, 10_000)) / 1000.0
+
+
+def memory_write_queue_size() -> int:
+    raw_value = str(os.getenv("GAIA_MEMORY_WRITE_QUEUE", "") or "").strip()
+    try:
+        value = int(raw_value) if raw_value else _DEFAULT_WRITE_QUEUE_SIZE
+    except Exception:
+        return _DEFAULT_WRITE_QUEUE_SIZE
+    return max(1, min(value, 100_000))
+
+
+def _env_int(name: str, default: int, *, minimum: int = 0) -> int:
+    raw_value = str(os.getenv(name, "") or "").strip()
+    try:
+        value = int(raw_value) if raw_value else default
+    except Exception:
+        return default
+    return max(minimum, value)
+
+
+def aggregate_selector(selector: str) -> str:
+    """Selector shape used as the aggregate key: quoted values and numbers are collapsed.
+
+    ``li:nth-child(12) a[href="/item/981"]`` and ``li:nth-child(3) a[href="/item/7"]``
+    fold into the same ``li:nth-child(N) a[href=*]`` row.
+    """
+    shape = _SELECTOR_QUOTED_RE.sub("*", str(selector or "").strip())
+    shape = _SELECTOR_NUMBER_RE.sub("N", shape)
+    return shape[:_AGGREGATE_SELECTOR_MAX_CHARS]
+
+
+def memory_domain_row_budget() -> int:
+    """Max action rows kept per domain; ``0`` disables the budget."""
+    return _env_int("GAIA_MEMORY_DOMAIN_ROW_BUDGET", _DEFAULT_DOMAIN_ROW_BUDGET)
+
+
+def memory_max_db_bytes() -> int:
+    """Target size of ``kb.sqlite3``; ``0`` disables the budget."""
+    return _env_int("GAIA_MEMORY_MAX_DB_MB", _DEFAULT_MAX_DB_MB) * 1024 * 1024
+
+
+def _flush_live_stores() -> None:
+    for store in list(_LIVE_STORES):
+        try:
+            store.close()
+        except Exception:
+            pass
+
+
+atexit.register(_flush_live_stores)
+
+
+_FTS_SCHEMA_VERSION = 1
+_FTS_BODY_SQL = (
+    "{p}.action || ' ' || {p}.selector || ' ' || {p}.full_selector || ' ' || "
+    "{p}.reason || ' ' || {p}.reason_code"
+)
+
+
 class MemoryStore:
-    def __init__(self, db_path: Path | None = None, enabled: bool = True):
+    """SQLite memory store.
+
+    With write-behind enabled (``GAIA_MEMORY_WRITE_BEHIND``, default on),
+    ``record_action`` and ``add_dialog_summary`` only enqueue; a background
+    writer commits queued rows in one transaction per flush interval. Reads,
+    ``flush()``, ``close()`` and interpreter exit drain the queue first, so
+    callers always read their own writes.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        enabled: bool = True,
+        *,
+        write_behind: bool | None = None,
+    ):
         self.enabled = bool(enabled)
+        self.fts_enabled = False
         self.db_path = db_path or (Path.home() / ".gaia" / "memory" / "kb.sqlite3")
+        self.write_behind = memory_write_behind_enabled() if write_behind is None else bool(write_behind)
+        self._write_queue: "queue.Queue[tuple[str, Any, str]]" = queue.Queue(maxsize=memory_write_queue_size())
+        self._flush_requested = threading.Event()
+        self._writer_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._closed = False
         if self.enabled:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             self._ensure_schema()
+            _LIVE_STORES.add(self)
 
-    def _connect(self) -> sqlite3.Connection:
+    def _connect(self, *, auto_vacuum: bool = False) -> sqlite3.Connection:
         conn = sqlite3.connect(str(self.db_path), timeout=30)
         conn.row_factory = sqlite3.Row
+        if auto_vacuum:
+            # Must precede journal_mode: it only sticks before the file is initialised.
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
     def _ensure_schema(self) -> None:
-        with self._connect() as conn:
+        # auto_vacuum only takes effect on a fresh file; older files switch on `compact(full_vacuum=True)`.
+        with self._connect(auto_vacuum=True) as conn:
             conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS episodes (
@@ -87,34 +203,288 @@ class MemoryStore:
                     ON action_records(domain, action, created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_dialog_domain_created
                     ON dialog_summaries(domain, created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_action_created
+                    ON action_records(created_at);
+                CREATE INDEX IF NOT EXISTS idx_action_episode
+                    ON action_records(episode_id);
+                CREATE INDEX IF NOT EXISTS idx_dialog_episode
+                    ON dialog_summaries(episode_id);
+                CREATE TABLE IF NOT EXISTS action_aggregates (
+                    domain TEXT NOT NULL,
+                    action TEXT NOT NULL,
+                    selector TEXT NOT NULL,
+                    reason_code TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    effective_count INTEGER NOT NULL,
+                    changed_count INTEGER NOT NULL,
+                    first_seen TEXT NOT NULL,
+                    last_seen TEXT NOT NULL,
+                    PRIMARY KEY (domain, action, selector, reason_code)
+                );
                 """
             )
+            self.fts_enabled = self._ensure_fts_index(conn)
+
+    @staticmethod
+    def _ensure_fts_index(conn: sqlite3.Connection) -> bool:
+        """Keep an FTS5 index of action text in sync via triggers; backfill once."""
+        try:
+            conn.executescript(
+                f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS action_records_fts USING fts5(
+                    domain, body, tokenize = "unicode61 tokenchars '_'"
+                );
+                CREATE TRIGGER IF NOT EXISTS action_records_fts_ai AFTER INSERT ON action_records BEGIN
+                    INSERT INTO action_records_fts(rowid, domain, body)
+                    VALUES (new.id, new.domain, {_FTS_BODY_SQL.format(p="new")});
+                END;
+                CREATE TRIGGER IF NOT EXISTS action_records_fts_ad AFTER DELETE ON action_records BEGIN
+                    DELETE FROM action_records_fts WHERE rowid = old.id;
+                END;
+                """
+            )
+        except sqlite3.OperationalError:
+            return False
+        version = int(conn.execute("PRAGMA user_version").fetchone()[0] or 0)
+        if version < _FTS_SCHEMA_VERSION:
+            conn.execute("DELETE FROM action_records_fts")
+            conn.execute(
+                f"""
+                INSERT INTO action_records_fts(rowid, domain, body)
+                SELECT a.id, a.domain, {_FTS_BODY_SQL.format(p="a")} FROM action_records AS a
+                """
+            )
+            conn.execute(f"PRAGMA user_version = {_FTS_SCHEMA_VERSION}")
+        return True
 
     def garbage_collect(self, retention_days: int = 30) -> int:
         if not self.enabled:
             return 0
-        cutoff = (datetime.now(timezone.utc) - timedelta(days=max(1, retention_days))).isoformat()
+        return int(self.compact(retention_days=retention_days)["deleted"])
+
+    @staticmethod
+    def _delete_action_ids(conn: sqlite3.Connection, ids: list[int]) -> int:
+        """Fold successful rows into ``action_aggregates``, then delete all of ``ids``."""
+        if not ids:
+            return 0
+        placeholders = ",".join(["?"] * len(ids))
+        folded: dict[tuple[str, str, str, str], list[Any]] = {}
+        for row in conn.execute(
+            f"""
+            SELECT domain, action, COALESCE(NULLIF(selector, ''), full_selector), reason_code,
+                   effective, changed, created_at
+            FROM action_records
+            WHERE id IN ({placeholders}) AND success = 1
+            """,
+            ids,
+        ):
+            key = (row[0], row[1], aggregate_selector(row[2]), row[3])
+            bucket = folded.get(key)
+            if bucket is None:
+                folded[key] = [1, int(row[4] or 0), int(row[5] or 0), row[6], row[6]]
+                continue
+            bucket[0] += 1
+            bucket[1] += int(row[4] or 0)
+            bucket[2] += int(row[5] or 0)
+            bucket[3] = min(bucket[3], row[6])
+            bucket[4] = max(bucket[4], row[6])
+        conn.executemany(
+            """
+            INSERT INTO action_aggregates (
+                domain, action, selector, reason_code, count, effective_count,
+                changed_count, first_seen, last_seen
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(domain, action, selector, reason_code) DO UPDATE SET
+                count = count + excluded.count,
+                effective_count = effective_count + excluded.effective_count,
+                changed_count = changed_count + excluded.changed_count,
+                first_seen = MIN(first_seen, excluded.first_seen),
+                last_seen = MAX(last_seen, excluded.last_seen)
+            """,
+            [(*key, *bucket) for key, bucket in folded.items()],
+        )
+        cur = conn.execute(f"DELETE FROM action_records WHERE id IN ({placeholders})", ids)
+        return int(cur.rowcount or 0)
+
+    def _delete_actions_in_batches(
+        self,
+        select_sql: str,
+        params: list[Any],
+        batch_size: int,
+        *,
+        max_rows: int | None = None,
+    ) -> int:
+        """Run ``select_sql`` (must end in ``LIMIT ?``) and delete its ids, one short transaction per batch."""
         deleted = 0
+        while max_rows is None or deleted < max_rows:
+            limit = batch_size if max_rows is None else min(batch_size, max_rows - deleted)
+            with self._connect() as conn:
+                ids = [int(row[0]) for row in conn.execute(select_sql, [*params, limit]).fetchall()]
+                if not ids:
+                    break
+                deleted += self._delete_action_ids(conn, ids)
+            if len(ids) < limit:
+                break
+        return deleted
+
+    def _delete_in_batches(
+        self,
+        delete_sql: str,
+        params: list[Any],
+        batch_size: int,
+        *,
+        max_rows: int | None = None,
+    ) -> int:
+        deleted = 0
+        while max_rows is None or deleted < max_rows:
+            limit = batch_size if max_rows is None else min(batch_size, max_rows - deleted)
+            with self._connect() as conn:
+                count = int(conn.execute(delete_sql, [*params, limit]).rowcount or 0)
+            deleted += count
+            if count < limit:
+                break
+        return deleted
+
+    def _db_bytes(self) -> int:
         with self._connect() as conn:
-            cur1 = conn.execute(
-                "DELETE FROM action_records WHERE created_at < ?",
-                (cutoff,),
-            )
-            cur2 = conn.execute(
-                "DELETE FROM dialog_summaries WHERE created_at < ?",
-                (cutoff,),
-            )
-            cur3 = conn.execute(
-                """
-                DELETE FROM episodes
-                WHERE created_at < ?
-                  AND id NOT IN (SELECT DISTINCT episode_id FROM action_records WHERE episode_id IS NOT NULL)
-                  AND id NOT IN (SELECT DISTINCT episode_id FROM dialog_summaries WHERE episode_id IS NOT NULL)
-                """,
-                (cutoff,),
+            page_size = int(conn.execute("PRAGMA page_size").fetchone()[0] or 0)
+            page_count = int(conn.execute("PRAGMA page_count").fetchone()[0] or 0)
+            freelist = int(conn.execute("PRAGMA freelist_count").fetchone()[0] or 0)
+        return page_size * max(0, page_count - freelist)
+
+    def compact(
+        self,
+        *,
+        retention_days: int = 30,
+        domain_row_budget: int | None = None,
+        max_db_bytes: int | None = None,
+        batch_size: int = _DEFAULT_GC_BATCH_SIZE,
+        full_vacuum: bool = False,
+    ) -> dict[str, Any]:
+        """Incremental GC: bounded delete batches, row/size budgets, then incremental VACUUM.
+
+        Successful action rows are folded into ``action_aggregates`` before they
+        are removed. Each batch commits on its own so concurrent agents only ever
+        wait for one short transaction.
+        """
+        stats: dict[str, Any] = {
+            "deleted": 0,
+            "expired_actions": 0,
+            "expired_summaries": 0,
+            "budget_actions": 0,
+            "size_actions": 0,
+            "size_aggregates": 0,
+            "episodes": 0,
+            "freed_pages": 0,
+        }
+        if not self.enabled:
+            return stats
+        self.flush()
+        batch_size = max(1, int(batch_size))
+        domain_budget = memory_domain_row_budget() if domain_row_budget is None else max(0, int(domain_row_budget))
+        size_budget = memory_max_db_bytes() if max_db_bytes is None else max(0, int(max_db_bytes))
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=max(1, retention_days))).isoformat()
+
+        stats["expired_actions"] = self._delete_actions_in_batches(
+            "SELECT id FROM action_records WHERE created_at < ? ORDER BY created_at LIMIT ?",
+            [cutoff],
+            batch_size,
+        )
+        stats["expired_summaries"] = self._delete_in_batches(
+            "DELETE FROM dialog_summaries WHERE id IN "
+            "(SELECT id FROM dialog_summaries WHERE created_at < ? LIMIT ?)",
+            [cutoff],
+            batch_size,
+        )
+
+        if domain_budget > 0:
+            with self._connect() as conn:
+                over_budget = conn.execute(
+                    "SELECT domain, COUNT(*) AS n FROM action_records GROUP BY domain HAVING n > ?",
+                    (domain_budget,),
+                ).fetchall()
+            for row in over_budget:
+                stats["budget_actions"] += self._delete_actions_in_batches(
+                    "SELECT id FROM action_records WHERE domain = ? ORDER BY created_at LIMIT ?",
+                    [row["domain"]],
+                    batch_size,
+                    max_rows=int(row["n"]) - domain_budget,
+                )
+
+        if size_budget > 0:
+            while self._db_bytes() > size_budget:
+                removed = self._delete_actions_in_batches(
+                    "SELECT id FROM action_records ORDER BY created_at LIMIT ?",
+                    [],
+                    batch_size,
+                    max_rows=batch_size,
+                )
+                if removed <= 0:
+                    # Only aggregates left; drop the stalest ones.
+                    removed = self._delete_in_batches(
+                        "DELETE FROM action_aggregates WHERE rowid IN "
+                        "(SELECT rowid FROM action_aggregates ORDER BY last_seen LIMIT ?)",
+                        [],
+                        batch_size,
+                        max_rows=batch_size,
+                    )
+                    stats["size_aggregates"] += removed
+                    if removed <= 0:
+                        break
+                    continue
+                stats["size_actions"] += removed
+
+        stats["episodes"] = self._delete_in_batches(
+            """
+            DELETE FROM episodes WHERE id IN (
+                SELECT e.id FROM episodes AS e
+                WHERE e.created_at < ?
+                  AND NOT EXISTS (SELECT 1 FROM action_records AS a WHERE a.episode_id = e.id)
+                  AND NOT EXISTS (SELECT 1 FROM dialog_summaries AS d WHERE d.episode_id = e.id)
+                LIMIT ?
             )
-            deleted = int(cur1.rowcount or 0) + int(cur2.rowcount or 0) + int(cur3.rowcount or 0)
-        return deleted
+            """,
+            [cutoff],
+            batch_size,
+        )
+
+        removed_actions = stats["expired_actions"] + stats["budget_actions"] + stats["size_actions"]
+        if removed_actions and self.fts_enabled:
+            with self._connect() as conn:
+                # Bounded segment merge so FTS tombstones do not pin freed pages.
+                conn.execute("INSERT INTO action_records_fts(action_records_fts, rank) VALUES ('merge', 64)")
+
+        with self._connect() as conn:
+            before = int(conn.execute("PRAGMA freelist_count").fetchone()[0] or 0)
+            if full_vacuum:
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.commit()
+                conn.execute("VACUUM")
+            elif int(conn.execute("PRAGMA auto_vacuum").fetchone()[0] or 0) == 2:
+                # execute()는 pragma를 한 페이지만 진행시키므로 executescript로 끝까지 돌린다
+                remaining = before
+                while remaining > 0:
+                    conn.executescript(f"PRAGMA incremental_vacuum({_INCREMENTAL_VACUUM_PAGES});")
+                    drained = int(conn.execute("PRAGMA freelist_count").fetchone()[0] or 0)
+                    if drained >= remaining:
+                        break
+                    remaining = drained
+            after = int(conn.execute("PRAGMA freelist_count").fetchone()[0] or 0)
+            if after < before:
+                # WAL 모드에서는 체크포인트가 끝나야 파일이 실제로 줄어든다
+                conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+        stats["freed_pages"] = max(0, before - after)
+        stats["deleted"] = (
+            stats["expired_actions"]
+            + stats["expired_summaries"]
+            + stats["budget_actions"]
+            + stats["size_actions"]
+            + stats["size_aggregates"]
+            + stats["episodes"]
+        )
+        stats["db_bytes"] = self._db_bytes()
+        return stats
 
     def start_episode(
         self,
@@ -146,70 +516,155 @@ class MemoryStore:
             )
             return int(cur.lastrowid)
 
+    @staticmethod
+    def _insert_action(conn: sqlite3.Connection, record: MemoryActionRecord, created_at: str) -> None:
+        conn.execute(
+            """
+            INSERT INTO action_records (
+                episode_id, created_at, domain, url, step_number, action,
+                selector, full_selector, ref_id, success, effective, changed,
+                reason_code, reason, snapshot_id, dom_hash, epoch,
+                frame_index, tab_index, state_change_json, attempt_logs_json
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                record.episode_id,
+                created_at,
+                record.domain,
+                record.url,
+                int(record.step_number),
+                record.action,
+                record.selector,
+                record.full_selector,
+                record.ref_id,
+                1 if record.success else 0,
+                1 if record.effective else 0,
+                1 if record.changed else 0,
+                record.reason_code,
+                record.reason,
+                record.snapshot_id,
+                record.dom_hash,
+                int(record.epoch),
+                record.frame_index,
+                record.tab_index,
+                json.dumps(record.state_change or {}, ensure_ascii=False),
+                json.dumps(record.attempt_logs or [], ensure_ascii=False),
+            ),
+        )
+
+    @staticmethod
+    def _insert_summary(conn: sqlite3.Connection, record: MemorySummaryRecord, created_at: str) -> None:
+        conn.execute(
+            """
+            INSERT INTO dialog_summaries (
+                episode_id, created_at, domain, command, summary, status, metadata_json
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                record.episode_id,
+                created_at,
+                record.domain,
+                record.command,
+                record.summary,
+                record.status,
+                json.dumps(record.metadata or {}, ensure_ascii=False),
+            ),
+        )
+
+    def _write_items(self, conn: sqlite3.Connection, items: list[tuple[str, Any, str]]) -> None:
+        for kind, record, created_at in items:
+            if kind == "action":
+                self._insert_action(conn, record, created_at)
+            else:
+                self._insert_summary(conn, record, created_at)
+
+    def _write_batch(self, items: list[tuple[str, Any, str]]) -> None:
+        try:
+            with self._connect() as conn:
+                self._write_items(conn, items)
+            return
+        except Exception:
+            pass
+        # One bad row must not take the rest of the batch with it.
+        for item in items:
+            try:
+                with self._connect() as conn:
+                    self._write_items(conn, [item])
+            except Exception:
+                continue
+
+    def _enqueue(self, kind: str, record: Any) -> None:
+        item = (kind, record, _utc_now_iso())
+        if not self.write_behind or self._closed:
+            with self._connect() as conn:
+                self._write_items(conn, [item])
+            return
+        self._ensure_writer()
+        # Blocks when the bounded queue is full, applying back-pressure to the agent.
+        self._write_queue.put(item)
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name="gaia-memory-writer",
+                daemon=True,
+            )
+            self._writer.start()
+
+    def _writer_loop(self) -> None:
+        interval = memory_flush_interval_seconds()
+        while True:
+            try:
+                first = self._write_queue.get(timeout=interval)
+            except queue.Empty:
+                if self._closed:
+                    return
+                continue
+            self._flush_requested.wait(interval)
+            batch = [first]
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+            if self._write_queue.unfinished_tasks == 0:
+                self._flush_requested.clear()
+
+    def flush(self) -> None:
+        """Block until every queued record has been committed."""
+        if not self.enabled or self._writer is None:
+            return
+        self._flush_requested.set()
+        self._write_queue.join()
+
+    def close(self) -> None:
+        self.flush()
+        self._closed = True
+
     def record_action(self, record: MemoryActionRecord) -> None:
         if not self.enabled:
             return
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO action_records (
-                    episode_id, created_at, domain, url, step_number, action,
-                    selector, full_selector, ref_id, success, effective, changed,
-                    reason_code, reason, snapshot_id, dom_hash, epoch,
-                    frame_index, tab_index, state_change_json, attempt_logs_json
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record.episode_id,
-                    _utc_now_iso(),
-                    record.domain,
-                    record.url,
-                    int(record.step_number),
-                    record.action,
-                    record.selector,
-                    record.full_selector,
-                    record.ref_id,
-                    1 if record.success else 0,
-                    1 if record.effective else 0,
-                    1 if record.changed else 0,
-                    record.reason_code,
-                    record.reason,
-                    record.snapshot_id,
-                    record.dom_hash,
-                    int(record.epoch),
-                    record.frame_index,
-                    record.tab_index,
-                    json.dumps(record.state_change or {}, ensure_ascii=False),
-                    json.dumps(record.attempt_logs or [], ensure_ascii=False),
-                ),
-            )
+        self._enqueue("action", record)
 
     def add_dialog_summary(self, record: MemorySummaryRecord) -> None:
         if not self.enabled:
             return
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO dialog_summaries (
-                    episode_id, created_at, domain, command, summary, status, metadata_json
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record.episode_id,
-                    _utc_now_iso(),
-                    record.domain,
-                    record.command,
-                    record.summary,
-                    record.status,
-                    json.dumps(record.metadata or {}, ensure_ascii=False),
-                ),
-            )
+        self._enqueue("summary", record)
 
     def get_stats(self, domain: str | None = None) -> dict[str, Any]:
         if not self.enabled:
             return {"enabled": False}
+        self.flush()
         filters = ""
         params: list[Any] = []
         if domain:
@@ -228,18 +683,24 @@ class MemoryStore:
                 f"SELECT COUNT(*) AS n FROM dialog_summaries{filters}",
                 params,
             ).fetchone()["n"]
+            aggregates = conn.execute(
+                f"SELECT COUNT(*) AS n FROM action_aggregates{filters}",
+                params,
+            ).fetchone()["n"]
         return {
             "enabled": True,
             "domain": domain or "*",
             "episodes": int(episodes or 0),
             "action_records": int(actions or 0),
             "dialog_summaries": int(dialogs or 0),
+            "action_aggregates": int(aggregates or 0),
             "db_path": str(self.db_path),
         }
 
     def clear_domain(self, domain: str | None = None) -> int:
         if not self.enabled:
             return 0
+        self.flush()
         deleted = 0
         with self._connect() as conn:
             if domain:
@@ -249,10 +710,12 @@ class MemoryStore:
                     "DELETE FROM episodes WHERE domain = ?",
                     (domain,),
                 )
+                conn.execute("DELETE FROM action_aggregates WHERE domain = ?", (domain,))
             else:
                 cur1 = conn.execute("DELETE FROM action_records")
                 cur2 = conn.execute("DELETE FROM dialog_summaries")
                 cur3 = conn.execute("DELETE FROM episodes")
+                conn.execute("DELETE FROM action_aggregates")
             deleted = int(cur1.rowcount or 0) + int(cur2.rowcount or 0) + int(cur3.rowcount or 0)
         return deleted
 
@@ -265,6 +728,7 @@ class MemoryStore:
     ) -> list[dict[str, Any]]:
         if not self.enabled:
             return []
+        self.flush()
         clauses = ["domain = ?"]
         params: list[Any] = [domain]
         if reason_codes:
@@ -285,9 +749,56 @@ class MemoryStore:
             ).fetchall()
         return [dict(row) for row in rows]
 
+    def search_actions(
+        self,
+        *,
+        domain: str,
+        tokens: list[str],
+        limit: int = 200,
+        reason_codes: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Rank a domain's full action history against ``tokens`` with FTS5 BM25.
+
+        Each returned row carries ``bm25`` (lower is more relevant). Returns an
+        empty list when FTS5 is unavailable or no token matches.
+        """
+        if not self.enabled or not self.fts_enabled or not domain:
+            return []
+        self.flush()
+        terms = [tok for tok in dict.fromkeys(tokens) if tok][:32]
+        if not terms:
+            return []
+        domain_phrase = domain.replace('"', " ")
+        body_terms = " OR ".join('"' + tok.replace('"', " ") + '"' for tok in terms)
+        match = f'domain : "{domain_phrase}" AND body : ({body_terms})'
+        clauses = ["action_records_fts MATCH ?", "a.domain = ?"]
+        params: list[Any] = [match, domain]
+        if reason_codes:
+            placeholders = ",".join(["?"] * len(reason_codes))
+            clauses.append(f"a.reason_code IN ({placeholders})")
+            params.extend(reason_codes)
+        where = " AND ".join(clauses)
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT a.*, bm25(action_records_fts, 0.0, 1.0) AS bm25
+                    FROM action_records_fts
+                    JOIN action_records AS a ON a.id = action_records_fts.rowid
+                    WHERE {where}
+                    ORDER BY bm25 ASC, a.created_at DESC
+                    LIMIT ?
+                    """,
+                    [*params, max(1, int(limit))],
+                ).fetchall()
+        except sqlite3.OperationalError:
+            return []
+        return [dict(row) for row in rows]
+
     def query_recent_summaries(self, *, domain: str, limit: int = 5) -> list[dict[str, Any]]:
         if not self.enabled:
             return []
+        self.flush()
         with self._connect() as conn:
             rows = conn.execute(
                 """
@@ -0,0 +1,172 @@
+"""Pooled keep-alive HTTP sessions for the OpenClaw browser server."""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_DEFAULT_POOL_SIZE = 8
+
+_POOL_LOCK = threading.Lock()
+_POOLED_SESSIONS: Dict[Tuple[str, str, str], requests.Session] = {}
+_POOL_STATS: Dict[str, int] = {
+    "requests": 0,
+    "pooled_requests": 0,
+    "unpooled_requests": 0,
+    "sessions_created": 0,
+}
+
+
+def openclaw_http_pool_enabled() -> bool:
+    raw_value = str(os.getenv("GAIA_OPENCLAW_HTTP_POOL", "1") or "1").strip().lower()
+    return raw_value not in {"0", "false", "no", "off"}
+
+
+def openclaw_http_keepalive_enabled() -> bool:
+    raw_value = str(os.getenv("GAIA_OPENCLAW_HTTP_KEEPALIVE", "1") or "1").strip().lower()
+    return raw_value not in {"0", "false", "no", "off"}
+
+
+def openclaw_http_pool_size() -> int:
+    raw_value = str(os.getenv("GAIA_OPENCLAW_HTTP_POOL_SIZE", "") or "").strip()
+    try:
+        value = int(raw_value) if raw_value else _DEFAULT_POOL_SIZE
+    except Exception:
+        return _DEFAULT_POOL_SIZE
+    return max(1, min(value, 64))
+
+
+def _origin(url: str) -> str:
+    scheme, _, rest = str(url or "").partition("://")
+    host = rest.split("/", 1)[0]
+    return f"{scheme.lower()}://{host.lower()}" if host else str(url or "")
+
+
+def _headers_fingerprint(headers: Optional[Dict[str, str]]) -> str:
+    if not headers:
+        return ""
+    blob = "\n".join(f"{str(k).lower()}:{v}" for k, v in sorted(headers.items()))
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def _new_session() -> requests.Session:
+    size = openclaw_http_pool_size()
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not openclaw_http_keepalive_enabled():
+        session.headers["Connection"] = "close"
+    return session
+
+
+def _pooled_session(url: str, *, profile: str, headers: Optional[Dict[str, str]]) -> requests.Session:
+    key = (_origin(url), str(profile or ""), _headers_fingerprint(headers))
+    with _POOL_LOCK:
+        session = _POOLED_SESSIONS.get(key)
+        if session is None:
+            session = _new_session()
+            _POOLED_SESSIONS[key] = session
+            _POOL_STATS["sessions_created"] += 1
+        return session
+
+
+def openclaw_http_request(
+    method: str,
+    url: str,
+    *,
+    profile: str = "",
+    params: Optional[Dict[str, Any]] = None,
+    json: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Any = None,
+) -> requests.Response:
+    """Send one request to the OpenClaw server, reusing a pooled connection when enabled.
+
+    Sessions are keyed by origin, profile and auth headers so profiles with
+    different credentials never share a connection.
+    """
+    if not openclaw_http_pool_enabled():
+        with _POOL_LOCK:
+            _POOL_STATS["requests"] += 1
+            _POOL_STATS["unpooled_requests"] += 1
+        return requests.request(
+            method=method.upper(),
+            url=url,
+            params=params,
+            json=json,
+            headers=headers,
+            timeout=timeout,
+        )
+    session = _pooled_session(url, profile=profile, headers=headers)
+    with _POOL_LOCK:
+        _POOL_STATS["requests"] += 1
+        _POOL_STATS["pooled_requests"] += 1
+    return session.request(
+        method=method.upper(),
+        url=url,
+        params=params,
+        json=json,
+        headers=headers,
+        timeout=timeout,
+    )
+
+
+def _connection_counts(session: requests.Session) -> Tuple[int, int]:
+    connections = 0
+    requests_sent = 0
+    seen: set[int] = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        manager = getattr(adapter, "poolmanager", None)
+        pools = getattr(manager, "pools", None)
+        if pools is None:
+            continue
+        try:
+            pool_keys = list(pools.keys())
+        except Exception:
+            continue
+        for pool_key in pool_keys:
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            connections += int(getattr(pool, "num_connections", 0) or 0)
+            requests_sent += int(getattr(pool, "num_requests", 0) or 0)
+    return connections, requests_sent
+
+
+def openclaw_http_pool_stats() -> Dict[str, int]:
+    """Return request counters plus new-connect vs reused-connection totals."""
+    with _POOL_LOCK:
+        stats = dict(_POOL_STATS)
+        sessions = list(_POOLED_SESSIONS.values())
+    new_connections = 0
+    pooled_sent = 0
+    for session in sessions:
+        connections, requests_sent = _connection_counts(session)
+        new_connections += connections
+        pooled_sent += requests_sent
+    stats["active_sessions"] = len(sessions)
+    stats["new_connections"] = new_connections + stats["unpooled_requests"]
+    stats["reused_connections"] = max(0, pooled_sent - new_connections)
+    return stats
+
+
+def reset_openclaw_http_pool() -> None:
+    """Close every pooled session and zero the counters."""
+    with _POOL_LOCK:
+        sessions = list(_POOLED_SESSIONS.values())
+        _POOLED_SESSIONS.clear()
+        for key in _POOL_STATS:
+            _POOL_STATS[key] = 0
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:
+            pass
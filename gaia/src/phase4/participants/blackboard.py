@@ -9,11 +9,16 @@ Blackboard - 참여자 간 공유 사실 저장소 (N:N).
 from __future__ import annotations
 
 import asyncio
+import bisect
 import threading
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from .models import BlackboardEntry
 
+# 보존 한도를 넘으면 오래된 entry를 이 비율만큼 한 번에 잘라내 압축한다 (매 write마다 자르지 않도록).
+DEFAULT_MAX_ENTRIES = 5000
+_COMPACT_SLACK_RATIO = 0.25
+
 
 class Blackboard:
     """
@@ -22,14 +27,32 @@ class Blackboard:
     - write/read는 thread-safe (asyncio + 동기 호출 혼용 가능)
     - subscribe는 asyncio 기반: 술어(predicate)가 True가 되는 entry를 await
     - 새 entry는 항상 append-only, 기존 entry 수정 금지 (immutable)
+    - entry마다 전역 순번(seq)을 매기고 key/참여자별 seq 인덱스를 유지해
+      append·최근 조회·latest가 전체 로그 길이와 무관하게 동작한다
+    - max_entries를 넘은 오래된 entry는 key/참여자별 카운트 요약으로 압축된다
+      (key별 최신 entry는 압축 후에도 latest()로 조회 가능)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max(1, int(max_entries))
         self._entries: List[BlackboardEntry] = []
+        # _entries[0]의 전역 seq (압축으로 잘려나간 entry 수)
+        self._base_seq = 0
+        self._by_key: Dict[str, List[int]] = {}
+        self._by_participant: Dict[str, List[int]] = {}
+        self._latest_by_key: Dict[str, BlackboardEntry] = {}
+        self._compacted_count = 0
+        self._compacted_keys: Dict[str, int] = {}
+        self._compacted_participants: Dict[str, int] = {}
         self._lock = threading.Lock()
-        # 새 entry가 추가될 때 모든 대기자에게 통지 (asyncio.Condition은 event loop 종속이라
-        # 이벤트 루프 외부에서도 안전한 콜백 리스트로 처리)
-        self._waiters: List["_Waiter"] = []
+        # 새 entry가 추가될 때 대기자에게 통지 (asyncio.Condition은 event loop 종속이라
+        # 이벤트 루프 외부에서도 안전한 콜백 리스트로 처리). key를 지정한 대기자는
+        # 해당 key의 write에서만 술어를 평가하고, None 버킷은 모든 write에서 평가한다.
+        self._waiters: Dict[Optional[str], List["_Waiter"]] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
 
     # ------------------------------------------------------------------
     # Write
@@ -51,22 +74,60 @@ class Blackboard:
             tags=list(tags) if tags else [],
         )
         with self._lock:
-            self._entries = [*self._entries, entry]
+            seq = self._base_seq + len(self._entries)
+            self._entries.append(entry)
+            self._by_key.setdefault(entry.key, []).append(seq)
+            self._by_participant.setdefault(entry.participant_id, []).append(seq)
+            self._latest_by_key[entry.key] = entry
+            if len(self._entries) > self.max_entries * (1.0 + _COMPACT_SLACK_RATIO):
+                self._compact_locked()
             # 통지 대상 추출 (락 안에서 매칭 평가)
             triggered: List["_Waiter"] = []
-            remaining: List["_Waiter"] = []
-            for waiter in self._waiters:
-                if waiter.predicate(entry):
+            for bucket in (entry.key, None):
+                for waiter in list(self._waiters.get(bucket, ())):
+                    if waiter.done or not waiter.predicate(entry):
+                        continue
+                    waiter.done = True
                     triggered.append(waiter)
-                else:
-                    remaining.append(waiter)
-            self._waiters = remaining
+                    self._remove_waiter_locked(waiter)
 
         # 통지는 락 밖에서 (콜백이 다시 락을 잡으면 데드락)
         for waiter in triggered:
             waiter.fulfill(entry)
         return entry
 
+    def _compact_locked(self) -> None:
+        drop = len(self._entries) - self.max_entries
+        if drop <= 0:
+            return
+        for entry in self._entries[:drop]:
+            self._compacted_keys[entry.key] = self._compacted_keys.get(entry.key, 0) + 1
+            self._compacted_participants[entry.participant_id] = (
+                self._compacted_participants.get(entry.participant_id, 0) + 1
+            )
+        del self._entries[:drop]
+        self._compacted_count += drop
+        self._base_seq += drop
+        for index in (self._by_key, self._by_participant):
+            for name in list(index.keys()):
+                seqs = index[name]
+                cut = bisect.bisect_left(seqs, self._base_seq)
+                if cut >= len(seqs):
+                    del index[name]
+                elif cut:
+                    del seqs[:cut]
+
+    def _remove_waiter_locked(self, waiter: "_Waiter") -> None:
+        for bucket in waiter.buckets:
+            waiters = self._waiters.get(bucket)
+            if not waiters:
+                continue
+            remaining = [w for w in waiters if w is not waiter]
+            if remaining:
+                self._waiters[bucket] = remaining
+            else:
+                del self._waiters[bucket]
+
     # ------------------------------------------------------------------
     # Read
     # ------------------------------------------------------------------
@@ -78,28 +139,49 @@ class Blackboard:
         limit: int = 10,
     ) -> List[BlackboardEntry]:
         """가장 최근 entry부터 limit개 반환."""
+        if limit <= 0:
+            return []
         with self._lock:
-            snapshot = list(self._entries)
-
-        filtered = snapshot
-        if participant_id is not None:
-            filtered = [e for e in filtered if e.participant_id == participant_id]
-        if key is not None:
-            filtered = [e for e in filtered if e.key == key]
-        return list(reversed(filtered[-limit:]))
+            if participant_id is None and key is None:
+                return list(reversed(self._entries[-limit:]))
+            if participant_id is not None and key is not None:
+                key_seqs = self._by_key.get(key, [])
+                participant_seqs = self._by_participant.get(participant_id, [])
+                # 짧은 쪽 인덱스를 최신부터 훑으며 나머지 조건만 확인
+                if len(key_seqs) <= len(participant_seqs):
+                    seqs, field, expected = key_seqs, "participant_id", participant_id
+                else:
+                    seqs, field, expected = participant_seqs, "key", key
+                out: List[BlackboardEntry] = []
+                for seq in reversed(seqs):
+                    entry = self._entries[seq - self._base_seq]
+                    if getattr(entry, field) == expected:
+                        out.append(entry)
+                        if len(out) >= limit:
+                            break
+                return out
+            seqs = self._by_key.get(key, []) if key is not None else self._by_participant.get(participant_id, [])
+            return [self._entries[seq - self._base_seq] for seq in reversed(seqs[-limit:])]
 
     def latest(self, key: str) -> Optional[BlackboardEntry]:
-        """특정 key의 가장 최근 entry."""
+        """특정 key의 가장 최근 entry (압축으로 로그에서 빠졌어도 유지)."""
         with self._lock:
-            for entry in reversed(self._entries):
-                if entry.key == key:
-                    return entry
-        return None
+            return self._latest_by_key.get(key)
 
     def all_entries(self) -> List[BlackboardEntry]:
+        """보존 중인 entry 전체 (압축된 entry는 compacted_summary 참고)."""
         with self._lock:
             return list(self._entries)
 
+    def compacted_summary(self) -> Dict[str, Any]:
+        """보존 한도를 넘어 잘려나간 entry의 key/참여자별 카운트."""
+        with self._lock:
+            return {
+                "count": self._compacted_count,
+                "keys": dict(self._compacted_keys),
+                "participants": dict(self._compacted_participants),
+            }
+
     # ------------------------------------------------------------------
     # Subscribe (asyncio)
     # ------------------------------------------------------------------
@@ -108,22 +190,35 @@ class Blackboard:
         predicate: Callable[[BlackboardEntry], bool],
         *,
         timeout: Optional[float] = None,
+        keys: Optional[Iterable[str]] = None,
     ) -> Optional[BlackboardEntry]:
         """
         predicate가 True인 entry가 들어올 때까지 await.
 
         - 호출 시점에 이미 만족하는 entry가 있으면 즉시 그 entry 반환 (가장 최근 것)
         - timeout 초과 시 None 반환 (asyncio.TimeoutError 잡아서 None)
+        - keys를 주면 해당 key의 entry에 대해서만 predicate를 평가한다
         """
         loop = asyncio.get_running_loop()
         future: asyncio.Future[BlackboardEntry] = loop.create_future()
+        key_filter = sorted({str(k) for k in keys}) if keys is not None else None
 
         with self._lock:
-            for entry in reversed(self._entries):
+            if key_filter is None:
+                candidates = reversed(self._entries)
+            else:
+                seqs = sorted(
+                    (seq for k in key_filter for seq in self._by_key.get(k, ())),
+                    reverse=True,
+                )
+                candidates = (self._entries[seq - self._base_seq] for seq in seqs)
+            for entry in candidates:
                 if predicate(entry):
                     return entry
-            waiter = _Waiter(predicate=predicate, future=future, loop=loop)
-            self._waiters = [*self._waiters, waiter]
+            buckets: List[Optional[str]] = list(key_filter) if key_filter is not None else [None]
+            waiter = _Waiter(predicate=predicate, future=future, loop=loop, buckets=buckets)
+            for bucket in buckets:
+                self._waiters.setdefault(bucket, []).append(waiter)
 
         try:
             if timeout is None:
@@ -131,9 +226,14 @@ class Blackboard:
             return await asyncio.wait_for(future, timeout=timeout)
         except asyncio.TimeoutError:
             with self._lock:
-                self._waiters = [w for w in self._waiters if w is not waiter]
+                waiter.done = True
+                self._remove_waiter_locked(waiter)
             return None
 
+    def pending_waiter_count(self) -> int:
+        with self._lock:
+            return len({id(w) for waiters in self._waiters.values() for w in waiters})
+
     # ------------------------------------------------------------------
     # Prompt summary
     # ------------------------------------------------------------------
@@ -151,6 +251,8 @@ class Blackboard:
         """
         with self._lock:
             recent = list(self._entries[-limit:])
+            compacted_count = self._compacted_count
+            compacted_keys = dict(self._compacted_keys)
         if not recent:
             return ""
 
@@ -162,6 +264,10 @@ class Blackboard:
             return pid
 
         lines: List[str] = []
+        if compacted_count:
+            top_keys = sorted(compacted_keys.items(), key=lambda item: item[1], reverse=True)[:5]
+            key_summary = ", ".join(f"{name}×{count}" for name, count in top_keys)
+            lines.append(f"- (earlier {compacted_count} entries compacted: {key_summary})")
         for entry in recent:
             actor = render_actor(entry.participant_id)
             value_repr = "" if entry.value is None else f" — {entry.value!r}"
@@ -172,7 +278,7 @@ class Blackboard:
 class _Waiter:
     """asyncio.Future + predicate를 묶어둔 내부 보관소."""
 
-    __slots__ = ("predicate", "future", "loop")
+    __slots__ = ("predicate", "future", "loop", "buckets", "done")
 
     def __init__(
         self,
@@ -180,10 +286,13 @@ class _Waiter:
         predicate: Callable[[BlackboardEntry], bool],
         future: asyncio.Future,
         loop: asyncio.AbstractEventLoop,
+        buckets: List[Optional[str]],
     ) -> None:
         self.predicate = predicate
         self.future = future
         self.loop = loop
+        self.buckets = buckets
+        self.done = False
 
     def fulfill(self, entry: BlackboardEntry) -> None:
         # write가 다른 스레드에서 호출됐을 수도 있으므로 loop에 안전 dispatch
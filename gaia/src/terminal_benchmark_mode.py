@@ -33,12 +33,12 @@ from gaia.src.benchmark_manager import (
     delete_custom_benchmark_site,
     delete_scenario_from_suite,
     extract_url_host,
-    find_preset,
     generate_scenario_id,
     load_benchmark_registry,
     load_suite_payload,
     override_suite_urls,
     prune_benchmark_reports,
+    record_benchmark_report,
     render_benchmark_reports_html,
     replace_scenario_in_suite,
     resolve_benchmark_site,
@@ -783,18 +783,6 @@ def write_benchmark_report_html(
     return report_path
 
 
-def _summary_matches_preset(summary: Mapping[str, Any], preset: BenchmarkPreset, selected_url: str) -> bool:
-    site = summary.get("site") if isinstance(summary.get("site"), Mapping) else {}
-    base_url = str(site.get("base_url") or "").strip()
-    host = extract_url_host(base_url)
-    selected_host = extract_url_host(selected_url)
-    if selected_host and host == selected_host:
-        return True
-    if host and any(alias in host for alias in preset.host_aliases):
-        return True
-    return False
-
-
 def _scan_benchmark_reports_for_preset(
     *,
     workspace_root: Path,
@@ -802,47 +790,13 @@ def _scan_benchmark_reports_for_preset(
     selected_url: str,
     limit: int = 12,
 ) -> list[dict[str, Any]]:
-    if find_preset(preset.key) is not None:
-        return scan_benchmark_reports(
-            workspace_root=workspace_root,
-            site_key=preset.key,
-            selected_url=selected_url,
-            limit=limit,
-        )
-    root = workspace_root / "artifacts" / "benchmarks"
-    if not root.exists():
-        return []
-    reports: list[dict[str, Any]] = []
-    for summary_path in sorted(root.glob("*/summary.json"), reverse=True):
-        try:
-            summary = json.loads(summary_path.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        if not isinstance(summary, Mapping):
-            continue
-        if not _summary_matches_preset(summary, preset, selected_url):
-            continue
-        result_path = summary_path.with_name("results.json")
-        results: list[dict[str, Any]] = []
-        if result_path.exists():
-            try:
-                parsed = json.loads(result_path.read_text(encoding="utf-8"))
-                if isinstance(parsed, list):
-                    results = [row for row in parsed if isinstance(row, dict)]
-            except Exception:
-                results = []
-        reports.append(
-            {
-                "artifact_dir": str(summary_path.parent),
-                "summary_path": str(summary_path),
-                "results_path": str(result_path),
-                "summary": dict(summary),
-                "results": results,
-            }
-        )
-        if len(reports) >= max(1, int(limit)):
-            break
-    return reports
+    return scan_benchmark_reports(
+        workspace_root=workspace_root,
+        site_key=preset.key,
+        selected_url=selected_url,
+        limit=limit,
+        preset=preset,
+    )
 
 
 def open_benchmark_report(report_path: Path, opener: ReportOpener = webbrowser.open_new_tab) -> bool:
@@ -1102,6 +1056,7 @@ def run_benchmark_suite(
             captured.append(line)
             emit(line)
     return_code = process.wait()
+    record_benchmark_report(workspace_root, output_dir)
 
     summary_path = output_dir / "summary.json"
     results_path = output_dir / "results.json"
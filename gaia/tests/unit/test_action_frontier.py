@@ -0,0 +1,119 @@
+"""ActionFrontier 단위 테스트 (페이지 파티션 + lazy re-score 힙)."""
+
+from __future__ import annotations
+
+from gaia.src.phase4.goal_driven.action_frontier import (
+    MAX_CONTEXT_BONUS,
+    ActionFrontier,
+    frontier_key,
+    order_bonus,
+)
+
+
+def _naive_pick(entries, score_fn):
+    best = None
+    for entry in entries:
+        score = score_fn(entry)
+        if best is None or score > best[0]:
+            best = (score, entry)
+    return best[1] if best else None
+
+
+def test_push_dedupes_and_partitions_by_page() -> None:
+    frontier = ActionFrontier()
+    assert frontier.push("p1", "e1", "click", priority=0.8)
+    assert not frontier.push("p1", "e1", "click", priority=0.9)
+    assert frontier.push("p2", "e1", "click", priority=0.8)
+
+    assert len(frontier) == 2
+    assert frontier.partition_size("p1") == 1
+    assert frontier.partition_size("p2") == 1
+    assert frontier_key("p1", "e1", "click") in frontier
+    assert [entry["url_hash"] for entry in frontier] == ["p1", "p2"]
+
+
+def test_pop_best_only_touches_requested_page() -> None:
+    frontier = ActionFrontier()
+    frontier.push("p1", "a", "click", priority=0.3)
+    frontier.push("p2", "b", "click", priority=0.9)
+
+    entry = frontier.pop_best("p1", lambda e: e.priority)
+    assert entry is not None and entry.element_id == "a"
+    assert frontier.pop_best("p1", lambda e: e.priority) is None
+    assert frontier.partition_size("p2") == 1
+
+
+def test_pop_best_matches_full_sort_with_context_bonus() -> None:
+    frontier = ActionFrontier()
+    bonuses = {}
+    for index in range(40):
+        element_id = f"e{index}"
+        frontier.push("page", element_id, "click", priority=0.3 if index % 3 else 0.8)
+        bonuses[element_id] = (index * 7 % 11) * 0.05
+
+    remaining = [frontier._live[key] for key in list(frontier._live)]
+    while remaining:
+        position = {entry.key: index for index, entry in enumerate(remaining)}
+
+        def score(entry):
+            return entry.priority + bonuses[entry.element_id] + order_bonus(position[entry.key])
+
+        expected = _naive_pick(remaining, score)
+        picked = frontier.pop_best("page", score)
+        assert picked is expected
+        remaining.remove(expected)
+    assert len(frontier) == 0
+
+
+def test_order_bonus_follows_position_across_pages() -> None:
+    frontier = ActionFrontier()
+    frontier.push("other", "x", "click", priority=0.5)
+    frontier.push("page", "a", "click", priority=0.5)
+
+    assert frontier.order_bonuses()[frontier_key("page", "a", "click")] == order_bonus(1)
+    frontier.pop_best("other", lambda e: e.priority)
+    assert frontier.order_bonuses()[frontier_key("page", "a", "click")] == order_bonus(0)
+
+
+def test_pop_best_sees_priority_raised_after_enqueue() -> None:
+    frontier = ActionFrontier()
+    for index in range(30):
+        frontier.push("page", f"e{index}", "click", priority=0.6)
+    frontier.push("page", "late", "click", priority=0.05)
+    current = {entry.key: entry.priority for entry in frontier._live.values()}
+
+    # 로그인 부스트처럼 enqueue 이후 우선순위가 오른 항목
+    late_key = frontier_key("page", "late", "click")
+    current[late_key] = 1.0
+    assert frontier.raise_priority(late_key, 1.0)
+    assert not frontier.raise_priority(late_key, 0.7)
+
+    def score(entry):
+        return current[entry.key] + MAX_CONTEXT_BONUS
+
+    picked = frontier.pop_best("page", score)
+    assert picked is not None and picked.element_id == "late"
+    assert frontier.metrics["reprioritized"] == 1
+    assert frontier.pop_best("page", score).element_id == "e0"
+    assert frontier.stats()["size"] == 29
+
+
+def test_discard_and_stats() -> None:
+    frontier = ActionFrontier()
+    for index in range(5):
+        frontier.push("page", f"e{index}", "click", priority=0.5)
+
+    assert frontier.discard(frontier_key("page", "e0", "click"))
+    assert not frontier.discard(frontier_key("page", "e0", "click"))
+    bonuses = frontier.order_bonuses()
+    assert bonuses[frontier_key("page", "e1", "click")] == order_bonus(0)
+    picked = frontier.pop_best("page", lambda e: e.priority + bonuses.get(e.key, 0.0))
+    assert picked is not None and picked.element_id == "e1"
+
+    stats = frontier.stats()
+    assert stats["size"] == 3
+    assert stats["partitions"] == 1
+    assert stats["pushes"] == 5
+    assert stats["discards"] == 1
+    assert stats["pops"] == 1
+    assert stats["oldest_age_s"] >= 0.0
@@ -5,12 +5,15 @@ from pathlib import Path
 
 from gaia.src.gui.benchmark_mode import (
     BENCHMARK_PRESETS,
+    BenchmarkReportCatalog,
     benchmark_report_has_failures,
     build_benchmark_catalog,
     build_benchmark_site_catalog,
+    find_preset,
     load_benchmark_registry,
     override_suite_urls,
     prune_benchmark_reports,
+    record_benchmark_report,
     render_benchmark_reports_html,
     resolve_benchmark_site,
     save_benchmark_registry,
@@ -181,6 +184,79 @@ def test_scan_benchmark_reports_filters_by_selected_url_host(tmp_path: Path) ->
     assert reports[0]["summary"]["site"]["base_url"] == "https://inuu-timetable.vercel.app/"
 
 
+def test_benchmark_report_catalog_revalidates_changed_and_removed_runs(tmp_path: Path) -> None:
+    bench_root = tmp_path / "artifacts" / "benchmarks"
+    preset = find_preset("inu_timetable")
+    assert preset is not None
+
+    def write_run(name: str, status_counts: dict[str, int]) -> Path:
+        directory = bench_root / name
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / "summary.json").write_text(
+            json.dumps({"site": {"base_url": "https://inuu-timetable.vercel.app/"}, "status_counts": status_counts}),
+            encoding="utf-8",
+        )
+        (directory / "results.json").write_text(
+            json.dumps([{"scenario_id": "INUU_001", "status": "SUCCESS", "duration_seconds": 2.5}]),
+            encoding="utf-8",
+        )
+        return directory
+
+    write_run("run_1", {"SUCCESS": 1})
+    second = write_run("run_2", {"SUCCESS": 1})
+    (bench_root / "run_broken").mkdir()
+    (bench_root / "run_broken" / "summary.json").write_text("{not json", encoding="utf-8")
+
+    with BenchmarkReportCatalog(tmp_path) as catalog:
+        catalog.refresh()
+        reports = catalog.query(preset=preset)
+        assert [Path(report["artifact_dir"]).name for report in reports] == ["run_2", "run_1"]
+        assert [report["has_failures"] for report in reports] == [False, False]
+
+    # 같은 run 을 실패로 다시 쓰고, 다른 run 은 지우고, 새 run 은 즉시 기록
+    (second / "summary.json").write_text(
+        json.dumps({"site": {"base_url": "https://inuu-timetable.vercel.app/"}, "status_counts": {"FAIL": 12}}),
+        encoding="utf-8",
+    )
+    (bench_root / "run_1" / "summary.json").unlink()
+    third = write_run("run_3", {"SUCCESS": 1})
+    record_benchmark_report(tmp_path, third)
+
+    with BenchmarkReportCatalog(tmp_path) as catalog:
+        assert [Path(report["artifact_dir"]).name for report in catalog.query(preset=preset)] == [
+            "run_3",
+            "run_2",
+            "run_1",
+        ]
+        catalog.refresh()
+        reports = catalog.query(preset=preset, include_payloads=False)
+
+    assert [Path(report["artifact_dir"]).name for report in reports] == ["run_3", "run_2"]
+    assert [report["has_failures"] for report in reports] == [False, True]
+
+
+def test_benchmark_report_catalog_is_created_only_on_first_insert(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "artifacts" / "cache"
+    bench_root = tmp_path / "artifacts" / "benchmarks"
+    bench_root.mkdir(parents=True)
+
+    assert scan_benchmark_reports(workspace_root=tmp_path, site_key="inu_timetable") == []
+    assert prune_benchmark_reports(workspace_root=tmp_path, site_key="inu_timetable")["scanned"] == 0
+    assert not cache_dir.exists()
+
+    run_dir = bench_root / "run_1"
+    run_dir.mkdir()
+    (run_dir / "summary.json").write_text(
+        json.dumps({"site": {"base_url": "https://inuu-timetable.vercel.app/"}, "status_counts": {"SUCCESS": 1}}),
+        encoding="utf-8",
+    )
+    record_benchmark_report(tmp_path, run_dir)
+
+    assert (cache_dir / "benchmark_reports.sqlite3").exists()
+    reports = scan_benchmark_reports(workspace_root=tmp_path, site_key="inu_timetable")
+    assert [Path(report["artifact_dir"]).name for report in reports] == ["run_1"]
+
+
 def test_benchmark_report_has_failures_checks_summary_and_results() -> None:
     assert benchmark_report_has_failures({"summary": {"status_counts": {"SUCCESS": 1, "FAIL": 1}}}) is True
     assert benchmark_report_has_failures({"results": [{"status": "SUCCESS"}, {"status": "FAIL"}]}) is True
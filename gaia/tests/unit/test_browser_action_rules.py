@@ -14,7 +14,7 @@ from gaia.src.phase4.goal_driven.browser_action_rules import (
     _detect_repeated_failure,
     _detect_repeated_wait,
     build_browser_action_rules_block,
-    build_browser_action_rules_for_agent,
+    build_browser_action_reinforcement_block,
     slice_recent_prompt_items,
 )
 
@@ -116,9 +116,8 @@ def test_build_for_agent_no_warnings():
     agent = _FakeAgent()
     agent._action_history = ["click(e1)", "fill(e2)"]
     agent._action_feedback = ["success", "success"]
-    result = build_browser_action_rules_for_agent(agent)
-    assert "긴급 행동 경고" not in result
-    assert "## 작업 규칙" in result
+    result = build_browser_action_reinforcement_block(agent)
+    assert result == ""
 
 
 def test_build_for_agent_wait_warning():
@@ -126,7 +125,7 @@ def test_build_for_agent_wait_warning():
     agent = _FakeAgent()
     agent._action_history = ["wait", "wait"]
     agent._action_feedback = ["success", "success"]
-    result = build_browser_action_rules_for_agent(agent)
+    result = build_browser_action_reinforcement_block(agent)
     assert "긴급 행동 경고" in result
     assert "wait" in result.split("긴급 행동 경고")[1]
 
@@ -136,7 +135,7 @@ def test_build_for_agent_failure_warning():
     agent = _FakeAgent()
     agent._action_history = ["click(e1)", "click(e1)"]
     agent._action_feedback = ["fail: not found", "fail: not found"]
-    result = build_browser_action_rules_for_agent(agent)
+    result = build_browser_action_reinforcement_block(agent)
     assert "긴급 행동 경고" in result
     assert "반복 실패" in result.split("긴급 행동 경고")[1]
 
@@ -152,7 +151,7 @@ def test_build_for_agent_respects_recent_history_limit(monkeypatch):
     agent = _FakeAgent()
     agent._action_history = ["click(e1)", "wait", "wait"]
     agent._action_feedback = ["success", "success", "success"]
-    result = build_browser_action_rules_for_agent(agent)
+    result = build_browser_action_reinforcement_block(agent)
     assert "긴급 행동 경고" not in result
 
 
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from gaia.src.phase4.codex_app_server_client import (
+    CodexAppServerClient,
+    CodexAppServerError,
+    CodexAppServerPool,
+)
+
+_FAKE_APP_SERVER = textwrap.dedent(
+    """
+    import json
+    import os
+    import sys
+    import threading
+    import time
+
+    reject_images = os.environ.get("FAKE_REJECT_INLINE_IMAGES") == "1"
+    write_lock = threading.Lock()
+    counter = {"thread": 0, "turn": 0}
+
+    def send(payload):
+        with write_lock:
+            sys.stdout.write(json.dumps(payload) + "\\n")
+            sys.stdout.flush()
+
+    def finish_turn(thread_id, turn_id, text):
+        time.sleep(0.3)
+        send({"method": "item/agentMessage/delta", "params": {"threadId": thread_id, "turnId": turn_id, "delta": text}})
+        send({"method": "turn/completed", "params": {"threadId": thread_id, "turn": {"id": turn_id, "status": "completed"}}})
+
+    for line in sys.stdin:
+        message = json.loads(line)
+        method = message.get("method")
+        params = message.get("params") or {}
+        if method == "initialize":
+            send({"id": message["id"], "result": {}})
+        elif method == "thread/start":
+            counter["thread"] += 1
+            send({"id": message["id"], "result": {"thread": {"id": f"t{counter['thread']}"}}})
+        elif method == "turn/start":
+            kinds = [item.get("type") for item in params["input"]]
+            if reject_images and "image" in kinds:
+                send({"id": message["id"], "error": {"code": -32602, "message": "unknown input type"}})
+                continue
+            counter["turn"] += 1
+            turn_id = f"u{counter['turn']}"
+            send({"id": message["id"], "result": {"turn": {"id": turn_id}}})
+            text = params["input"][0]["text"] + "|" + params["threadId"] + "|" + ",".join(kinds)
+            threading.Thread(target=finish_turn, args=(params["threadId"], turn_id, text), daemon=True).start()
+    """
+)
+
+
+@pytest.fixture()
+def fake_codex_bin(tmp_path: Path) -> str:
+    server = tmp_path / "fake_app_server.py"
+    server.write_text(_FAKE_APP_SERVER, encoding="utf-8")
+    launcher = tmp_path / "codex"
+    launcher.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{server}"\n', encoding="utf-8")
+    launcher.chmod(0o755)
+    return str(launcher)
+
+
+def test_client_runs_concurrent_turns_on_separate_threads(fake_codex_bin: str) -> None:
+    client = CodexAppServerClient(codex_bin=fake_codex_bin, timeout_sec=15)
+    results: dict[str, str] = {}
+
+    def run(prompt: str) -> None:
+        results[prompt] = client.analyze_text(prompt)
+
+    try:
+        workers = [threading.Thread(target=run, args=(prompt,)) for prompt in ("a", "b")]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+
+        assert {value.split("|")[0] for value in results.values()} == {"a", "b"}
+        assert len({value.split("|")[1] for value in results.values()}) == 2
+        assert client.analyze_text("c").split("|")[1] in {"t1", "t2"}
+        deltas: list[str] = []
+        assert client.analyze_text("d", on_delta=deltas.append) == "".join(deltas)
+        assert client.healthy
+    finally:
+        client.close()
+
+
+def test_client_falls_back_to_local_image_files(monkeypatch, fake_codex_bin: str) -> None:
+    monkeypatch.setenv("FAKE_REJECT_INLINE_IMAGES", "1")
+    client = CodexAppServerClient(codex_bin=fake_codex_bin, timeout_sec=15)
+    try:
+        answer = client.analyze_with_images("look", ["aGVsbG8="])
+
+        assert answer.endswith("text,localImage")
+        assert client.inline_images is False
+        assert client.healthy
+    finally:
+        client.close()
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.last_used_at = time.monotonic()
+        self.is_started = True
+        self.healthy = True
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_pool_spreads_leases_then_shares_and_waits() -> None:
+    created: list[_FakeClient] = []
+
+    def factory() -> _FakeClient:
+        created.append(_FakeClient())
+        return created[-1]
+
+    pool = CodexAppServerPool(factory, size=2, max_turns_per_client=2, idle_recycle_sec=0)
+    leased = [pool.acquire(timeout=0) for _ in range(4)]
+
+    assert len(created) == 2
+    assert [client.in_flight for client in created] == [2, 2]
+    with pytest.raises(CodexAppServerError):
+        pool.acquire(timeout=0)
+
+    pool.release(leased[0])
+    assert pool.acquire(timeout=0) is leased[0]
+    assert pool.metrics["leases"] == 5
+    pool.close()
+    assert all(client.closed for client in created)
+
+
+def test_pool_discards_broken_and_releases_idle_clients_without_respawning() -> None:
+    created: list[_FakeClient] = []
+
+    def factory() -> _FakeClient:
+        created.append(_FakeClient())
+        return created[-1]
+
+    pool = CodexAppServerPool(factory, size=1, max_turns_per_client=1, idle_recycle_sec=0.05)
+    with pool.lease() as first:
+        first.healthy = False
+    assert first.closed
+
+    with pool.lease() as second:
+        pass
+    assert second is not first
+    deadline = time.monotonic() + 2
+    while not second.closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert second.closed
+    assert len(created) == 2
+    assert pool.metrics["recycled"] == 1
+
+    with pool.lease() as third:
+        pass
+    assert third is created[2]
+    assert pool.metrics["discarded"] == 1
+    pool.close()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import re
+
+from gaia.src.phase4.goal_driven.browser_action_rules import (
+    build_browser_action_reinforcement_block,
+    build_browser_action_rules_block,
+)
+from gaia.src.phase4.goal_driven.decision_prompt_layout import (
+    PROMPT_TAIL,
+    PromptSection,
+    assemble_decision_prompt,
+    build_static_prompt_prefix,
+    estimate_prompt_tokens,
+)
+
+
+def _prefix(openclaw_backend: bool = True) -> str:
+    return build_static_prompt_prefix(
+        openclaw_backend=openclaw_backend,
+        participant_skill_prompt="## skill\n- participant rules",
+        browser_rules_block=build_browser_action_rules_block(),
+    )
+
+
+def _sections(dom_lines: int, history: list[str]) -> list[PromptSection]:
+    return [
+        PromptSection("goal", "## 목표", "- 이름: demo", trimmable=False),
+        PromptSection("action_history", "## 최근 액션 기록", "\n".join(history), priority=70, keep="tail", min_lines=1),
+        PromptSection("replay_packet", "", "## replay\n" + "\n".join(f"replay {i}" for i in range(50)), priority=20, min_lines=1),
+        PromptSection("dom", "## DOM", "\n".join(f"[{i}] button b{i}" for i in range(dom_lines)), priority=90, min_lines=5),
+        PromptSection("empty", "", ""),
+    ]
+
+
+def test_static_prefix_is_byte_stable_and_leads_every_prompt() -> None:
+    prefix = _prefix()
+    first, first_trace = assemble_decision_prompt(prefix, _sections(10, ["click e1"]), token_budget=0)
+    second, second_trace = assemble_decision_prompt(prefix, _sections(30, ["click e1", "fill e2"]), token_budget=0)
+
+    assert _prefix() is prefix
+    assert first.startswith(prefix) and second.startswith(prefix)
+    assert first_trace["static_prefix_sha1"] == second_trace["static_prefix_sha1"]
+    assert "OpenClaw 원본 우선 규칙" in prefix
+    assert "OpenClaw 원본 우선 규칙" not in _prefix(openclaw_backend=False)
+    assert "## 목표\n- 이름: demo" in first[len(prefix):]
+    assert first.endswith(PROMPT_TAIL)
+    assert first_trace["trimmed_sections"] == {}
+
+
+def test_budget_trims_lowest_priority_sections_first() -> None:
+    prefix = _prefix()
+    untrimmed, trace = assemble_decision_prompt(prefix, _sections(200, ["a", "b", "c"]), token_budget=0)
+    budget = trace["estimated_tokens"] - 60
+
+    prompt, trace = assemble_decision_prompt(prefix, _sections(200, ["a", "b", "c"]), token_budget=budget)
+
+    assert trace["trimmed_sections"]["replay_packet"] > 0
+    assert "dom" not in trace["trimmed_sections"]
+    assert "## replay\nreplay 0" in prompt
+    assert "replay 49" not in prompt
+    assert "[199] button b199" in prompt
+    assert trace["estimated_tokens"] <= budget + 10
+    assert len(prompt) < len(untrimmed)
+
+
+def test_budget_keeps_min_lines_and_tail_of_history() -> None:
+    prefix = _prefix()
+    prompt, trace = assemble_decision_prompt(
+        prefix,
+        _sections(200, [f"step {i}" for i in range(30)]),
+        token_budget=1,
+    )
+
+    assert trace["trimmed_sections"]["dom"] == 195
+    assert "[4] button b4\n(... 195줄 생략: token budget)" in prompt
+    assert "(... 29줄 생략: token budget)\nstep 29" in prompt
+    assert "- 이름: demo" in prompt
+
+
+def test_typical_korean_page_is_not_trimmed_by_default(monkeypatch) -> None:
+    monkeypatch.delenv("GAIA_DECISION_PROMPT_TOKEN_BUDGET", raising=False)
+    dom = "\n".join(f'[{i}] link "서울 강남구 역삼동 아파트 매물 {i}번 상세 보기" ref=e{i}' for i in range(600))
+    sections = _sections(0, ["click e1"])
+    sections[3] = PromptSection("dom", "## DOM", dom, priority=90, min_lines=40)
+
+    prompt, trace = assemble_decision_prompt(_prefix(), sections)
+
+    assert trace["token_budget"] == 0
+    assert trace["trimmed_sections"] == {}
+    assert not re.search(r"\(\.\.\. \d+줄 생략", prompt)
+    assert estimate_prompt_tokens("가나다라") == 1
+
+
+def test_reinforcement_block_is_split_from_static_rules() -> None:
+    class _Agent:
+        _action_history = ["wait", "wait"]
+        _action_feedback = []
+
+    block = build_browser_action_reinforcement_block(_Agent())
+
+    assert block.startswith("## 긴급 행동 경고")
+    assert block not in build_browser_action_rules_block()
@@ -0,0 +1,168 @@
+import json
+import threading
+
+from gaia.src.phase4.goal_driven.decision_parsing_runtime import parse_decision
+from gaia.src.phase4.goal_driven.decision_stream_runtime import (
+    DecisionStreamScanner,
+    decision_streaming_enabled,
+    early_decision_ready,
+    finish_decision_stream,
+    flush_decision_stream_tails,
+    shutdown_decision_stream,
+    stream_decision_response,
+)
+from gaia.src.phase4.goal_driven.models import ActionType
+
+_DECISION = {
+    "action": "click",
+    "ref_id": "e12",
+    "element_id": 3,
+    "value": None,
+    "reasoning": "로그인 버튼을 눌러 {다음} 단계로 간다 \"quoted\"",
+    "confidence": 0.8,
+    "is_goal_achieved": False,
+    "goal_achievement_reason": None,
+    "collect_text_evidence": False,
+    "text_evidence_reason": None,
+    "text_evidence_focus": [],
+    "participant_id": None,
+    "next_participant": None,
+    "turn_control": None,
+    "participant_plan": None,
+    "blackboard_event": None,
+    "blackboard_payload": {},
+}
+
+
+def _chunks(text: str, size: int = 7) -> list[str]:
+    return [text[idx:idx + size] for idx in range(0, len(text), size)]
+
+
+class _StreamingLLM:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.release_tail = threading.Event()
+        self.consumed = 0
+
+    def stream_text(self, prompt, images=None, **_kwargs):
+        for chunk in _chunks(self.text):
+            if self.consumed >= self.text.index('"participant_id"'):
+                self.release_tail.wait(5)
+            self.consumed += len(chunk)
+            yield chunk
+
+
+class _Agent:
+    def __init__(self, llm) -> None:
+        self.llm = llm
+        self.reason_codes = []
+
+    def _record_reason_code(self, code: str) -> None:
+        self.reason_codes.append(code)
+
+    def _log(self, _message: str) -> None:
+        return None
+
+
+def test_scanner_tracks_completed_top_level_fields_across_chunks() -> None:
+    text = "```json\n" + json.dumps(_DECISION, ensure_ascii=False, indent=2) + "\n```"
+    scanner = DecisionStreamScanner()
+    seen_ready_at = None
+    for chunk in _chunks(text, 3):
+        scanner.feed(chunk)
+        if seen_ready_at is None and early_decision_ready(scanner.fields):
+            seen_ready_at = len(scanner.text)
+
+    assert scanner.closed
+    assert scanner.fields == _DECISION
+    assert seen_ready_at is not None and seen_ready_at < text.index('"participant_id"')
+    partial = {key: _DECISION[key] for key in ("action", "ref_id", "element_id", "value", "reasoning", "confidence", "is_goal_achieved")}
+    assert early_decision_ready({**partial, "collect_text_evidence": False})
+    assert not early_decision_ready({**partial, "collect_text_evidence": True})
+    assert not early_decision_ready({**partial, "collect_text_evidence": False, "is_goal_achieved": True})
+
+
+def test_stream_commits_before_tail_and_flushes_it_later(monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_LLM_STREAM_DECISION", "1")
+    text = json.dumps(_DECISION, ensure_ascii=False)
+    llm = _StreamingLLM(text)
+    agent = _Agent(llm)
+    recorded = []
+    monkeypatch.setattr(
+        "gaia.src.phase4.goal_driven.run_history_runtime.record_run_history_transcript",
+        lambda _agent, **kwargs: recorded.append(kwargs),
+    )
+
+    assert decision_streaming_enabled(agent)
+    response_text, trace = stream_decision_response(agent, "prompt", None, participant_mode=False, metadata={"goal_id": "g1"})
+    decision = parse_decision(agent, response_text)
+
+    assert trace["commit"] == "fields"
+    assert llm.consumed < len(text)
+    assert decision.action == ActionType.CLICK
+    assert decision.ref_id == "e12"
+    assert decision.reasoning == _DECISION["reasoning"]
+
+    llm.release_tail.set()
+    agent._decision_stream_tails[0].future.result(timeout=5)
+    assert flush_decision_stream_tails(agent) == 1
+    assert recorded[0]["stage"] == "actor_decision_response_tail"
+    assert json.loads(recorded[0]["content"]) == _DECISION
+    assert recorded[0]["metadata"]["goal_id"] == "g1"
+    assert not getattr(agent, "_decision_stream_hold", False)
+    shutdown_decision_stream(agent)
+
+
+def test_participant_mode_and_dropped_tail_fields_wait_for_object_close(monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_LLM_STREAM_DECISION", "1")
+    monkeypatch.setattr(
+        "gaia.src.phase4.goal_driven.run_history_runtime.record_run_history_transcript",
+        lambda _agent, **_kwargs: None,
+    )
+    payload = {**_DECISION, "blackboard_event": "message_sent"}
+    text = json.dumps(payload, ensure_ascii=False)
+
+    llm = _StreamingLLM(text)
+    llm.release_tail.set()
+    agent = _Agent(llm)
+    response_text, trace = stream_decision_response(agent, "prompt", None, participant_mode=True)
+    assert trace["commit"] == "object"
+    assert json.loads(response_text) == payload
+
+    llm = _StreamingLLM(text)
+    llm.release_tail.set()
+    agent = _Agent(llm)
+    response_text, trace = stream_decision_response(agent, "prompt", None, participant_mode=False)
+    assert trace["commit"] == "fields"
+    agent._decision_stream_tails[0].future.result(timeout=5)
+    flush_decision_stream_tails(agent)
+
+    assert agent._decision_stream_hold is True
+    assert agent.reason_codes == ["llm_stream_tail_dropped_fields"]
+    response_text, trace = stream_decision_response(agent, "prompt", None, participant_mode=False)
+    assert trace["commit"] == "object"
+    shutdown_decision_stream(agent)
+    assert agent._decision_stream_hold is False
+
+
+def test_finish_decision_stream_flushes_the_last_pending_tail(monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_LLM_STREAM_DECISION", "1")
+    text = json.dumps(_DECISION, ensure_ascii=False)
+    llm = _StreamingLLM(text)
+    agent = _Agent(llm)
+    recorded = []
+    monkeypatch.setattr(
+        "gaia.src.phase4.goal_driven.run_history_runtime.record_run_history_transcript",
+        lambda _agent, **kwargs: recorded.append(kwargs),
+    )
+
+    _response_text, trace = stream_decision_response(agent, "prompt", None, participant_mode=False)
+    assert trace["commit"] == "fields"
+    assert flush_decision_stream_tails(agent) == 0
+
+    threading.Timer(0.05, llm.release_tail.set).start()
+    assert finish_decision_stream(agent) == 1
+    assert recorded[0]["stage"] == "actor_decision_response_tail"
+    assert json.loads(recorded[0]["content"]) == _DECISION
+    assert agent._decision_stream_tails == []
+    shutdown_decision_stream(agent)
@@ -862,6 +862,69 @@ def test_detect_active_surface_context_uses_goal_destination_terms_without_domai
 # --- Delta snapshot compression tests ---
 
 
+def _feature_index_elements(count: int) -> list[DOMElement]:
+    return [
+        DOMElement(
+            id=index,
+            tag="button" if index % 3 else "a",
+            role="button" if index % 3 else "link",
+            text="바로 추가" if index % 5 == 0 else f"항목 {index}",
+            ref_id=f"e{index + 100}",
+            container_name=f"(HUSS)포용사회와문화탐방{index % 7}" if index % 2 else "검색 결과",
+            container_ref_id=f"c{index % 11}",
+            container_role="listitem",
+            context_text=f"포용사회와문화탐방{index % 7} | 시간표 {index}",
+            role_ref_role="button",
+            role_ref_name=f"항목 {index}",
+            bounding_box={"x": index, "y": 2 * index, "width": 40, "height": 20},
+        )
+        for index in range(count)
+    ]
+
+
+def test_element_feature_index_matches_uncached_formatting_and_reuses_features() -> None:
+    elements = _feature_index_elements(120)
+    uncached_agent = _FakeAgent()
+    uncached_agent._browser_backend_name = "playwright"
+    expected = format_dom_for_llm(uncached_agent, elements)
+
+    agent = _FakeAgent()
+    agent._browser_backend_name = "playwright"
+    agent._active_snapshot_id = "snap-1"
+    agent._active_dom_hash = "hash-1"
+    tokenize_calls = []
+    original_tokenize = agent._tokenize_text
+    agent._tokenize_text = lambda value: tokenize_calls.append(value) or original_tokenize(value)
+
+    assert format_dom_for_llm(agent, elements) == expected
+    first_pass_calls = len(tokenize_calls)
+    index = agent._element_feature_index
+    assert len(index) == len(elements)
+    assert index.features(agent, elements[3], fields_for_element).element is elements[3]
+
+    agent._prev_raw_snapshot_text = ""
+    assert format_dom_for_llm(agent, elements) == expected
+    assert len(tokenize_calls) - first_pass_calls < first_pass_calls // 4
+    assert index.misses == len(elements)
+
+
+def test_element_feature_index_invalidates_on_snapshot_and_goal_change() -> None:
+    agent = _FakeAgent()
+    agent._active_snapshot_id = "snap-1"
+    element = _feature_index_elements(1)[0]
+
+    assert "target_match" not in semantic_tags_for_element(agent, element)
+    first_index = agent._element_feature_index
+
+    agent._goal_semantics = SimpleNamespace(target_terms=["바로 추가"], destination_terms=[])
+    assert "target_match" in semantic_tags_for_element(agent, element)
+    assert agent._element_feature_index is first_index
+
+    agent._active_snapshot_id = "snap-2"
+    semantic_tags_for_element(agent, element)
+    assert agent._element_feature_index is not first_index
+
+
 def test_compute_delta_snapshot_identical():
     """동일 snapshot은 빈 delta와 change_ratio 0.0을 반환한다."""
     lines = ["line1", "line2", "line3"]
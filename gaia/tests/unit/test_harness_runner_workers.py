@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+from gaia.harness import cli_runtime, runner
+from gaia.harness.registry import HarnessTask, TaskRegistry
+
+
+def _fake_run_task_factory(calls: list[dict[str, object]], barrier: threading.Barrier | None = None):
+    lock = threading.Lock()
+
+    def fake_run_task(task, *, python_executable, timeout_sec, env, session_id, qa_mode, runtime_isolation=None):
+        if barrier is not None:
+            barrier.wait()
+        # Finish later jobs first so completion order differs from job order.
+        time.sleep(0.05 if task.id == "task-a" else 0.0)
+        with lock:
+            calls.append({"task_id": task.id, "session_id": session_id, "env": dict(env or {})})
+        return {
+            "task_id": task.id,
+            "status": "SUCCESS",
+            "final_status": "SUCCESS",
+            "reason": "",
+            "exit_code": 0,
+            "duration_seconds": 1.0,
+            "summary": {"final_status": "SUCCESS"},
+        }
+
+    return fake_run_task
+
+
+def _registry() -> TaskRegistry:
+    return TaskRegistry(
+        tasks=(
+            HarnessTask(id="task-a", url="https://a.example.test", goal="a"),
+            HarnessTask(id="task-b", url="https://b.example.test", goal="b"),
+        )
+    )
+
+
+def test_run_task_jobs_keeps_job_order_and_isolates_worker_profiles(monkeypatch) -> None:
+    calls: list[dict[str, object]] = []
+    monkeypatch.setattr(runner, "run_task", _fake_run_task_factory(calls, threading.Barrier(2, timeout=5)))
+    tasks = _registry().tasks
+    streamed: list[int] = []
+
+    rows = runner._run_task_jobs(
+        [(tasks[0], "s:a"), (tasks[1], "s:b")],
+        workers=2,
+        env={"GAIA_OPENCLAW_PROFILE": "bench"},
+        on_row=lambda job_index, row: streamed.append(job_index),
+    )
+
+    assert [row["task_id"] for row in rows] == ["task-a", "task-b"]
+    assert streamed == [1, 0]
+    profiles = {call["env"]["GAIA_OPENCLAW_PROFILE"] for call in calls}
+    assert profiles == {"bench-w1", "bench-w2"}
+    assert {row["worker_index"] for row in rows} == {1, 2}
+
+
+def test_run_task_jobs_single_worker_keeps_caller_env(monkeypatch) -> None:
+    calls: list[dict[str, object]] = []
+    monkeypatch.setattr(runner, "run_task", _fake_run_task_factory(calls))
+    tasks = _registry().tasks
+
+    rows = runner._run_task_jobs([(tasks[0], "s:a")], workers=4, env={"FOO": "1"})
+
+    assert rows[0]["task_id"] == "task-a"
+    assert calls[0]["env"] == {"FOO": "1"}
+    assert "worker_index" not in rows[0]
+
+
+def test_cli_run_registry_streams_rows_and_reports_in_deterministic_order(monkeypatch, tmp_path) -> None:
+    calls: list[dict[str, object]] = []
+    monkeypatch.setattr(runner, "run_task", _fake_run_task_factory(calls))
+    monkeypatch.setattr(cli_runtime, "ARTIFACT_ROOT", tmp_path)
+
+    payload = cli_runtime._run_registry(_registry(), repeats=2, workers=3)
+
+    assert payload["workers"] == 3
+    assert [(row["task_id"], row["repeat_index"]) for row in payload["results"]] == [
+        ("task-a", 1),
+        ("task-b", 1),
+        ("task-a", 2),
+        ("task-b", 2),
+    ]
+    assert [task["attempt_count"] for task in payload["tasks"]] == [2, 2]
+    artifact_dir = tmp_path / payload["run_id"]
+    streamed = [json.loads(line) for line in (artifact_dir / "results.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert len(streamed) == 4
+    assert (artifact_dir / "report.json").exists()
+
+
+def test_normalize_harness_workers_clamps_values() -> None:
+    assert runner.normalize_harness_workers(None) == 1
+    assert runner.normalize_harness_workers("0") == 1
+    assert runner.normalize_harness_workers("bad") == 1
+    assert runner.normalize_harness_workers(100) == 32
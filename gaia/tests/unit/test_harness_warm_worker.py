@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sys
+
+from gaia.harness.warm_worker import WarmWorker, runtime_uses_persistent_worker
+
+_PID_CODE = """
+import json, os
+print("log line before result")
+print(json.dumps({"pid": os.getpid(), "marker": os.getenv("GAIA_WARM_TEST_MARKER", "")}))
+"""
+
+
+def _last_json_line(stdout: str) -> dict:
+    import json
+
+    return json.loads(stdout.strip().splitlines()[-1])
+
+
+def test_warm_worker_reuses_interpreter_and_applies_task_env() -> None:
+    worker = WarmWorker(python_executable=sys.executable, max_tasks=10)
+    try:
+        first = worker.run(_PID_CODE, env={"GAIA_WARM_TEST_MARKER": "one", "PATH": ""}, timeout_sec=30)
+        second = worker.run(_PID_CODE, env={"GAIA_WARM_TEST_MARKER": "two", "PATH": ""}, timeout_sec=30)
+    finally:
+        worker.close()
+
+    assert first.exit_code == 0 and second.exit_code == 0
+    first_payload = _last_json_line(first.stdout)
+    second_payload = _last_json_line(second.stdout)
+    assert first_payload["pid"] == second_payload["pid"]
+    assert (first_payload["marker"], second_payload["marker"]) == ("one", "two")
+    assert worker.spawn_count == 1
+
+
+def test_warm_worker_streams_raw_stdout_lines_to_callback() -> None:
+    worker = WarmWorker(python_executable=sys.executable)
+    lines: list[str] = []
+    try:
+        result = worker.run(
+            "import sys\nsys.__stdout__.write('--- Step 1\\n')\nsys.__stdout__.flush()\nprint('done')\n",
+            timeout_sec=30,
+            on_line=lines.append,
+        )
+    finally:
+        worker.close()
+
+    assert lines == ["--- Step 1", "done"]
+    assert result.log_lines == ["--- Step 1"]
+    assert result.stdout.strip() == "done"
+
+
+def test_warm_worker_forwards_printed_lines_before_the_result_and_keeps_them_on_timeout() -> None:
+    worker = WarmWorker(python_executable=sys.executable)
+    seen: list[tuple[str, bool]] = []
+    returned = {"done": False}
+
+    def _on_line(line: str) -> None:
+        seen.append((line, returned["done"]))
+
+    try:
+        result = worker.run(
+            "import sys, time\nprint('first')\nsys.stderr.write('second\\nthi')\nprint('rd', end='')\ntime.sleep(0.2)\n",
+            timeout_sec=30,
+            on_line=_on_line,
+        )
+        returned["done"] = True
+        timed_out = worker.run(
+            "import time\nprint('--- Step 1', flush=True)\ntime.sleep(30)\n",
+            timeout_sec=1,
+            on_line=_on_line,
+        )
+    finally:
+        worker.close()
+
+    assert [line for line, _ in seen[:3]] == ["first", "second", "third"]
+    assert not any(after for _, after in seen[:3])
+    assert result.stdout == "first\nsecond\nthird\n"
+    assert timed_out.timed_out is True
+    assert seen[3:] == [("--- Step 1", True)]
+    assert timed_out.stdout.strip() == "--- Step 1"
+
+
+def test_warm_worker_recycles_after_crash_and_task_budget() -> None:
+    worker = WarmWorker(python_executable=sys.executable, max_tasks=2)
+    try:
+        crashed = worker.run("import os\nos._exit(3)\n", timeout_sec=30)
+        assert crashed.crashed is True
+        assert crashed.exit_code == 3
+
+        pids = [_last_json_line(worker.run(_PID_CODE, timeout_sec=30).stdout)["pid"] for _ in range(3)]
+    finally:
+        worker.close()
+
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[1]
+    assert worker.spawn_count == 3
+
+
+def test_warm_worker_reports_exceptions_and_timeouts() -> None:
+    worker = WarmWorker(python_executable=sys.executable)
+    try:
+        failed = worker.run("raise ValueError('boom')\n", timeout_sec=30)
+        timed_out = worker.run("import time\ntime.sleep(30)\n", timeout_sec=1)
+    finally:
+        worker.close()
+
+    assert failed.exit_code == 1
+    assert "ValueError: boom" in failed.stdout
+    assert timed_out.timed_out is True
+    assert timed_out.exit_code == 124
+
+
+def test_runtime_uses_persistent_worker_accepts_aliases() -> None:
+    assert runtime_uses_persistent_worker("persistent-worker-cold-state") is True
+    assert runtime_uses_persistent_worker("persistent_worker") is True
+    assert runtime_uses_persistent_worker("warm-process-cold-state") is False
+    assert runtime_uses_persistent_worker(None) is False
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from gaia.src.phase4 import llm_rate_limiter
+from gaia.src.phase4.llm_rate_limiter import acquire_llm_call_slot
+
+
+def test_acquire_is_noop_without_rate(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GAIA_LLM_RATE_LIMIT_PER_MIN", raising=False)
+    monkeypatch.setattr(llm_rate_limiter.time, "sleep", lambda _: pytest.fail("must not sleep"))
+
+    assert acquire_llm_call_slot() == 0.0
+
+
+def test_shared_state_spaces_calls_across_limiters(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    slept: list[float] = []
+    monkeypatch.setenv("GAIA_LLM_RATE_LIMIT_PER_MIN", "60")
+    monkeypatch.setenv("GAIA_LLM_RATE_LIMIT_STATE", str(tmp_path / "rate.sqlite3"))
+    monkeypatch.setattr(llm_rate_limiter.time, "time", lambda: 1000.0)
+    monkeypatch.setattr(llm_rate_limiter.time, "sleep", slept.append)
+
+    waits = [acquire_llm_call_slot() for _ in range(3)]
+
+    assert waits == [0.0, 1.0, 2.0]
+    assert slept == [1.0, 2.0]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import base64
+from io import BytesIO
+from types import SimpleNamespace
+
+from PIL import Image
+
+from gaia.src.phase4.goal_driven import exploration_cache_runtime as cache_runtime
+from gaia.src.phase4.goal_driven.llm_response_cache import LLMResponseCache, screenshot_digest
+
+
+def _png_base64(color_left: int, color_right: int, *, noise_pixel: bool = False) -> str:
+    image = Image.new("RGB", (200, 100), (color_left, color_left, color_left))
+    image.paste((color_right, color_right, color_right), (100, 0, 200, 100))
+    if noise_pixel:
+        image.putpixel((3, 3), (color_left + 1, color_left, color_left))
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def test_screenshot_digest_ignores_pixel_noise_but_not_layout_changes() -> None:
+    base = _png_base64(240, 20)
+    noisy = _png_base64(240, 20, noise_pixel=True)
+    flipped = _png_base64(20, 240)
+
+    assert base != noisy
+    assert screenshot_digest(base) == screenshot_digest(noisy)
+    assert screenshot_digest(base) != screenshot_digest(flipped)
+    assert screenshot_digest("not-an-image").startswith("sha1:")
+    assert screenshot_digest("") == ""
+
+
+def test_cache_upserts_evicts_lru_and_tracks_metrics(tmp_path) -> None:
+    cache = LLMResponseCache(tmp_path / "llm_cache.sqlite3", max_entries=2)
+    cache["a"] = "alpha"
+    cache["b"] = "bravo"
+    assert cache.get("a") == "alpha"
+    cache["a"] = "alpha-2"
+    cache["c"] = "charlie"
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "alpha-2"
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == len("alpha-2") + len("charlie")
+    cache.close()
+
+    reopened = LLMResponseCache(tmp_path / "llm_cache.sqlite3", max_entries=2)
+    assert len(reopened) == 2
+    assert reopened.get("c") == "charlie"
+    reopened.close()
+
+
+def test_cache_enforces_byte_budget() -> None:
+    cache = LLMResponseCache(max_entries=100, max_bytes=10)
+    cache["a"] = "123456"
+    cache["b"] = "654321"
+
+    assert len(cache) == 1
+    assert "b" in cache
+    assert "a" not in cache
+
+
+def test_cache_key_uses_perceptual_screenshot_digest() -> None:
+    base = _png_base64(240, 20)
+    noisy = _png_base64(240, 20, noise_pixel=True)
+
+    assert cache_runtime.get_llm_cache_key("prompt", base, "sig") == cache_runtime.get_llm_cache_key(
+        "prompt", noisy, "sig"
+    )
+    assert cache_runtime.get_llm_cache_key("prompt", base, "sig") != cache_runtime.get_llm_cache_key(
+        "prompt", base, "other"
+    )
+
+
+def test_load_llm_cache_opens_sqlite_store(tmp_path) -> None:
+    agent = SimpleNamespace(_llm_cache={}, _llm_cache_path=str(tmp_path / "cache" / "llm.sqlite3"), _log=print)
+
+    cache_runtime.load_llm_cache(agent)
+    agent._llm_cache["key"] = "value"
+
+    assert isinstance(agent._llm_cache, LLMResponseCache)
+    assert LLMResponseCache(agent._llm_cache_path).get("key") == "value"
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from gaia.src.phase4.llm_vision_client import LLMVisionClient, get_vision_client
 
 
@@ -102,9 +104,10 @@ def test_codex_transport_prefers_app_server(monkeypatch) -> None:
     calls: list[tuple[str, list[str] | None]] = []
     client = object.__new__(LLMVisionClient)
     client._prefer_codex_app_server = True
-    client._codex_app_server_client = None
+    client._codex_app_server_pool = None
 
-    def fake_app_server(prompt: str, images: list[str] | None = None) -> str:
+    def fake_app_server(prompt: str, images: list[str] | None = None, *, on_delta=None) -> str:
+        assert on_delta is None
         calls.append((prompt, images))
         return "app-server-result"
 
@@ -117,9 +120,9 @@ def test_codex_transport_prefers_app_server(monkeypatch) -> None:
 def test_codex_transport_falls_back_to_exec_when_app_server_fails(monkeypatch) -> None:
     client = object.__new__(LLMVisionClient)
     client._prefer_codex_app_server = True
-    client._codex_app_server_client = None
+    client._codex_app_server_pool = None
 
-    def fake_app_server(_prompt: str, _images: list[str] | None = None) -> str:
+    def fake_app_server(_prompt: str, _images: list[str] | None = None, *, on_delta=None) -> str:
         raise RuntimeError("boom")
 
     def fake_exec(prompt: str, images: list[str] | None = None) -> str:
@@ -133,6 +136,39 @@ def test_codex_transport_falls_back_to_exec_when_app_server_fails(monkeypatch) -
     assert client._prefer_codex_app_server is False
 
 
+def test_stream_text_does_not_rerun_codex_after_the_stream_was_sent(monkeypatch) -> None:
+    client = object.__new__(LLMVisionClient)
+    client._prefer_codex_cli = True
+    calls: list[str] = []
+
+    def fake_transport(prompt: str, images=None, *, on_delta=None) -> str:
+        calls.append("transport")
+        raise RuntimeError("codex exec failed")
+
+    monkeypatch.setattr(client, "_run_codex_transport", fake_transport)
+    monkeypatch.setattr(client, "analyze_text", lambda *_args, **_kwargs: calls.append("analyze_text") or "{}")
+
+    with pytest.raises(RuntimeError, match="codex exec failed"):
+        list(client.stream_text("prompt"))
+    assert calls == ["transport"]
+
+
+def test_stream_text_falls_back_when_the_stream_request_is_not_sent(monkeypatch) -> None:
+    client = object.__new__(LLMVisionClient)
+    client._prefer_codex_cli = False
+    client.client = object()
+    client.model = "gpt-test"
+
+    def fake_create(**kwargs):
+        assert kwargs["stream"] is True
+        raise RuntimeError("stream unsupported")
+
+    monkeypatch.setattr(client, "_create_chat_completion", fake_create)
+    monkeypatch.setattr(client, "analyze_text", lambda prompt, **_kwargs: f"blocking:{prompt}")
+
+    assert list(client.stream_text("prompt")) == ["blocking:prompt"]
+
+
 def test_openai_profile_loader_skips_expired_codex_oauth_token(monkeypatch, tmp_path) -> None:
     auth_dir = tmp_path / ".gaia" / "auth"
     auth_dir.mkdir(parents=True)
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import base64
-
-import requests
+import threading
 
 from gaia.src.phase4 import mcp_openclaw_dispatch_runtime as runtime
 from gaia.src.phase4.browser_context_manager import (
@@ -230,11 +229,11 @@ def test_request_uses_default_timeout_tuple(monkeypatch) -> None:
         def json():
             return {"ok": True}
 
-    def fake_request(*, method, url, params, json, headers, timeout):
+    def fake_request(method, url, *, profile, params, json, headers, timeout):
         seen["timeout"] = timeout
         return _FakeResponse()
 
-    monkeypatch.setattr(requests, "request", fake_request)
+    monkeypatch.setattr(runtime, "openclaw_http_request", fake_request)
 
     status_code, data, text = runtime._request(
         "GET",
@@ -260,11 +259,12 @@ def test_request_prefers_payload_profile_over_default_profile(monkeypatch) -> No
         def json():
             return {"ok": True}
 
-    def fake_request(*, method, url, params, json, headers, timeout):
+    def fake_request(method, url, *, profile, params, json, headers, timeout):
         seen["params"] = params
+        seen["profile"] = profile
         return _FakeResponse()
 
-    monkeypatch.setattr(requests, "request", fake_request)
+    monkeypatch.setattr(runtime, "openclaw_http_request", fake_request)
 
     runtime._request(
         "POST",
@@ -274,6 +274,7 @@ def test_request_prefers_payload_profile_over_default_profile(monkeypatch) -> No
     )
 
     assert seen["params"]["profile"] == "gaia-test-sender"
+    assert seen["profile"] == "gaia-test-sender"
 
 
 def test_ensure_openclaw_profile_creates_missing_profile_and_starts(monkeypatch) -> None:
@@ -601,6 +602,31 @@ def test_derive_state_change_from_snapshot_payloads_surfaces_new_page_evidence()
     assert state_change["backend_effective_only"] is False
 
 
+def test_derive_state_change_from_snapshot_payloads_adds_role_snapshot_diff() -> None:
+    before_snapshot = '- main "Cart" [ref=e1]\n  - button "Checkout" [ref=e2]'
+    after_snapshot = before_snapshot + '\n  - dialog "Confirm order" [ref=e3]\n    - button "OK" [ref=e4]'
+    before_payload = {
+        "current_url": "https://shop.example/cart",
+        "evidence": _evidence("same", live_texts=["Checkout"]),
+        "role_snapshot": {"snapshot": before_snapshot},
+    }
+    after_payload = {
+        "current_url": "https://shop.example/cart",
+        "evidence": _evidence("same", live_texts=["Checkout"]),
+        "role_snapshot": {"snapshot": after_snapshot},
+    }
+
+    state_change = runtime._derive_state_change_from_snapshot_payloads(
+        before_payload=before_payload,
+        after_payload=after_payload,
+    )
+
+    assert state_change["dom_delta"]["structure_changed"] is True
+    assert state_change["dom_delta"]["subtrees_inserted"] == 1
+    assert state_change["dom_delta"]["inserted_refs"] == ["e3", "e4"]
+    assert not any(key.startswith("dom_") and key != "dom_delta" for key in state_change)
+
+
 def test_apply_commit_verification_flags_unreflected_date_apply() -> None:
     before_evidence = _evidence(
         "날짜, 인원 선택 2026.06 06.02(화) • 1박 적용하기",
@@ -2003,3 +2029,143 @@ def test_runtime_bundle_classifies_pointer_intercept_before_visibility_timeout()
     assert intercept_pos != -1, "pointer-intercept branch missing from runtime bundle"
     assert not_found_pos != -1, "visibility-timeout branch missing from runtime bundle"
     assert intercept_pos < not_found_pos, "pointer-intercept must be classified before visibility-timeout"
+
+
+def _fake_observe_request_factory(barrier=None):
+    raw_snapshot = {
+        "url": "https://mail.example.test/new",
+        "snapshot": """
+- generic [ref=e1]:
+  - iframe [ref=e2]:
+    - button "보내기" [ref=e3]
+""".strip(),
+        "refs": {
+            "e1": {"role": "generic"},
+            "e2": {"role": "iframe"},
+            "e3": {"role": "button", "name": "보내기"},
+        },
+    }
+
+    def fake_request(method, *, base_url, path, timeout=None, params=None, payload=None):
+        if barrier is not None:
+            barrier.wait()
+        if path == "/snapshot":
+            return 200, dict(raw_snapshot), ""
+        fn = str((payload or {}).get("fn") or "")
+        if fn == runtime._FRAME_DESCRIPTOR_SCRIPT:
+            return 200, {"result": [{"selector": "iframe >> nth=0", "visible": True, "bodyText": "프레임 본문"}]}, ""
+        if fn == runtime._DOM_TEXT_EVIDENCE_SCRIPT:
+            return 200, {"result": [{"text": "배송 완료 안내", "tag": "p"}]}, ""
+        raise AssertionError(path)
+
+    return fake_request
+
+
+def test_snapshot_payload_parallel_observe_matches_sequential(monkeypatch) -> None:
+    monkeypatch.setattr(runtime, "_probe_ref_actionability", lambda **kwargs: None)
+    monkeypatch.setattr(runtime, "_request", _fake_observe_request_factory())
+    monkeypatch.setenv("GAIA_OPENCLAW_PARALLEL_OBSERVE", "0")
+    sequential = runtime._snapshot_payload_for_target(
+        base_url="http://127.0.0.1:18791",
+        session_id="s-seq",
+        state={"profile": "openclaw"},
+        target_id="tab-1",
+        timeout=None,
+    )
+
+    monkeypatch.setattr(runtime, "_request", _fake_observe_request_factory(threading.Barrier(3, timeout=5)))
+    monkeypatch.setenv("GAIA_OPENCLAW_PARALLEL_OBSERVE", "1")
+    parallel = runtime._snapshot_payload_for_target(
+        base_url="http://127.0.0.1:18791",
+        session_id="s-seq",
+        state={"profile": "openclaw"},
+        target_id="tab-1",
+        timeout=None,
+    )
+
+    assert sequential is not None and parallel is not None
+    sequential_timings = sequential.pop("observation_timings_ms")
+    parallel_timings = parallel.pop("observation_timings_ms")
+    assert set(sequential_timings) == {"snapshot", "frames", "dom_text", "total"}
+    assert set(parallel_timings) == {"snapshot", "frames", "dom_text", "total"}
+    assert parallel == sequential
+    assert parallel["evidence"]["frame_texts"] == ["프레임 본문"]
+
+
+def test_parallel_observe_drops_speculative_frames_without_iframe(monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_OPENCLAW_PARALLEL_OBSERVE", "1")
+
+    def fake_request(method, *, base_url, path, timeout=None, params=None, payload=None):
+        if path == "/snapshot":
+            return 200, {"snapshot": '- button "확인" [ref=e1]', "refs": {"e1": {"role": "button"}}}, ""
+        return 200, {"result": [{"selector": "iframe >> nth=0", "bodyText": "stale"}]}, ""
+
+    monkeypatch.setattr(runtime, "_request", fake_request)
+
+    observation = runtime._observe_target(
+        base_url="http://127.0.0.1:18791",
+        target_id="tab-1",
+        profile="openclaw",
+        timeout=None,
+    )
+
+    assert observation["status_code"] == 200
+    assert observation["frame_descriptors"] == []
+
+
+def test_dispatch_openclaw_settle_waits_for_network_idle_then_dom_quiescence(monkeypatch) -> None:
+    monkeypatch.setattr(runtime, "_resolve_base_url", lambda raw: "http://127.0.0.1:18791")
+    state = _seed_session("settle-s1")
+    monkeypatch.setattr(runtime, "_ensure_target", lambda **kwargs: state)
+    waits: list[dict[str, object]] = []
+
+    def fake_request(method, *, base_url, path, timeout=None, params=None, payload=None):
+        assert (method, path) == ("POST", "/act")
+        waits.append(dict(payload or {}))
+        if payload.get("loadState"):
+            return 500, {"error": "Timeout 1000ms exceeded."}, ""
+        return 200, {"ok": True, "targetId": "tab-1"}, ""
+
+    monkeypatch.setattr(runtime, "_request", fake_request)
+
+    status_code, payload, _text = runtime.dispatch_openclaw_action(
+        None,
+        action="browser_settle",
+        params={"session_id": "settle-s1", "value": '{"max_wait_ms": 2000, "quiet_ms": 250}'},
+    )
+
+    assert status_code == 200
+    assert [wait["kind"] for wait in waits] == ["wait", "wait"]
+    assert waits[0]["loadState"] == "networkidle"
+    assert waits[0]["timeoutMs"] == 1000
+    assert "MutationObserver" in waits[1]["fn"] and "const quietMs = 250;" in waits[1]["fn"]
+    assert waits[1]["timeoutMs"] <= 2000
+    settle = payload["state_change"]["settle"]
+    assert settle["network_idle"] is False
+    assert settle["dom_quiet"] is True
+    assert settle["timed_out"] is False
+    assert payload["reason_code"] == "ok"
+
+
+def test_dispatch_openclaw_settle_can_skip_network_idle(monkeypatch) -> None:
+    monkeypatch.setattr(runtime, "_resolve_base_url", lambda raw: "http://127.0.0.1:18791")
+    state = _seed_session("settle-s2")
+    monkeypatch.setattr(runtime, "_ensure_target", lambda **kwargs: state)
+    waits: list[dict[str, object]] = []
+
+    def fake_request(method, *, base_url, path, timeout=None, params=None, payload=None):
+        waits.append(dict(payload or {}))
+        return 408, {"error": "Timeout exceeded"}, ""
+
+    monkeypatch.setattr(runtime, "_request", fake_request)
+
+    status_code, payload, _text = runtime.dispatch_openclaw_action(
+        None,
+        action="browser_act",
+        params={"session_id": "settle-s2", "action": "settle", "max_wait_ms": 800, "network_idle": False},
+    )
+
+    assert status_code == 200
+    assert len(waits) == 1 and "fn" in waits[0]
+    assert payload["settle"]["timed_out"] is True
+    assert payload["reason_code"] == "settle_timeout"
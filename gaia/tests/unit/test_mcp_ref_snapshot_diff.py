@@ -0,0 +1,113 @@
+from gaia.src.phase4.mcp_ref.snapshot_diff import (
+    build_role_snapshot_index,
+    diff_role_snapshots,
+    render_role_snapshot_delta,
+    summarize_role_snapshot_change,
+)
+
+
+_BASE = "\n".join(
+    [
+        '- main "Shop" [ref=e1]',
+        '  - list "Cart" [ref=e2]',
+        '    - listitem "Apple" [ref=e3]',
+        '    - listitem "Pear" [ref=e4]',
+        '  - button "Checkout" [ref=e5]',
+        '  - navigation "Footer" [ref=e6]',
+        '    - link "About" [ref=e7]',
+    ]
+)
+
+
+def _diff(prev: str, cur: str):
+    return diff_role_snapshots(build_role_snapshot_index(prev), build_role_snapshot_index(cur))
+
+
+def test_diff_role_snapshots_is_empty_for_identical_snapshots() -> None:
+    assert _diff(_BASE, _BASE).empty
+
+
+def test_diff_role_snapshots_reports_inserted_subtree_by_ref() -> None:
+    cur = _BASE.replace(
+        '    - listitem "Pear" [ref=e4]',
+        '    - listitem "Pear" [ref=e4]\n    - listitem "Plum" [ref=e8]\n      - button "Remove" [ref=e9]',
+    )
+
+    diff = _diff(_BASE, cur)
+
+    index = build_role_snapshot_index(cur)
+    assert [index.nodes[line].ref for line in diff.inserted] == ["e8"]
+    assert diff.removed == [] and diff.changed == []
+    assert {index.nodes[line].ref for line in diff.touched} == {"e8", "e9"}
+
+
+def test_diff_role_snapshots_anchors_removed_subtree_on_previous_sibling() -> None:
+    cur = _BASE.replace('    - listitem "Pear" [ref=e4]\n', "")
+
+    diff = _diff(_BASE, cur)
+
+    prev_index = build_role_snapshot_index(_BASE)
+    cur_index = build_role_snapshot_index(cur)
+    assert [prev_index.nodes[line].ref for line in diff.removed] == ["e4"]
+    assert [cur_index.nodes[line].ref for line in diff.touched] == ["e3"]
+
+
+def test_diff_role_snapshots_matches_reordered_refs_as_changes_not_churn() -> None:
+    cur = _BASE.replace('button "Checkout" [ref=e5]', 'button "Checkout (2)" [ref=e5]')
+
+    diff = _diff(_BASE, cur)
+
+    index = build_role_snapshot_index(cur)
+    assert [index.nodes[line].ref for line in diff.changed] == ["e5"]
+    assert diff.inserted == [] and diff.removed == []
+
+
+def test_diff_role_snapshots_reports_reordered_siblings() -> None:
+    cur = _BASE.replace(
+        '    - listitem "Apple" [ref=e3]\n    - listitem "Pear" [ref=e4]',
+        '    - listitem "Pear" [ref=e4]\n    - listitem "Apple" [ref=e3]',
+    )
+
+    diff = _diff(_BASE, cur)
+
+    index = build_role_snapshot_index(cur)
+    assert not diff.empty
+    assert [index.nodes[line].ref for line in diff.reordered] == ["e2"]
+    assert diff.inserted == [] and diff.removed == [] and diff.changed == []
+    assert len(diff.touched) == 1 and index.nodes[next(iter(diff.touched))].ref in {"e3", "e4"}
+
+    delta_lines, ratio, _diff_result = render_role_snapshot_delta(_BASE, cur, context_radius=0)
+    assert ratio > 0.0
+    assert any('listitem "Pear"' in line or 'listitem "Apple"' in line for line in delta_lines)
+
+
+def test_render_role_snapshot_delta_skips_unchanged_subtrees_and_keeps_ancestors() -> None:
+    items = [f'    - listitem "Row {i}" [ref=e{i + 10}]' for i in range(200)]
+    prev = "\n".join(['- main "Feed" [ref=e1]', '  - list "Rows" [ref=e2]', *items])
+    cur = prev.replace('"Row 150" [ref=e160]', '"Row 150 (updated)" [ref=e160]')
+
+    delta_lines, ratio, diff = render_role_snapshot_delta(prev, cur, context_radius=1)
+
+    assert len(diff.changed) == 1
+    assert ratio < 0.05
+    assert delta_lines[0] == '- main "Feed" [ref=e1]'
+    assert any("Row 150 (updated)" in line for line in delta_lines)
+    assert any(line.startswith("... (unchanged") for line in delta_lines)
+
+
+def test_summarize_role_snapshot_change_reports_inserted_refs() -> None:
+    cur = _BASE.replace(
+        '  - button "Checkout" [ref=e5]',
+        '  - button "Checkout" [ref=e5]\n  - dialog "Confirm" [ref=e10]\n    - button "OK" [ref=e11]',
+    )
+
+    evidence = summarize_role_snapshot_change(
+        {"role_snapshot": {"snapshot": _BASE}},
+        {"role_snapshot": {"snapshot": cur}},
+    )
+
+    assert evidence["structure_changed"] is True
+    assert evidence["subtrees_inserted"] == 1
+    assert evidence["inserted_refs"] == ["e10", "e11"]
+    assert evidence["inserted_samples"] == ['- dialog "Confirm" [ref=e10]']
+    assert summarize_role_snapshot_change({}, {"role_snapshot": {"snapshot": cur}}) == {}
@@ -1,6 +1,10 @@
 from gaia.src.phase4.mcp_ref.snapshot_helpers import (
     _build_context_snapshot_from_elements,
+    _build_role_snapshot_from_ai_text,
     _build_role_snapshot_from_elements,
+    _build_role_tree,
+    _compact_role_tree,
+    _parse_role_snapshot,
 )
 from gaia.src.phase4.mcp_page_evidence_runtime import (
     build_ref_candidates,
@@ -116,3 +120,56 @@ def test_build_role_snapshot_from_elements_includes_ref_role_name_and_nth() -> N
     assert '[nth=1]' in payload["snapshot"]
     assert payload["refs"]["31"]["role"] == "button"
     assert payload["refs"]["32"]["nth"] == 1
+
+
+def test_parse_role_snapshot_links_parents_and_ref_descendants_in_one_pass() -> None:
+    snapshot = "\n".join(
+        [
+            '- main "Shop"',
+            "  - paragraph",
+            '    - button "담기" [ref=e1] [nth=1]',
+            "  - paragraph",
+            "    - img",
+            "",
+            '- link "Home" [ref=e2]',
+        ]
+    )
+
+    nodes = _parse_role_snapshot(snapshot)
+
+    assert [node.parent for node in nodes] == [-1, 0, 1, 0, 3, -1, -1]
+    assert [node.has_ref_descendant for node in nodes] == [True, True, False, False, False, False, False]
+    assert (nodes[2].role, nodes[2].name, nodes[2].ref, nodes[2].nth) == ("button", "담기", "e1", 1)
+    assert _compact_role_tree(snapshot).split("\n") == [
+        '- main "Shop"',
+        "  - paragraph",
+        '    - button "담기" [ref=e1] [nth=1]',
+        '- link "Home" [ref=e2]',
+    ]
+    tree = _build_role_tree(snapshot, {})
+    assert tree[2]["parent_ref"] is None
+    assert tree[2]["ancestor_names"] == ["Shop"]
+    assert tree[-1]["ref"] == "e2" and tree[-1]["depth"] == 0
+
+
+def test_compact_role_tree_stays_linear_on_deep_ref_less_chains() -> None:
+    depth = 4000
+    snapshot = "\n".join("  " * level + "- paragraph" for level in range(depth))
+    snapshot += "\n" + "  " * depth + '- button "ok" [ref=e1]'
+
+    compacted = _compact_role_tree(snapshot)
+
+    assert compacted.count("\n") == depth
+
+
+def test_role_snapshot_truncation_reuses_parsed_lines_for_tree_and_stats() -> None:
+    snapshot = "\n".join(f'- button "item {index}" [ref=e{index}]' for index in range(1, 40))
+
+    payload = _build_role_snapshot_from_ai_text(snapshot, interactive=False, compact=True, max_chars=200)
+
+    assert payload["truncated"] is True
+    lines = payload["snapshot"].split("\n")
+    assert lines[-1] == "[...TRUNCATED - page too large]"
+    assert payload["stats"]["lines"] == len(lines)
+    assert [node["line"] for node in payload["tree"]] == [line.strip() for line in lines if line.strip()]
+    assert payload["tree"][0]["ref"] == "e1"
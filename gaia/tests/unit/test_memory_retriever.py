@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import sqlite3
+
+from gaia.src.phase4.memory import MemoryActionRecord, MemoryRetriever, MemoryStore
+
+
+def _record(store: MemoryStore, *, domain: str, selector: str, reason_code: str = "ok", success: bool = True) -> None:
+    store.record_action(
+        MemoryActionRecord(
+            episode_id=1,
+            domain=domain,
+            url=f"https://{domain}/",
+            step_number=1,
+            action="click",
+            selector=selector,
+            success=success,
+            effective=success,
+            reason_code=reason_code,
+        )
+    )
+
+
+def test_retrieve_lightweight_ranks_full_history_beyond_recency_window(tmp_path) -> None:
+    store = MemoryStore(db_path=tmp_path / "kb.sqlite3")
+    assert store.fts_enabled is True
+    _record(store, domain="shop.example", selector="button#checkout_submit")
+    for index in range(300):
+        _record(store, domain="shop.example", selector=f"a.filler-link-{index}")
+    _record(store, domain="other.example", selector="button#checkout_submit")
+
+    hints = MemoryRetriever(store).retrieve_lightweight(
+        domain="shop.example",
+        goal_text="press checkout_submit to pay",
+        action_history=[],
+        success_limit=1,
+        failure_limit=1,
+    )
+
+    assert hints[0].selector_hint == "button#checkout_submit"
+    assert hints[0].source == "success_pattern"
+
+
+def test_retrieve_recovery_filters_reason_codes_in_index(tmp_path) -> None:
+    store = MemoryStore(db_path=tmp_path / "kb.sqlite3")
+    _record(store, domain="shop.example", selector="#login", reason_code="not_found", success=False)
+    _record(store, domain="shop.example", selector="#login", reason_code="ok")
+
+    hints = MemoryRetriever(store).retrieve_recovery(
+        domain="shop.example",
+        goal_text="login",
+        reason_code="not_found",
+    )
+
+    assert [hint.reason_code for hint in hints] == ["not_found"]
+
+
+def test_fts_index_tracks_deletes_and_backfills_existing_rows(tmp_path) -> None:
+    db_path = tmp_path / "kb.sqlite3"
+    store = MemoryStore(db_path=db_path)
+    _record(store, domain="shop.example", selector="#cart")
+    store.clear_domain("shop.example")
+    assert store.search_actions(domain="shop.example", tokens=["cart"]) == []
+
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute("DROP TRIGGER action_records_fts_ai")
+        conn.execute("DROP TRIGGER action_records_fts_ad")
+        conn.execute("DROP TABLE action_records_fts")
+        conn.execute("PRAGMA user_version = 0")
+        conn.execute(
+            """
+            INSERT INTO action_records (
+                episode_id, created_at, domain, url, step_number, action, selector, full_selector,
+                ref_id, success, effective, changed, reason_code, reason, snapshot_id, dom_hash, epoch,
+                state_change_json, attempt_logs_json
+            )
+            VALUES (1, '2026-01-01T00:00:00+00:00', 'shop.example', 'https://shop.example/', 1, 'click',
+                    '#wishlist', '', '', 1, 1, 0, 'ok', '', '', '', 0, '{}', '[]')
+            """
+        )
+
+    reopened = MemoryStore(db_path=db_path)
+    rows = reopened.search_actions(domain="shop.example", tokens=["wishlist"])
+    assert [row["selector"] for row in rows] == ["#wishlist"]
+    assert rows[0]["bm25"] < 0
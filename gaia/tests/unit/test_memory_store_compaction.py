@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from gaia import cli
+from gaia.src.phase4.memory import MemoryActionRecord, MemoryStore
+
+
+def _store(tmp_path) -> MemoryStore:
+    return MemoryStore(db_path=tmp_path / "kb.sqlite3", write_behind=False)
+
+
+def _record(store: MemoryStore, *, domain: str = "shop.example", selector: str = "#buy", success: bool = True) -> None:
+    store.record_action(
+        MemoryActionRecord(
+            episode_id=1,
+            domain=domain,
+            url=f"https://{domain}/",
+            step_number=1,
+            action="click",
+            selector=selector,
+            success=success,
+            effective=success,
+            reason_code="ok" if success else "not_found",
+        )
+    )
+
+
+def _age_all_rows(store: MemoryStore, created_at: str = "2020-01-01T00:00:00+00:00") -> None:
+    with sqlite3.connect(str(store.db_path)) as conn:
+        conn.execute("UPDATE action_records SET created_at = ?", (created_at,))
+
+
+def test_compact_folds_expired_successes_into_aggregates(tmp_path) -> None:
+    store = _store(tmp_path)
+    for _ in range(3):
+        _record(store, selector="#buy")
+    _record(store, selector="#missing", success=False)
+    _age_all_rows(store)
+    _record(store, selector="#fresh")
+
+    result = store.compact(retention_days=30, batch_size=2, domain_row_budget=0, max_db_bytes=0)
+
+    assert result["expired_actions"] == 4
+    assert [row["selector"] for row in store.query_actions(domain="shop.example")] == ["#fresh"]
+    with sqlite3.connect(str(store.db_path)) as conn:
+        rows = conn.execute("SELECT selector, count, effective_count FROM action_aggregates").fetchall()
+    assert rows == [("#buy", 3, 3)]
+    assert store.get_stats("shop.example")["action_aggregates"] == 1
+
+
+def test_compact_enforces_per_domain_row_budget(tmp_path) -> None:
+    store = _store(tmp_path)
+    for index in range(7):
+        _record(store, selector=f"#a{index}")
+    _record(store, domain="other.example", selector="#keep")
+
+    result = store.compact(domain_row_budget=3, max_db_bytes=0, batch_size=2)
+
+    assert result["budget_actions"] == 4
+    kept = sorted(row["selector"] for row in store.query_actions(domain="shop.example"))
+    assert kept == ["#a4", "#a5", "#a6"]
+    assert len(store.query_actions(domain="other.example")) == 1
+
+
+def test_fresh_store_uses_incremental_autovacuum(tmp_path) -> None:
+    store = _store(tmp_path)
+    with sqlite3.connect(str(store.db_path)) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_size_budget_trims_oldest_rows(tmp_path) -> None:
+    store = _store(tmp_path)
+    for index in range(200):
+        _record(store, selector=f"#row-{index}-" + "x" * 400)
+
+    result = store.compact(domain_row_budget=0, max_db_bytes=192 * 1024, batch_size=50)
+
+    assert result["size_actions"] > 0
+    assert result["db_bytes"] <= 192 * 1024
+
+
+def test_memory_cli_gc_reports_json(tmp_path, capsys) -> None:
+    store = _store(tmp_path)
+    _record(store)
+    _age_all_rows(store)
+
+    code = cli.main(["memory", "--db", str(store.db_path), "gc", "--format", "json"])
+
+    assert code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["expired_actions"] == 1
+    assert payload["deleted"] >= 1
+
+
+def test_compact_drains_freelist_and_folds_selector_shapes(tmp_path) -> None:
+    store = _store(tmp_path)
+    for index in range(300):
+        _record(store, selector=f'li:nth-child({index}) a[href="/item/{index}"]' + " " * 400)
+    _age_all_rows(store)
+    size_before = store.db_path.stat().st_size
+
+    result = store.compact(retention_days=30, domain_row_budget=0, max_db_bytes=0)
+
+    assert result["expired_actions"] == 300
+    assert result["freed_pages"] > 1
+    assert store.db_path.stat().st_size < size_before
+    with sqlite3.connect(str(store.db_path)) as conn:
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+        rows = conn.execute("SELECT selector, count FROM action_aggregates").fetchall()
+    assert rows == [("li:nth-child(N) a[href=*]", 300)]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import sqlite3
+
+from gaia.src.phase4.memory import MemoryActionRecord, MemoryStore, MemorySummaryRecord
+
+
+def _action(step: object, selector: str = "#btn") -> MemoryActionRecord:
+    return MemoryActionRecord(
+        episode_id=1,
+        domain="shop.example",
+        url="https://shop.example/",
+        step_number=step,  # type: ignore[arg-type]
+        action="click",
+        selector=selector,
+        success=True,
+        effective=True,
+        reason_code="ok",
+    )
+
+
+def _row_count(db_path, table: str) -> int:
+    with sqlite3.connect(str(db_path)) as conn:
+        return int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+
+def test_write_behind_batches_rows_into_few_transactions(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("GAIA_MEMORY_FLUSH_INTERVAL_MS", "200")
+    store = MemoryStore(db_path=tmp_path / "kb.sqlite3", write_behind=True)
+    batch_sizes: list[int] = []
+    original = store._write_batch
+
+    def _tracking_batch(items):
+        batch_sizes.append(len(items))
+        original(items)
+
+    monkeypatch.setattr(store, "_write_batch", _tracking_batch)
+    for step in range(40):
+        store.record_action(_action(step))
+    store.add_dialog_summary(MemorySummaryRecord(domain="shop.example", command="/test", summary="done", status="ok"))
+    store.flush()
+
+    assert _row_count(store.db_path, "action_records") == 40
+    assert _row_count(store.db_path, "dialog_summaries") == 1
+    assert sum(batch_sizes) == 41
+    assert len(batch_sizes) < 10
+
+
+def test_reads_see_queued_writes(tmp_path) -> None:
+    store = MemoryStore(db_path=tmp_path / "kb.sqlite3", write_behind=True)
+    store.record_action(_action(1, selector="#queued"))
+
+    rows = store.query_actions(domain="shop.example")
+
+    assert [row["selector"] for row in rows] == ["#queued"]
+    assert store.get_stats("shop.example")["action_records"] == 1
+
+
+def test_bad_row_does_not_drop_rest_of_batch(tmp_path) -> None:
+    store = MemoryStore(db_path=tmp_path / "kb.sqlite3", write_behind=True)
+    store.record_action(_action(1, selector="#first"))
+    store.record_action(_action("not-a-number", selector="#broken"))
+    store.record_action(_action(3, selector="#third"))
+    store.flush()
+
+    selectors = sorted(row["selector"] for row in store.query_actions(domain="shop.example"))
+    assert selectors == ["#first", "#third"]
+
+
+def test_write_behind_disabled_writes_synchronously(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("GAIA_MEMORY_WRITE_BEHIND", "0")
+    store = MemoryStore(db_path=tmp_path / "kb.sqlite3")
+    store.record_action(_action(1))
+
+    assert store.write_behind is False
+    assert store._writer is None
+    assert _row_count(store.db_path, "action_records") == 1
+
+
+def test_close_drains_queue_and_falls_back_to_direct_writes(tmp_path) -> None:
+    store = MemoryStore(db_path=tmp_path / "kb.sqlite3", write_behind=True)
+    store.record_action(_action(1))
+    store.close()
+    assert _row_count(store.db_path, "action_records") == 1
+
+    store.record_action(_action(2))
+    assert _row_count(store.db_path, "action_records") == 2
@@ -0,0 +1,151 @@
+from gaia.src.phase4.goal_driven.goal_dom_runtime import analyze_dom
+from gaia.src.phase4.goal_driven.observation_prefetch import (
+    resolve_screenshot,
+    shutdown_observation_prefetch,
+    start_screenshot_capture,
+    start_snapshot_prefetch,
+)
+
+
+class _Agent:
+    def __init__(self) -> None:
+        self.session_id = "session-1"
+        self.mcp_host_url = "http://mcp.local"
+        self._dom_cache_generation = 3
+        self._dom_analyze_cache = {}
+        self._active_snapshot_id = "snap-before"
+        self._active_dom_hash = "dom-before"
+        self._active_snapshot_epoch = 4
+        self._active_url = "https://example.com"
+        self._active_scoped_container_ref = ""
+        self._last_context_snapshot = {}
+        self._last_role_snapshot = {}
+        self._last_snapshot_elements_by_ref = {}
+        self._last_snapshot_evidence = {}
+        self._last_container_source_summary = {}
+        self._element_ref_meta_by_id = {}
+        self.reason_codes = []
+
+    def _record_reason_code(self, code: str) -> None:
+        self.reason_codes.append(code)
+
+    def _log(self, _message: str) -> None:
+        return None
+
+    def _capture_screenshot(self) -> str:
+        return "base64-image"
+
+
+def _patch_snapshot(monkeypatch, calls):
+    class _Dispatch:
+        status_code = 200
+        text = ""
+
+        def __init__(self, epoch: int) -> None:
+            self.payload = {
+                "snapshot_id": f"snap-{epoch}",
+                "dom_hash": f"dom-{epoch}",
+                "epoch": epoch,
+                "url": "https://example.com/next",
+                "elements": [
+                    {
+                        "tag": "button",
+                        "text": "다음",
+                        "selector": "button[name='다음']",
+                        "ref_id": "e7",
+                        "attributes": {},
+                        "is_visible": True,
+                    }
+                ],
+                "evidence": {"modal_open": False},
+            }
+
+    def fake_execute(**kwargs):
+        calls.append(kwargs)
+        return _Dispatch(5 + len(calls))
+
+    monkeypatch.setattr(
+        "gaia.src.phase4.goal_driven.goal_dom_runtime.execute_mcp_action_with_recovery",
+        fake_execute,
+    )
+
+
+def test_prefetched_snapshot_is_applied_by_next_analyze_dom(monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_OBSERVATION_PIPELINING", "1")
+    calls = []
+    _patch_snapshot(monkeypatch, calls)
+    agent = _Agent()
+
+    assert start_snapshot_prefetch(agent, reason="click") is True
+    elements = analyze_dom(agent)
+
+    assert len(calls) == 1
+    assert [element.text for element in elements] == ["다음"]
+    assert agent._active_snapshot_id == "snap-6"
+    assert agent._last_snapshot_evidence == {"modal_open": False}
+    assert agent._dom_analyze_cache["key"] == (3, "session-1", "", "")
+    assert agent._observation_prefetch_metrics["hits"] == 1
+    assert analyze_dom(agent) == elements
+    assert len(calls) == 1
+    shutdown_observation_prefetch(agent)
+
+
+def test_prefetch_is_dropped_after_another_action(monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_OBSERVATION_PIPELINING", "1")
+    calls = []
+    _patch_snapshot(monkeypatch, calls)
+    agent = _Agent()
+
+    start_snapshot_prefetch(agent)
+    agent._observation_prefetch_pending.future.result(timeout=5)
+    analyze_dom(agent, scope_container_ref_id="e1")
+    assert agent._observation_prefetch_pending is not None
+
+    agent._dom_cache_generation += 1
+    agent._dom_analyze_cache = {}
+    analyze_dom(agent)
+
+    assert len(calls) == 3
+    assert agent._observation_prefetch_pending is None
+    assert agent._observation_prefetch_metrics["stale"] == 1
+    assert agent._observation_prefetch_metrics["hits"] == 0
+    shutdown_observation_prefetch(agent)
+
+
+def test_post_action_probe_snapshot_is_never_served_from_prefetch(monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_OBSERVATION_PIPELINING", "1")
+    calls = []
+    _patch_snapshot(monkeypatch, calls)
+    agent = _Agent()
+
+    # post-action probe는 선행 수집 없이 직접 새 snapshot을 받는다
+    probe_elements = analyze_dom(agent)
+    assert len(calls) == 1
+    assert getattr(agent, "_observation_prefetch_pending", None) is None
+
+    # probe가 캐시를 채웠으면 다음 스텝 관찰은 캐시로 충분하므로 선행 수집을 하지 않는다
+    assert start_snapshot_prefetch(agent, reason="click") is False
+    assert analyze_dom(agent) == probe_elements
+    assert len(calls) == 1
+
+    # 관찰이 지연돼 캐시가 비어 있으면 다음 스텝 관찰용으로만 선행 수집한다
+    agent._dom_cache_generation += 1
+    assert start_snapshot_prefetch(agent, reason="click") is True
+    analyze_dom(agent)
+    assert len(calls) == 2
+    assert agent._observation_prefetch_metrics["hits"] == 1
+    shutdown_observation_prefetch(agent)
+
+
+def test_prefetch_and_background_screenshot_are_opt_in(monkeypatch) -> None:
+    monkeypatch.delenv("GAIA_OBSERVATION_PIPELINING", raising=False)
+    agent = _Agent()
+
+    assert start_snapshot_prefetch(agent) is False
+    assert getattr(agent, "_observation_prefetch_pending", None) is None
+
+    pending = start_screenshot_capture(agent)
+    assert resolve_screenshot(pending) == "base64-image"
+    assert resolve_screenshot("inline") == "inline"
+    assert resolve_screenshot(None) is None
+    shutdown_observation_prefetch(agent)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from gaia.src.phase4 import openclaw_http_pool as pool
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = json.dumps({"ok": True, "path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # noqa: A002
+        return
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    pool.reset_openclaw_http_pool()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        pool.reset_openclaw_http_pool()
+        server.shutdown()
+        server.server_close()
+
+
+def test_pooled_requests_reuse_connection(monkeypatch, server_url) -> None:
+    monkeypatch.delenv("GAIA_OPENCLAW_HTTP_POOL", raising=False)
+    monkeypatch.delenv("GAIA_OPENCLAW_HTTP_KEEPALIVE", raising=False)
+
+    for _ in range(3):
+        response = pool.openclaw_http_request("GET", f"{server_url}/tabs", profile="openclaw", timeout=5)
+        assert response.json()["ok"] is True
+
+    stats = pool.openclaw_http_pool_stats()
+    assert stats["requests"] == 3
+    assert stats["pooled_requests"] == 3
+    assert stats["sessions_created"] == 1
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 2
+
+
+def test_sessions_are_keyed_by_profile_and_auth_headers(monkeypatch, server_url) -> None:
+    monkeypatch.delenv("GAIA_OPENCLAW_HTTP_POOL", raising=False)
+
+    pool.openclaw_http_request("GET", f"{server_url}/", profile="alpha", timeout=5)
+    pool.openclaw_http_request("GET", f"{server_url}/", profile="beta", timeout=5)
+    pool.openclaw_http_request(
+        "GET",
+        f"{server_url}/",
+        profile="alpha",
+        headers={"Authorization": "Bearer other"},
+        timeout=5,
+    )
+    pool.openclaw_http_request("GET", f"{server_url}/", profile="alpha", timeout=5)
+
+    stats = pool.openclaw_http_pool_stats()
+    assert stats["sessions_created"] == 3
+    assert stats["active_sessions"] == 3
+
+
+def test_disabled_pool_falls_back_to_plain_requests(monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_OPENCLAW_HTTP_POOL", "0")
+    pool.reset_openclaw_http_pool()
+    seen: dict[str, object] = {}
+
+    def fake_request(*, method, url, params, json, headers, timeout):
+        seen["method"] = method
+        seen["url"] = url
+        return "response"
+
+    monkeypatch.setattr(requests, "request", fake_request)
+
+    assert pool.openclaw_http_request("get", "http://127.0.0.1:1/snapshot", timeout=1) == "response"
+    assert seen == {"method": "GET", "url": "http://127.0.0.1:1/snapshot"}
+    stats = pool.openclaw_http_pool_stats()
+    assert stats["unpooled_requests"] == 1
+    assert stats["active_sessions"] == 0
+
+
+def test_pool_size_is_clamped(monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_OPENCLAW_HTTP_POOL_SIZE", "500")
+    assert pool.openclaw_http_pool_size() == 64
+    monkeypatch.setenv("GAIA_OPENCLAW_HTTP_POOL_SIZE", "nope")
+    assert pool.openclaw_http_pool_size() == 8
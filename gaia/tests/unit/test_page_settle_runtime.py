@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from gaia.src.phase4.goal_driven import page_settle_runtime
+from gaia.src.phase4.goal_driven.page_settle_runtime import settle_page
+from gaia.src.phase4.goal_driven.step_profiler import StepProfiler
+from gaia.src.phase4.mcp_local_dispatch_runtime import DispatchResult
+
+
+def _agent(monkeypatch, outcome):
+    calls: list[tuple[str, dict[str, object]]] = []
+    logs: list[str] = []
+
+    def _execute_mcp_action(raw_base_url, *, action, params, timeout=None):
+        calls.append((action, dict(params)))
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def _execute_action(*_args, **_kwargs):
+        raise AssertionError("settle must not go through _execute_action")
+
+    monkeypatch.setattr(page_settle_runtime, "execute_mcp_action", _execute_mcp_action)
+    agent = SimpleNamespace(
+        mcp_host_url="http://mcp.test",
+        session_id="s1",
+        _execute_action=_execute_action,
+        _log=logs.append,
+    )
+    return agent, calls, logs
+
+
+def _settled(**settle):
+    return DispatchResult(status_code=200, payload={"success": True, "settle": settle}, text="")
+
+
+def test_settle_page_uses_backend_settle_instead_of_sleeping(monkeypatch) -> None:
+    monkeypatch.delenv("GAIA_PAGE_SETTLE_MAX_MS", raising=False)
+    sleeps: list[float] = []
+    monkeypatch.setattr(page_settle_runtime.time, "sleep", sleeps.append)
+    agent, calls, _logs = _agent(
+        monkeypatch,
+        _settled(network_idle=True, dom_quiet=True, timed_out=False, waited_ms=140),
+    )
+
+    record = settle_page(agent, reason="start_url", fallback_ms=2000)
+
+    assert sleeps == []
+    assert calls == [
+        ("browser_settle", {"session_id": "s1", "max_wait_ms": 4000, "quiet_ms": 300, "network_idle": True})
+    ]
+    assert record["mode"] == "event"
+    assert record["dom_quiet"] is True and record["timed_out"] is False
+    assert agent._last_page_settle is record
+    assert agent._page_settle_history == [record]
+
+
+def test_settle_page_falls_back_to_sleep_when_backend_cannot_settle(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(page_settle_runtime.time, "sleep", sleeps.append)
+    agent, _calls, logs = _agent(monkeypatch, RuntimeError("connection refused"))
+
+    record = settle_page(agent, reason="context_shift", max_wait_ms=1500, fallback_ms=300)
+
+    assert sleeps == [0.3]
+    assert record["mode"] == "fallback_sleep"
+    assert any("page settle" in line for line in logs)
+
+
+def test_settle_page_leaves_the_previous_action_state_alone(monkeypatch) -> None:
+    monkeypatch.setattr(page_settle_runtime.time, "sleep", lambda _seconds: None)
+    agent, _calls, _logs = _agent(monkeypatch, _settled(network_idle=False, dom_quiet=False, timed_out=True))
+    failed_meta = {"reason_code": "not_actionable", "reason": "element detached", "state_change": {}}
+    agent._last_exec_meta = failed_meta
+    agent._last_backend_trace = {"action": "click"}
+    agent._dom_cache_generation = 3
+
+    record = settle_page(agent, reason="post_action", fallback_ms=1000)
+
+    assert record["mode"] == "event"
+    assert record["timed_out"] is True
+    assert agent._last_exec_meta is failed_meta
+    assert agent._last_exec_meta["reason_code"] == "not_actionable"
+    assert agent._last_backend_trace == {"action": "click"}
+    assert agent._dom_cache_generation == 3
+
+
+def test_settle_page_falls_back_without_a_backend_or_on_failed_settle(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(page_settle_runtime.time, "sleep", sleeps.append)
+    agent, calls, _logs = _agent(
+        monkeypatch,
+        DispatchResult(status_code=500, payload={"success": False, "error": "boom"}, text=""),
+    )
+
+    assert settle_page(agent, reason="post_action", fallback_ms=500)["mode"] == "fallback_sleep"
+    agent.mcp_host_url = ""
+    assert settle_page(agent, reason="post_action", fallback_ms=500)["mode"] == "fallback_sleep"
+    assert len(calls) == 1
+    assert sleeps == [0.5, 0.5]
+
+
+def test_settle_page_respects_disable_flag_and_max_wait_ceiling(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(page_settle_runtime.time, "sleep", sleeps.append)
+    monkeypatch.setenv("GAIA_PAGE_SETTLE_MAX_MS", "900")
+    agent, calls, _logs = _agent(monkeypatch, _settled(dom_quiet=True))
+
+    settle_page(agent, reason="post_login", max_wait_ms=6000)
+    assert calls[0][1]["max_wait_ms"] == 900
+
+    monkeypatch.setenv("GAIA_PAGE_SETTLE", "0")
+    record = settle_page(agent, reason="start_url", fallback_ms=2000)
+    assert len(calls) == 1
+    assert sleeps == [2.0]
+    assert record["mode"] == "fallback_sleep"
+
+
+def test_settle_page_records_waited_time_on_the_current_step(monkeypatch) -> None:
+    monkeypatch.setattr(page_settle_runtime.time, "sleep", lambda _seconds: None)
+    agent, _calls, _logs = _agent(monkeypatch, _settled(dom_quiet=True))
+    profiler = StepProfiler()
+    agent._step_profiler = profiler
+
+    settle_page(agent, reason="start_url")
+    profiler.begin_step(1)
+    settle_page(agent, reason="stale_dom_wait", network_idle=False)
+    profiler.end_step()
+
+    payload = profiler.to_payload()
+    assert [event["reason"] for event in payload["setup_events"]] == ["start_url"]
+    step = payload["steps"][0]
+    assert [event["kind"] for event in step["events"]] == ["settle"]
+    assert "waited_ms" in step["events"][0]
+    assert "settle" in step["phases"]
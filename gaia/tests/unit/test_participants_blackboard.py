@@ -119,3 +119,65 @@ def test_wait_for_returns_none_on_timeout() -> None:
         assert entry is None
 
     asyncio.run(run())
+
+
+def test_read_recent_filters_by_participant_and_key_together() -> None:
+    bb = Blackboard()
+    for step in range(5):
+        bb.write("alice", "ping", step, step=step)
+        bb.write("bob", "ping", step, step=step)
+        bb.write("alice", "pong", step, step=step)
+
+    entries = bb.read_recent(participant_id="alice", key="ping", limit=2)
+    assert [(e.participant_id, e.key, e.value) for e in entries] == [("alice", "ping", 4), ("alice", "ping", 3)]
+
+
+def test_compaction_keeps_recent_entries_latest_and_summary() -> None:
+    bb = Blackboard(max_entries=10)
+    bb.write("alice", "joined", "first")
+    for step in range(30):
+        bb.write("bob" if step % 2 else "alice", "tick", step, step=step)
+
+    assert len(bb) <= 13
+    assert bb.read_recent(limit=1)[0].value == 29
+    assert [e.value for e in bb.read_recent(key="tick", participant_id="bob", limit=2)] == [29, 27]
+    latest_joined = bb.latest("joined")
+    assert latest_joined is not None and latest_joined.value == "first"
+    summary = bb.compacted_summary()
+    assert summary["count"] + len(bb) == 31
+    assert summary["keys"]["joined"] == 1
+    assert "entries compacted" in bb.to_prompt_summary("alice")
+
+
+def test_wait_for_with_keys_only_evaluates_matching_writes() -> None:
+    async def run() -> None:
+        bb = Blackboard()
+        seen: list[str] = []
+
+        def predicate(entry) -> bool:
+            seen.append(entry.key)
+            return entry.value == "ok"
+
+        async def writer() -> None:
+            await asyncio.sleep(0.02)
+            bb.write("alice", "noise", "ok")
+            bb.write("alice", "ready", "ok")
+
+        task = asyncio.create_task(writer())
+        entry = await bb.wait_for(predicate, keys=["ready"], timeout=2.0)
+        await task
+        assert entry is not None and entry.key == "ready"
+        assert seen == ["ready"]
+        assert bb.pending_waiter_count() == 0
+
+    asyncio.run(run())
+
+
+def test_wait_for_timeout_unregisters_keyed_waiter() -> None:
+    async def run() -> None:
+        bb = Blackboard()
+        entry = await bb.wait_for(lambda e: True, keys=["a", "b"], timeout=0.02)
+        assert entry is None
+        assert bb.pending_waiter_count() == 0
+
+    asyncio.run(run())
@@ -4,9 +4,11 @@ from types import SimpleNamespace
 
 import pytest
 
+from gaia.harness import runner
 from scripts.run_goal_benchmark import (
     COLD_PROCESS_RUNTIME,
     DEEP_ADAPTIVE_QA_MODE,
+    PERSISTENT_WORKER_COLD_STATE_RUNTIME,
     WARM_PROCESS_COLD_STATE_RUNTIME,
     WARM_PROCESS_WARM_STATE_RUNTIME,
     _apply_qa_mode_env,
@@ -21,11 +23,14 @@ from scripts.run_goal_benchmark import (
     _compute_trace_metrics,
     _extract_trace_metrics,
     _infer_provider_from_model,
+    _normalize_concurrency,
     _normalize_runtime_isolation,
     _normalize_qa_mode,
     _prepare_scenario_env,
+    _prewarm_slot_profiles,
     _provider_credential_error,
     _runtime_uses_cold_state,
+    _runtime_uses_persistent_worker,
     _runtime_uses_warm_process,
     _run_scenario_once,
     _resolve_codex_exec_timeout,
@@ -33,6 +38,7 @@ from scripts.run_goal_benchmark import (
     _should_emit_live_trace_line,
     _should_publish_battle_board,
     _should_push_metrics,
+    _slot_env,
     _try_upload_battle_record,
 )
 from scripts.runner_identity import resolve_runner_id, sanitize_runner_id
@@ -121,6 +127,51 @@ def test_runtime_isolation_helpers_normalize_warm_and_cold_modes() -> None:
     assert _runtime_uses_cold_state(WARM_PROCESS_WARM_STATE_RUNTIME) is False
 
 
+def test_runtime_isolation_helpers_normalize_persistent_worker_mode() -> None:
+    assert _normalize_runtime_isolation("persistent_worker") == PERSISTENT_WORKER_COLD_STATE_RUNTIME
+    assert _runtime_uses_persistent_worker(PERSISTENT_WORKER_COLD_STATE_RUNTIME) is True
+    assert _runtime_uses_persistent_worker(WARM_PROCESS_COLD_STATE_RUNTIME) is False
+    assert _runtime_uses_warm_process(PERSISTENT_WORKER_COLD_STATE_RUNTIME) is True
+    assert _runtime_uses_cold_state(PERSISTENT_WORKER_COLD_STATE_RUNTIME) is True
+
+
+def test_run_scenario_once_uses_persistent_worker_when_selected(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: dict[str, object] = {}
+
+    class _FakeWorker:
+        def run(self, code, *, env, timeout_sec, on_line=None):
+            seen["code"] = code
+            seen["env"] = dict(env)
+            if on_line is not None:
+                on_line("--- Step 1 ---")
+            result = {"exit_code": 0, "summary": {"final_status": "SUCCESS", "reason": "done"}, "captured_log": "log"}
+            return SimpleNamespace(
+                exit_code=0,
+                stdout=json.dumps(result) + "\n",
+                log_lines=["--- Step 1 ---"],
+                timed_out=False,
+            )
+
+    def _fail_popen(*args, **kwargs):  # noqa: ANN002, ANN003
+        raise AssertionError("cold subprocess should not be used")
+
+    monkeypatch.setattr("scripts.run_goal_benchmark.get_warm_worker", lambda **kwargs: _FakeWorker())
+    monkeypatch.setattr("scripts.run_goal_benchmark.subprocess.Popen", _fail_popen)
+
+    row = _run_scenario_once(
+        {"id": "WARM_001", "url": "https://example.com", "goal": "check page"},
+        python_executable="python",
+        session_id="warm-session",
+        timeout_sec=600,
+        env={},
+        runtime_isolation=PERSISTENT_WORKER_COLD_STATE_RUNTIME,
+    )
+
+    assert row["status"] == "SUCCESS"
+    assert row["exit_code"] == 0
+    assert "run_chat_terminal_once" in str(seen["code"])
+
+
 def test_qa_mode_helpers_normalize_and_apply_env() -> None:
     env = {"GAIA_ADAPTIVE_QA": "1", "GAIA_DEEP_ADAPTIVE_QA": "1"}
 
@@ -631,3 +682,79 @@ def test_cancelled_required_human_input_is_normalized_to_blocked_user_action() -
 
     assert row["status"] == BLOCKED_USER_ACTION_STATUS
     assert is_blocked_user_action(row)
+
+
+def test_slot_env_assigns_distinct_openclaw_profiles() -> None:
+    base = {"GAIA_OPENCLAW_PROFILE": "bench"}
+
+    first = _slot_env(base, 1)
+    second = _slot_env(base, 2)
+
+    assert first["GAIA_OPENCLAW_PROFILE"] == "bench-w1"
+    assert second["GAIA_BENCHMARK_SLOT_PROFILE"] == "bench-w2"
+    assert first["GAIA_OPENCLAW_PROFILE"] == runner._worker_env(base, 1)["GAIA_OPENCLAW_PROFILE"]
+    assert second["GAIA_BENCHMARK_SLOT"] == "2"
+    assert base == {"GAIA_OPENCLAW_PROFILE": "bench"}
+    assert _normalize_concurrency("0") == 1
+    assert _normalize_concurrency(64) == 16
+
+
+def test_prewarm_slot_profiles_starts_every_slot_profile(monkeypatch: pytest.MonkeyPatch) -> None:
+    ensured: list[tuple[str, str]] = []
+
+    def _ensure(base_url, *, profile, timeout=None):  # noqa: ANN001
+        ensured.append((base_url, profile))
+        return SimpleNamespace(status_code=500 if profile.endswith("w3") else 200)
+
+    monkeypatch.setattr("gaia.src.phase4.mcp_local_dispatch_runtime.ensure_browser_profile", _ensure)
+    env = {"GAIA_OPENCLAW_PROFILE": "bench", "GAIA_OPENCLAW_BASE_URL": "http://claw.test"}
+
+    outcomes = _prewarm_slot_profiles(env, 3)
+
+    assert ensured == [("http://claw.test", f"bench-w{slot}") for slot in (1, 2, 3)]
+    assert outcomes == {"bench-w1": "ok", "bench-w2": "ok", "bench-w3": "http_500"}
+    assert _prewarm_slot_profiles(env, 1) == {}
+    assert _prewarm_slot_profiles({"GAIA_OPENCLAW_PROFILE": "bench"}, 3) == {}
+
+
+def test_build_child_code_ensures_slot_profile_before_reset() -> None:
+    code = _build_child_code({"id": "S1", "url": "https://example.com", "goal": "check"}, "sid")
+
+    assert "GAIA_BENCHMARK_SLOT_PROFILE" in code
+    assert "ensure_browser_profile" in code
+    assert "profile=slot_profile" in code
+
+
+def test_run_scenario_once_prefixes_live_trace_with_slot(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    seen: dict[str, object] = {}
+
+    class _FakeWorker:
+        def run(self, code, *, env, timeout_sec, on_line=None):
+            if on_line is not None:
+                on_line("--- Step 1 ---")
+                on_line("noise that is not traced")
+            result = {"exit_code": 0, "summary": {"final_status": "SUCCESS"}, "captured_log": ""}
+            return SimpleNamespace(exit_code=0, stdout=json.dumps(result) + "\n", log_lines=[], timed_out=False)
+
+    def _get_worker(**kwargs):  # noqa: ANN003
+        seen.update(kwargs)
+        return _FakeWorker()
+
+    monkeypatch.setattr("scripts.run_goal_benchmark.get_warm_worker", _get_worker)
+
+    row = _run_scenario_once(
+        {"id": "SLOT_001", "url": "https://example.com", "goal": "check page"},
+        python_executable="python",
+        session_id="slot-session",
+        timeout_sec=600,
+        env={},
+        runtime_isolation=PERSISTENT_WORKER_COLD_STATE_RUNTIME,
+        slot=3,
+        trace_prefix="[s3] ",
+    )
+
+    assert row["status"] == "SUCCESS"
+    assert seen["slot"] == "3"
+    assert capsys.readouterr().out == "[s3] --- Step 1 ---\n"
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from gaia.src.phase4.goal_driven.run_history_reader import JsonlTailReader, read_jsonl_rows
+
+
+def _append(path: Path, *rows: dict) -> None:
+    with path.open("a", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def test_reader_parses_only_appended_lines(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    _append(path, {"kind": "goal_start", "run_id": "r1"})
+    reader = JsonlTailReader(path, aggregate=True)
+
+    assert [row["kind"] for row in reader.read()] == ["goal_start"]
+    _append(path, {"kind": "step_outcome", "run_id": "r1", "success": False, "action": "click", "reason_code": "x"})
+    rows = reader.read()
+
+    assert [row["kind"] for row in rows] == ["goal_start", "step_outcome"]
+    assert reader.metrics == {"full_reads": 1, "incremental_reads": 1, "parsed_rows": 2}
+    assert reader.read() == rows
+    assert reader.metrics["parsed_rows"] == 2
+
+
+def test_reader_waits_for_partial_line_and_skips_invalid_rows(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"kind": "a"}\nnot json\n[1, 2]\n{"kind": "b"', encoding="utf-8")
+    reader = JsonlTailReader(path)
+
+    assert [row["kind"] for row in reader.read()] == ["a"]
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write("}\n")
+    assert [row["kind"] for row in reader.read()] == ["a", "b"]
+
+
+def test_reader_restarts_after_rewrite(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    _append(path, {"kind": "old", "run_id": "r1"}, {"kind": "old", "run_id": "r1"})
+    reader = JsonlTailReader(path)
+    assert len(reader.read()) == 2
+
+    path.write_text(json.dumps({"kind": "new", "run_id": "r2", "padding": "x" * 80}) + "\n", encoding="utf-8")
+
+    assert [row["kind"] for row in reader.read()] == ["new"]
+
+
+def test_window_is_bounded_but_aggregates_cover_whole_file(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    _append(
+        path,
+        {"kind": "step_outcome", "run_id": "r1", "success": False, "action": "click", "ref_id": "e1", "reason_code": "not_found"},
+        {"kind": "goal_end", "run_id": "r1", "status": "failed"},
+        {"kind": "step_outcome", "run_id": "r2", "success": False, "action": "click", "ref_id": "e1", "reason_code": "not_found"},
+        {"kind": "step_outcome", "run_id": "r2", "success": True, "action": "fill", "ref_id": "e2"},
+    )
+    reader = JsonlTailReader(path, window_rows=2, aggregate=True)
+
+    window = reader.read()
+
+    assert len(window) == 2
+    assert window.dropped_rows == 2
+    assert window.aggregates is not None
+    assert window.aggregates.last_terminal == {"kind": "goal_end", "run_id": "r1", "status": "failed"}
+    assert window.aggregates.last_progress["action"] == "fill"
+    assert window.aggregates.failure_buckets() == [
+        {"action": "click", "ref_id": "e1", "reason_code": "not_found", "count": 2, "last_run_id": "r2"}
+    ]
+
+
+def test_read_jsonl_rows_returns_empty_for_missing_path(tmp_path: Path) -> None:
+    assert read_jsonl_rows("") == []
+    assert read_jsonl_rows(tmp_path / "missing.jsonl") == []
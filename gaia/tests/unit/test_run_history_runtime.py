@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -19,6 +20,7 @@ from gaia.src.phase4.goal_driven.run_history_runtime import (
     build_run_history_session_replay_context,
     build_run_history_session_summary_context,
     drain_pending_run_history_updates,
+    flush_run_history_writer,
     initialize_run_history,
     list_run_history_pending_updates,
     record_run_history_transcript,
@@ -459,6 +461,7 @@ def test_run_history_decision_update_launches_background_subprocess(monkeypatch,
     monkeypatch.setenv("GAIA_RUN_HISTORY_DIR", str(tmp_path))
     monkeypatch.setenv("GAIA_RUN_HISTORY_ENABLED", "1")
     monkeypatch.setenv("GAIA_RUN_HISTORY_BACKGROUND_SUBPROCESS", "1")
+    monkeypatch.setenv("GAIA_RUN_HISTORY_BACKGROUND_UPDATER", "subprocess")
     from gaia.src.phase4.goal_driven import run_history_runtime as runtime
 
     launches: list[dict[str, object]] = []
@@ -512,6 +515,50 @@ def test_run_history_decision_update_launches_background_subprocess(monkeypatch,
     assert lock_payload["pid"] == 4242
 
 
+def test_run_history_decision_update_drains_on_in_process_worker(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("GAIA_RUN_HISTORY_DIR", str(tmp_path))
+    monkeypatch.setenv("GAIA_RUN_HISTORY_ENABLED", "1")
+    monkeypatch.setenv("GAIA_RUN_HISTORY_BACKGROUND_SUBPROCESS", "1")
+    from gaia.src.phase4.goal_driven import run_history_runtime as runtime
+
+    def _unexpected_popen(*args, **kwargs):
+        raise AssertionError("in-process worker should not spawn a subprocess")
+
+    monkeypatch.setattr(runtime.subprocess, "Popen", _unexpected_popen)
+
+    agent = _HistoryAgent()
+    goal = _build_goal()
+    initialize_run_history(agent, goal)
+    for step in (1, 2):
+        decision = ActionDecision(
+            action=ActionType.CLICK,
+            ref_id=f"e30{step}",
+            element_id=30 + step,
+            reasoning="worker drain test",
+            confidence=0.8,
+        )
+        record_run_history_decision(agent, step_number=step, decision=decision)
+
+    assert runtime.wait_for_run_history_updater_idle(timeout=10.0)
+    run_dir = (
+        tmp_path
+        / "sessions"
+        / agent._run_history_session_key
+        / "runs"
+        / agent._run_history_run_id
+    )
+    compact = (run_dir / "compact.md").read_text(encoding="utf-8")
+    lock_payload = json.loads((run_dir / "updater_lock.json").read_text(encoding="utf-8"))
+    queue_payload = json.loads((run_dir / "updater_queue.json").read_text(encoding="utf-8"))
+
+    assert agent._run_history_background_last_launch_pid == os.getpid()
+    assert agent._run_history_background_last_launch_status in {"queued", "coalesced"}
+    assert "Step 2 | plan | click" in compact
+    assert lock_payload["status"] == "idle"
+    assert lock_payload["owner"] == "artifact_only_worker"
+    assert queue_payload["queue_state"] == "idle"
+
+
 def test_run_history_decision_update_skips_spawn_when_active_lock_exists(monkeypatch, tmp_path) -> None:
     monkeypatch.setenv("GAIA_RUN_HISTORY_DIR", str(tmp_path))
     monkeypatch.setenv("GAIA_RUN_HISTORY_ENABLED", "1")
@@ -647,6 +694,7 @@ def test_run_history_artifact_only_updater_drains_pending_queue_with_snapshot_co
         / "runs"
         / agent._run_history_run_id
     )
+    flush_run_history_writer(agent)
     drained = run_history_artifact_only_updater_pass(str(run_dir))
 
     compact = (run_dir / "compact.md").read_text(encoding="utf-8")
@@ -1364,6 +1412,7 @@ def test_run_history_transcript_persists_to_run_and_session(monkeypatch, tmp_pat
         metadata={"phase": "collect"},
     )
 
+    flush_run_history_writer(agent)
     session_dir = tmp_path / "sessions" / agent._run_history_session_key
     run_dir = session_dir / "runs" / agent._run_history_run_id
     run_transcript = run_dir / "transcript.jsonl"
@@ -1399,6 +1448,7 @@ def test_run_history_transcript_uses_configurable_large_char_limit(monkeypatch,
         metadata={"phase": "collect"},
     )
 
+    flush_run_history_writer(agent)
     session_dir = tmp_path / "sessions" / agent._run_history_session_key
     run_dir = session_dir / "runs" / agent._run_history_run_id
     run_transcript = run_dir / "transcript.jsonl"
@@ -1819,3 +1869,23 @@ def test_run_history_retrieval_prefers_recent_attempts_and_latest_prior_run(monk
     assert lines
     assert "empty_pr_list" in lines[0] or "Recent Attempts" in lines[0]
     assert not any("older_noise" in line for line in lines[:1])
+
+
+def test_outcome_line_signals_skip_nested_dom_delta() -> None:
+    from gaia.src.phase4.goal_driven.run_history_runtime import _render_outcome_line
+
+    line = _render_outcome_line(
+        {
+            "step": 3,
+            "action": "click",
+            "status": "ok",
+            "state_change": {
+                "dom_delta": {"structure_changed": True, "inserted_refs": ["e3"]},
+                "dom_changed": True,
+                "url_changed": True,
+            },
+        }
+    )
+
+    assert "signals=dom_changed,url_changed" in line
+    assert "dom_delta" not in line
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import threading
+
+from gaia.src.phase4.goal_driven.run_history_updater_worker import CoalescingUpdaterWorker
+
+
+def test_worker_merges_waiting_triggers_per_key() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[tuple[str, str]] = []
+
+    def _handler(key: str, reason: str) -> None:
+        calls.append((key, reason))
+        if key == "blocker":
+            started.set()
+            release.wait(5.0)
+
+    worker = CoalescingUpdaterWorker(_handler)
+    assert worker.submit("blocker", "first")
+    assert started.wait(5.0)
+    assert worker.submit("run-a", "decision")
+    assert not worker.submit("run-a", "step_outcome")
+    assert worker.submit("run-b", "decision")
+    release.set()
+
+    assert worker.wait_idle(5.0)
+    assert calls == [("blocker", "first"), ("run-a", "step_outcome"), ("run-b", "decision")]
+    assert worker.metrics["coalesced"] == 1
+    assert worker.metrics["passes"] == 3
+    worker.stop()
+
+
+def test_worker_reruns_key_submitted_while_in_flight_and_survives_errors() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def _handler(key: str, reason: str) -> None:
+        calls.append(reason)
+        if reason == "first":
+            started.set()
+            release.wait(5.0)
+            raise RuntimeError("boom")
+
+    worker = CoalescingUpdaterWorker(_handler)
+    worker.submit("run-a", "first")
+    assert started.wait(5.0)
+    assert worker.submit("run-a", "second")
+    release.set()
+
+    assert worker.wait_idle(5.0)
+    assert calls == ["first", "second"]
+    assert worker.metrics["errors"] == 1
+    assert worker.last_error == "RuntimeError: boom"
+    worker.stop()
+    assert not worker.submit("run-a", "after_stop")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from gaia.src.phase4.goal_driven.run_history_runtime import (
+    _append_event,
+    _load_events,
+    close_run_history_writer,
+)
+from gaia.src.phase4.goal_driven.run_history_writer import RunHistoryWriter
+
+
+def _lines(path: Path) -> list[dict]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line]
+
+
+def test_writer_buffers_until_flush_and_dedupes_paths(tmp_path: Path) -> None:
+    run_path = tmp_path / "run" / "events.jsonl"
+    session_path = tmp_path / "session" / "events.jsonl"
+    writer = RunHistoryWriter(flush_interval_sec=60, flush_bytes=1 << 20)
+
+    writer.append([str(run_path), str(session_path), str(run_path)], json.dumps({"kind": "a"}))
+    writer.append([str(run_path), str(session_path)], json.dumps({"kind": "b"}))
+    assert _lines(run_path) == []
+
+    writer.flush(fsync=False)
+    assert [row["kind"] for row in _lines(run_path)] == ["a", "b"]
+    assert [row["kind"] for row in _lines(session_path)] == ["a", "b"]
+    assert writer.metrics["opens"] == 2
+    assert writer.metrics["fsyncs"] == 0
+    writer.close()
+
+
+def test_writer_flushes_on_size_durable_event_and_timer(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    writer = RunHistoryWriter(flush_interval_sec=0.05, flush_bytes=32)
+
+    writer.append([str(path)], json.dumps({"kind": "x", "pad": "y" * 40}))
+    assert len(_lines(path)) == 1
+    writer.append([str(path)], json.dumps({"kind": "goal_end"}), durable=True)
+    assert len(_lines(path)) == 2
+    assert writer.metrics["fsyncs"] >= 2
+
+    writer.append([str(path)], json.dumps({"kind": "late"}))
+    deadline = time.monotonic() + 2.0
+    while len(_lines(path)) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _lines(path)[-1] == {"kind": "late"}
+    writer.close()
+
+
+def test_load_events_sees_buffered_rows(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("GAIA_RUN_HISTORY_FLUSH_INTERVAL_SEC", "60")
+    agent = SimpleNamespace(
+        _run_history_enabled=True,
+        _run_history_events_path=str(tmp_path / "run" / "events.jsonl"),
+        _run_history_session_events_path=str(tmp_path / "session" / "events.jsonl"),
+    )
+
+    _append_event(agent, {"kind": "decision", "step": 1})
+    assert [row["kind"] for row in _load_events(agent)] == ["decision"]
+
+    _append_event(agent, {"kind": "goal_end", "status": "success"}, durable=True)
+    close_run_history_writer(agent)
+    assert [row["kind"] for row in _lines(tmp_path / "run" / "events.jsonl")] == ["decision", "goal_end"]
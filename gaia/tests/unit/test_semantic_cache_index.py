@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from gaia.src.phase4.goal_driven import exploration_cache_runtime as cache_runtime
+from gaia.src.phase4.goal_driven.semantic_cache_index import SemanticCacheIndex, open_semantic_cache
+
+
+def _vec(index: int, dim: int = 128) -> list[float]:
+    vector = [0.0] * dim
+    vector[index] = 1.0
+    return vector
+
+
+def test_lookup_is_partitioned_by_signature_and_thresholded() -> None:
+    index = SemanticCacheIndex(capacity=10)
+    index.store(_vec(1), "click-a", "sig-a")
+    index.store(_vec(2), "click-b", "sig-b")
+
+    assert index.lookup(_vec(1), "sig-a") == ("click-a", 1.0)
+    assert index.lookup(_vec(1), "sig-b")[0] is None
+    assert index.lookup(_vec(3), "sig-a")[0] is None
+    assert index.stats() == {"entries": 2, "partitions": 2, "capacity": 10}
+
+
+def test_capacity_evicts_least_recently_used_entry() -> None:
+    index = SemanticCacheIndex(capacity=2)
+    index.store(_vec(1), "first", "sig")
+    index.store(_vec(2), "second", "sig")
+    assert index.lookup(_vec(1), "sig")[0] == "first"
+
+    index.store(_vec(3), "third", "sig")
+
+    assert len(index) == 2
+    assert index.lookup(_vec(2), "sig")[0] is None
+    assert index.lookup(_vec(1), "sig")[0] == "first"
+    assert index.lookup(_vec(3), "sig")[0] == "third"
+
+
+def test_ttl_drops_expired_entries(monkeypatch) -> None:
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("gaia.src.phase4.goal_driven.semantic_cache_index.time.time", lambda: clock["now"])
+    index = SemanticCacheIndex(capacity=10, ttl_seconds=60)
+    index.store(_vec(1), "stale", "sig")
+
+    clock["now"] += 120
+
+    assert index.lookup(_vec(1), "sig")[0] is None
+    assert len(index) == 0
+
+
+def test_sqlite_persistence_survives_reopen_and_imports_legacy_json(tmp_path) -> None:
+    legacy = tmp_path / "semantic_llm_cache.json"
+    legacy.write_text(
+        json.dumps([{"embedding": _vec(4), "response": "legacy", "signature": "sig", "text": "t"}]),
+        encoding="utf-8",
+    )
+    db_path = tmp_path / "semantic_llm_cache.sqlite3"
+
+    index = open_semantic_cache(db_path, legacy_json_path=legacy)
+    index.store(_vec(5), "fresh", "sig")
+    index.close()
+
+    reopened = open_semantic_cache(db_path, legacy_json_path=legacy)
+    assert len(reopened) == 2
+    assert reopened.lookup(_vec(4), "sig")[0] == "legacy"
+    assert reopened.lookup(_vec(5), "sig")[0] == "fresh"
+    reopened.close()
+
+
+def test_runtime_helpers_round_trip_through_agent_index() -> None:
+    logs: list[str] = []
+    agent = SimpleNamespace(_semantic_cache=SemanticCacheIndex(capacity=10), _log=logs.append)
+
+    assert cache_runtime.semantic_cache_lookup(agent, "login button submit", "sig") is None
+    cache_runtime.semantic_cache_store(agent, "login button submit", '{"action": 1}', "sig")
+
+    assert cache_runtime.semantic_cache_lookup(agent, "login button submit", "sig") == '{"action": 1}'
+    assert cache_runtime.semantic_cache_lookup(agent, "login button submit", "other") is None
+    assert any("시맨틱 캐시 hit" in line for line in logs)
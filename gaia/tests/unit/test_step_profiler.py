@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from gaia.src.phase4.goal_driven import step_profiler
+from gaia.src.phase4.goal_driven.step_profiler import StepProfiler, finalize_step_profile, profile_phase
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance_ms(self, value: float) -> None:
+        self.now += value / 1000.0
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(step_profiler.time, "perf_counter", fake)
+    return fake
+
+
+def test_nested_phases_report_self_time_and_other(clock) -> None:
+    profiler = StepProfiler()
+    profiler.begin_step(1)
+    with profiler.phase("post_action_probe"):
+        clock.advance_ms(10)
+        with profiler.phase("snapshot"):
+            clock.advance_ms(30)
+    with profiler.phase("snapshot"):
+        clock.advance_ms(5)
+    clock.advance_ms(7)
+    profiler.end_step()
+
+    step = profiler.steps[0]
+    assert step["total_ms"] == 52
+    assert step["phases"] == {"post_action_probe": 10, "snapshot": 35, "other": 7}
+
+
+def test_summary_reports_percentiles_per_phase(clock) -> None:
+    profiler = StepProfiler()
+    for step_number, llm_ms in enumerate([10, 20, 30, 40, 100], start=1):
+        profiler.begin_step(step_number)
+        with profiler.phase("llm_call"):
+            clock.advance_ms(llm_ms)
+    profiler.end_step()
+
+    summary = profiler.summary()
+    assert summary["llm_call"]["count"] == 5
+    assert summary["llm_call"]["p50_ms"] == 30
+    assert summary["llm_call"]["p95_ms"] == 100
+    assert summary["step_total"]["total_ms"] == 200
+
+
+def test_phases_from_other_threads_are_ignored(clock) -> None:
+    profiler = StepProfiler()
+    profiler.begin_step(1)
+
+    def _worker() -> None:
+        with profiler.phase("snapshot"):
+            clock.advance_ms(50)
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join()
+    profiler.end_step()
+
+    assert "snapshot" not in profiler.steps[0]["phases"]
+
+
+def test_profile_phase_is_noop_without_profiler() -> None:
+    agent = SimpleNamespace()
+    with profile_phase(agent, "snapshot"):
+        pass
+    assert finalize_step_profile(agent) is None
+
+
+def test_finalize_writes_profile_into_run_history_dir(clock, tmp_path) -> None:
+    logs: list[str] = []
+    agent = SimpleNamespace(_run_history_dir=str(tmp_path), _log=logs.append)
+    agent._step_profiler = StepProfiler()
+    agent._step_profiler.begin_step(1)
+    with profile_phase(agent, "action_dispatch"):
+        clock.advance_ms(12)
+
+    payload = finalize_step_profile(agent)
+
+    written = json.loads((tmp_path / "step_profile.json").read_text(encoding="utf-8"))
+    assert written == payload == agent._last_step_profile
+    assert written["step_count"] == 1
+    assert written["summary"]["action_dispatch"]["p95_ms"] == 12
+    assert any("step profile" in line for line in logs)
+
+
+def test_profile_payload_reports_openclaw_transport_delta(clock, monkeypatch) -> None:
+    counters = {"requests": 5, "new_connections": 2, "reused_connections": 3, "active_sessions": 1}
+    monkeypatch.setattr(step_profiler, "_openclaw_transport_stats", lambda: dict(counters))
+    profiler = StepProfiler()
+    assert "openclaw_transport" not in profiler.to_payload()
+
+    counters.update(requests=9, new_connections=3, reused_connections=6, active_sessions=2)
+
+    assert profiler.to_payload()["openclaw_transport"] == {
+        "requests": 4,
+        "new_connections": 1,
+        "reused_connections": 3,
+        "active_sessions": 2,
+    }
@@ -7,15 +7,18 @@ import io
 import json
 import mimetypes
 import os
+import queue
 import re
 import shutil
 import statistics
 import subprocess
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
@@ -41,6 +44,8 @@ from scripts.benchmark_blocking import (
 from scripts.runner_identity import resolve_runner_id
 from gaia.src.battle_board import write_battle_board
 from gaia.harness.benchmark_policy import apply_benchmark_success_policy
+from gaia.harness.runner import worker_profile_name
+from gaia.harness.warm_worker import PERSISTENT_WORKER_RUNTIME, get_warm_worker
 
 _MIN_BENCHMARK_TIMEOUT_SEC = 600
 _MIN_CODEX_EXEC_TIMEOUT_SEC = 180
@@ -59,13 +64,17 @@ QA_MODE_CHOICES = (
 COLD_PROCESS_RUNTIME = "cold-process"
 WARM_PROCESS_COLD_STATE_RUNTIME = "warm-process-cold-state"
 WARM_PROCESS_WARM_STATE_RUNTIME = "warm-process-warm-state"
+PERSISTENT_WORKER_COLD_STATE_RUNTIME = PERSISTENT_WORKER_RUNTIME
 RUNTIME_ISOLATION_CHOICES = (
     COLD_PROCESS_RUNTIME,
     WARM_PROCESS_COLD_STATE_RUNTIME,
     WARM_PROCESS_WARM_STATE_RUNTIME,
+    PERSISTENT_WORKER_COLD_STATE_RUNTIME,
 )
 _DEFAULT_RUNTIME_ISOLATION = WARM_PROCESS_COLD_STATE_RUNTIME
 _DEFAULT_BATTLE_SCREENSHOT_MAX_BYTES = 850_000
+_MAX_BENCHMARK_CONCURRENCY = 16
+_LIVE_TRACE_LOCK = threading.Lock()
 _LIVE_TRACE_MARKERS = (
     "🎯 목표 시작",
     "--- Step ",
@@ -137,6 +146,53 @@ def _should_emit_live_trace_line(line: str) -> bool:
     return False
 
 
+def _emit_live_trace_line(line: str, prefix: str = "") -> None:
+    # 동시 실행 슬롯의 trace 줄이 섞이지 않도록 한 줄 단위로 직렬화
+    with _LIVE_TRACE_LOCK:
+        sys.stdout.write(f"{prefix}{line}\n")
+        sys.stdout.flush()
+
+
+def _normalize_concurrency(value: Any) -> int:
+    try:
+        concurrency = int(value or 1)
+    except Exception:
+        return 1
+    return max(1, min(concurrency, _MAX_BENCHMARK_CONCURRENCY))
+
+
+def _slot_env(env: Dict[str, str], slot: int) -> Dict[str, str]:
+    """Give each concurrent slot its own OpenClaw profile so browser state never collides."""
+    slot_env = dict(env)
+    slot_profile = worker_profile_name(slot_env, slot)
+    slot_env["GAIA_OPENCLAW_PROFILE"] = slot_profile
+    slot_env["GAIA_BENCHMARK_SLOT_PROFILE"] = slot_profile
+    slot_env["GAIA_BENCHMARK_SLOT"] = str(slot)
+    return slot_env
+
+
+def _prewarm_slot_profiles(env: Dict[str, str], concurrency: int) -> Dict[str, str]:
+    """Start every slot profile before fan-out so no scenario pays the profile cold start."""
+    base_url = str(env.get("GAIA_OPENCLAW_BASE_URL") or env.get("MCP_HOST_URL") or "").strip()
+    if concurrency <= 1 or not base_url:
+        # 기준 URL이 없으면 child가 첫 시나리오에서 직접 프로필을 보장한다
+        return {}
+    from gaia.src.phase4.mcp_local_dispatch_runtime import ensure_browser_profile
+
+    outcomes: Dict[str, str] = {}
+    for slot in range(1, concurrency + 1):
+        profile = worker_profile_name(env, slot)
+        try:
+            result = ensure_browser_profile(base_url, profile=profile, timeout=(3, 30))
+            outcomes[profile] = "ok" if int(result.status_code) < 400 else f"http_{result.status_code}"
+        except Exception as exc:
+            outcomes[profile] = f"error: {exc}"
+    failed = {name: outcome for name, outcome in outcomes.items() if outcome != "ok"}
+    if failed:
+        print(f"⚠️ slot profile prewarm failed; those slots start cold: {failed}", flush=True)
+    return outcomes
+
+
 def _tail_text(text: str, *, max_lines: int = 20, max_chars: int = 4000) -> str:
     lines = str(text or "").splitlines()
     tail = "\n".join(lines[-max(1, int(max_lines)):]).strip()
@@ -188,6 +244,11 @@ def _normalize_runtime_isolation(value: str | None) -> str:
         "warm-state": WARM_PROCESS_WARM_STATE_RUNTIME,
         "warm-process-warm-state": WARM_PROCESS_WARM_STATE_RUNTIME,
         "demo": WARM_PROCESS_WARM_STATE_RUNTIME,
+        "worker": PERSISTENT_WORKER_COLD_STATE_RUNTIME,
+        "warm-worker": PERSISTENT_WORKER_COLD_STATE_RUNTIME,
+        "persistent": PERSISTENT_WORKER_COLD_STATE_RUNTIME,
+        "persistent-worker": PERSISTENT_WORKER_COLD_STATE_RUNTIME,
+        "persistent-worker-cold-state": PERSISTENT_WORKER_COLD_STATE_RUNTIME,
         "cold": COLD_PROCESS_RUNTIME,
         "cold-process": COLD_PROCESS_RUNTIME,
         "legacy": COLD_PROCESS_RUNTIME,
@@ -199,11 +260,19 @@ def _runtime_uses_warm_process(runtime_isolation: str) -> bool:
     return _normalize_runtime_isolation(runtime_isolation) in {
         WARM_PROCESS_COLD_STATE_RUNTIME,
         WARM_PROCESS_WARM_STATE_RUNTIME,
+        PERSISTENT_WORKER_COLD_STATE_RUNTIME,
     }
 
 
 def _runtime_uses_cold_state(runtime_isolation: str) -> bool:
-    return _normalize_runtime_isolation(runtime_isolation) == WARM_PROCESS_COLD_STATE_RUNTIME
+    return _normalize_runtime_isolation(runtime_isolation) in {
+        WARM_PROCESS_COLD_STATE_RUNTIME,
+        PERSISTENT_WORKER_COLD_STATE_RUNTIME,
+    }
+
+
+def _runtime_uses_persistent_worker(runtime_isolation: str) -> bool:
+    return _normalize_runtime_isolation(runtime_isolation) == PERSISTENT_WORKER_COLD_STATE_RUNTIME
 
 
 def _build_runtime_policy(runtime_isolation: str) -> Dict[str, Any]:
@@ -212,6 +281,7 @@ def _build_runtime_policy(runtime_isolation: str) -> Dict[str, Any]:
         "runtime_isolation": normalized,
         "warm_process": _runtime_uses_warm_process(normalized),
         "cold_state_reset": _runtime_uses_cold_state(normalized),
+        "persistent_worker": _runtime_uses_persistent_worker(normalized),
         "openclaw": {
             "prewarmed": False,
             "base_url": "",
@@ -317,6 +387,17 @@ if constraints.get('requires_test_credentials'):
 prepared_goal.test_data = goal_test_data
 runtime_reset = {{}}
 runtime_cleanup = {{}}
+slot_profile = str(os.getenv('GAIA_BENCHMARK_SLOT_PROFILE') or '').strip()
+if slot_profile:
+    try:
+        from gaia.src.phase4.mcp_local_dispatch_runtime import ensure_browser_profile
+        ensure_browser_profile(
+            os.getenv('GAIA_OPENCLAW_BASE_URL') or os.getenv('MCP_HOST_URL') or '',
+            profile=slot_profile,
+            timeout=(3, 30),
+        )
+    except Exception:
+        pass
 def _reset_scenario_state_if_enabled():
     if str(os.getenv('GAIA_BENCHMARK_COLD_STATE_RESET') or '').strip() != '1':
         return {{}}
@@ -326,6 +407,7 @@ def _reset_scenario_state_if_enabled():
             os.getenv('GAIA_OPENCLAW_BASE_URL') or os.getenv('MCP_HOST_URL') or '',
             session_id=f"{{session_id}}:reset",
             url=str(scenario.get('url') or ''),
+            profile=slot_profile,
             timeout=(3, 20),
         )
         payload = dict(getattr(result, 'payload', {{}}) or {{}})
@@ -433,10 +515,42 @@ def _run_scenario_once(
     timeout_sec: int,
     env: Dict[str, str],
     qa_mode: str | None = None,
+    runtime_isolation: str | None = None,
+    slot: int = 0,
+    trace_prefix: str = "",
 ) -> Dict[str, Any]:
     scenario_env = _prepare_scenario_env(env, timeout_sec)
     code = _build_child_code(scenario, session_id, qa_mode=qa_mode)
     started = time.monotonic()
+    if runtime_isolation is None:
+        runtime_isolation = scenario_env.get("GAIA_BENCHMARK_RUNTIME_ISOLATION")
+    if _runtime_uses_persistent_worker(runtime_isolation or ""):
+        stdout_lines, return_code, timed_out = _run_child_code_in_warm_worker(
+            code,
+            python_executable=python_executable,
+            env=scenario_env,
+            timeout_sec=timeout_sec,
+            slot=slot,
+            trace_prefix=trace_prefix,
+        )
+        if timed_out:
+            return normalize_blocked_user_action_row({
+                "scenario_id": scenario.get("id"),
+                "goal": scenario.get("goal"),
+                "status": "FAIL",
+                "reason": f"benchmark_timeout({timeout_sec}s)",
+                "exit_code": 124,
+                "duration_seconds": round(time.monotonic() - started, 2),
+                "summary": {},
+                "captured_log": "\n".join(stdout_lines),
+            })
+        duration = round(time.monotonic() - started, 2)
+        return _scenario_row_from_child_output(
+            scenario,
+            stdout_lines=stdout_lines,
+            return_code=return_code,
+            duration=duration,
+        )
     try:
         proc = subprocess.Popen(
             [python_executable, "-u", "-c", code],
@@ -462,7 +576,7 @@ def _run_scenario_once(
             line = str(raw_line or "").rstrip("\n")
             stdout_lines.append(line)
             if _should_emit_live_trace_line(line):
-                print(line, flush=True)
+                _emit_live_trace_line(line, trace_prefix)
         return_code = proc.wait(timeout=max(1, timeout_sec - int(time.monotonic() - started)))
         duration = round(time.monotonic() - started, 2)
     except subprocess.TimeoutExpired as exc:
@@ -480,7 +594,41 @@ def _run_scenario_once(
             "summary": {},
             "captured_log": str(exc.stdout or "") + str(exc.stderr or ""),
         })
+    return _scenario_row_from_child_output(
+        scenario,
+        stdout_lines=stdout_lines,
+        return_code=return_code,
+        duration=duration,
+    )
+
+
+def _run_child_code_in_warm_worker(
+    code: str,
+    *,
+    python_executable: str,
+    env: Dict[str, str],
+    timeout_sec: int,
+    slot: int = 0,
+    trace_prefix: str = "",
+) -> tuple[List[str], int, bool]:
+    worker = get_warm_worker(python_executable=python_executable, slot=str(slot), env=env)
+
+    def _emit(line: str) -> None:
+        if _should_emit_live_trace_line(line):
+            _emit_live_trace_line(line, trace_prefix)
+
+    result = worker.run(code, env=env, timeout_sec=timeout_sec, on_line=_emit)
+    stdout_lines = [*result.log_lines, *str(result.stdout or "").splitlines()]
+    return stdout_lines, int(result.exit_code), bool(result.timed_out)
 
+
+def _scenario_row_from_child_output(
+    scenario: Dict[str, Any],
+    *,
+    stdout_lines: List[str],
+    return_code: int,
+    duration: float,
+) -> Dict[str, Any]:
     stdout = "\n".join(stdout_lines).strip()
     stderr = ""
     payload: Dict[str, Any] = {}
@@ -962,6 +1110,14 @@ def _safe_int(value: Any, default: int) -> int:
     return parsed if parsed > 0 else default
 
 
+def _safe_float(value: Any, default: float = 0.0) -> float:
+    try:
+        parsed = float(value)
+    except Exception:
+        return default
+    return parsed if parsed > 0 else default
+
+
 def _base64_size(data: str) -> int:
     clean = str(data or "").strip()
     if "," in clean and clean.startswith("data:image/"):
@@ -1140,6 +1296,24 @@ def main() -> int:
             "but clears cookies/localStorage/sessionStorage per scenario."
         ),
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=_safe_int(os.getenv("GAIA_BENCHMARK_CONCURRENCY"), 1),
+        help=(
+            "Run up to N scenarios at once. Each slot gets its own OpenClaw profile "
+            "and prefixes its live trace lines with [sN]."
+        ),
+    )
+    parser.add_argument(
+        "--llm-rate-limit",
+        type=float,
+        default=0.0,
+        help=(
+            "Global cap on LLM calls per minute shared by all concurrent scenarios. "
+            "Defaults to GAIA_LLM_RATE_LIMIT_PER_MIN; 0 disables pacing."
+        ),
+    )
     parser.add_argument(
         "--push-metrics",
         action="store_true",
@@ -1181,6 +1355,7 @@ def main() -> int:
     benchmark_mode = _benchmark_mode_label(normalized_qa_mode)
     runtime_isolation = _normalize_runtime_isolation(args.runtime_isolation)
     runtime_policy = _build_runtime_policy(runtime_isolation)
+    concurrency = _normalize_concurrency(args.concurrency)
 
     started_at = datetime.now().astimezone()
     run_id = f"{Path(args.suite).stem}_{started_at.strftime('%Y%m%d_%H%M%S')}"
@@ -1203,6 +1378,12 @@ def main() -> int:
     env.setdefault("GAIA_RAIL_ENABLED", "0")
     env["GAIA_BENCHMARK_RUNTIME_ISOLATION"] = runtime_isolation
     env["GAIA_BENCHMARK_COLD_STATE_RESET"] = "1" if _runtime_uses_cold_state(runtime_isolation) else "0"
+    if args.llm_rate_limit and float(args.llm_rate_limit) > 0:
+        env["GAIA_LLM_RATE_LIMIT_PER_MIN"] = str(float(args.llm_rate_limit))
+    llm_rate_limit = _safe_float(env.get("GAIA_LLM_RATE_LIMIT_PER_MIN"))
+    llm_rate_limit_state = output_dir / "llm_rate_limit.sqlite3"
+    if llm_rate_limit > 0:
+        env["GAIA_LLM_RATE_LIMIT_STATE"] = str(llm_rate_limit_state)
     _populate_provider_credentials(env, provider)
     credential_error = _provider_credential_error(provider, env)
     if credential_error:
@@ -1257,82 +1438,131 @@ def main() -> int:
 
     runtime_policy = _prewarm_benchmark_runtime(runtime_isolation, env)
 
-    rows: List[Dict[str, Any]] = []
-    for repeat_idx in range(1, repeats + 1):
-        for idx, scenario in enumerate(scenarios, start=1):
-            sid = f"{args.session_prefix}_{Path(args.suite).stem}_{repeat_idx}_{idx}"
-            scenario_budget = int(scenario.get("time_budget_sec") or 600)
-            budget = _resolve_scenario_timeout_budget(
-                scenario_budget=scenario_budget,
-                timeout_cap=timeout_cap,
-                timeout_floor=_MIN_BENCHMARK_TIMEOUT_SEC,
+    jobs = [
+        (repeat_idx, idx, scenario)
+        for repeat_idx in range(1, repeats + 1)
+        for idx, scenario in enumerate(scenarios, start=1)
+    ]
+    concurrency = min(concurrency, max(1, len(jobs)))
+    if concurrency > 1:
+        print(f"⚡ concurrency: {concurrency} slots (llm_rate_limit={llm_rate_limit or '-'}/min)", flush=True)
+        runtime_policy["slot_profiles"] = _prewarm_slot_profiles(env, concurrency)
+    free_slots: "queue.Queue[int]" = queue.Queue()
+    for slot in range(1, concurrency + 1):
+        free_slots.put(slot)
+
+    def _run_job(job_index: int) -> Dict[str, Any]:
+        repeat_idx, idx, scenario = jobs[job_index]
+        sid = f"{args.session_prefix}_{Path(args.suite).stem}_{repeat_idx}_{idx}"
+        scenario_budget = int(scenario.get("time_budget_sec") or 600)
+        budget = _resolve_scenario_timeout_budget(
+            scenario_budget=scenario_budget,
+            timeout_cap=timeout_cap,
+            timeout_floor=_MIN_BENCHMARK_TIMEOUT_SEC,
+        )
+        slot = free_slots.get()
+        trace_prefix = f"[s{slot}] " if concurrency > 1 else ""
+        try:
+            _emit_live_trace_line(
+                f"[{repeat_idx}/{repeats}] {idx}/{len(scenarios)} {scenario.get('id')} ...",
+                trace_prefix,
             )
-            print(f"[{repeat_idx}/{repeats}] {idx}/{len(scenarios)} {scenario.get('id')} ...", flush=True)
             row = _run_scenario_once(
                 scenario,
                 python_executable=sys.executable,
                 session_id=sid,
                 timeout_sec=budget,
-                env=env,
+                env=_slot_env(env, slot) if concurrency > 1 else env,
                 qa_mode=normalized_qa_mode,
+                runtime_isolation=runtime_isolation,
+                slot=slot if concurrency > 1 else 0,
+                trace_prefix=trace_prefix,
             )
-            row["repeat"] = repeat_idx
-            row["provider"] = provider
-            row["model"] = str(args.model)
-            row["runner_id"] = runner_id
-            row["qa_mode"] = normalized_qa_mode or "off"
-            row["benchmark_mode"] = benchmark_mode
-            row["runtime_isolation"] = runtime_isolation
-            row["runtime_policy"] = {
-                "warm_process": bool(runtime_policy.get("warm_process")),
-                "cold_state_reset": bool(runtime_policy.get("cold_state_reset")),
-                "openclaw_prewarmed": bool((runtime_policy.get("openclaw") or {}).get("prewarmed"))
-                if isinstance(runtime_policy.get("openclaw"), dict)
-                else False,
+        finally:
+            free_slots.put(slot)
+        if concurrency > 1:
+            row["concurrency_slot"] = slot
+        return row
+
+    def _finalize_row(job_index: int, row: Dict[str, Any]) -> None:
+        nonlocal battle_board_info
+        repeat_idx, _idx, scenario = jobs[job_index]
+        row["repeat"] = repeat_idx
+        row["provider"] = provider
+        row["model"] = str(args.model)
+        row["runner_id"] = runner_id
+        row["qa_mode"] = normalized_qa_mode or "off"
+        row["benchmark_mode"] = benchmark_mode
+        row["runtime_isolation"] = runtime_isolation
+        row["runtime_policy"] = {
+            "warm_process": bool(runtime_policy.get("warm_process")),
+            "cold_state_reset": bool(runtime_policy.get("cold_state_reset")),
+            "persistent_worker": bool(runtime_policy.get("persistent_worker")),
+            "openclaw_prewarmed": bool((runtime_policy.get("openclaw") or {}).get("prewarmed"))
+            if isinstance(runtime_policy.get("openclaw"), dict)
+            else False,
+        }
+        try:
+            scenario_max_steps = int(scenario.get("max_steps") or 0)
+        except Exception:
+            scenario_max_steps = 0
+        row["max_steps"] = scenario_max_steps or max_steps_override or None
+        row["constraints"] = scenario.get("constraints") if isinstance(scenario.get("constraints"), dict) else {}
+        row["expected_signals"] = scenario.get("expected_signals") if isinstance(scenario.get("expected_signals"), list) else []
+        row["trace_metrics"] = _extract_trace_metrics(row)
+        completed_rows.append(row)
+        if battle_board_enabled:
+            partial_summary = {
+                "schema_version": "gaia.benchmark.v1",
+                "suite_id": suite.get("suite_id") or suite_path.stem,
+                "site": suite.get("site") or {},
+                "started_at": started_at.isoformat(),
+                "repeats": repeats,
+                "scenario_count": len(scenarios),
+                "provider": provider,
+                "model": args.model,
+                "runner_id": runner_id,
+                "qa_mode": normalized_qa_mode or "off",
+                "benchmark_mode": benchmark_mode,
+                "runtime_isolation": runtime_isolation,
+                "metrics": _compute_metrics(completed_rows, repeats),
+                "trace_metrics": _compute_trace_metrics(completed_rows),
+                "status_counts": dict(Counter(str(r.get("status") or "UNKNOWN") for r in completed_rows)),
             }
-            try:
-                scenario_max_steps = int(scenario.get("max_steps") or 0)
-            except Exception:
-                scenario_max_steps = 0
-            row["max_steps"] = scenario_max_steps or max_steps_override or None
-            row["constraints"] = scenario.get("constraints") if isinstance(scenario.get("constraints"), dict) else {}
-            row["expected_signals"] = scenario.get("expected_signals") if isinstance(scenario.get("expected_signals"), list) else []
-            row["trace_metrics"] = _extract_trace_metrics(row)
-            rows.append(row)
-            if battle_board_enabled:
-                partial_summary = {
-                    "schema_version": "gaia.benchmark.v1",
-                    "suite_id": suite.get("suite_id") or suite_path.stem,
-                    "site": suite.get("site") or {},
-                    "started_at": started_at.isoformat(),
-                    "repeats": repeats,
-                    "scenario_count": len(scenarios),
-                    "provider": provider,
-                    "model": args.model,
-                    "runner_id": runner_id,
-                    "qa_mode": normalized_qa_mode or "off",
-                    "benchmark_mode": benchmark_mode,
-                    "runtime_isolation": runtime_isolation,
-                    "metrics": _compute_metrics(rows, repeats),
-                    "trace_metrics": _compute_trace_metrics(rows),
-                    "status_counts": dict(Counter(str(r.get("status") or "UNKNOWN") for r in rows)),
-                }
-                battle_board_info = _try_write_battle_board(output_dir, summary=partial_summary, rows=rows)
-                if battle_board_info and len(rows) == 1:
-                    print(f"battle_board: {battle_board_info.get('url')}", flush=True)
-            if battle_upload_config:
-                upload_summary = {
-                    "battle_board": battle_board_info,
-                    "suite_id": suite.get("suite_id") or suite_path.stem,
-                }
-                upload_payload = _build_battle_upload_payload(
-                    config=battle_upload_config,
-                    row=row,
-                    scenario=scenario,
-                    summary=upload_summary,
-                )
-                if _try_upload_battle_record(battle_upload_config, upload_payload):
-                    print(f"battle_upload: {battle_upload_config['session_id']} {row.get('scenario_id')}", flush=True)
+            battle_board_info = _try_write_battle_board(output_dir, summary=partial_summary, rows=completed_rows)
+            if battle_board_info and len(completed_rows) == 1:
+                print(f"battle_board: {battle_board_info.get('url')}", flush=True)
+        if battle_upload_config:
+            upload_summary = {
+                "battle_board": battle_board_info,
+                "suite_id": suite.get("suite_id") or suite_path.stem,
+            }
+            upload_payload = _build_battle_upload_payload(
+                config=battle_upload_config,
+                row=row,
+                scenario=scenario,
+                summary=upload_summary,
+            )
+            if _try_upload_battle_record(battle_upload_config, upload_payload):
+                print(f"battle_upload: {battle_upload_config['session_id']} {row.get('scenario_id')}", flush=True)
+
+    job_rows: List[Dict[str, Any]] = [{} for _ in jobs]
+    completed_rows: List[Dict[str, Any]] = []
+    if concurrency <= 1:
+        for job_index in range(len(jobs)):
+            job_rows[job_index] = _run_job(job_index)
+            _finalize_row(job_index, job_rows[job_index])
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="gaia-bench") as executor:
+            futures = {executor.submit(_run_job, job_index): job_index for job_index in range(len(jobs))}
+            for future in as_completed(futures):
+                job_index = futures[future]
+                job_rows[job_index] = future.result()
+                _finalize_row(job_index, job_rows[job_index])
+    # 결과 파일은 완료 순서와 무관하게 repeat/scenario 순서를 유지
+    rows = job_rows
+    if llm_rate_limit > 0:
+        llm_rate_limit_state.unlink(missing_ok=True)
 
     metrics = _compute_metrics(rows, repeats)
     kpi_metrics = _compute_kpi_metrics(rows, repeats)
@@ -1353,6 +1583,8 @@ def main() -> int:
         "benchmark_mode": benchmark_mode,
         "runtime_isolation": runtime_isolation,
         "runtime_policy": runtime_policy,
+        "concurrency": concurrency,
+        "llm_rate_limit_per_min": llm_rate_limit or None,
         "max_steps_override": max_steps_override or None,
         "metrics": metrics,
         "kpi_metrics": kpi_metrics,
@@ -1397,6 +1629,7 @@ def main() -> int:
     md.write(f"- qa_mode: {normalized_qa_mode or 'off'}\n")
     md.write(f"- benchmark_mode: {benchmark_mode}\n")
     md.write(f"- runtime_isolation: {runtime_isolation}\n")
+    md.write(f"- concurrency: {concurrency}\n")
     md.write(f"- max_steps_override: {max_steps_override or '-'}\n")
     summary_battle_board = summary.get("battle_board") if isinstance(summary.get("battle_board"), dict) else {}
     md.write(f"- battle_board: {summary_battle_board.get('url') or '-'}\n")